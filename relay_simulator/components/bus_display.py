@@ -92,6 +92,21 @@ class BusDisplay(Component):
         start_pin = self._get_start_pin()
         return f"{bus_name}_{start_pin + int(bit_index)}"
 
+    def read_value(self, vnet_manager) -> int:
+        """Read the displayed bus as an integer (bit 0 = first displayed bit).
+
+        Args:
+            vnet_manager: VnetManager of the running simulation
+
+        Returns:
+            Bus value, or 0 without a bus name or simulation
+        """
+        bus_name = self._get_bus_name()
+        read_bus_value = getattr(vnet_manager, 'read_bus_value', None)
+        if not bus_name or not callable(read_bus_value):
+            return 0
+        return read_bus_value(bus_name, self._get_number_of_pins(), self._get_start_pin())
+
     # --- Simulation interface (passive) ---
 
     def simulate_logic(self, vnet_manager, bridge_manager=None):
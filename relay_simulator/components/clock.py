@@ -9,6 +9,8 @@ Behavior:
 - When ON, output pulses HIGH/FLOAT at the configured frequency (50% duty cycle).
 - When OFF, output is FLOAT.
 - If enabled on sim start, the clock starts pulsing when simulation starts.
+- With an engine event scheduler, each half-period is a simulated-time event;
+  otherwise a background thread paces the clock in wall-clock time.
 
 Properties:
 - frequency: One of ("4Hz", "2Hz", "1Hz", "2 sec", "4 sec", "8 sec")
@@ -22,7 +24,7 @@ from __future__ import annotations
 
 import threading
 import time
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Set
 
 from components.base import Component
 from core.pin import Pin
@@ -69,6 +71,9 @@ class Clock(Component):
         self._stop_event = threading.Event()
         self._thread: Optional[threading.Thread] = None
 
+        self._scheduler = None  # EventScheduler (set by the engine)
+        self._toggle_event_id: Optional[int] = None
+
         self._create_pin_and_tabs()
 
     def _create_pin_and_tabs(self) -> None:
@@ -107,9 +112,17 @@ class Clock(Component):
             return 4.0
         return 0.5
 
+    def set_event_scheduler(self, scheduler) -> None:
+        """Use a simulated-time event scheduler instead of a clock thread.
+
+        Called by the SimulationEngine before sim_start.
+        """
+        self._scheduler = scheduler
+
     def set_on_tick_callback(self, callback) -> None:
         """Set a callback to request the GUI/engine rerun simulation.
 
+        The callback receives the set of output VNET IDs the tick changed.
         Called by the SimulationEngine during initialization.
         """
         self._tick_callback = callback
@@ -139,14 +152,19 @@ class Clock(Component):
             self.properties["dull_color"] = self.COLOR_PRESETS[color_name]["dull"]
             self.properties["off_color"] = self.COLOR_PRESETS[color_name]["off"]
 
-    def _apply_output_state(self) -> None:
-        """Apply the current output state to the pin and mark its VNET dirty."""
+    def _apply_output_state(self) -> Set[str]:
+        """Apply the current output state to the pin and mark its VNET dirty.
+
+        Returns:
+            IDs of the output VNETs marked dirty (empty if unchanged)
+        """
+        affected: Set[str] = set()
         if not self._vnet_manager:
-            return
+            return affected
 
         pin = next(iter(self.pins.values()), None)
         if not pin:
-            return
+            return affected
 
         desired = PinState.HIGH if (self._is_enabled and self._output_high) else PinState.FLOAT
 
@@ -155,10 +173,18 @@ class Clock(Component):
             for tab in pin.tabs.values():
                 try:
                     self._vnet_manager.mark_tab_dirty(tab.tab_id)
+                    vnet = self._vnet_manager.get_vnet_for_tab(tab.tab_id)
+                    if vnet:
+                        affected.add(vnet.vnet_id)
                 except Exception:
                     pass
+        return affected
 
     def _ensure_thread_running(self) -> None:
+        if self._scheduler is not None:
+            self._schedule_next_toggle()
+            return
+
         if self._thread and self._thread.is_alive():
             return
 
@@ -168,6 +194,37 @@ class Clock(Component):
 
     def _stop_thread(self) -> None:
         self._stop_event.set()
+        self._cancel_toggle_event()
+
+    def _schedule_next_toggle(self) -> None:
+        """Schedule the next output toggle one half-period from now."""
+        if self._toggle_event_id is not None:
+            return
+        half_period = self._half_period_seconds(self.properties.get("frequency", "1Hz"))
+        self._toggle_event_id = self._scheduler.schedule(half_period, self._on_toggle_event)
+
+    def _cancel_toggle_event(self) -> None:
+        if self._scheduler is not None and self._toggle_event_id is not None:
+            self._scheduler.cancel(self._toggle_event_id)
+        self._toggle_event_id = None
+
+    def _on_toggle_event(self) -> None:
+        """Scheduler event: toggle the output and schedule the next half-period."""
+        self._toggle_event_id = None
+        if not self._is_enabled:
+            return
+
+        self._output_high = not self._output_high
+        affected = self._apply_output_state()
+
+        cb = self._tick_callback
+        if cb:
+            try:
+                cb(affected)
+            except Exception:
+                pass
+
+        self._schedule_next_toggle()
 
     def _run_clock(self) -> None:
         next_toggle = time.perf_counter()
@@ -182,12 +239,12 @@ class Clock(Component):
             now = time.perf_counter()
             if now >= next_toggle:
                 self._output_high = not self._output_high
-                self._apply_output_state()
+                affected = self._apply_output_state()
 
                 cb = self._tick_callback
                 if cb:
                     try:
-                        cb()
+                        cb(affected)
                     except Exception:
                         pass
 
@@ -200,6 +257,7 @@ class Clock(Component):
 
     def sim_start(self, vnet_manager, bridge_manager):
         self._vnet_manager = vnet_manager
+        self._toggle_event_id = None
 
         self._is_enabled = bool(self.properties.get("enable_on_sim_start", False))
         self._output_high = True if self._is_enabled else False
@@ -225,6 +283,7 @@ class Clock(Component):
             self._ensure_thread_running()
         else:
             self._output_high = False
+            self._cancel_toggle_event()
 
         return True
 
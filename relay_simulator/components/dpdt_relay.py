@@ -12,10 +12,14 @@ Pins: 7 pins total
   - Pole 2: COM2, NO2, NC2 (3 pins)
 
 Timing: 10ms delay when coil state changes before contacts switch
+       (a simulated-time event when the engine provides an EventScheduler,
+       otherwise a timer thread)
 State: Energized when coil is HIGH, De-energized when coil is FLOAT
+Bridges: The four contact bridges (COM-NO, COM-NC per pole) are allocated
+         once at sim_start; switching only enables/disables them
 """
 
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional, Set, Tuple
 import time
 import threading
 from components.base import Component
@@ -83,12 +87,19 @@ class DPDTRelay(Component):
         self._timer_active = False  # Whether timer is running
         self._timer_thread: Optional[threading.Thread] = None
         self._timer_lock = threading.Lock()
+        self._scheduler = None  # EventScheduler (set by the engine)
+        self._timer_event_id: Optional[int] = None
         self._on_contacts_switched_callback = None  # Callback to trigger simulation restart
         
         # Bridge references (runtime only)
         self._pole1_bridge_id: Optional[str] = None
         self._pole2_bridge_id: Optional[str] = None
         
+        # Preallocated contact bridges per pole: (NC bridge ID, NO bridge ID,
+        # VNET IDs of its contacts); None when the bridge manager cannot
+        # allocate bridges
+        self._poles: Optional[List[Tuple[Optional[str], Optional[str], Tuple[str, ...]]]] = None
+        
         # Pin references (set during pin creation)
         self._coil_pin: Optional[Pin] = None
         self._com1_pin: Optional[Pin] = None
@@ -199,6 +210,7 @@ class DPDTRelay(Component):
         
         Reads coil pin state and starts a 10ms timer if state change detected.
         When timer completes, switches bridges between NC and NO contacts.
+        With an event scheduler the timer is a simulated-time event.
         
         Args:
             vnet_manager: VnetManager instance for state tracking
@@ -231,47 +243,121 @@ class DPDTRelay(Component):
 
                 if not self._timer_active:
                     self._timer_active = True
-                    self._timer_thread = threading.Thread(
-                        target=self._timer_callback,
-                        args=(vnet_manager, bridge_manager),
-                        daemon=True
-                    )
-                    self._timer_thread.start()
+                    if self._scheduler is not None:
+                        self._timer_event_id = self._scheduler.schedule(
+                            self.SWITCHING_DELAY,
+                            self._on_timer_expired,
+                            vnet_manager,
+                            bridge_manager
+                        )
+                    else:
+                        self._timer_thread = threading.Thread(
+                            target=self._timer_callback,
+                            args=(vnet_manager, bridge_manager),
+                            daemon=True
+                        )
+                        self._timer_thread.start()
     
     def _timer_callback(self, vnet_manager, bridge_manager):
         """
-        Timer callback that executes after SWITCHING_DELAY.
+        Timer thread body: waits SWITCHING_DELAY then switches contacts.
         
-        Switches bridges and updates relay state, then triggers simulation restart.
+        Only used when no event scheduler is set.
         
         Args:
             vnet_manager: VnetManager instance
             bridge_manager: BridgeManager instance
         """
         time.sleep(self.SWITCHING_DELAY)
-
+        self._on_timer_expired(vnet_manager, bridge_manager)
+    
+    def _on_timer_expired(self, vnet_manager, bridge_manager):
+        """
+        Timer completion (scheduler event or timer thread).
+        
+        Switches bridges and updates relay state, then triggers simulation restart.
+        
+        Args:
+            vnet_manager: VnetManager instance
+            bridge_manager: BridgeManager instance
+        """
         with self._timer_lock:
+            self._timer_event_id = None
+
             if self._target_energized != self._is_energized:
                 self._is_energized = self._target_energized
-                self._switch_contacts(vnet_manager, bridge_manager)
+                affected = self._switch_contacts(vnet_manager, bridge_manager)
 
                 if self._on_contacts_switched_callback:
-                    self._on_contacts_switched_callback()
+                    self._on_contacts_switched_callback(affected)
 
             self._timer_active = False
     
 
     
-    def _switch_contacts(self, vnet_manager, bridge_manager):
-        """Switch relay contacts by moving bridges."""
+    def _allocate_contacts(self, vnet_manager, bridge_manager):
+        """
+        Allocate the COM-NO and COM-NC bridges of both poles (all disabled).
+        
+        Bridge IDs are derived from the component ID, so a restart reuses
+        the same bridges. A contact whose pin has no VNET, or shares the
+        COM VNET, gets no bridge.
+        """
+        self._poles = []
+        for pole, (com_pin, no_pin, nc_pin) in enumerate(
+                ((self._com1_pin, self._no1_pin, self._nc1_pin),
+                 (self._com2_pin, self._no2_pin, self._nc2_pin)), start=1):
+            vnet_com = vnet_manager.get_vnet_for_pin(com_pin.pin_id)
+            contact_ids = []
+            vnet_ids = set()
+            for contact, pin in (("NC", nc_pin), ("NO", no_pin)):
+                vnet = vnet_manager.get_vnet_for_pin(pin.pin_id)
+                if vnet_com is None or vnet is None or vnet.vnet_id == vnet_com.vnet_id:
+                    contact_ids.append(None)
+                    continue
+                contact_ids.append(bridge_manager.allocate_bridge(
+                    vnet_com.vnet_id, vnet.vnet_id, self.component_id,
+                    f"{self.component_id}.COM{pole}-{contact}{pole}"
+                ))
+                vnet_ids.update((vnet_com.vnet_id, vnet.vnet_id))
+            self._poles.append((contact_ids[0], contact_ids[1], tuple(vnet_ids)))
+    
+    def _switch_contacts(self, vnet_manager, bridge_manager) -> Set[str]:
+        """
+        Switch relay contacts by moving bridges.
+        
+        Preallocated contact bridges are toggled; otherwise the old bridges
+        are removed and new ones created.
+        
+        Returns:
+            IDs of the VNETs at the ends of the removed and created bridges
+        """
+        affected: Set[str] = set()
+        
+        if self._poles is not None:
+            active_ids = []
+            for nc_id, no_id, vnet_ids in self._poles:
+                closed, opened = (no_id, nc_id) if self._is_energized else (nc_id, no_id)
+                changed = opened is not None and bridge_manager.set_bridge_enabled(opened, False)
+                if closed is not None and bridge_manager.set_bridge_enabled(closed, True):
+                    changed = True
+                if changed:
+                    affected.update(vnet_ids)
+                active_ids.append(closed)
+            self._pole1_bridge_id, self._pole2_bridge_id = active_ids
+            return affected
         
         # Remove existing bridges
         if self._pole1_bridge_id:
-            bridge_manager.remove_bridge(self._pole1_bridge_id)
+            old_bridge = bridge_manager.remove_bridge(self._pole1_bridge_id)
+            if old_bridge is not None:
+                affected.update(old_bridge.get_connected_vnets())
             self._pole1_bridge_id = None
         
         if self._pole2_bridge_id:
-            bridge_manager.remove_bridge(self._pole2_bridge_id)
+            old_bridge = bridge_manager.remove_bridge(self._pole2_bridge_id)
+            if old_bridge is not None:
+                affected.update(old_bridge.get_connected_vnets())
             self._pole2_bridge_id = None
         
         # Create new bridges based on state
@@ -283,6 +369,7 @@ class DPDTRelay(Component):
                 self._pole1_bridge_id = bridge_manager.create_bridge(
                     vnet_com1.vnet_id, vnet_no1.vnet_id, self.component_id
                 )
+                affected.update((vnet_com1.vnet_id, vnet_no1.vnet_id))
             
             vnet_com2 = vnet_manager.get_vnet_for_pin(self._com2_pin.pin_id)
             vnet_no2 = vnet_manager.get_vnet_for_pin(self._no2_pin.pin_id)
@@ -290,6 +377,7 @@ class DPDTRelay(Component):
                 self._pole2_bridge_id = bridge_manager.create_bridge(
                     vnet_com2.vnet_id, vnet_no2.vnet_id, self.component_id
                 )
+                affected.update((vnet_com2.vnet_id, vnet_no2.vnet_id))
         else:
             # De-energized: COM→NC
             vnet_com1 = vnet_manager.get_vnet_for_pin(self._com1_pin.pin_id)
@@ -298,6 +386,7 @@ class DPDTRelay(Component):
                 self._pole1_bridge_id = bridge_manager.create_bridge(
                     vnet_com1.vnet_id, vnet_nc1.vnet_id, self.component_id
                 )
+                affected.update((vnet_com1.vnet_id, vnet_nc1.vnet_id))
             
             vnet_com2 = vnet_manager.get_vnet_for_pin(self._com2_pin.pin_id)
             vnet_nc2 = vnet_manager.get_vnet_for_pin(self._nc2_pin.pin_id)
@@ -305,6 +394,18 @@ class DPDTRelay(Component):
                 self._pole2_bridge_id = bridge_manager.create_bridge(
                     vnet_com2.vnet_id, vnet_nc2.vnet_id, self.component_id
                 )
+                affected.update((vnet_com2.vnet_id, vnet_nc2.vnet_id))
+        
+        return affected
+    
+    def set_event_scheduler(self, scheduler):
+        """
+        Use a simulated-time event scheduler for the switching delay.
+        
+        Args:
+            scheduler: EventScheduler instance, or None to use timer threads
+        """
+        self._scheduler = scheduler
     
     def set_on_contacts_switched_callback(self, callback):
         """
@@ -312,7 +413,8 @@ class DPDTRelay(Component):
         
         This allows the relay to trigger a simulation restart after the timer completes.
         Args:
-            callback: Function to call when contacts switch (no arguments)
+            callback: Function to call when contacts switch. Receives the set of
+                      VNET IDs at the ends of the old and new bridges.
         """
         self._on_contacts_switched_callback = callback
     
@@ -341,14 +443,18 @@ class DPDTRelay(Component):
             if pin:
                 pin.set_state(PinState.FLOAT)
         
-        # Create initial bridges (de-energized: COM→NC)
+        # Allocate contact bridges, then close the de-energized ones (COM→NC)
+        self._poles = None
+        if hasattr(bridge_manager, 'allocate_bridge'):
+            self._allocate_contacts(vnet_manager, bridge_manager)
         self._switch_contacts(vnet_manager, bridge_manager)
     
     def sim_stop(self, vnet_manager=None, bridge_manager=None):
         """
         Clean up relay state on simulation stop.
         
-        Bridges are removed automatically by the engine via BridgeManager.
+        Contact bridges stay allocated; sim_start reuses them and returns
+        them to the de-energized contacts.
         
         Args:
             vnet_manager: VnetManager instance (unused)
@@ -357,6 +463,9 @@ class DPDTRelay(Component):
         # Cancel any active timer
         with self._timer_lock:
             self._timer_active = False
+            if self._scheduler is not None and self._timer_event_id is not None:
+                self._scheduler.cancel(self._timer_event_id)
+            self._timer_event_id = None
         
         # Wait for timer thread to complete
         if self._timer_thread and self._timer_thread.is_alive():
@@ -1,20 +1,24 @@
 """Memory Component.
 
 A RAM memory component with:
-- Configurable address space (3-16 bits)
+- Configurable address space (3-16 bits, up to 24 with a mapped image)
 - Configurable byte size (1-16 bits)
 - Address and Data buses (linked by name)
 - Enable, Read, Write control pins
 - Memory viewer/editor grid (16 addresses wide)
-- File load/save capability
+- File load/save capability (text .mem, raw binary, Intel HEX)
 - Auto-load from default file on simulation start
+- Optional memory-mapped raw binary image (ROM, or copy-on-write RAM)
 
 Properties:
-- address_bits: Address space size in bits (3-16)
+- address_bits: Address space size in bits (3-16, up to 24 when mapped)
 - data_bits: Byte/word size in bits (1-16)
 - address_bus_name: Name of the address bus
 - data_bus_name: Name of the data bus
 - default_memory_file: Optional default file to load on sim start
+- mapped_image_file: Optional raw binary image to mmap instead of storing
+  contents (the .rsim keeps only the path and a content hash)
+- mapped_image_mode: 'read_only' (ROM) or 'copy_on_write' (RAM)
 """
 
 from __future__ import annotations
@@ -23,6 +27,10 @@ import os
 from typing import Dict, Any, Optional
 
 from components.base import Component
+from components.memory_image import (
+    MAPPED_MODES, MAPPED_READ_ONLY, MappedMemory, MemoryArray,
+    decode_block, encode_block, load_image, save_image,
+)
 from core.pin import Pin
 from core.tab import Tab
 from core.state import PinState
@@ -40,6 +48,10 @@ class Memory(Component):
     PIN_OFFSET_X = -440  # Pins on left side
     PIN_SPACING = 70     # Vertical spacing between pins
 
+    # Address space limits: in-document storage and mapped images
+    MAX_ADDRESS_BITS = 16
+    MAPPED_MAX_ADDRESS_BITS = 24
+
     def _read_input_pin_high(self, vnet_manager, pin: Optional[Pin]) -> bool:
         """Read a passive input pin by looking at its VNET state.
 
@@ -74,14 +86,21 @@ class Memory(Component):
             'data_bus_name': 'Data',
             'default_memory_file': '',  # Optional file path
             'is_volatile': False,        # If True, clears on sim start and not saved to .rsim
+            'mapped_image_file': '',     # Optional raw binary image to mmap
+            'mapped_image_mode': MAPPED_READ_ONLY,
             'label': 'RAM',
             'label_position': 'top',
             'visible_rows': 16,     # Number of rows visible in viewer (resizable)
         }
 
-        # Memory storage: dict[address: int] -> value: int
-        # Only stores non-zero values to save memory
-        self.memory: Dict[int, int] = {}
+        # Memory storage: one word per address, dict-style access
+        # (MemoryArray, or MappedMemory when mapped_image_file is set)
+        self.memory = MemoryArray(self.memory_size, self._get_data_bits())
+
+        # Whether the mapped image differs from the one the document was saved
+        # with, and that saved content reference (kept if the image is missing)
+        self.mapped_image_changed = False
+        self._mapped_image_reference: Optional[Dict[str, Any]] = None
 
         # Viewer state
         self.scroll_offset = 0  # Row offset for scrolling
@@ -98,7 +117,8 @@ class Memory(Component):
             bits = int(self.properties.get('address_bits', 8))
         except Exception:
             bits = 8
-        return max(3, min(16, bits))
+        limit = self.MAPPED_MAX_ADDRESS_BITS if self._get_mapped_image_file() else self.MAX_ADDRESS_BITS
+        return max(3, min(limit, bits))
 
     def _get_data_bits(self) -> int:
         try:
@@ -125,6 +145,16 @@ class Memory(Component):
             return ''
         return path.strip()
 
+    def _get_mapped_image_file(self) -> str:
+        path = self.properties.get('mapped_image_file', '')
+        if not isinstance(path, str):
+            return ''
+        return path.strip()
+
+    def _get_mapped_image_mode(self) -> str:
+        mode = self.properties.get('mapped_image_mode', MAPPED_READ_ONLY)
+        return mode if mode in MAPPED_MODES else MAPPED_READ_ONLY
+
     def _is_volatile(self) -> bool:
         """Whether this memory is volatile.
 
@@ -151,6 +181,47 @@ class Memory(Component):
         """Maximum value that can be stored (based on data_bits)."""
         return (1 << self._get_data_bits()) - 1
 
+    @property
+    def is_mapped(self) -> bool:
+        """Whether contents come from a memory-mapped image file."""
+        return isinstance(self.memory, MappedMemory)
+
+    def _new_storage(self):
+        """Empty storage, or the mapped image, for the current properties."""
+        size = self.memory_size
+        data_bits = self._get_data_bits()
+        image = self._get_mapped_image_file()
+        if image:
+            try:
+                return MappedMemory(image, size, data_bits, self._get_mapped_image_mode())
+            except (OSError, ValueError) as e:
+                print(f"Error mapping memory image {image}: {e}")
+                # Unavailable image: read as all zero until it can be mapped
+                return MemoryArray(0, data_bits)
+        return MemoryArray(size, data_bits)
+
+    def _replace_storage(self) -> None:
+        """Drop the current contents (releasing any mapping) for new storage."""
+        if self.is_mapped:
+            self.memory.close()
+        self.memory = self._new_storage()
+
+    def _sync_storage(self) -> None:
+        """Resize or remap the storage when the properties no longer match it."""
+        size = self.memory_size
+        data_bits = self._get_data_bits()
+        image = self._get_mapped_image_file()
+        store = self.memory
+        if image:
+            mapped = self.is_mapped and (store.path, store.mode, store.size, store.data_bits) == \
+                (image, self._get_mapped_image_mode(), size, data_bits)
+            if not mapped and (self.is_mapped or os.path.isfile(image)):
+                self._replace_storage()
+        elif self.is_mapped:
+            self._replace_storage()
+        elif store.size != size or store.data_bits != data_bits:
+            self.memory = store.resized(size, data_bits)
+
     def _rebuild_pins(self) -> None:
         """Create the control pins (Enable, Read, Write) and data bus pins."""
         self.pins.clear()
@@ -200,6 +271,8 @@ class Memory(Component):
         data_start_y = -(data_bits - 1) * data_pin_spacing // 2
         data_pin_x = 360  # Right side of memory viewer
 
+        # DATA pins in bit order, driven as one word
+        self._data_pins = []
         for bit_index in range(data_bits):
             pin_id = f"{self.component_id}.DATA_{bit_index}"
             pin = Pin(pin_id, self)
@@ -210,12 +283,15 @@ class Memory(Component):
             tab = Tab(tab_id, pin, (tab_x, tab_y))
             pin.add_tab(tab)
             self.add_pin(pin)
+            self._data_pins.append(pin)
 
     def on_property_changed(self, key: str) -> None:
         """Hook called by the UI when a property changes."""
-        if key in ('address_bits', 'data_bits'):
-            # Clear memory if dimensions change
-            self.memory.clear()
+        if key in ('address_bits', 'data_bits', 'mapped_image_file', 'mapped_image_mode'):
+            # Clear (or remap) memory if dimensions or the mapped image change
+            self._replace_storage()
+            self.mapped_image_changed = False
+            self._mapped_image_reference = None
             self.last_operation = None
             self.last_address = None
             self.last_data = None
@@ -270,18 +346,14 @@ class Memory(Component):
     def read_memory(self, address: int) -> int:
         """Read value at address (returns 0 if not written)."""
         address = address & ((1 << self._get_address_bits()) - 1)
-        return self.memory.get(address, 0)
+        return self.memory.get(address)
 
     def write_memory(self, address: int, value: int) -> None:
         """Write value to address."""
+        self._sync_storage()
         address = address & ((1 << self._get_address_bits()) - 1)
-        value = value & self.max_value
-
-        if value == 0:
-            # Remove zero entries to save space
-            self.memory.pop(address, None)
-        else:
-            self.memory[address] = value
+        if address < self.memory.size:
+            self.memory[address] = value & self.max_value
 
     def clear_memory(self) -> None:
         """Clear all memory contents."""
@@ -293,33 +365,30 @@ class Memory(Component):
     def load_from_file(self, filepath: str) -> bool:
         """Load memory contents from file.
         
-        File format: text file with lines of "address:value" in hex.
-        Example:
-            0000:FF
-            0001:A5
+        Formats:
+        - Text (.mem, default): lines of "address:value" in hex.
+          Example:
+              0000:FF
+              0001:A5
+        - Raw binary (.bin, .rom): little-endian words from address 0
+          (1 byte per word up to 8 data bits, otherwise 2).
+        - Intel HEX (any file whose first record starts with ':'):
+          byte records, words little-endian as in raw binary.
             
+        Contents are only replaced if the whole file loads; a memory
+        with a mapped image cannot load other files.
         Returns True if successful.
         """
         if not filepath or not os.path.isfile(filepath):
             return False
+        if self.is_mapped:
+            print(f"Cannot load {filepath}: memory is mapped to {self.memory.path}")
+            return False
 
         try:
-            self.memory.clear()
-            with open(filepath, 'r') as f:
-                for line in f:
-                    line = line.strip()
-                    if not line or line.startswith('#'):
-                        continue
-
-                    if ':' not in line:
-                        continue
-
-                    addr_str, val_str = line.split(':', 1)
-                    addr = int(addr_str.strip(), 16)
-                    val = int(val_str.strip(), 16)
-
-                    self.write_memory(addr, val)
-
+            store = MemoryArray(self.memory_size, self._get_data_bits())
+            load_image(store, filepath)
+            self.memory = store
             return True
         except Exception as e:
             print(f"Error loading memory file {filepath}: {e}")
@@ -328,7 +397,8 @@ class Memory(Component):
     def save_to_file(self, filepath: str) -> bool:
         """Save memory contents to file.
         
-        Only saves non-zero entries.
+        The format follows the extension as in load_from_file(); text
+        files only list non-zero entries.
         Returns True if successful.
         """
         if not filepath:
@@ -340,19 +410,8 @@ class Memory(Component):
             if dir_path and not os.path.exists(dir_path):
                 os.makedirs(dir_path)
 
-            with open(filepath, 'w') as f:
-                f.write("# Memory contents\n")
-                f.write(f"# Address bits: {self._get_address_bits()}\n")
-                f.write(f"# Data bits: {self._get_data_bits()}\n")
-                f.write("#\n")
-
-                # Sort by address
-                for addr in sorted(self.memory.keys()):
-                    val = self.memory[addr]
-                    addr_width = (self._get_address_bits() + 3) // 4  # Hex digits
-                    val_width = (self._get_data_bits() + 3) // 4
-                    f.write(f"{addr:0{addr_width}X}:{val:0{val_width}X}\n")
-
+            self._sync_storage()
+            save_image(self.memory, filepath)
             return True
         except Exception as e:
             print(f"Error saving memory file {filepath}: {e}")
@@ -361,83 +420,35 @@ class Memory(Component):
     # --- Bus reading helpers ---
 
     def _read_bus_value(self, vnet_manager, bus_name: str, num_bits: int) -> int:
-        """Read a multi-bit value from a bus by reading individual link states.
+        """Read a multi-bit value from a bus.
         
         Reads links: {bus_name}_0, {bus_name}_1, ..., {bus_name}_{num_bits-1}
-        Returns an integer with bit 0 = LSB.
+        Returns an integer with bit 0 = LSB. The bus is resolved to its VNETs
+        once by the VnetManager and read as a word.
         """
         if not bus_name or not vnet_manager:
             return 0
 
-        value = 0
-        for bit_index in range(num_bits):
-            link_name = f"{bus_name}_{bit_index}"
-
-            # Check if link exists and is HIGH
-            is_high = False
-            vnets = getattr(vnet_manager, 'vnets', {})
-            if isinstance(vnets, dict):
-                for vnet in vnets.values():
-                    try:
-                        if not vnet.has_link(link_name):
-                            continue
-                        state = getattr(vnet, 'state', None)
-                        if state == PinState.HIGH or state is True or state == 1:
-                            is_high = True
-                            break
-                    except Exception:
-                        continue
-
-            if is_high:
-                value |= (1 << bit_index)
-
-        return value
+        read_bus_value = getattr(vnet_manager, 'read_bus_value', None)
+        if not callable(read_bus_value):
+            return 0
+        return read_bus_value(bus_name, num_bits)
 
     def _drive_data_bus_pins(self, vnet_manager, value: int | None) -> None:
         """Drive (or float) the DATA bus using our DATA_* pins.
 
         If value is None, all DATA pins are floated.
         If value is an int, DATA_i is HIGH when bit i is set, else FLOAT.
+        Only the VNETs of DATA pins that change are marked dirty.
         """
-        data_bits = self._get_data_bits()
-
-        for bit_index in range(data_bits):
-            pin = self.pins.get(f"{self.component_id}.DATA_{bit_index}")
-            if not pin:
-                continue
-
-            if value is None:
-                new_state = PinState.FLOAT
-            else:
-                bit_high = bool(value & (1 << bit_index))
-                new_state = PinState.HIGH if bit_high else PinState.FLOAT
-
-            if pin.state == new_state:
-                continue
+        if vnet_manager is not None and callable(getattr(vnet_manager, 'drive_pins', None)):
+            vnet_manager.drive_pins(self._data_pins, value)
+            return
 
-            pin.set_state(new_state)
-
-            try:
-                data_bus = self._get_data_bus_name()
-                link_name = f"{data_bus}_{bit_index}" if data_bus else ""
-                tab = next(iter(pin.tabs.values()), None)
-                vnet = vnet_manager.get_vnet_for_tab(tab.tab_id) if (vnet_manager and tab) else None
-                vnet_id = getattr(vnet, 'vnet_id', None)
-                has_link = bool(vnet.has_link(link_name)) if (vnet and link_name) else False
-                self._debug(
-                    f"[RSIM_DEBUG_MEMORY] {self.component_id} drive bit{bit_index}={new_state} "
-                    f"(link={link_name} vnet={vnet_id} has_link={has_link})"
-                )
-            except Exception:
-                pass
-
-            # Mark connected VNET(s) dirty so the simulation engine re-evaluates.
-            if vnet_manager:
-                for tab in pin.tabs.values():
-                    try:
-                        vnet_manager.mark_tab_dirty(tab.tab_id)
-                    except Exception:
-                        pass
+        # No simulation attached: just set the pin states
+        for bit_index, pin in enumerate(self._data_pins):
+            high = value is not None and bool(value & (1 << bit_index))
+            pin.set_state(PinState.HIGH if high else PinState.FLOAT)
 
     # --- Simulation interface ---
 
@@ -512,9 +523,12 @@ class Memory(Component):
         # Just ensure the bus is floated initially.
         self._drive_data_bus_pins(vnet_manager, None)
 
-        # Load default memory file if specified
+        # Map the image again if its properties changed without a hook call
+        self._sync_storage()
+
+        # Load default memory file if specified (mapped images replace it)
         default_file = self._get_default_memory_file()
-        if default_file:
+        if default_file and not self.is_mapped:
             # Try to resolve relative paths
             if not os.path.isabs(default_file):
                 # Try relative to current working directory
@@ -547,9 +561,29 @@ class Memory(Component):
         if 'properties' in data and isinstance(data['properties'], dict):
             mem.properties.update(data['properties'])
 
-        # Load memory contents only when non-volatile.
-        if (not mem._is_volatile()) and 'memory' in data and isinstance(data['memory'], dict):
-            mem.memory = {int(k): int(v) for k, v in data['memory'].items()}
+        # Size (or map) the storage from the loaded properties
+        mem.memory = mem._new_storage()
+
+        # A mapped image only has a content reference: nothing is read from
+        # the image while its size and modification time are unchanged.
+        if mem._get_mapped_image_file():
+            reference = data.get('mapped_image')
+            if isinstance(reference, dict):
+                mem._mapped_image_reference = dict(reference)
+                if mem.is_mapped:
+                    try:
+                        mem.mapped_image_changed = not mem.memory.check_reference(reference)
+                    except OSError:
+                        mem.mapped_image_changed = True
+                    if mem.mapped_image_changed:
+                        print(f"Warning: memory image {mem.memory.path} changed since the document was saved")
+        # Otherwise load memory contents only when non-volatile: the encoded
+        # block, or the {"address": value} dict written by older versions.
+        elif not mem._is_volatile():
+            if isinstance(data.get('memory_image'), dict):
+                decode_block(data['memory_image'], mem.memory)
+            elif isinstance(data.get('memory'), dict):
+                mem.memory.update({int(k): int(v) for k, v in data['memory'].items()})
 
         # Load viewer state
         if 'scroll_offset' in data:
@@ -562,9 +596,19 @@ class Memory(Component):
         """Serialize to dictionary."""
         result = super().to_dict()
 
-        # Include memory contents (only non-zero values) when non-volatile.
-        if (not self._is_volatile()) and self.memory:
-            result['memory'] = {str(k): v for k, v in self.memory.items()}
+        # Mapped images are referenced by content hash; other contents are
+        # included (as an encoded block) when non-volatile.
+        if self.is_mapped:
+            try:
+                result['mapped_image'] = self.memory.reference()
+            except OSError as e:
+                print(f"Error hashing memory image {self.memory.path}: {e}")
+        elif self._get_mapped_image_file():
+            # Image unavailable: keep the reference it was saved with
+            if self._mapped_image_reference:
+                result['mapped_image'] = dict(self._mapped_image_reference)
+        elif (not self._is_volatile()) and self.memory:
+            result['memory_image'] = encode_block(self.memory)
 
         # Include viewer state
         result['scroll_offset'] = self.scroll_offset
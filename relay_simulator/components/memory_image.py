@@ -0,0 +1,589 @@
+"""Memory Image - dense word storage and file formats for Memory.
+
+MemoryArray keeps every word of a Memory's address space in one flat
+array (1 byte per word up to 8 data bits, 2 bytes up to 16), while still
+behaving like the previous sparse {address: value} dict: get(), item
+access, pop(), clear(), and keys()/items() over non-zero words only.
+
+Images can be loaded and saved as:
+- text: "address:value" hex lines (the original .mem format)
+- binary: raw little-endian words from address 0 (.bin, .rom)
+- Intel HEX: byte records, words little-endian (.hex, .ihx)
+
+encode_block()/decode_block() convert the contents to and from the
+compact base64 block stored in .rsim files.
+
+MappedMemory offers the same interface over a raw binary image that is
+mmap'ed rather than loaded, read-only (ROM) or copy-on-write (RAM whose
+writes never reach the file), for images too large to keep in the
+document.
+"""
+
+from __future__ import annotations
+
+import base64
+import hashlib
+import mmap
+import os
+import sys
+import zlib
+from array import array
+from typing import Any, Dict, Iterator, Mapping, Optional, Tuple
+
+
+BINARY_EXTENSIONS = ('.bin', '.rom')
+INTEL_HEX_EXTENSIONS = ('.hex', '.ihx', '.ihex')
+
+# Data bytes per Intel HEX record written
+INTEL_HEX_RECORD_BYTES = 16
+
+BLOCK_ENCODING = 'zlib+base64'
+
+MAPPED_READ_ONLY = 'read_only'
+MAPPED_COPY_ON_WRITE = 'copy_on_write'
+MAPPED_MODES = (MAPPED_READ_ONLY, MAPPED_COPY_ON_WRITE)
+
+
+class MemoryArray:
+    """
+    Dense word store for a Memory address space.
+
+    Values are masked to data_bits on write. Iterating, keys(), items()
+    and len() only see non-zero words, as with the sparse dict it replaces.
+    """
+
+    __slots__ = ('data_bits', '_words')
+
+    def __init__(self, size: int, data_bits: int = 8, words: Optional[array] = None):
+        """
+        Initialize a zero-filled store.
+
+        Args:
+            size: Number of addressable words
+            data_bits: Word width in bits (1-16)
+            words: Existing array to adopt (must match size and width)
+        """
+        self.data_bits = data_bits
+        self._words = words if words is not None else array(self.typecode_for(data_bits), [0]) * size
+
+    @staticmethod
+    def typecode_for(data_bits: int) -> str:
+        """Array typecode holding data_bits wide words."""
+        return 'B' if data_bits <= 8 else 'H'
+
+    @property
+    def size(self) -> int:
+        """Number of addressable words."""
+        return len(self._words)
+
+    @property
+    def word_bytes(self) -> int:
+        """Bytes per word in binary images (1 or 2)."""
+        return self._words.itemsize
+
+    @property
+    def mask(self) -> int:
+        """Largest storable value."""
+        return (1 << self.data_bits) - 1
+
+    # --- Dict-style access ---
+
+    def get(self, address: int, default: int = 0) -> int:
+        """Value at address (default when outside the address space)."""
+        if 0 <= address < len(self._words):
+            return self._words[address]
+        return default
+
+    def __getitem__(self, address: int) -> int:
+        return self._words[address]
+
+    def __setitem__(self, address: int, value: int) -> None:
+        self._words[address] = value & self.mask
+
+    def pop(self, address: int, default: Any = None) -> Any:
+        """Zero a word and return its previous value (default when it was zero)."""
+        value = self.get(address)
+        if not value:
+            return default
+        self._words[address] = 0
+        return value
+
+    def clear(self) -> None:
+        """Zero every word."""
+        self._words = array(self._words.typecode, [0]) * len(self._words)
+
+    def update(self, values: Mapping[int, int]) -> None:
+        """Write {address: value} pairs; addresses outside the store are ignored."""
+        size = len(self._words)
+        mask = self.mask
+        for address, value in values.items():
+            if 0 <= address < size:
+                self._words[address] = value & mask
+
+    def __iter__(self) -> Iterator[int]:
+        return self.keys()
+
+    def keys(self) -> Iterator[int]:
+        """Addresses of non-zero words, ascending."""
+        return (address for address, value in enumerate(self._words) if value)
+
+    def values(self) -> Iterator[int]:
+        """Non-zero words in address order."""
+        return (value for value in self._words if value)
+
+    def items(self) -> Iterator[Tuple[int, int]]:
+        """(address, value) of non-zero words, ascending."""
+        return ((address, value) for address, value in enumerate(self._words) if value)
+
+    def __contains__(self, address: int) -> bool:
+        return bool(self.get(address))
+
+    def __len__(self) -> int:
+        return len(self._words) - self._words.count(0)
+
+    def __bool__(self) -> bool:
+        return any(self._words)
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, MemoryArray):
+            return self.data_bits == other.data_bits and self._words == other._words
+        if isinstance(other, Mapping):
+            return dict(self.items()) == {a: v for a, v in other.items() if v}
+        return NotImplemented
+
+    def copy(self) -> 'MemoryArray':
+        """Independent copy of the store."""
+        return MemoryArray(len(self._words), self.data_bits, array(self._words.typecode, self._words))
+
+    __copy__ = copy
+
+    def resized(self, size: int, data_bits: int) -> 'MemoryArray':
+        """
+        Copy of the store with a new address space and word width.
+
+        Words beyond the new size are dropped; values are masked to data_bits.
+        """
+        result = MemoryArray(size, data_bits)
+        count = min(size, len(self._words))
+        if result._words.typecode == self._words.typecode and data_bits >= self.data_bits:
+            result._words[:count] = self._words[:count]
+        else:
+            mask = result.mask
+            result._words[:count] = array(result._words.typecode, (v & mask for v in self._words[:count]))
+        return result
+
+    # --- Bulk byte access ---
+
+    def to_bytes(self) -> bytes:
+        """All words as little-endian bytes."""
+        if self._words.itemsize == 1 or sys.byteorder == 'little':
+            return self._words.tobytes()
+        words = array(self._words.typecode, self._words)
+        words.byteswap()
+        return words.tobytes()
+
+    def load_bytes(self, data: bytes) -> None:
+        """
+        Replace the contents with little-endian words from address 0.
+
+        Missing words are zero; bytes beyond the address space and value
+        bits above data_bits are ignored.
+        """
+        itemsize = self._words.itemsize
+        size = len(self._words)
+        data = bytes(data[:size * itemsize])
+        if len(data) % itemsize:
+            data += bytes(itemsize - len(data) % itemsize)
+        words = array(self._words.typecode)
+        words.frombytes(data)
+        if itemsize > 1 and sys.byteorder != 'little':
+            words.byteswap()
+        mask = self.mask
+        if mask != (1 << (8 * itemsize)) - 1 and any(v > mask for v in words):
+            words = array(words.typecode, (v & mask for v in words))
+        if len(words) < size:
+            words.extend(array(words.typecode, [0]) * (size - len(words)))
+        self._words = words
+
+
+class MappedMemory:
+    """
+    Word store reading straight from an mmap'ed raw binary image.
+
+    The image holds little-endian words from address 0, as written by
+    save_image() for .bin files. Addresses past the end of the image read
+    as zero. In read-only mode writes are ignored; in copy-on-write mode
+    they go to private pages (only within the image) and clear() drops
+    them. Nothing is read from the file until a word is accessed.
+    """
+
+    def __init__(self, path: str, size: int, data_bits: int = 8, mode: str = MAPPED_READ_ONLY):
+        """
+        Map an image file.
+
+        Args:
+            path: Raw binary image file
+            size: Number of addressable words
+            data_bits: Word width in bits (1-16)
+            mode: MAPPED_READ_ONLY or MAPPED_COPY_ON_WRITE
+
+        Raises:
+            OSError: If the file cannot be opened or mapped
+            ValueError: If mode is unknown
+        """
+        if mode not in MAPPED_MODES:
+            raise ValueError(f"Unknown mapped image mode: {mode!r}")
+        self.path = path
+        self.size = size
+        self.data_bits = data_bits
+        self.mode = mode
+        self.mask = (1 << data_bits) - 1
+        self.word_bytes = 1 if data_bits <= 8 else 2
+        self._swap = self.word_bytes == 2 and sys.byteorder != 'little'
+        self._digest: Optional[Tuple[int, int, str]] = None  # (size, mtime_ns, sha256)
+        self._mmap: Optional[mmap.mmap] = None
+        self._view: Optional[memoryview] = None
+        self._map()
+
+    def _map(self) -> None:
+        access = mmap.ACCESS_READ if self.mode == MAPPED_READ_ONLY else mmap.ACCESS_COPY
+        with open(self.path, 'rb') as f:
+            length = os.fstat(f.fileno()).st_size
+            if length:
+                self._mmap = mmap.mmap(f.fileno(), 0, access=access)
+        words = min(self.size, length // self.word_bytes)
+        if self._mmap is not None and words:
+            self._view = memoryview(self._mmap)[:words * self.word_bytes].cast(
+                MemoryArray.typecode_for(self.data_bits))
+
+    def close(self) -> None:
+        """Release the mapping; the store then reads as all zero."""
+        if self._view is not None:
+            self._view.release()
+            self._view = None
+        if self._mmap is not None:
+            self._mmap.close()
+            self._mmap = None
+
+    @property
+    def writable(self) -> bool:
+        """True in copy-on-write mode."""
+        return self.mode == MAPPED_COPY_ON_WRITE
+
+    @property
+    def mapped_words(self) -> int:
+        """Number of words backed by the image."""
+        return len(self._view) if self._view is not None else 0
+
+    def get(self, address: int, default: int = 0) -> int:
+        """Value at address (zero past the image, default outside the address space)."""
+        view = self._view
+        if view is not None and 0 <= address < len(view):
+            value = view[address]
+            if self._swap:
+                value = ((value & 0xFF) << 8) | (value >> 8)
+            return value & self.mask
+        return 0 if 0 <= address < self.size else default
+
+    __getitem__ = get
+
+    def __setitem__(self, address: int, value: int) -> None:
+        if self.mode == MAPPED_COPY_ON_WRITE and self._view is not None and 0 <= address < len(self._view):
+            value &= self.mask
+            if self._swap:
+                value = ((value & 0xFF) << 8) | (value >> 8)
+            self._view[address] = value
+
+    def pop(self, address: int, default: Any = None) -> Any:
+        """Zero a word (copy-on-write only) and return its previous value."""
+        value = self.get(address)
+        if not value:
+            return default
+        self[address] = 0
+        return value
+
+    def clear(self) -> None:
+        """Drop copy-on-write changes by mapping the image again."""
+        if self.mode == MAPPED_COPY_ON_WRITE:
+            self.close()
+            self._map()
+
+    def keys(self) -> Iterator[int]:
+        """Addresses of non-zero words, ascending."""
+        return (address for address, value in self.items())
+
+    __iter__ = keys
+
+    def values(self) -> Iterator[int]:
+        """Non-zero words in address order."""
+        return (value for address, value in self.items())
+
+    def items(self) -> Iterator[Tuple[int, int]]:
+        """(address, value) of non-zero words, ascending."""
+        return ((address, self.get(address)) for address in range(self.mapped_words) if self.get(address))
+
+    def __contains__(self, address: int) -> bool:
+        return bool(self.get(address))
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self.items())
+
+    def __bool__(self) -> bool:
+        return any(True for _ in self.items())
+
+    def to_bytes(self) -> bytes:
+        """Mapped words as little-endian bytes (masked to data_bits)."""
+        store = MemoryArray(self.mapped_words, self.data_bits)
+        if self._view is not None:
+            store.load_bytes(self._mmap[:self.mapped_words * self.word_bytes])
+        return store.to_bytes()
+
+    def digest(self) -> str:
+        """
+        SHA-256 of the image file.
+
+        Cached until the file size or modification time changes.
+        """
+        stat = os.stat(self.path)
+        if self._digest is None or self._digest[:2] != (stat.st_size, stat.st_mtime_ns):
+            self._digest = (stat.st_size, stat.st_mtime_ns, image_digest(self.path))
+        return self._digest[2]
+
+    def reference(self) -> Dict[str, Any]:
+        """Content reference stored in .rsim files instead of the contents."""
+        digest = self.digest()
+        size, mtime_ns, _ = self._digest
+        return {'sha256': digest, 'size': size, 'mtime_ns': mtime_ns}
+
+    def check_reference(self, reference: Mapping[str, Any]) -> bool:
+        """
+        Check the image against a reference() from a saved document.
+
+        When the file size and modification time still match, the saved
+        digest is trusted without reading the file.
+
+        Returns:
+            True if the image content matches the reference
+        """
+        stat = os.stat(self.path)
+        if (reference.get('size'), reference.get('mtime_ns')) == (stat.st_size, stat.st_mtime_ns) \
+                and isinstance(reference.get('sha256'), str):
+            self._digest = (stat.st_size, stat.st_mtime_ns, reference['sha256'])
+            return True
+        return self.digest() == reference.get('sha256')
+
+
+def image_digest(filepath: str) -> str:
+    """SHA-256 hex digest of a file."""
+    digest = hashlib.sha256()
+    with open(filepath, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+# --- File formats ---
+
+def image_format(filepath: str) -> str:
+    """
+    Format of a memory image file to load: 'binary', 'intel_hex' or 'text'.
+
+    Binary is chosen by extension. Other files are Intel HEX when their
+    first record starts with ':', so text files keep loading whatever
+    their extension.
+    """
+    if os.path.splitext(filepath)[1].lower() in BINARY_EXTENSIONS:
+        return 'binary'
+    with open(filepath, 'r', errors='replace') as f:
+        for line in f:
+            line = line.strip()
+            if line and not line.startswith('#'):
+                return 'intel_hex' if line.startswith(':') else 'text'
+    return 'text'
+
+
+def _save_format(filepath: str) -> str:
+    """Format of a memory image file to save, by extension."""
+    extension = os.path.splitext(filepath)[1].lower()
+    if extension in BINARY_EXTENSIONS:
+        return 'binary'
+    if extension in INTEL_HEX_EXTENSIONS:
+        return 'intel_hex'
+    return 'text'
+
+
+def load_image(store: MemoryArray, filepath: str) -> None:
+    """
+    Replace store contents with a memory image file.
+
+    Raises:
+        OSError: If the file cannot be read
+        ValueError: If the file is malformed
+    """
+    fmt = image_format(filepath)
+    if fmt == 'binary':
+        with open(filepath, 'rb') as f:
+            store.load_bytes(f.read(store.size * store.word_bytes))
+    elif fmt == 'intel_hex':
+        with open(filepath, 'r') as f:
+            store.load_bytes(_parse_intel_hex(f, store.size * store.word_bytes))
+    else:
+        with open(filepath, 'r') as f:
+            _read_text(f, store)
+
+
+def save_image(store: MemoryArray, filepath: str) -> None:
+    """
+    Write store contents as a memory image file (format by extension).
+
+    Raises:
+        OSError: If the file cannot be written
+    """
+    fmt = _save_format(filepath)
+    if fmt == 'binary':
+        with open(filepath, 'wb') as f:
+            f.write(store.to_bytes())
+    elif fmt == 'intel_hex':
+        with open(filepath, 'w') as f:
+            _write_intel_hex(f, store.to_bytes())
+    else:
+        with open(filepath, 'w') as f:
+            _write_text(f, store)
+
+
+def _read_text(f, store: MemoryArray) -> None:
+    """Parse "address:value" hex lines into a cleared store."""
+    store.clear()
+    words = store._words
+    address_mask = store.size - 1
+    mask = store.mask
+    for line in f:
+        line = line.strip()
+        if not line or line.startswith('#') or ':' not in line:
+            continue
+        addr_str, val_str = line.split(':', 1)
+        words[int(addr_str.strip(), 16) & address_mask] = int(val_str.strip(), 16) & mask
+
+
+def _write_text(f, store: MemoryArray) -> None:
+    """Write non-zero words as "address:value" hex lines."""
+    address_bits = store.size.bit_length() - 1
+    f.write("# Memory contents\n")
+    f.write(f"# Address bits: {address_bits}\n")
+    f.write(f"# Data bits: {store.data_bits}\n")
+    f.write("#\n")
+    addr_width = (address_bits + 3) // 4  # Hex digits
+    val_width = (store.data_bits + 3) // 4
+    line = f"%0{addr_width}X:%0{val_width}X\n"
+    f.write("".join([line % item for item in store.items()]))
+
+
+def _parse_intel_hex(f, byte_count: int) -> bytearray:
+    """
+    Parse Intel HEX records into a byte image of byte_count bytes.
+
+    Supports data (00), end of file (01), extended segment (02) and
+    extended linear (04) address records; start address records are
+    ignored. Data outside the image is dropped.
+    """
+    image = bytearray(byte_count)
+    base = 0
+    for line_number, line in enumerate(f, 1):
+        line = line.strip()
+        if not line:
+            continue
+        if not line.startswith(':'):
+            raise ValueError(f"Line {line_number}: record does not start with ':'")
+        try:
+            record = bytes.fromhex(line[1:])
+        except ValueError:
+            raise ValueError(f"Line {line_number}: invalid hex digits") from None
+        if len(record) < 5 or len(record) != record[0] + 5:
+            raise ValueError(f"Line {line_number}: bad record length")
+        if sum(record) & 0xFF:
+            raise ValueError(f"Line {line_number}: checksum mismatch")
+
+        length, record_type, data = record[0], record[3], record[4:-1]
+        if record_type == 0x00:
+            start = base + (record[1] << 8 | record[2])
+            end = min(start + length, byte_count)
+            if start < end:
+                image[start:end] = data[:end - start]
+        elif record_type == 0x01:
+            break
+        elif record_type == 0x02:
+            base = int.from_bytes(data, 'big') << 4
+        elif record_type == 0x04:
+            base = int.from_bytes(data, 'big') << 16
+    return image
+
+
+def _intel_hex_record(record_type: int, address: int, data: bytes) -> str:
+    record = bytes((len(data), (address >> 8) & 0xFF, address & 0xFF, record_type)) + data
+    return f":{record.hex().upper()}{(-sum(record)) & 0xFF:02X}\n"
+
+
+def _write_intel_hex(f, image: bytes) -> None:
+    """Write a byte image as Intel HEX, skipping all-zero records."""
+    segment = 0
+    step = INTEL_HEX_RECORD_BYTES
+    for start in range(0, len(image), step):
+        data = image[start:start + step]
+        if not any(data):
+            continue
+        if start >> 16 != segment:
+            segment = start >> 16
+            f.write(_intel_hex_record(0x04, 0, segment.to_bytes(2, 'big')))
+        f.write(_intel_hex_record(0x00, start & 0xFFFF, data))
+    f.write(_intel_hex_record(0x01, 0, b''))
+
+
+# --- .rsim block ---
+
+def encode_block(store: MemoryArray) -> Dict[str, Any]:
+    """
+    Encode store contents as a compact .rsim block.
+
+    Words are little-endian, trailing zero words are trimmed, and the bytes
+    are zlib compressed and base64 encoded.
+    """
+    data = store.to_bytes().rstrip(b'\x00')
+    word_bytes = store.word_bytes
+    if len(data) % word_bytes:
+        data += bytes(word_bytes - len(data) % word_bytes)
+    return {
+        'encoding': BLOCK_ENCODING,
+        'word_bytes': word_bytes,
+        'words': len(data) // word_bytes,
+        'data': base64.b64encode(zlib.compress(data, 9)).decode('ascii'),
+    }
+
+
+def decode_block(block: Mapping[str, Any], store: MemoryArray) -> None:
+    """
+    Replace store contents with an encode_block() block.
+
+    Raises:
+        ValueError: If the block is malformed
+    """
+    if block.get('encoding') != BLOCK_ENCODING:
+        raise ValueError(f"Unsupported memory encoding: {block.get('encoding')!r}")
+    try:
+        data = zlib.decompress(base64.b64decode(block.get('data', ''), validate=True))
+    except (ValueError, zlib.error) as e:
+        raise ValueError(f"Invalid memory block data: {e}") from None
+
+    word_bytes = int(block.get('word_bytes', store.word_bytes))
+    if word_bytes not in (1, 2):
+        raise ValueError(f"Unsupported memory word size: {word_bytes}")
+    if word_bytes != store.word_bytes:
+        # Written with a different width: convert word by word
+        words = array(MemoryArray.typecode_for(8 * word_bytes))
+        words.frombytes(data[:len(data) - len(data) % word_bytes])
+        if word_bytes > 1 and sys.byteorder != 'little':
+            words.byteswap()
+        count = min(len(words), store.size)
+        store.clear()
+        store._words[:count] = array(store._words.typecode, (v & store.mask for v in words[:count]))
+        return
+    store.load_bytes(data)
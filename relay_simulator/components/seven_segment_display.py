@@ -68,6 +68,21 @@ class SevenSegmentDisplay(Component):
         end_pin = start_pin + 3
         return f"{bus_name}_{start_pin}...{bus_name}_{end_pin}"
 
+    def read_value(self, vnet_manager) -> int:
+        """Read the 4-bit input value from the bus links.
+
+        Args:
+            vnet_manager: VnetManager of the running simulation
+
+        Returns:
+            Nibble value 0..15, or 0 without a bus name or simulation
+        """
+        bus_name = self._get_bus_name()
+        read_bus_value = getattr(vnet_manager, 'read_bus_value', None)
+        if not bus_name or not callable(read_bus_value):
+            return 0
+        return read_bus_value(bus_name, 4, self._get_start_pin()) & 0xF
+
     # --- Simulation interface (passive) ---
 
     def simulate_logic(self, vnet_manager, bridge_manager=None):
@@ -11,6 +11,7 @@ Author: Cascade AI
 Date: 2025-12-10
 """
 
+import inspect
 import threading
 from typing import Any, Dict, Optional
 from contextlib import contextmanager
@@ -18,6 +19,29 @@ from contextlib import contextmanager
 from components.base import Component
 
 
+def takes_simulation_managers(method) -> bool:
+    """
+    Check whether a simulate_logic()/sim_start() method accepts managers.
+    
+    Components take (vnet_manager, bridge_manager); older test components
+    drive their pins directly and take no arguments.
+    
+    Args:
+        method: Bound method to inspect
+        
+    Returns:
+        True if the method accepts at least one positional argument
+    """
+    try:
+        parameters = inspect.signature(method).parameters.values()
+    except (TypeError, ValueError):
+        return True
+    return any(
+        p.kind in (p.POSITIONAL_ONLY, p.POSITIONAL_OR_KEYWORD, p.VAR_POSITIONAL)
+        for p in parameters
+    )
+
+
 class ThreadSafeComponent:
     """
     Thread-safe wrapper for Component instances.
@@ -50,6 +74,7 @@ class ThreadSafeComponent:
         self._component = component
         self._lock = threading.RLock()
         self._execution_errors = []
+        self._takes_managers = takes_simulation_managers(component.simulate_logic)
     
     @property
     def component(self) -> Component:
@@ -85,13 +110,17 @@ class ThreadSafeComponent:
         finally:
             self._lock.release()
     
-    def execute_logic_safe(self) -> tuple[bool, Optional[Exception]]:
+    def execute_logic_safe(self, vnet_manager=None, bridge_manager=None) -> tuple[bool, Optional[Exception]]:
         """
         Execute component logic with thread-safety.
         
         Acquires lock before calling simulate_logic() and releases
         after completion or error.
         
+        Args:
+            vnet_manager: VnetManager passed to simulate_logic() (if it takes one)
+            bridge_manager: BridgeManager passed to simulate_logic() (if it takes one)
+        
         Returns:
             Tuple of (success, exception)
             - success: True if logic executed without error
@@ -99,7 +128,10 @@ class ThreadSafeComponent:
         """
         with self._lock:
             try:
-                self._component.simulate_logic()
+                if self._takes_managers:
+                    self._component.simulate_logic(vnet_manager, bridge_manager)
+                else:
+                    self._component.simulate_logic()
                 return (True, None)
             except Exception as e:
                 self._execution_errors.append(e)
@@ -252,12 +284,19 @@ class ComponentExecutionCoordinator:
         with self._lock:
             return self._components.get(component_id)
     
-    def execute_component_parallel(self, component_id: str) -> tuple[bool, Optional[Exception]]:
+    def execute_component_parallel(
+        self,
+        component_id: str,
+        vnet_manager=None,
+        bridge_manager=None
+    ) -> tuple[bool, Optional[Exception]]:
         """
         Execute component logic with thread-safety.
         
         Args:
             component_id: Component ID to execute
+            vnet_manager: VnetManager passed to simulate_logic()
+            bridge_manager: BridgeManager passed to simulate_logic()
             
         Returns:
             Tuple of (success, exception)
@@ -270,7 +309,7 @@ class ComponentExecutionCoordinator:
             self._execution_stats['total_executions'] += 1
         
         # Execute outside the coordinator lock (component has its own lock)
-        success, exception = ts_comp.execute_logic_safe()
+        success, exception = ts_comp.execute_logic_safe(vnet_manager, bridge_manager)
         
         with self._lock:
             if success:
@@ -284,23 +323,53 @@ class ComponentExecutionCoordinator:
         
         return (success, exception)
     
-    def execute_batch_parallel(self, component_ids: list[str]) -> Dict[str, tuple[bool, Optional[Exception]]]:
+    def execute_batch_parallel(
+        self,
+        component_ids: list[str],
+        vnet_manager=None,
+        bridge_manager=None
+    ) -> Dict[str, tuple[bool, Optional[Exception]]]:
         """
         Execute multiple components in parallel.
         
-        This is called by the simulation engine's thread pool.
-        Each component executes with its own lock.
+        This is called by the simulation engine's thread pool, one batch
+        (shard) per worker. Each component executes with its own lock; the
+        coordinator lock is taken once to look the batch up and once to
+        record its statistics, not twice per component.
         
         Args:
             component_ids: List of component IDs to execute
+            vnet_manager: VnetManager passed to simulate_logic()
+            bridge_manager: BridgeManager passed to simulate_logic()
             
         Returns:
             Dict of component_id -> (success, exception)
         """
+        with self._lock:
+            wrappers = [(comp_id, self._components.get(comp_id)) for comp_id in component_ids]
+        
         results = {}
+        for comp_id, ts_comp in wrappers:
+            if ts_comp is None:
+                results[comp_id] = (False, ValueError(f"Component {comp_id} not registered"))
+            else:
+                results[comp_id] = ts_comp.execute_logic_safe(vnet_manager, bridge_manager)
         
-        for comp_id in component_ids:
-            results[comp_id] = self.execute_component_parallel(comp_id)
+        with self._lock:
+            stats = self._execution_stats
+            for comp_id, ts_comp in wrappers:
+                if ts_comp is None:
+                    continue
+                stats['total_executions'] += 1
+                success, exception = results[comp_id]
+                if success:
+                    stats['successful_executions'] += 1
+                else:
+                    stats['failed_executions'] += 1
+                    stats['errors'].append({
+                        'component_id': comp_id,
+                        'exception': exception
+                    })
         
         return results
     
@@ -121,10 +121,15 @@ class Thumbwheel(Component):
     def _apply_outputs(self, vnet_manager) -> bool:
         """Apply pin outputs based on current value. Returns True if any pin changed."""
         value = self._get_value()
-        changed_any = False
+        pins = [self.pins.get(f"{self.component_id}.pin{bit_index}") for bit_index in range(4)]
 
-        for bit_index in range(4):
-            pin = self.pins.get(f"{self.component_id}.pin{bit_index}")
+        # Drive the nibble as one word through the VnetManager bus API
+        drive_pins = getattr(vnet_manager, 'drive_pins', None)
+        if callable(drive_pins):
+            return drive_pins(pins, value)
+
+        changed_any = False
+        for bit_index, pin in enumerate(pins):
             if not pin:
                 continue
 
@@ -32,8 +32,12 @@ class Bridge:
         vnet_id1: ID of first connected VNET
         vnet_id2: ID of second connected VNET
         owner_component_id: ID of component that owns this bridge
+        enabled: Whether the bridge conducts (preallocated relay contact
+                 bridges are switched by toggling this flag)
     """
     
+    __slots__ = ('bridge_id', 'vnet_id1', 'vnet_id2', 'owner_component_id', 'enabled')
+    
     def __init__(
         self,
         vnet_id1: str,
@@ -60,6 +64,7 @@ class Bridge:
         self.vnet_id1 = vnet_id1
         self.vnet_id2 = vnet_id2
         self.owner_component_id = owner_component_id
+        self.enabled = True
     
     def get_connected_vnets(self) -> tuple[str, str]:
         """
@@ -5,6 +5,7 @@ Document class - Represents a complete .rsim file with multiple pages.
 from typing import Dict, List, Optional
 from core.page import Page
 from core.id_manager import IDManager
+from core.incremental_vnet_builder import IncrementalVnetBuilder
 
 
 class Document:
@@ -27,6 +28,9 @@ class Document:
         # get_all_pages() and serialization order.
         self.page_order: List[str] = []
         self.id_manager = IDManager()
+        # Nets kept up to date from the pages' edit journals; a simulation
+        # start only re-unions the nets touched since the last one
+        self.vnet_builder = IncrementalVnetBuilder(self.id_manager)
     
     # === Page Management ===
     
@@ -0,0 +1,364 @@
+"""
+Incremental VNET Builder for Relay Logic Simulator
+
+Keeps each page's nets up to date from the edits journaled by the page
+(Page.connectivity_changes), re-unioning only the nets an edit touched, so
+unchanged nets keep their VNET IDs and a simulation start or a net query
+on an unedited page costs nothing beyond creating its VNET objects.
+"""
+
+from typing import Dict, Iterable, List, Set, Optional, Tuple
+from core.vnet import VNET
+from core.page import Page
+from core.wire import Wire
+from core.id_manager import IDManager
+from core.vnet_builder import VnetBuilder, _UnionFind
+
+
+# Scan item key: ('pin', pin_id) or ('wire', top-level wire_id)
+_ItemKey = Tuple[str, str]
+
+
+class _PageNets:
+    """Nets of one page as of the last IncrementalVnetBuilder update."""
+    
+    __slots__ = ('items', 'net_of', 'nets', 'net_items', 'tab_nets', 'component_items', 'links')
+    
+    def __init__(self):
+        # Item -> node IDs it connects (pin tabs, or wire tree endpoints)
+        self.items: Dict[_ItemKey, Tuple[str, ...]] = {}
+        # Node ID -> net ID
+        self.net_of: Dict[str, str] = {}
+        # Net ID -> node IDs
+        self.nets: Dict[str, List[str]] = {}
+        # Net ID -> items whose nodes are in the net
+        self.net_items: Dict[str, List[_ItemKey]] = {}
+        # Nets containing a component tab (the ones that become VNETs)
+        self.tab_nets: Set[str] = set()
+        # Component ID -> its pin items
+        self.component_items: Dict[str, List[_ItemKey]] = {}
+        # Component ID -> (link_name, [tab_ids]) entries (linked components only)
+        self.links: Dict[str, List[Tuple[str, List[str]]]] = {}
+
+
+class IncrementalVnetBuilder(VnetBuilder):
+    """
+    VNET builder that keeps each page's nets up to date as it is edited.
+    
+    A page is split into items: the tabs of each pin and the endpoints of
+    each top-level wire tree. The first build of a page scans all of them.
+    After that, Page.add/remove_component, add/remove_wire and the
+    mark_*_changed() calls of editing code journal the edited items in
+    page.connectivity_changes, and each build rescans only those. Nets
+    touching an added, removed or changed item are dissolved and
+    re-unioned; every other net is reused with its VNET ID. A page without
+    edits costs nothing beyond creating its VNET objects.
+    
+    The link entries of each component are kept alongside, so link
+    resolution (get_link_map()) does not rescan the document either.
+    
+    A Document owns one (Document.vnet_builder). Only that builder may
+    consume its pages' journals.
+    """
+    
+    def __init__(self, id_manager: Optional[IDManager] = None):
+        """
+        Initialize incremental VNET builder.
+        
+        Args:
+            id_manager: Optional ID manager for generating VNET IDs
+        """
+        super().__init__(id_manager)
+        self._pages: Dict[str, _PageNets] = {}
+        
+        # Nets rebuilt and reused by the last update
+        self.last_rebuilt_nets = 0
+        self.last_reused_nets = 0
+    
+    def build_vnets_for_page(self, page: Page) -> List[VNET]:
+        """
+        Build all VNETs for a page, reusing nets unaffected by edits.
+        
+        Returns fresh VNET objects (with no simulation state) on every call.
+        
+        Args:
+            page: Page to build VNETs for
+            
+        Returns:
+            List of all VNETs on the page
+        """
+        state = self.update_page(page)
+        vnets: List[VNET] = []
+        for net_id, nodes in state.nets.items():
+            if net_id in state.tab_nets:
+                vnet = VNET(net_id, page.page_id)
+                vnet.tab_ids = set(nodes)
+                vnets.append(vnet)
+        return vnets
+    
+    def get_net_tabs(self, page: Page, tab_id: str) -> Set[str]:
+        """
+        Get the tab and junction IDs connected to a tab (e.g. to highlight a net).
+        
+        Cheap in design mode: only edits since the last query are applied.
+        
+        Args:
+            page: Page containing the tab
+            tab_id: Tab ID
+            
+        Returns:
+            Set of connected IDs (empty if the tab is not on the page)
+        """
+        state = self.update_page(page)
+        net_id = state.net_of.get(tab_id)
+        return set(state.nets[net_id]) if net_id is not None else set()
+    
+    def get_link_map(self, pages: Iterable[Page]) -> Dict[str, List[Tuple[str, str, List[str]]]]:
+        """
+        Get the link name → components map of pages (see LinkResolver).
+        
+        Args:
+            pages: Pages to include (brought up to date first)
+            
+        Returns:
+            Dict mapping link_name -> list of (component_id, page_id, [tab_ids])
+        """
+        link_map: Dict[str, List[Tuple[str, str, List[str]]]] = {}
+        for page in pages:
+            state = self.update_page(page)
+            page_id = page.page_id
+            for component_id, entries in state.links.items():
+                for link_name, tab_ids in entries:
+                    link_map.setdefault(link_name, []).append((component_id, page_id, tab_ids))
+        return link_map
+    
+    def forget_pages(self, page_ids: Iterable[str]):
+        """
+        Drop cached nets of pages not in page_ids (e.g. deleted pages).
+        
+        Args:
+            page_ids: IDs of the pages to keep
+        """
+        keep = set(page_ids)
+        for page_id in [p for p in self._pages if p not in keep]:
+            for net_id in self._pages.pop(page_id).nets:
+                self.id_manager.release_id(net_id)
+    
+    def update_page(self, page: Page) -> _PageNets:
+        """
+        Bring a page's nets up to date with its edits.
+        
+        Applies the edits journaled since the last update, or scans the
+        whole page the first time (and whenever page.connectivity_changes
+        is None).
+        
+        Args:
+            page: Page to update
+            
+        Returns:
+            Updated per-page net state
+        """
+        state = self._pages.get(page.page_id)
+        changes = page.connectivity_changes
+        if state is None or changes is None:
+            if state is None:
+                state = self._pages[page.page_id] = _PageNets()
+            changed = self._scan_page(page, state)
+        elif changes:
+            changed = self._scan_changes(page, state, changes)
+        else:
+            changed = {}
+        page.connectivity_changes = set()
+        
+        self._apply_changes(state, changed)
+        return state
+    
+    def _scan_page(self, page: Page, state: _PageNets) -> Dict[_ItemKey, Optional[Tuple[str, ...]]]:
+        """
+        Scan a whole page and diff it with the items of the last update.
+        
+        Returns:
+            Changed items: item key -> new node IDs (None = removed)
+        """
+        items: Dict[_ItemKey, Tuple[str, ...]] = {}
+        state.component_items.clear()
+        state.links.clear()
+        for component in page.get_all_components():
+            self._scan_component(component, state, items)
+        
+        # One item per top-level wire and its junction subtree, so each can
+        # be rescanned on its own when edited
+        for wire in page.get_all_wires():
+            endpoints = self._scan_wire(wire)
+            if endpoints:
+                items[('wire', wire.wire_id)] = endpoints
+        
+        old = state.items
+        changed: Dict[_ItemKey, Optional[Tuple[str, ...]]] = {
+            key: None for key in old if key not in items
+        }
+        for key, nodes in items.items():
+            if old.get(key) != nodes:
+                changed[key] = nodes
+        return changed
+    
+    def _scan_changes(
+        self,
+        page: Page,
+        state: _PageNets,
+        changes: Set[Tuple[str, str]]
+    ) -> Dict[_ItemKey, Optional[Tuple[str, ...]]]:
+        """
+        Rescan only the journaled components and wires of a page.
+        
+        Returns:
+            Changed items: item key -> new node IDs (None = removed)
+        """
+        changed: Dict[_ItemKey, Optional[Tuple[str, ...]]] = {}
+        for kind, item_id in changes:
+            if kind == 'component':
+                for key in state.component_items.pop(item_id, ()):
+                    changed[key] = None
+                state.links.pop(item_id, None)
+                component = page.components.get(item_id)
+                if component is not None:
+                    self._scan_component(component, state, changed)
+            else:
+                wire = page.wires.get(item_id)
+                endpoints = self._scan_wire(wire) if wire is not None else ()
+                changed[('wire', item_id)] = endpoints or None
+        return changed
+    
+    @staticmethod
+    def _scan_component(component, state: _PageNets, items: Dict[_ItemKey, Optional[Tuple[str, ...]]]):
+        """Add a component's pin items to items and record its items and links."""
+        from core.link_resolver import LinkResolver
+        
+        keys: List[_ItemKey] = []
+        for pin in component.get_all_pins().values():
+            if pin.tabs:
+                key = ('pin', pin.pin_id)
+                items[key] = tuple(pin.tabs)
+                keys.append(key)
+        state.component_items[component.component_id] = keys
+        
+        entries = LinkResolver.component_link_entries(component)
+        if entries:
+            state.links[component.component_id] = entries
+    
+    @staticmethod
+    def _scan_wire(wire: Wire) -> Tuple[str, ...]:
+        """Endpoints of a wire and every wire in its junction subtree."""
+        if not wire.junctions:
+            # Plain wire (the common case): no subtree to walk
+            start, end = wire.start_tab_id, wire.end_tab_id
+            if start and end:
+                return (start, end)
+            return (start or end,) if (start or end) else ()
+        endpoints: List[str] = []
+        visited: Set[str] = set()
+        to_process: List[Wire] = [wire]
+        while to_process:
+            current = to_process.pop()
+            if current.wire_id in visited:
+                continue
+            visited.add(current.wire_id)
+            if current.start_tab_id:
+                endpoints.append(current.start_tab_id)
+            if current.end_tab_id:
+                endpoints.append(current.end_tab_id)
+            for junction in current.junctions.values():
+                to_process.extend(junction.child_wires.values())
+        return tuple(endpoints)
+    
+    def _apply_changes(self, state: _PageNets, changed: Dict[_ItemKey, Optional[Tuple[str, ...]]]):
+        """
+        Re-union the nets touched by changed items; reuse all others.
+        
+        Args:
+            state: Per-page net state to update
+            changed: Item key -> new node IDs (None = removed)
+        """
+        items = state.items
+        net_of = state.net_of
+        
+        # Nets touching removed or changed items, and nets the new items join
+        dirty: Set[str] = set()
+        work: List[_ItemKey] = []
+        for key, nodes in changed.items():
+            old = items.get(key)
+            if old == nodes:
+                continue
+            if old is not None:
+                dirty.add(net_of[old[0]])
+            if nodes is None:
+                del items[key]
+                continue
+            items[key] = nodes
+            work.append(key)
+            for node in nodes:
+                net_id = net_of.get(node)
+                if net_id is not None:
+                    dirty.add(net_id)
+        
+        if not work and not dirty:
+            self.last_rebuilt_nets = 0
+            self.last_reused_nets = len(state.nets)
+            return
+        
+        # Dissolve them, keeping their unchanged items for the re-union
+        in_work = set(work)
+        previous: Dict[str, str] = {}
+        for net_id in dirty:
+            for node in state.nets.pop(net_id):
+                previous[node] = net_of.pop(node)
+            for key in state.net_items.pop(net_id):
+                if key in items and key not in in_work:
+                    in_work.add(key)
+                    work.append(key)
+            state.tab_nets.discard(net_id)
+        
+        # Re-union the affected items only
+        sets = _UnionFind()
+        union = sets.union
+        for key in work:
+            nodes = items[key]
+            first = nodes[0]
+            sets.add(first)
+            for node in nodes[1:]:
+                union(first, node)
+        
+        members: Dict[str, List[str]] = {}
+        find = sets.find
+        for node in sets.parent:
+            members.setdefault(find(node), []).append(node)
+        member_items: Dict[str, List[_ItemKey]] = {}
+        for key in work:
+            member_items.setdefault(find(items[key][0]), []).append(key)
+        
+        # New nets take over the ID of a dissolved net they overlap
+        unclaimed = set(dirty)
+        for root, nodes in members.items():
+            net_id = None
+            for node in nodes:
+                candidate = previous.get(node)
+                if candidate in unclaimed:
+                    net_id = candidate
+                    unclaimed.discard(candidate)
+                    break
+            if net_id is None:
+                net_id = self.id_manager.generate_id()
+            
+            state.nets[net_id] = nodes
+            keys = member_items[root]
+            state.net_items[net_id] = keys
+            for node in nodes:
+                net_of[node] = net_id
+            if any(kind == 'pin' for kind, _ in keys):
+                state.tab_nets.add(net_id)
+        
+        for net_id in unclaimed:
+            self.id_manager.release_id(net_id)
+        
+        self.last_rebuilt_nets = len(members)
+        self.last_reused_nets = len(state.nets) - len(members)
@@ -12,9 +12,13 @@ using component link names. The algorithm:
 
 Link names enable cross-page connections by allowing VNETs on different pages
 to be electrically connected without physical wires.
+
+Linked tabs are looked up in a tab → VNET index (built once, ideally while
+the VNETs are built), so resolution is O(linked tabs) rather than scanning
+every VNET for every link name.
 """
 
-from typing import Dict, List, Set, Optional, Tuple
+from typing import Dict, Iterable, List, Set, Optional, Tuple
 from collections import defaultdict
 from core.vnet import VNET
 from core.document import Document
@@ -69,10 +73,29 @@ class LinkResolver:
     This enables cross-page electrical connections without physical wires.
     """
     
+    @staticmethod
+    def build_tab_index(vnets: Iterable[VNET]) -> Dict[str, VNET]:
+        """
+        Build a tab ID → VNET index.
+        
+        Args:
+            vnets: VNETs to index (not yet shared with a running simulation)
+            
+        Returns:
+            Dict mapping every tab ID in the VNETs to its VNET
+        """
+        tab_index: Dict[str, VNET] = {}
+        for vnet in vnets:
+            for tab_id in vnet.tab_ids:
+                tab_index[tab_id] = vnet
+        return tab_index
+    
     def resolve_links(
         self,
         document: Document,
-        vnets: List[VNET]
+        vnets: List[VNET],
+        tab_index: Optional[Dict[str, VNET]] = None,
+        link_map: Optional[Dict[str, List[Tuple[str, str, List[str]]]]] = None
     ) -> LinkResolutionResult:
         """
         Resolve all link names in the document.
@@ -87,6 +110,10 @@ class LinkResolver:
         Args:
             document: Document containing components
             vnets: List of all VNETs (from all pages)
+            tab_index: Optional tab ID → VNET index of those VNETs
+                       (built from vnets if not given)
+            link_map: Optional link name → components map (e.g. kept by
+                      the document's VNET builder; scanned if not given)
             
         Returns:
             LinkResolutionResult with statistics and validation info
@@ -94,14 +121,17 @@ class LinkResolver:
         result = LinkResolutionResult()
         
         # Step 1: Build link name → components map
-        link_map = self._build_link_map(document)
+        if link_map is None:
+            link_map = self._build_link_map(document)
         result.total_links = len(link_map)
         
         if result.total_links == 0:
             return result  # No links to resolve
         
         # Step 2: For each link name, find all VNETs containing linked component tabs
-        link_to_vnets = self._map_links_to_vnets(link_map, vnets)
+        if tab_index is None:
+            tab_index = self.build_tab_index(vnets)
+        link_to_vnets = self._map_links_to_vnets(link_map, tab_index)
         
         # Step 3: Add link names to VNETs
         self._add_links_to_vnets(link_map, link_to_vnets, result)
@@ -126,91 +156,102 @@ class LinkResolver:
         # Scan all components in all pages
         for page in document.get_all_pages():
             for component in page.get_all_components():
-                # Support components that provide per-pin link mappings.
-                # Example: BUS returns {'Bus_0': ['comp.pin0.tab'], 'Bus_1': [...], ...}
-                get_link_mappings = getattr(component, 'get_link_mappings', None)
-                if callable(get_link_mappings):
-                    try:
-                        mappings = get_link_mappings()
-                    except Exception:
-                        mappings = None
+                for link_name, tab_ids in self.component_link_entries(component):
+                    link_map[link_name].append((component.component_id, page.page_id, tab_ids))
+        
+        return link_map
+    
+    @staticmethod
+    def component_link_entries(component) -> List[Tuple[str, List[str]]]:
+        """
+        Get the link names of one component and the tabs each one covers.
+        
+        Covers per-pin link mappings (e.g. BUS returns {'Bus_0':
+        ['comp.pin0.tab'], ...}) and the component's own link name, which
+        covers all of its tabs.
+        
+        Args:
+            component: Component to inspect
+            
+        Returns:
+            List of (link_name, [tab_ids]), empty if the component has no links
+        """
+        entries: List[Tuple[str, List[str]]] = []
+        
+        # Support components that provide per-pin link mappings.
+        get_link_mappings = getattr(component, 'get_link_mappings', None)
+        if callable(get_link_mappings):
+            try:
+                mappings = get_link_mappings()
+            except Exception:
+                mappings = None
 
-                    if isinstance(mappings, dict):
-                        for link_name, tab_ids in mappings.items():
-                            if isinstance(link_name, str):
-                                link_name = link_name.strip()
-                            else:
-                                continue
+            if isinstance(mappings, dict):
+                for link_name, tab_ids in mappings.items():
+                    if isinstance(link_name, str):
+                        link_name = link_name.strip()
+                    else:
+                        continue
 
-                            if not link_name:
-                                continue
+                    if not link_name:
+                        continue
 
-                            if isinstance(tab_ids, (tuple, set)):
-                                tab_ids = list(tab_ids)
+                    if isinstance(tab_ids, (tuple, set)):
+                        tab_ids = list(tab_ids)
 
-                            if not isinstance(tab_ids, list):
-                                continue
+                    if not isinstance(tab_ids, list):
+                        continue
 
-                            cleaned_tab_ids: List[str] = []
-                            for tab_id in tab_ids:
-                                if isinstance(tab_id, str):
-                                    tab_id = tab_id.strip()
-                                if tab_id:
-                                    cleaned_tab_ids.append(tab_id)
+                    cleaned_tab_ids: List[str] = []
+                    for tab_id in tab_ids:
+                        if isinstance(tab_id, str):
+                            tab_id = tab_id.strip()
+                        if tab_id:
+                            cleaned_tab_ids.append(tab_id)
 
-                            if cleaned_tab_ids:
-                                link_map[link_name].append((component.component_id, page.page_id, cleaned_tab_ids))
+                    if cleaned_tab_ids:
+                        entries.append((link_name, cleaned_tab_ids))
 
-                # Check if component has a link name
-                link_name = getattr(component, 'link_name', None)
-                if isinstance(link_name, str):
-                    link_name = link_name.strip()
-                if link_name:
-                    
-                    # Collect all tab IDs from this component
-                    tab_ids = []
-                    for pin in component.get_all_pins().values():
-                        for tab in pin.tabs.values():
-                            tab_ids.append(tab.tab_id)
-                    
-                    # Add to link map
-                    link_map[link_name].append((component.component_id, page.page_id, tab_ids))
+        # Check if component has a link name
+        link_name = getattr(component, 'link_name', None)
+        if isinstance(link_name, str):
+            link_name = link_name.strip()
+        if link_name:
+            # Collect all tab IDs from this component
+            tab_ids = []
+            for pin in component.get_all_pins().values():
+                for tab in pin.tabs.values():
+                    tab_ids.append(tab.tab_id)
+            entries.append((link_name, tab_ids))
         
-        return link_map
+        return entries
     
     def _map_links_to_vnets(
         self,
         link_map: Dict[str, List[Tuple[str, str, List[str]]]],
-        vnets: List[VNET]
+        tab_index: Dict[str, VNET]
     ) -> Dict[str, Set[VNET]]:
         """
         Map link names to VNETs containing linked component tabs.
         
-        For each link name, finds all VNETs that contain tabs from
+        For each link name, looks up the VNET of every tab from
         components with that link name.
         
         Args:
             link_map: Map of link_name -> component info
-            vnets: List of all VNETs
+            tab_index: Tab ID → VNET index
             
         Returns:
-            Dict mapping link_name -> set of VNETs
+            Dict mapping link_name -> set of VNETs (only links with VNETs)
         """
         link_to_vnets: Dict[str, Set[VNET]] = defaultdict(set)
         
-        # For each link name
         for link_name, component_infos in link_map.items():
-            # Collect all tab IDs for this link
-            all_linked_tabs = set()
             for comp_id, page_id, tab_ids in component_infos:
-                all_linked_tabs.update(tab_ids)
-            
-            # Find VNETs containing any of these tabs
-            for vnet in vnets:
-                for tab_id in all_linked_tabs:
-                    if vnet.has_tab(tab_id):
+                for tab_id in tab_ids:
+                    vnet = tab_index.get(tab_id)
+                    if vnet is not None:
                         link_to_vnets[link_name].add(vnet)
-                        break  # Found this VNET, move to next
         
         return link_to_vnets
     
@@ -319,52 +360,86 @@ class LinkValidator:
         return []
     
     @staticmethod
-    def find_unconnected_links(document: Document, vnets: List[VNET]) -> List[str]:
+    def find_unconnected_links(
+        document: Document,
+        vnets: List[VNET],
+        tab_index: Optional[Dict[str, VNET]] = None
+    ) -> List[str]:
         """
         Find link names that don't connect to any VNETs.
         
         Args:
             document: Document containing components
             vnets: List of all VNETs
+            tab_index: Optional tab ID → VNET index (built from vnets if not given)
             
         Returns:
             List of link names with no VNET connections
         """
         resolver = LinkResolver()
         link_map = resolver._build_link_map(document)
-        link_to_vnets = resolver._map_links_to_vnets(link_map, vnets)
+        if tab_index is None:
+            tab_index = resolver.build_tab_index(vnets)
+        link_to_vnets = resolver._map_links_to_vnets(link_map, tab_index)
         
-        unconnected = []
         # Check all links from link_map
-        for link_name in link_map.keys():
-            vnet_set = link_to_vnets.get(link_name, set())
-            if len(vnet_set) == 0:
-                unconnected.append(link_name)
-        
-        return unconnected
+        return [link_name for link_name in link_map if link_name not in link_to_vnets]
     
     @staticmethod
-    def get_link_statistics(document: Document) -> Dict[str, int]:
+    def get_link_statistics(
+        document: Document,
+        vnets: Optional[List[VNET]] = None,
+        tab_index: Optional[Dict[str, VNET]] = None
+    ) -> Dict[str, int]:
         """
         Get statistics about link names in document.
         
+        total_components_with_links, unique_link_names and link_usage count
+        component link names. The mapped_* keys also include per-pin link
+        mappings (BUS, Memory, Thumbwheel), as used for link resolution.
+        Given VNETs or their tab index, also counts how many of those link
+        names connect to a VNET.
+        
         Args:
             document: Document to analyze
+            vnets: Optional list of all VNETs
+            tab_index: Optional tab ID → VNET index (built from vnets if not given)
             
         Returns:
             Dict with statistics (total_components_with_links, unique_link_names, etc.)
         """
-        link_map: Dict[str, int] = defaultdict(int)
+        link_names: Dict[str, int] = defaultdict(int)
         total_components = 0
-        
         for page in document.get_all_pages():
             for component in page.get_all_components():
                 if component.link_name:
                     total_components += 1
-                    link_map[component.link_name] += 1
+                    link_names[component.link_name] += 1
+        
+        resolver = LinkResolver()
+        link_map = resolver._build_link_map(document)
         
-        return {
+        mapped_components: Set[str] = set()
+        mapped_usage: Dict[str, int] = {}
+        for link_name, component_infos in link_map.items():
+            mapped_usage[link_name] = len(component_infos)
+            for comp_id, page_id, tab_ids in component_infos:
+                mapped_components.add(comp_id)
+        
+        stats = {
             'total_components_with_links': total_components,
-            'unique_link_names': len(link_map),
-            'link_usage': dict(link_map)
+            'unique_link_names': len(link_names),
+            'link_usage': dict(link_names),
+            'total_components_with_mapped_links': len(mapped_components),
+            'unique_mapped_link_names': len(link_map),
+            'mapped_link_usage': mapped_usage
         }
+        
+        if tab_index is None and vnets is not None:
+            tab_index = resolver.build_tab_index(vnets)
+        if tab_index is not None:
+            link_to_vnets = resolver._map_links_to_vnets(link_map, tab_index)
+            stats['connected_link_names'] = len(link_to_vnets)
+            stats['unconnected_link_names'] = len(link_map) - len(link_to_vnets)
+        
+        return stats
@@ -0,0 +1,29 @@
+"""
+Locking helpers for single-writer simulation
+
+While a simulation engine owns its objects (one thread mutates them under
+the engine's coarse run lock), per-object locks only add overhead. Objects
+that support single-writer mode swap their lock for NULL_LOCK, which has
+the same interface as an RLock but does nothing.
+"""
+
+
+class NullLock:
+    """Lock stand-in that never blocks (context manager and acquire/release)."""
+
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        return False
+
+    def acquire(self, blocking: bool = True, timeout: float = -1) -> bool:
+        return True
+
+    def release(self):
+        pass
+
+
+NULL_LOCK = NullLock()
@@ -1,9 +1,13 @@
 """
 Page class - Represents a single page in a document.
 Contains components and wires.
+
+Edits that change connectivity (components and wires added, removed or
+changed in place) are journaled in connectivity_changes, so the document's
+VNET builder only recomputes the nets those items touch.
 """
 
-from typing import Dict, List, Optional, TYPE_CHECKING
+from typing import Dict, List, Optional, Set, Tuple, TYPE_CHECKING
 
 if TYPE_CHECKING:
     from components.base import Component
@@ -33,6 +37,40 @@ class Page:
         self.canvas_x: float = 0.0
         self.canvas_y: float = 0.0
         self.canvas_zoom: float = 1.0
+        
+        # Connectivity edits since the document's VNET builder last caught
+        # up: ('component', id) or ('wire', id). None until that builder
+        # first scans the page (nothing is journaled before then).
+        self.connectivity_changes: Optional[Set[Tuple[str, str]]] = None
+    
+    # === Connectivity Journal ===
+    
+    def mark_component_changed(self, component_id: str):
+        """
+        Record that a component's pins, tabs or link names may have changed.
+        
+        Called by add/remove_component, and by editing code after changing
+        a component in place (e.g. a property that rebuilds its pins).
+        
+        Args:
+            component_id: Component ID
+        """
+        if self.connectivity_changes is not None:
+            self.connectivity_changes.add(('component', component_id))
+    
+    def mark_wire_changed(self, wire_id: str):
+        """
+        Record that a wire's endpoints may have changed.
+        
+        Called by add/remove_wire, and by editing code after retargeting a
+        wire end in place. Moving waypoints or junctions does not change
+        connectivity and needs no call.
+        
+        Args:
+            wire_id: ID of the wire in page.wires
+        """
+        if self.connectivity_changes is not None:
+            self.connectivity_changes.add(('wire', wire_id))
     
     # === Component Management ===
     
@@ -44,6 +82,7 @@ class Page:
             component: Component instance
         """
         self.components[component.component_id] = component
+        self.mark_component_changed(component.component_id)
     
     def remove_component(self, component_id: str) -> Optional['Component']:
         """
@@ -55,6 +94,7 @@ class Page:
         Returns:
             Component: Removed component or None
         """
+        self.mark_component_changed(component_id)
         return self.components.pop(component_id, None)
     
     def get_component(self, component_id: str) -> Optional['Component']:
@@ -87,8 +127,8 @@ class Page:
         Args:
             wire: Wire instance
         """
-        # Wire class to be implemented later
         self.wires[wire.wire_id] = wire
+        self.mark_wire_changed(wire.wire_id)
     
     def remove_wire(self, wire_id: str):
         """
@@ -100,6 +140,7 @@ class Page:
         Returns:
             Wire: Removed wire or None
         """
+        self.mark_wire_changed(wire_id)
         return self.wires.pop(wire_id, None)
     
     def get_wire(self, wire_id: str):
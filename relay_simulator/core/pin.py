@@ -19,8 +19,12 @@ class Pin:
     - Any tab goes HIGH → Pin goes HIGH → All tabs go HIGH
     - Pin goes HIGH → All tabs go HIGH
     - State is read from PIN, not individual tabs
+    
+    Uses __slots__ (one pin per component terminal, many per document).
     """
     
+    __slots__ = ('pin_id', 'parent_component', 'tabs', '_state')
+    
     def __init__(self, pin_id: str, parent_component: 'Component'):
         """
         Initialize pin.
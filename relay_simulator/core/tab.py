@@ -17,8 +17,12 @@ class Tab:
     
     Example: An indicator has 4 tabs at different positions (12, 3, 6, 9 o'clock)
     all connected to the same pin.
+    
+    Uses __slots__: documents contain tens of thousands of tabs.
     """
     
+    __slots__ = ('tab_id', 'parent_pin', 'relative_position', '_state')
+    
     def __init__(self, tab_id: str, parent_pin: 'Pin', relative_position: Tuple[float, float]):
         """
         Initialize tab.
@@ -11,11 +11,25 @@ VNETs handle:
 - Bridge connections for advanced routing
 - Dirty flag optimization for simulation
 - Thread-safe state updates
+
+Large documents hold tens of thousands of VNETs, so the class is compact:
+attributes live in __slots__, link and bridge sets are only allocated when
+the first one is added, and VNETs share a small pool of striped locks
+instead of owning an RLock each. No VNET method holds its lock while
+taking another VNET's lock, so two VNETs sharing a stripe cannot deadlock.
 """
 
 import threading
-from typing import Set, Optional, List
+from typing import AbstractSet, Iterable, Set, Optional, List
 from core.state import PinState, combine_states
+from core.locking import NULL_LOCK
+
+
+# Shared by all VNETs, selected by hash of the VNET ID (see module docstring)
+_LOCK_STRIPES = tuple(threading.RLock() for _ in range(64))
+
+# Returned for VNETs without links/bridges (read-only, never allocated per VNET)
+_EMPTY: AbstractSet[str] = frozenset()
 
 
 class VNET:
@@ -30,12 +44,19 @@ class VNET:
         vnet_id: Unique 8-character identifier
         tab_ids: Set of tab IDs in this network
         link_names: Set of link names for cross-page connections
+                    (read-only view; use add_link/remove_link)
         bridge_ids: Set of bridge IDs for advanced routing
+                    (read-only view; use add_bridge/remove_bridge)
         state: Current electrical state (HIGH or FLOAT)
         dirty: Flag indicating state needs re-evaluation
         page_id: Page ID for single-page VNETs (None for cross-page)
     """
     
+    __slots__ = (
+        'vnet_id', 'page_id', 'tab_ids', '_link_names', '_bridge_ids',
+        '_state', '_dirty', '_dirty_listener', '_lock'
+    )
+    
     def __init__(self, vnet_id: str, page_id: Optional[str] = None):
         """
         Initialize a VNET.
@@ -47,28 +68,54 @@ class VNET:
         self.vnet_id = vnet_id
         self.page_id = page_id
         
-        # Collections
+        # Collections (links and bridges allocated on first use)
         self.tab_ids: Set[str] = set()
-        self.link_names: Set[str] = set()
-        self.bridge_ids: Set[str] = set()
+        self._link_names: Optional[Set[str]] = None
+        self._bridge_ids: Optional[Set[str]] = None
         
         # State management
         self._state = PinState.FLOAT
         self._dirty = True  # Start dirty to force initial evaluation
         
-        # Thread safety
-        self._lock = threading.RLock()  # Reentrant lock for nested calls
+        # Called with this VNET when it goes from clean to dirty (see set_dirty_listener)
+        self._dirty_listener = None
+        
+        # Thread safety: shared reentrant lock stripe
+        self._lock = _LOCK_STRIPES[hash(vnet_id) % len(_LOCK_STRIPES)]
+    
+    @property
+    def link_names(self) -> AbstractSet[str]:
+        """Link names of this VNET (do not modify; use add_link/remove_link)."""
+        names = self._link_names
+        return names if names is not None else _EMPTY
+    
+    @link_names.setter
+    def link_names(self, names: Iterable[str]):
+        with self._lock:
+            self._link_names = set(names) or None
+    
+    @property
+    def bridge_ids(self) -> AbstractSet[str]:
+        """Bridge IDs of this VNET (do not modify; use add_bridge/remove_bridge)."""
+        ids = self._bridge_ids
+        return ids if ids is not None else _EMPTY
+    
+    @bridge_ids.setter
+    def bridge_ids(self, ids: Iterable[str]):
+        with self._lock:
+            self._bridge_ids = set(ids) or None
     
     @property
     def state(self) -> PinState:
         """
         Get current VNET state (thread-safe).
         
+        A single attribute read is atomic, so no lock is taken.
+        
         Returns:
             Current PinState (HIGH or FLOAT)
         """
-        with self._lock:
-            return self._state
+        return self._state
     
     @state.setter
     def state(self, value: PinState):
@@ -79,9 +126,54 @@ class VNET:
             value: New PinState value
         """
         with self._lock:
-            if self._state != value:
-                self._state = value
-                self._dirty = True
+            if self._state == value:
+                return
+            self._state = value
+            became_dirty = self._set_dirty_locked()
+        if became_dirty:
+            self._notify_dirty()
+    
+    def set_single_writer(self, enabled: bool):
+        """
+        Skip locking while a simulation engine owns this VNET.
+        
+        Only call while no other thread uses the VNET (the engine switches
+        it on at initialize and off at shutdown).
+        
+        Args:
+            enabled: True to use no lock, False to restore the shared lock
+        """
+        if enabled:
+            self._lock = NULL_LOCK
+        else:
+            self._lock = _LOCK_STRIPES[hash(self.vnet_id) % len(_LOCK_STRIPES)]
+    
+    def set_dirty_listener(self, listener):
+        """
+        Set the callback notified when this VNET becomes dirty.
+        
+        The listener is called with the VNET whenever the dirty flag goes from
+        clean to dirty (state change, bridge change or mark_dirty()). It is
+        called outside the VNET lock. Only one listener is kept; the
+        DirtyFlagManager tracking this VNET registers itself here.
+        
+        Args:
+            listener: Callable taking the VNET, or None to remove
+        """
+        with self._lock:
+            self._dirty_listener = listener
+    
+    def _set_dirty_locked(self) -> bool:
+        """Set the dirty flag (lock held). Returns True if it was clean."""
+        if self._dirty:
+            return False
+        self._dirty = True
+        return self._dirty_listener is not None
+    
+    def _notify_dirty(self):
+        listener = self._dirty_listener
+        if listener is not None:
+            listener(self)
     
     def add_tab(self, tab_id: str) -> bool:
         """
@@ -166,10 +258,12 @@ class VNET:
             True if link was added, False if already exists
         """
         with self._lock:
-            if link_name in self.link_names:
+            if self._link_names is None:
+                self._link_names = set()
+            elif link_name in self._link_names:
                 return False
             
-            self.link_names.add(link_name)
+            self._link_names.add(link_name)
             return True
     
     def remove_link(self, link_name: str) -> bool:
@@ -186,7 +280,9 @@ class VNET:
             if link_name not in self.link_names:
                 return False
             
-            self.link_names.remove(link_name)
+            self._link_names.remove(link_name)
+            if not self._link_names:
+                self._link_names = None
             return True
     
     def has_link(self, link_name: str) -> bool:
@@ -226,12 +322,16 @@ class VNET:
             True if bridge was added, False if already exists
         """
         with self._lock:
-            if bridge_id in self.bridge_ids:
+            if self._bridge_ids is None:
+                self._bridge_ids = set()
+            elif bridge_id in self._bridge_ids:
                 return False
             
-            self.bridge_ids.add(bridge_id)
-            self._dirty = True  # Mark dirty when bridge added
-            return True
+            self._bridge_ids.add(bridge_id)
+            became_dirty = self._set_dirty_locked()  # Mark dirty when bridge added
+        if became_dirty:
+            self._notify_dirty()
+        return True
     
     def remove_bridge(self, bridge_id: str) -> bool:
         """
@@ -250,9 +350,13 @@ class VNET:
             if bridge_id not in self.bridge_ids:
                 return False
             
-            self.bridge_ids.remove(bridge_id)
-            self._dirty = True  # Mark dirty when bridge removed
-            return True
+            self._bridge_ids.remove(bridge_id)
+            if not self._bridge_ids:
+                self._bridge_ids = None
+            became_dirty = self._set_dirty_locked()  # Mark dirty when bridge removed
+        if became_dirty:
+            self._notify_dirty()
+        return True
     
     def has_bridge(self, bridge_id: str) -> bool:
         """
@@ -310,7 +414,9 @@ class VNET:
         their state recalculated in the next simulation step.
         """
         with self._lock:
-            self._dirty = True
+            became_dirty = self._set_dirty_locked()
+        if became_dirty:
+            self._notify_dirty()
     
     def clear_dirty(self):
         """
@@ -328,8 +434,7 @@ class VNET:
         Returns:
             True if VNET needs re-evaluation
         """
-        with self._lock:
-            return self._dirty
+        return self._dirty
     
     def to_dict(self) -> dict:
         """
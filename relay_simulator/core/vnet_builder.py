@@ -1,29 +1,70 @@
 """
 VNET Builder for Relay Logic Simulator
 
-This module implements the graph traversal algorithm that builds VNETs (Virtual Networks)
+This module implements the connectivity algorithm that builds VNETs (Virtual Networks)
 from wire connections on a page. The algorithm:
 
 1. Identifies all tabs on components
-2. Traverses wire connections to group electrically connected tabs
+2. Unions the tabs of each pin, and the endpoints of each wire together
+   with its junction subtree, in a union-find over tab and junction IDs
 3. Handles junctions (wire branches) for complex networks
-4. Creates VNETs containing all connected tabs
+4. Creates one VNET per union-find set containing component tabs
 5. Handles disconnected tabs (single-tab VNETs)
 
-The builder uses a depth-first search approach to traverse wire connections
-and group all electrically connected tabs into VNETs.
+Building is O(tabs + wire endpoints) (near-linear union-find), instead of
+materializing every tab pair of a pin or wire tree, which made large bus
+nets quadratic in their number of taps.
+
+See core.incremental_vnet_builder for the builder a Document keeps up to
+date while it is edited.
 """
 
-from typing import Dict, List, Set, Optional
+from typing import Dict, Iterable, List, Set, Optional
 from core.vnet import VNET
 from core.page import Page
 from core.wire import Wire, Junction
 from core.id_manager import IDManager
 
 
+class _UnionFind:
+    """
+    Disjoint sets over string node IDs (path halving).
+    
+    Nodes are added on first use; a new node joins the other node's set
+    directly, which is the common case when wiring taps to a net.
+    """
+    
+    __slots__ = ('parent',)
+    
+    def __init__(self):
+        self.parent: Dict[str, str] = {}
+    
+    def add(self, node: str):
+        self.parent.setdefault(node, node)
+    
+    def find(self, node: str) -> str:
+        parent = self.parent
+        up = parent.setdefault(node, node)
+        while up != node:
+            grand = parent[up]
+            parent[node] = grand
+            node, up = grand, parent[grand]
+        return node
+    
+    def union(self, a: str, b: str):
+        root = self.find(a)
+        parent = self.parent
+        if b not in parent:
+            parent[b] = root
+            return
+        other = self.find(b)
+        if other != root:
+            parent[other] = root
+
+
 class VnetBuilder:
     """
-    Builds VNETs for a page by traversing wire connections.
+    Builds VNETs for a page from its wire connections.
     
     The VNET builder analyzes the wire topology on a page and groups
     electrically connected tabs into VNETs. It handles:
@@ -49,10 +90,13 @@ class VnetBuilder:
         
         This is the main entry point for VNET building. It:
         1. Collects all tabs from components on the page
-        2. Builds a wire connectivity map
-        3. Traverses connections to group tabs into VNETs
+        2. Unions pin tabs and wire endpoints into connected sets
+        3. Creates one VNET per set that contains a component tab
         4. Creates single-tab VNETs for disconnected tabs
         
+        Wire endpoints that are not component tabs (junction IDs used as
+        wire ends) stay members of their VNET, as before.
+        
         Args:
             page: Page to build VNETs for
             
@@ -62,24 +106,28 @@ class VnetBuilder:
         # Collect all tabs from all components
         all_tabs = self._collect_all_tabs(page)
         
-        # Build wire connectivity map
-        connectivity = self._build_connectivity_map(page)
+        # Union everything electrically connected
+        sets = self._build_connectivity_sets(page)
         
-        # Track processed tabs
-        processed_tabs: Set[str] = set()
+        # Group nodes by set root
+        parent = sets.parent
+        members: Dict[str, List[str]] = {}
+        for node in parent:
+            root = node
+            while parent[root] != root:
+                root = parent[root]
+            members.setdefault(root, []).append(node)
         
-        # Build VNETs
+        # Build one VNET per set containing a component tab
         vnets: List[VNET] = []
-        
-        # Process each unprocessed tab
+        created: Set[str] = set()
+        find = sets.find
         for tab_id in all_tabs:
-            if tab_id not in processed_tabs:
-                # Find all tabs connected to this tab
-                connected_tabs = self._find_connected_tabs(tab_id, connectivity, processed_tabs)
-                
-                # Create VNET with all connected tabs
-                vnet = self._create_vnet(page.page_id, connected_tabs)
-                vnets.append(vnet)
+            root = find(tab_id)
+            if root in created:
+                continue
+            created.add(root)
+            vnets.append(self._create_vnet(page.page_id, members.get(root, (tab_id,))))
         
         return vnets
     
@@ -104,170 +152,79 @@ class VnetBuilder:
         
         return all_tabs
     
-    def _build_connectivity_map(self, page: Page) -> Dict[str, Set[str]]:
+    def _build_connectivity_sets(self, page: Page) -> _UnionFind:
         """
-        Build a connectivity map from wires and pin connections.
-        
-        The connectivity map is a dictionary where:
-        - Key: tab_id
-        - Value: Set of tab_ids directly connected by wires OR same pin
+        Union electrically connected tab and junction IDs.
         
         This handles:
-        - Simple wires (start_tab → end_tab)
-        - Junctions (start_tab → multiple end_tabs)
-        - Nested junctions (recursive)
         - Tabs of the same pin (electrically connected)
+        - Simple wires (start_tab → end_tab)
+        - Junctions (start_tab → all child wire endpoints)
+        - Nested junctions
         
         Args:
-            page: Page containing wires
+            page: Page containing components and wires
             
         Returns:
-            Connectivity map (tab_id -> set of connected tab_ids)
+            Union-find over every pin tab and wire endpoint on the page
         """
-        connectivity: Dict[str, Set[str]] = {}
+        sets = _UnionFind()
         
-        # First, add implicit connections for tabs of the same pin
         # All tabs on the same pin are electrically connected
         for component in page.get_all_components():
             for pin in component.get_all_pins().values():
-                # Get all tab IDs for this pin
-                tab_ids = list(pin.tabs.keys())
-                
-                # Connect all tabs to each other (they're on the same pin)
-                for i, tab1 in enumerate(tab_ids):
-                    if tab1 not in connectivity:
-                        connectivity[tab1] = set()
-                    
-                    for j, tab2 in enumerate(tab_ids):
-                        if i != j:
-                            connectivity[tab1].add(tab2)
-        
-        # Create a global visited set to prevent infinite recursion across all wires
+                tab_ids = iter(pin.tabs)
+                first = next(tab_ids, None)
+                if first is None:
+                    continue
+                sets.add(first)
+                for tab_id in tab_ids:
+                    sets.union(first, tab_id)
+        
+        # Each wire visited once, even if reachable along several paths
         visited_wires: Set[str] = set()
-        
-        # Then, process all wires on the page
         for wire in page.get_all_wires():
-            self._add_wire_to_connectivity(wire, connectivity, visited_wires)
-        
-        return connectivity
-    
-    def _add_wire_to_connectivity(self, wire: Wire, connectivity: Dict[str, Set[str]], visited: Set[str]):
-        """
-        Add a wire's connections to the connectivity map.
-        
-        This recursively handles:
-        - Direct connections (start → end)
-        - Junctions (start → all child wire endpoints)
-        - Nested junctions
-        
-        Args:
-            wire: Wire to process
-            connectivity: Connectivity map to update
-            visited: Set of already-visited wire IDs (prevents infinite recursion)
-        """
-        # Get all tabs connected by this wire (including through junctions)
-        all_wire_tabs = self._get_all_wire_tabs(wire, visited)
+            self._union_wire_tree(wire, sets, visited_wires)
         
-        # Add bidirectional connections between all tabs
-        for tab1 in all_wire_tabs:
-            if tab1 not in connectivity:
-                connectivity[tab1] = set()
-            
-            for tab2 in all_wire_tabs:
-                if tab1 != tab2:
-                    connectivity[tab1].add(tab2)
+        return sets
     
-    def _get_all_wire_tabs(self, wire: Wire, visited: Set[str] = None) -> Set[str]:
+    def _union_wire_tree(self, wire: Wire, sets: _UnionFind, visited: Set[str]):
         """
-        Get all tab IDs connected by a wire, including through junctions.
+        Union a wire's endpoints with those of every wire in its junction subtree.
         
-        This recursively traverses junctions to find all connected tabs.
+        Iterative, so deeply nested junctions cannot exhaust the stack.
         
         Args:
-            wire: Wire to analyze
-            visited: Set of already-visited wire IDs to prevent infinite recursion
-            
-        Returns:
-            Set of all tab IDs connected by this wire
+            wire: Top-level wire to process
+            sets: Union-find to update
+            visited: Already-processed wire IDs (prevents cycles)
         """
-        if visited is None:
-            visited = set()
-        
-        # Prevent infinite recursion on circular wire paths
         if wire.wire_id in visited:
-            return set()
-        
-        visited.add(wire.wire_id)
-        
-        tabs: Set[str] = set()
-        
-        # Add start tab (could be tab_id or junction_id)
-        tabs.add(wire.start_tab_id)
-        
-        # Add end tab if present (could be tab_id or junction_id)
-        if wire.end_tab_id:
-            tabs.add(wire.end_tab_id)
-        
-        # Recursively add tabs from child wires in junctions
-        for junction in wire.get_all_junctions():
-            for child_wire in junction.get_all_child_wires():
-                tabs.update(self._get_all_wire_tabs(child_wire, visited))
-        
-        return tabs
-    
-    def _find_connected_tabs(
-        self,
-        start_tab_id: str,
-        connectivity: Dict[str, Set[str]],
-        processed_tabs: Set[str]
-    ) -> Set[str]:
-        """
-        Find all tabs connected to a starting tab using depth-first search.
-        
-        This performs a graph traversal to find all tabs that are electrically
-        connected through wires. It:
-        - Starts from start_tab_id
-        - Follows all wire connections
-        - Marks tabs as processed to avoid revisiting
-        - Handles circular paths without infinite loops
-        
-        Args:
-            start_tab_id: Tab to start search from
-            connectivity: Wire connectivity map
-            processed_tabs: Set to track processed tabs (modified in-place)
-            
-        Returns:
-            Set of all tabs connected to start_tab_id
-        """
-        connected: Set[str] = set()
-        to_process: List[str] = [start_tab_id]
+            return
+        anchor = wire.start_tab_id
+        union = sets.union
         
+        to_process: List[Wire] = [wire]
         while to_process:
-            current_tab = to_process.pop()
-            
-            # Skip if already processed
-            if current_tab in processed_tabs:
+            current = to_process.pop()
+            if current.wire_id in visited:
                 continue
+            visited.add(current.wire_id)
             
-            # Mark as processed and add to connected set
-            processed_tabs.add(current_tab)
-            connected.add(current_tab)
+            union(anchor, current.start_tab_id)
+            if current.end_tab_id:
+                union(anchor, current.end_tab_id)
             
-            # Add all connected tabs to the processing queue
-            if current_tab in connectivity:
-                for neighbor_tab in connectivity[current_tab]:
-                    if neighbor_tab not in processed_tabs:
-                        to_process.append(neighbor_tab)
-        
-        return connected
+            for junction in current.junctions.values():
+                to_process.extend(junction.child_wires.values())
     
-    def _create_vnet(self, page_id: str, tab_ids: Set[str]) -> VNET:
+    def _create_vnet(self, page_id: str, tab_ids: Iterable[str]) -> VNET:
         """
         Create a VNET with the given tab IDs.
         
         Args:
             page_id: Page ID for single-page VNETs
-            tab_ids: Set of tab IDs to include in VNET
+            tab_ids: Tab IDs to include in VNET
             
         Returns:
             New VNET instance
@@ -275,12 +232,9 @@ class VnetBuilder:
         # Generate VNET ID
         vnet_id = self.id_manager.generate_id()
         
-        # Create VNET
+        # Create VNET with all tabs (not yet shared, so no locking needed)
         vnet = VNET(vnet_id, page_id)
-        
-        # Add all tabs
-        for tab_id in tab_ids:
-            vnet.add_tab(tab_id)
+        vnet.tab_ids = set(tab_ids)
         
         return vnet
 
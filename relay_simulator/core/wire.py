@@ -18,6 +18,8 @@ class Waypoint:
     allowing wires to be drawn with specific paths rather than straight lines.
     """
     
+    __slots__ = ('waypoint_id', 'position')
+    
     def __init__(self, waypoint_id: str, position: Tuple[int, int]):
         """
         Initialize a Waypoint.
@@ -73,6 +75,8 @@ class Junction:
     into multiple paths. Each junction can have multiple child wires.
     """
     
+    __slots__ = ('junction_id', 'position', 'child_wires')
+    
     def __init__(self, junction_id: str, position: Tuple[int, int]):
         """
         Initialize a Junction.
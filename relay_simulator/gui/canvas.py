@@ -710,13 +710,13 @@ class DesignCanvas:
             
             # Get the tab connected to the wire
             if wire.start_tab_id:
-                tab = simulation_engine.tabs.get(wire.start_tab_id)
-                if tab:
-                    # Get the VNET containing this tab
-                    for vnet in simulation_engine.vnets.values():
-                        if wire.start_tab_id in vnet.tab_ids:
-                            is_high = vnet.state == PinState.HIGH
-                            return is_high
+                snapshot = self._get_simulation_snapshot(simulation_engine)
+                if snapshot is not None:
+                    return snapshot.is_tab_high(wire.start_tab_id)
+                # Get the VNET containing this tab
+                vnet = simulation_engine.vnet_manager.get_vnet_for_tab(wire.start_tab_id)
+                if vnet is not None:
+                    return vnet.state == PinState.HIGH
             return False
         except Exception as e:
             print(f"Error checking wire powered state: {e}")
@@ -798,6 +798,12 @@ class DesignCanvas:
             print(f"Error checking junction powered state: {e}")
             return False
     
+    @staticmethod
+    def _get_simulation_snapshot(simulation_engine):
+        """Published engine snapshot, or None for engines without one."""
+        get_snapshot = getattr(simulation_engine, 'get_snapshot', None)
+        return get_snapshot() if get_snapshot is not None else None
+    
     def _is_component_powered(self, component, simulation_engine) -> bool:
         """
         Check if a component is powered (has any HIGH pin).
@@ -810,14 +816,22 @@ class DesignCanvas:
             True if any pin is HIGH, False otherwise
         """
         try:
+            snapshot = self._get_simulation_snapshot(simulation_engine)
+            if snapshot is not None:
+                return any(
+                    snapshot.is_tab_high(tab_id)
+                    for pin in component.get_all_pins().values()
+                    for tab_id in pin.tabs
+                )
+            
             # Check all pins on the component
+            get_vnet_for_tab = simulation_engine.vnet_manager.get_vnet_for_tab
             for pin in component.get_all_pins().values():
-                for tab in pin.tabs.values():
+                for tab_id in pin.tabs:
                     # Get VNET for this tab
-                    for vnet in simulation_engine.vnets.values():
-                        if tab.tab_id in vnet.tab_ids:
-                            if vnet.state == PinState.HIGH:
-                                return True
+                    vnet = get_vnet_for_tab(tab_id)
+                    if vnet is not None and vnet.state == PinState.HIGH:
+                        return True
             return False
         except Exception as e:
             print(f"Error checking component powered state: {e}")
@@ -7,7 +7,7 @@ including initialization, lifecycle, and basic window operations.
 
 import tkinter as tk
 from tkinter import messagebox, filedialog
-from typing import Optional, Dict, Tuple, Any
+from typing import Optional, Dict, List, Tuple, Any
 from pathlib import Path
 import os
 import tempfile
@@ -33,7 +33,10 @@ from core.tab import Tab
 from core.bridge import Bridge
 from core.state import PinState
 from fileio.document_loader import DocumentLoader
-from simulation.simulation_engine import SimulationEngine
+from simulation.engine_factory import (
+    SimulationEngineFactory, EngineConfig, EngineMode, CalibrationCache, circuit_hash
+)
+from simulation.structure_builder import build_simulation_structures, build_detached_simulation_structures
 from components.base import Component
 from diagnostics import UiWatchdog, get_logger
 
@@ -89,7 +92,9 @@ class MainWindow:
         self._sim_run_lock = threading.Lock()
         self._sim_run_inflight = False
         self._sim_run_requested = False
+        self._sim_restart_pending = False  # Restart queued on the Tk thread
         self._sim_thread: Optional[threading.Thread] = None
+        self._calibration_thread: Optional[threading.Thread] = None  # Background engine calibration
         
         # Track wire info dialog
         self._wire_info_dialog = None
@@ -1174,14 +1179,31 @@ class MainWindow:
         
         # Create and initialize simulation engine
         try:
-            self.simulation_engine = SimulationEngine(
-                vnets=vnets,
-                tabs=tabs,
-                bridges=bridges,
-                components=components,
+            config = EngineConfig(
+                mode=self.settings.get_simulation_threading(),
                 max_iterations=10000,
                 timeout_seconds=30.0
             )
+            if config.mode == EngineMode.CALIBRATED:
+                # Use the cached calibration for this circuit and CPU count. On a
+                # miss start with the auto rule, and time the candidates in the
+                # background for the next start.
+                key = circuit_hash(vnets, tabs, bridges, components)
+                calibration = CalibrationCache().get(key, os.cpu_count() or 1)
+                if calibration is not None:
+                    config = calibration.apply(config)
+                    self._logger.info("Simulation engine: %s", calibration.describe())
+                else:
+                    config.mode = EngineMode.AUTO
+                    self._calibrate_engine_in_background(tab.document.to_dict(), key)
+            
+            self.simulation_engine = SimulationEngineFactory.create_engine(
+                vnets, tabs, bridges, components, config
+            )
+            self._logger.info(
+                "Simulation engine: %s for %d components",
+                type(self.simulation_engine).__name__, len(components)
+            )
             
             if not self.simulation_engine.initialize():
                 messagebox.showerror("Simulation Error", "Failed to initialize simulation")
@@ -1247,57 +1269,59 @@ class MainWindow:
         Returns:
             Tuple of (vnets, tabs, bridges, components) dictionaries
         """
-        vnets: Dict[str, VNET] = {}
-        tabs: Dict[str, Tab] = {}
-        bridges: Dict[str, Bridge] = {}
-        components: Dict[str, Component] = {}
+        # Shared with headless runners so both simulate the same netlist
+        return build_simulation_structures(document)
+    
+    def _calibrate_engine_in_background(self, document_data: dict, key: str) -> None:
+        """
+        Time the candidate engines for a circuit off the Tk thread.
         
-        # Collect all components from all pages
-        for page in document.get_all_pages():
-            for component in page.get_all_components():
-                components[component.component_id] = component
-                
-                # Collect all tabs from component pins and RESET THEIR STATE
-                # This ensures no state persists from previous simulation runs
-                for pin in component.get_all_pins().values():
-                    # Reset pin state to FLOAT
-                    pin._state = PinState.FLOAT
-                    for tab in pin.tabs.values():
-                        # Reset tab state to FLOAT
-                        tab._state = PinState.FLOAT
-                        tabs[tab.tab_id] = tab
-        
-        # Build VNETs for each page
-        vnet_builder = VnetBuilder(document.id_manager)
-        for page in document.get_all_pages():
-            page_vnets = vnet_builder.build_vnets_for_page(page)
-            for vnet in page_vnets:
-                vnets[vnet.vnet_id] = vnet
-
-        # Resolve cross-page links (adds link_names onto the appropriate VNETs)
-        try:
-            from core.link_resolver import LinkResolver
-            resolver = LinkResolver()
-            resolver.resolve_links(document, list(vnets.values()))
-        except Exception:
-            # Links are optional; continue without failing simulation build
-            pass
+        Candidates run on structures rebuilt from document_data, so the
+        document's own components are never started or settled. The result
+        goes to the calibration cache and is used from the next start.
         
-        # TODO: Build bridges for cross-page connections
-        # This would require scanning for components with matching link_names
-        # For Phase 15.2, we'll skip this (bridges remain empty for single-page circuits)
+        Args:
+            document_data: Serialized document (Document.to_dict())
+            key: circuit_hash() of the circuit
+        """
+        if self._calibration_thread is not None and self._calibration_thread.is_alive():
+            return
         
-        return vnets, tabs, bridges, components
+        def worker():
+            try:
+                calibration = SimulationEngineFactory.calibrate(
+                    lambda: build_detached_simulation_structures(document_data),
+                    circuit_key=key
+                )
+                self._logger.info("Engine calibration: %s", calibration.describe())
+            except Exception:
+                self._logger.exception("Engine calibration failed")
+        
+        self._calibration_thread = threading.Thread(
+            target=worker, name="EngineCalibration", daemon=True
+        )
+        self._calibration_thread.start()
     
     def _on_relay_timer_complete(self):
         """
         Callback when a relay timer completes and switches contacts.
         
-        This is called from the relay's timer thread, so we need to schedule
-        the simulation restart on the GUI thread.
+        This is called from the engine's real-time throttle thread, so we
+        need to schedule the simulation restart on the GUI thread. Batches
+        arriving before the queued restart runs share it.
         """
+        with self._sim_run_lock:
+            if self._sim_restart_pending:
+                return
+            self._sim_restart_pending = True
+        
+        def restart():
+            with self._sim_run_lock:
+                self._sim_restart_pending = False
+            self._run_simulation_step()
+        
         # Schedule simulation restart on GUI thread
-        self.root.after(10, self._run_simulation_step)
+        self.root.after(10, restart)
     
     def _run_simulation_step(self):
         """
@@ -1365,6 +1389,10 @@ class MainWindow:
             self.set_status("Simulation Error: no statistics")
             return
 
+        # Per-phase timings (only present while profiling is enabled, e.g. RSIM_PROFILE=1)
+        if getattr(stats, 'profile', None) is not None:
+            self._logger.info("Simulation run profile:\n%s", stats.profile.describe())
+
         # Update visual feedback (GUI thread)
         try:
             self._update_simulation_visuals()
@@ -1373,7 +1401,9 @@ class MainWindow:
 
         # Status
         try:
-            if getattr(stats, 'stable', False):
+            if getattr(stats, 'oscillation', None) is not None:
+                self.set_status(f"Simulation Oscillating - {stats.oscillation.describe()}")
+            elif getattr(stats, 'stable', False):
                 self.set_status(
                     f"Simulation Stable - {stats.iterations} iterations in {stats.time_to_stability:.3f}s"
                 )
@@ -1522,12 +1552,7 @@ class MainWindow:
             if changed and self.simulation_engine:
                 self.set_status("Thumbwheel updated")
 
-                clicked_component.simulate_logic(
-                    self.simulation_engine.vnet_manager,
-                    self.simulation_engine.bridge_manager
-                )
-
-                self.simulation_engine.dirty_manager.mark_all_dirty()
+                self._propagate_component_change(clicked_component)
                 self._update_simulation_visuals()
                 self.root.after(10, self._run_simulation_step)
 
@@ -1611,14 +1636,7 @@ class MainWindow:
                                     # Update display / propagate
                                     if self.simulation_mode and self.simulation_engine:
                                         try:
-                                            component.simulate_logic(
-                                                self.simulation_engine.vnet_manager,
-                                                self.simulation_engine.bridge_manager
-                                            )
-                                        except Exception:
-                                            pass
-                                        try:
-                                            self.simulation_engine.dirty_manager.mark_all_dirty()
+                                            self._propagate_component_change(component)
                                         except Exception:
                                             pass
                                         self._update_simulation_visuals()
@@ -1703,14 +1721,8 @@ class MainWindow:
                     self.set_status("Switch updated")
 
                 if self.simulation_engine:
-                    # Propagate switch output changes
-                    clicked_component.simulate_logic(
-                        self.simulation_engine.vnet_manager,
-                        self.simulation_engine.bridge_manager
-                    )
-
-                    # Force re-evaluation
-                    self.simulation_engine.dirty_manager.mark_all_dirty()
+                    # Propagate switch output changes and force re-evaluation
+                    self._propagate_component_change(clicked_component)
 
                     # Update visuals immediately
                     self._update_simulation_visuals()
@@ -1723,6 +1735,24 @@ class MainWindow:
             traceback.print_exc()
             self.set_status(f"Error interacting with switch: {e}")
 
+    def _propagate_component_change(self, component) -> None:
+        """Push a component's changed outputs into the running simulation.
+
+        The engine may be mid-run on the simulation thread, so the change is
+        applied through the engine's single-writer update queue when it has
+        one.
+        """
+        engine = self.simulation_engine
+
+        def update():
+            component.simulate_logic(engine.vnet_manager, engine.bridge_manager)
+            engine.dirty_manager.mark_all_dirty()
+
+        if hasattr(engine, 'apply_external_update'):
+            engine.apply_external_update(update)
+        else:
+            update()
+
     def _handle_switch_release(self) -> None:
         """Handle mouse release for pushbutton switches in simulation mode."""
         clicked_component = getattr(self, '_pressed_switch_component', None)
@@ -1739,11 +1769,7 @@ class MainWindow:
                 changed = bool(clicked_component.interact('release'))
 
             if changed and self.simulation_engine:
-                clicked_component.simulate_logic(
-                    self.simulation_engine.vnet_manager,
-                    self.simulation_engine.bridge_manager
-                )
-                self.simulation_engine.dirty_manager.mark_all_dirty()
+                self._propagate_component_change(clicked_component)
                 self._update_simulation_visuals()
                 self.root.after(10, self._run_simulation_step)
         except Exception as e:
@@ -3206,6 +3232,7 @@ class MainWindow:
         # Split the host wire at the junction: host wire now ends at junction
         original_end = host_wire.end_tab_id
         host_wire.end_tab_id = junction_id
+        page.mark_wire_changed(host_wire.wire_id)
 
         # Continuation from junction to original end (if any)
         # Start at junction and route through after_waypoints to reach original endpoint
@@ -3384,6 +3411,41 @@ class MainWindow:
             traceback.print_exc()
             self.set_status(f"Error: {e}")
     
+    def _get_linked_components(self, link_name: str, vnet: VNET, document: Document) -> List[Component]:
+        """
+        Get the components on other VNETs carrying a link name.
+        
+        Uses the engine's link index, so BUS/Memory pin link mappings are
+        included and no component or VNET scan is needed.
+        
+        Args:
+            link_name: Link name
+            vnet: VNET being inspected (its own components are skipped)
+            document: Document containing components
+            
+        Returns:
+            List of linked components
+        """
+        vnet_manager = getattr(self.simulation_engine, 'vnet_manager', None)
+        if vnet_manager is None:
+            return document.get_components_with_link_name(link_name)
+        
+        components = []
+        seen = set()
+        for other_vnet in vnet_manager.get_vnets_for_link(link_name):
+            if other_vnet is vnet:
+                continue
+            for tab_id in other_vnet.get_all_tabs():
+                # Tab ID format: component_id.pin_id.tab_id
+                component_id = tab_id.split('.')[0]
+                if component_id in seen:
+                    continue
+                seen.add(component_id)
+                component = document.get_component(component_id)
+                if component:
+                    components.append(component)
+        return components
+    
     def _build_vnet_info_dict(self, vnet: VNET, document: Document) -> Dict[str, Any]:
         """
         Build a dictionary with VNET information for display.
@@ -3477,7 +3539,7 @@ class MainWindow:
         # Also add components connected via links
         for link_name in all_links:
             print(f"Processing link: {link_name}")
-            linked_components = document.get_components_with_link_name(link_name)
+            linked_components = self._get_linked_components(link_name, vnet, document)
             print(f"  Found {len(linked_components)} components with link '{link_name}'")
             
             for component in linked_components:
@@ -4317,6 +4379,7 @@ class MainWindow:
 
         # Modify the clicked wire to end at the new junction and keep the "before" waypoints
         clicked_wire.end_tab_id = junction_id
+        page.mark_wire_changed(clicked_wire.wire_id)
         clicked_wire.waypoints = dict(before_items)
 
         # Create a continuation wire from the junction to the original end point and move "after" waypoints
@@ -4892,6 +4955,11 @@ class MainWindow:
         if not page:
             return
         
+        # Properties can rebuild pins or change link names
+        component = self.properties_panel.current_component
+        if component is not None:
+            page.mark_component_changed(component.component_id)
+        
         # Mark document as modified
         self.file_tabs.set_tab_modified(active_tab.tab_id, True)
         
@@ -429,7 +429,7 @@ PROPERTY_SCHEMAS: Dict[str, List[Dict[str, Any]]] = {
             'type': 'number',
             'default': 8,
             'min': 3,
-            'max': 16,
+            'max': 24,  # above 16 only with a mapped image
             'target': 'prop',
             'coerce': int,
         },
@@ -468,6 +468,23 @@ PROPERTY_SCHEMAS: Dict[str, List[Dict[str, Any]]] = {
             'default': '',
             'target': 'prop',
         },
+        {
+            'section': 'Advanced',
+            'key': 'mapped_image_file',
+            'label': 'Mapped Image',
+            'type': 'text',
+            'default': '',
+            'target': 'prop',
+        },
+        {
+            'section': 'Advanced',
+            'key': 'mapped_image_mode',
+            'label': 'Image Mode',
+            'type': 'dropdown',
+            'options': ['read_only', 'copy_on_write'],
+            'default': 'read_only',
+            'target': 'prop',
+        },
         {
             'section': 'Advanced',
             'key': 'is_volatile',
@@ -1425,6 +1442,8 @@ class PropertiesPanel:
             title="Load Memory File",
             filetypes=[
                 ("Memory files", "*.mem"),
+                ("Binary images", "*.bin *.rom"),
+                ("Intel HEX files", "*.hex *.ihx"),
                 ("Text files", "*.txt"),
                 ("All files", "*.*")
             ]
@@ -1453,6 +1472,8 @@ class PropertiesPanel:
             defaultextension=".mem",
             filetypes=[
                 ("Memory files", "*.mem"),
+                ("Binary images", "*.bin *.rom"),
+                ("Intel HEX files", "*.hex *.ihx"),
                 ("Text files", "*.txt"),
                 ("All files", "*.*")
             ]
@@ -13,7 +13,6 @@ from __future__ import annotations
 
 from gui.renderers.base_renderer import ComponentRenderer
 from gui.theme import VSCodeTheme
-from core.state import PinState
 
 
 class BusDisplayRenderer(ComponentRenderer):
@@ -76,30 +75,19 @@ class BusDisplayRenderer(ComponentRenderer):
         label = self.component.properties.get('label', '')
         return label if isinstance(label, str) else ''
 
-    def _read_link_state(self, link_name: str) -> bool:
-        """Read a link state from the simulation engine (True if HIGH)."""
+    def _read_value(self) -> int:
+        """Read the displayed bus from the simulation engine as one word."""
         engine = getattr(self, 'simulation_engine', None)
         if not engine:
-            return False
-
-        vnets = getattr(engine, 'vnets', None)
-        if not isinstance(vnets, dict):
-            return False
-
-        for vnet in vnets.values():
-            try:
-                if not vnet.has_link(link_name):
-                    continue
-
-                state = getattr(vnet, 'state', None)
-                if state == PinState.HIGH:
-                    return True
-                if state is True or state == 1:
-                    return True
-            except Exception:
-                continue
+            return 0
 
-        return False
+        read_value = getattr(self.component, 'read_value', None)
+        if not callable(read_value):
+            return 0
+        try:
+            return read_value(getattr(engine, 'vnet_manager', None))
+        except Exception:
+            return 0
 
     def render(self, zoom: float = 1.0) -> None:
         self.clear()
@@ -172,7 +160,6 @@ class BusDisplayRenderer(ComponentRenderer):
 
         # Indicators
         bus_name = self._get_bus_name()
-        start_pin = self._get_start_pin()
 
         spacing_px = self._get_pin_spacing_px()
         start_y = -(span / 2) * zoom
@@ -181,9 +168,10 @@ class BusDisplayRenderer(ComponentRenderer):
         off_fill = VSCodeTheme.INDICATOR_OFF
         on_fill = VSCodeTheme.INDICATOR_ON
 
+        value = self._read_value() if bus_name else 0
+
         for i in range(pin_count):
-            link_name = f"{bus_name}_{start_pin + i}" if bus_name else ""
-            is_on = self._read_link_state(link_name) if link_name else False
+            is_on = bool(value & (1 << i))
 
             dx = 0
             dy = start_y + (i * spacing_px * zoom)
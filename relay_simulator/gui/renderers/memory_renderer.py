@@ -44,11 +44,8 @@ class MemoryRenderer(ComponentRenderer):
         self._scrollbar_drag_offset_y = 0.0
 
     def _get_address_bits(self) -> int:
-        try:
-            bits = int(self.component.properties.get('address_bits', 8))
-        except Exception:
-            bits = 8
-        return max(3, min(16, bits))
+        # The component knows the limit (higher with a mapped image)
+        return self.component._get_address_bits()
 
     def _get_data_bits(self) -> int:
         try:
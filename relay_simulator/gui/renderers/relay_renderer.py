@@ -194,13 +194,18 @@ class RelayRenderer(ComponentRenderer):
         def is_pin_high(pin) -> bool:
             if not self.simulation_engine or not pin:
                 return False
+            # Read the engine's published snapshot when it has one
+            get_snapshot = getattr(self.simulation_engine, 'get_snapshot', None)
+            snapshot = get_snapshot() if get_snapshot is not None else None
+            if snapshot is not None:
+                return any(snapshot.is_tab_high(tab_id) for tab_id in pin.tabs)
             # Check all tabs on this pin
-            for tab in pin.tabs.values():
+            get_vnet_for_tab = self.simulation_engine.vnet_manager.get_vnet_for_tab
+            for tab_id in pin.tabs:
                 # Find VNET containing this tab
-                for vnet in self.simulation_engine.vnets.values():
-                    if tab.tab_id in vnet.tab_ids:
-                        if vnet.state == PinState.HIGH:
-                            return True
+                vnet = get_vnet_for_tab(tab_id)
+                if vnet is not None and vnet.state == PinState.HIGH:
+                    return True
             return False
         
         # Pole 1: COM1 to NC1 (de-energized) or NO1 (energized)
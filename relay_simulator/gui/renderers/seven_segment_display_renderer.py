@@ -13,7 +13,6 @@ from typing import Dict, Iterable, Optional
 
 from gui.renderers.base_renderer import ComponentRenderer
 from gui.theme import VSCodeTheme
-from core.state import PinState
 
 
 class SevenSegmentDisplayRenderer(ComponentRenderer):
@@ -71,52 +70,19 @@ class SevenSegmentDisplayRenderer(ComponentRenderer):
 
         return VSCodeTheme.WIRE_POWERED
 
-    def _read_link_state(self, link_name: str) -> bool:
-        """Read a link state from the simulation engine (True if HIGH)."""
+    def _read_input_value(self) -> int:
+        """Read the 4-bit input value from the bus links as one word."""
         engine = getattr(self, 'simulation_engine', None)
         if not engine:
-            return False
-
-        vnets = getattr(engine, 'vnets', None)
-        if not isinstance(vnets, dict):
-            return False
-
-        # If any VNET carrying this link is HIGH, treat as 1.
-        for vnet in vnets.values():
-            try:
-                if not vnet.has_link(link_name):
-                    continue
-
-                state = getattr(vnet, 'state', None)
-                # VNET.state is a PinState (HIGH or FLOAT). Enums are always truthy,
-                # so compare explicitly.
-                if state == PinState.HIGH:
-                    return True
-                # Be defensive: some future implementations may store bool/int.
-                if state is True or state == 1:
-                    return True
-            except Exception:
-                continue
-
-        return False
-
-    def _read_input_value(self) -> int:
-        """Compute the 4-bit input value from bus links."""
-        get_links = getattr(self.component, 'get_nibble_link_names', None)
-        if not callable(get_links):
             return 0
 
-        link_names = get_links()
-        if not isinstance(link_names, list) or len(link_names) != 4:
+        read_value = getattr(self.component, 'read_value', None)
+        if not callable(read_value):
+            return 0
+        try:
+            return read_value(getattr(engine, 'vnet_manager', None)) & 0xF
+        except Exception:
             return 0
-
-        value = 0
-        for bit_index, link_name in enumerate(link_names):
-            if isinstance(link_name, str) and link_name.strip():
-                if self._read_link_state(link_name.strip()):
-                    value |= (1 << bit_index)
-
-        return value & 0xF
 
     def render(self, zoom: float = 1.0) -> None:
         self.clear()
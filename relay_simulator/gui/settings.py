@@ -21,7 +21,7 @@ class Settings:
     
     Default settings:
     - recent_documents: [] (list of file paths, max 10)
-    - simulation_threading: "single" (options: "single", "multi")
+    - simulation_threading: "single" (options: "single", "multi", "calibrated")
     - default_canvas_width: 3000 (pixels)
     - default_canvas_height: 3000 (pixels)
     - canvas_grid_size: 20 (pixels)
@@ -172,7 +172,7 @@ class Settings:
         Get the simulation threading mode.
         
         Returns:
-            "single" or "multi"
+            "single", "multi" or "calibrated"
         """
         return self._settings.get('simulation_threading', 'single')
         
@@ -181,10 +181,11 @@ class Settings:
         Set the simulation threading mode.
         
         Args:
-            mode: "single" or "multi"
+            mode: "single", "multi" or "calibrated" (fastest engine timed
+                  on each circuit, see SimulationEngineFactory.calibrate)
         """
-        if mode not in ('single', 'multi'):
-            raise ValueError(f"Invalid threading mode: {mode}. Must be 'single' or 'multi'")
+        if mode not in ('single', 'multi', 'calibrated'):
+            raise ValueError(f"Invalid threading mode: {mode}. Must be 'single', 'multi' or 'calibrated'")
         self.set('simulation_threading', mode)
         
     def get_canvas_size(self) -> tuple[int, int]:
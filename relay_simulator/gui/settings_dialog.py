@@ -150,6 +150,18 @@ class SettingsDialog:
             selectcolor=VSCodeTheme.BG_TERTIARY,
             activebackground=VSCodeTheme.BG_PRIMARY,
             activeforeground=VSCodeTheme.FG_BRIGHT
+        ).pack(side=tk.LEFT, padx=(0, VSCodeTheme.PADDING_MEDIUM))
+        
+        tk.Radiobutton(
+            threading_frame,
+            text="Auto (calibrated)",
+            variable=self.threading_var,
+            value="calibrated",
+            bg=VSCodeTheme.BG_PRIMARY,
+            fg=VSCodeTheme.FG_PRIMARY,
+            selectcolor=VSCodeTheme.BG_TERTIARY,
+            activebackground=VSCodeTheme.BG_PRIMARY,
+            activeforeground=VSCodeTheme.FG_BRIGHT
         ).pack(side=tk.LEFT)
         
         row += 1
@@ -0,0 +1,539 @@
+"""
+Bit-Parallel Engine - Settle many input scenarios in one pass
+
+Relay logic is purely HIGH/FLOAT with OR-combining, so a whole set of input
+scenarios can be simulated at once by bit-slicing: every link group (VNETs
+joined by link names) holds a Python int with one bit per scenario.
+
+- Sources (VCC, Switch, Thumbwheel, Clock) drive a constant mask per pin
+- Relay contacts are bridges whose enable mask is the relay's energized mask
+  (COM-NO) or its complement (COM-NC)
+- Diodes drive their cathode with the mask of their anode
+- A settle pass ORs drive masks across enabled bridges (worklist flood fill)
+
+Relays switch in lockstep steps, like the event-driven engine where every
+relay has the same switching delay: settle, latch every coil mask, repeat
+until no relay changes. Scenarios still changing after max_steps are
+reported as unstable (oscillating).
+
+Memory has per-scenario addressed state and is not supported; restrict the
+run to the pages under test (see from_document) when a document contains it.
+
+Typical use is exhaustive truth-table checking:
+
+    engine = BitParallelEngine.from_document(doc, page_names=["Adder"])
+    result = engine.run(engine.exhaustive_scenarios(["A", "B", "Cin"]))
+    for scenario in result.iter_scenarios():
+        print(scenario.inputs, scenario.indicators)
+"""
+
+import time
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, Iterator, List, Mapping, Optional, Sequence, Set, Tuple, Union
+
+from core.document import Document
+from core.vnet import VNET
+from core.tab import Tab
+from core.pin import Pin
+from components.base import Component
+from simulation.compiled_netlist import CompiledNetlist
+from simulation.stimulus import build_input_index, resolve_input, exhaustive_vectors, get_bus_link_names
+
+
+# Components that never drive a signal
+PASSIVE_COMPONENT_TYPES = frozenset({
+    "Indicator", "BUS", "BusDisplay", "SevenSegmentDisplay", "Link", "Box", "Text"
+})
+
+
+@dataclass
+class ScenarioResult:
+    """Settled outputs of one scenario."""
+    index: int = 0
+    inputs: Dict[str, Union[bool, int]] = field(default_factory=dict)
+    stable: bool = True
+    indicators: Dict[str, bool] = field(default_factory=dict)
+    buses: Dict[str, int] = field(default_factory=dict)
+
+
+@dataclass
+class BitParallelResult:
+    """
+    Result of BitParallelEngine.run().
+
+    Per-signal states are bitmasks: bit i is scenario i.
+    """
+    scenario_count: int = 0
+    steps: int = 0
+    wall_time: float = 0.0
+    stable_mask: int = 0
+    scenarios_in: List[Dict[str, Union[bool, int]]] = field(default_factory=list)
+    vnet_masks: Dict[str, int] = field(default_factory=dict)
+    link_masks: Dict[str, int] = field(default_factory=dict)
+    indicator_masks: Dict[str, int] = field(default_factory=dict)
+    bus_bit_masks: Dict[str, List[int]] = field(default_factory=dict)
+
+    @property
+    def all_stable(self) -> bool:
+        """True if every scenario settled."""
+        return self.stable_mask == (1 << self.scenario_count) - 1
+
+    def is_stable(self, index: int) -> bool:
+        """Check whether a scenario settled (did not oscillate)."""
+        return bool((self.stable_mask >> index) & 1)
+
+    def get_indicator_states(self, index: int) -> Dict[str, bool]:
+        """Get indicator lit states (by component ID) for one scenario."""
+        return {
+            component_id: bool((mask >> index) & 1)
+            for component_id, mask in self.indicator_masks.items()
+        }
+
+    def get_bus_values(self, index: int) -> Dict[str, int]:
+        """Get bus display values (by component ID) for one scenario."""
+        values = {}
+        for component_id, bit_masks in self.bus_bit_masks.items():
+            value = 0
+            for bit_index, mask in enumerate(bit_masks):
+                if (mask >> index) & 1:
+                    value |= (1 << bit_index)
+            values[component_id] = value
+        return values
+
+    def get_link_state(self, link_name: str, index: int) -> bool:
+        """Get the state of a named link for one scenario (True if HIGH)."""
+        return bool((self.link_masks.get(link_name, 0) >> index) & 1)
+
+    def get_scenario(self, index: int) -> ScenarioResult:
+        """Get the settled outputs of one scenario."""
+        if not 0 <= index < self.scenario_count:
+            raise IndexError(f"Scenario index {index} out of range")
+        return ScenarioResult(
+            index=index,
+            inputs=dict(self.scenarios_in[index]),
+            stable=self.is_stable(index),
+            indicators=self.get_indicator_states(index),
+            buses=self.get_bus_values(index)
+        )
+
+    def iter_scenarios(self) -> Iterator[ScenarioResult]:
+        """Iterate over the per-scenario results in input order."""
+        for index in range(self.scenario_count):
+            yield self.get_scenario(index)
+
+
+class BitParallelEngine:
+    """
+    Multi-scenario simulation engine using one bit per scenario.
+
+    The circuit is compiled once; run() can be called repeatedly with
+    different scenario lists. Component objects are only read, never
+    mutated, so the same structures can also feed a SimulationEngine.
+
+    Scenario inputs are keyed by Switch/Thumbwheel component ID, or by a
+    unique Switch label / Thumbwheel bus name. Switches take a bool,
+    thumbwheels a value 0..15. Unassigned inputs use their simulation
+    start state (OFF / 0).
+    """
+
+    def __init__(
+        self,
+        vnets: Dict[str, VNET],
+        tabs: Dict[str, Tab],
+        components: Dict[str, Component],
+        max_steps: int = 1000
+    ):
+        """
+        Compile the circuit.
+
+        Args:
+            vnets: Dictionary of all VNETs by ID
+            tabs: Dictionary of all tabs by ID
+            components: Dictionary of all components by ID
+            max_steps: Maximum relay switching steps before scenarios are
+                reported as oscillating
+
+        Raises:
+            ValueError: If a component type cannot be bit-sliced (Memory)
+        """
+        self.vnets = vnets
+        self.tabs = tabs
+        self.components = components
+        self.max_steps = max_steps
+
+        self.netlist = CompiledNetlist(vnets, tabs, components)
+        self.group_count = len(self.netlist.group_vnets)
+
+        # Sources: always-HIGH groups, and (component, groups) per input
+        self._constant_groups: Set[int] = set()
+        self._switches: List[Tuple[Component, Tuple[int, ...]]] = []
+        self._thumbwheels: List[Tuple[Component, List[Tuple[int, ...]]]] = []
+
+        # Relays: (coil group, [(com, no, nc), ...]) with -1 for unconnected
+        self._relays: List[Tuple[int, List[Tuple[int, int, int]]]] = []
+
+        # Diodes: (anode group, cathode groups)
+        self._diodes: List[Tuple[int, Tuple[int, ...]]] = []
+
+        # Outputs
+        self._indicators: Dict[str, Tuple[int, ...]] = {}
+        self._buses: Dict[str, List[str]] = {}
+        self._link_groups: Dict[str, int] = {}
+
+        self._input_keys: Dict[str, Component] = build_input_index(components)
+
+        self._compile_components()
+        self._compile_links()
+
+    @classmethod
+    def from_document(
+        cls,
+        document: Document,
+        page_names: Optional[Iterable[str]] = None,
+        max_steps: int = 1000
+    ) -> 'BitParallelEngine':
+        """
+        Build an engine for a document, optionally for selected pages only.
+
+        Links to pages outside the selection are left unconnected.
+
+        Args:
+            document: Document to simulate
+            page_names: Page names or IDs to include (None = all pages)
+            max_steps: Maximum relay switching steps
+
+        Returns:
+            BitParallelEngine instance
+        """
+        from simulation.structure_builder import build_simulation_structures
+
+        vnets, tabs, _, components = build_simulation_structures(document)
+
+        if page_names is not None:
+            wanted = set(page_names)
+            pages = [
+                page for page in document.get_all_pages()
+                if page.page_id in wanted or page.name in wanted
+            ]
+            page_ids = {page.page_id for page in pages}
+            components = {
+                component.component_id: component
+                for page in pages for component in page.get_all_components()
+            }
+            tabs = {
+                tab_id: tab for tab_id, tab in tabs.items()
+                if tab.parent_pin is not None and tab.parent_pin.parent_component is not None
+                and tab.parent_pin.parent_component.component_id in components
+            }
+            vnets = {
+                vnet_id: vnet for vnet_id, vnet in vnets.items()
+                if vnet.page_id is None or vnet.page_id in page_ids
+            }
+
+        return cls(vnets, tabs, components, max_steps=max_steps)
+
+    # === COMPILATION ===
+
+    def _pin_groups(self, pin: Optional[Pin]) -> Tuple[int, ...]:
+        """Get the link groups of all tabs of a pin."""
+        if pin is None:
+            return ()
+        groups = {}
+        for tab_id in pin.tabs:
+            vnet_i = self.netlist.get_vnet_for_tab(tab_id)
+            if vnet_i >= 0:
+                groups[self.netlist.vnet_group[vnet_i]] = None
+        return tuple(groups)
+
+    def _first_tab_group(self, pin: Optional[Pin]) -> int:
+        """Get the link group of a pin's first tab (how components read pins)."""
+        if pin is None or not pin.tabs:
+            return -1
+        vnet_i = self.netlist.get_vnet_for_tab(next(iter(pin.tabs)))
+        return self.netlist.vnet_group[vnet_i] if vnet_i >= 0 else -1
+
+    def _compile_components(self):
+        """Classify components into sources, relays, diodes and outputs."""
+        unsupported = []
+
+        for component_id, component in self.components.items():
+            component_type = component.component_type
+            pins = list(component.get_all_pins().values())
+
+            if component_type == "VCC":
+                for pin in pins:
+                    self._constant_groups.update(self._pin_groups(pin))
+
+            elif component_type == "Clock":
+                # Held at its simulation start level (no simulated time here)
+                if component.properties.get("enable_on_sim_start", False):
+                    for pin in pins:
+                        self._constant_groups.update(self._pin_groups(pin))
+
+            elif component_type == "Switch":
+                groups = self._pin_groups(pins[0]) if pins else ()
+                self._switches.append((component, groups))
+
+            elif component_type == "Thumbwheel":
+                bit_groups = [
+                    self._pin_groups(component.pins.get(f"{component_id}.pin{bit_index}"))
+                    for bit_index in range(4)
+                ]
+                self._thumbwheels.append((component, bit_groups))
+
+            elif component_type == "DPDTRelay":
+                poles = []
+                for com, no, nc in (("COM1", "NO1", "NC1"), ("COM2", "NO2", "NC2")):
+                    poles.append((
+                        self._first_tab_group(component.get_pin_by_name(com)),
+                        self._first_tab_group(component.get_pin_by_name(no)),
+                        self._first_tab_group(component.get_pin_by_name(nc))
+                    ))
+                coil = self._first_tab_group(component.get_pin_by_name("COIL"))
+                self._relays.append((coil, poles))
+
+            elif component_type == "Diode":
+                self._diodes.append((
+                    self._first_tab_group(component.pins.get(f"{component_id}.A")),
+                    self._pin_groups(component.pins.get(f"{component_id}.K"))
+                ))
+
+            elif component_type in PASSIVE_COMPONENT_TYPES:
+                if component_type == "Indicator":
+                    groups = {}
+                    for pin in pins:
+                        for group_i in self._pin_groups(pin):
+                            groups[group_i] = None
+                    self._indicators[component_id] = tuple(groups)
+                else:
+                    link_names = get_bus_link_names(component)
+                    if link_names is not None:
+                        self._buses[component_id] = link_names
+
+            else:
+                unsupported.append(f"{component_type} ({component_id})")
+
+        if unsupported:
+            raise ValueError(
+                "Components not supported in bit-parallel mode: " + ", ".join(sorted(unsupported))
+            )
+
+    def _compile_links(self):
+        """Map link names to their link group."""
+        for vnet_i, vnet in enumerate(self.netlist.vnet_objects):
+            for link_name in vnet.link_names:
+                if link_name:
+                    self._link_groups.setdefault(link_name, self.netlist.vnet_group[vnet_i])
+
+    # === SCENARIOS ===
+
+    def get_input_keys(self) -> List[str]:
+        """Get all keys accepted in scenario assignments."""
+        return sorted(self._input_keys)
+
+    def exhaustive_scenarios(self, input_keys: Sequence[str]) -> List[Dict[str, Union[bool, int]]]:
+        """
+        Build every combination of the given inputs.
+
+        Switches take False/True, thumbwheels 0..15. The first key varies
+        slowest.
+
+        Args:
+            input_keys: Switch/Thumbwheel keys (see class docstring)
+
+        Returns:
+            List of scenario assignments
+        """
+        return exhaustive_vectors(self._input_keys, input_keys)
+
+    def _source_masks(self, scenarios: Sequence[Mapping[str, Any]], all_mask: int) -> List[int]:
+        """Compute the per-group drive mask of all sources."""
+        switch_masks: Dict[str, int] = {}
+        thumbwheel_masks: Dict[str, List[int]] = {}
+
+        for index, assignment in enumerate(scenarios):
+            bit = 1 << index
+            for key, value in assignment.items():
+                component = resolve_input(self._input_keys, key)
+                component_id = component.component_id
+                if component.component_type == "Thumbwheel":
+                    masks = thumbwheel_masks.setdefault(component_id, [0, 0, 0, 0])
+                    value = int(value) & 0xF
+                    for bit_index in range(4):
+                        if value & (1 << bit_index):
+                            masks[bit_index] |= bit
+                elif value:
+                    switch_masks[component_id] = switch_masks.get(component_id, 0) | bit
+
+        drive = [0] * self.group_count
+        for group_i in self._constant_groups:
+            drive[group_i] = all_mask
+        for component, groups in self._switches:
+            mask = switch_masks.get(component.component_id, 0)
+            if mask:
+                for group_i in groups:
+                    drive[group_i] |= mask
+        for component, bit_groups in self._thumbwheels:
+            masks = thumbwheel_masks.get(component.component_id)
+            if masks:
+                for groups, mask in zip(bit_groups, masks):
+                    for group_i in groups:
+                        drive[group_i] |= mask
+        return drive
+
+    # === SETTLING ===
+
+    def _build_adjacency(self, energized: List[int], all_mask: int) -> List[List[Tuple[int, int]]]:
+        """Build per-group (neighbour, enable mask) lists for the relay contacts."""
+        adjacency: List[List[Tuple[int, int]]] = [[] for _ in range(self.group_count)]
+        for (_, poles), mask in zip(self._relays, energized):
+            released = all_mask & ~mask
+            for com, no, nc in poles:
+                if com < 0:
+                    continue
+                for other, enable in ((no, mask), (nc, released)):
+                    if other >= 0 and other != com and enable:
+                        adjacency[com].append((other, enable))
+                        adjacency[other].append((com, enable))
+        return adjacency
+
+    @staticmethod
+    def _flood(drive: List[int], adjacency: List[List[Tuple[int, int]]]) -> List[int]:
+        """OR drive masks across enabled bridges (per-scenario connected groups)."""
+        state = list(drive)
+        work = [group_i for group_i, mask in enumerate(state) if mask]
+        while work:
+            group_i = work.pop()
+            mask = state[group_i]
+            for other, enable in adjacency[group_i]:
+                added = mask & enable & ~state[other]
+                if added:
+                    state[other] |= added
+                    work.append(other)
+        return state
+
+    def _settle(
+        self,
+        source_drive: List[int],
+        adjacency: List[List[Tuple[int, int]]],
+        diode_drive: List[int]
+    ) -> List[int]:
+        """
+        Settle with fixed relay contacts.
+
+        Diode outputs are re-evaluated until they stop changing; diode_drive
+        carries the cathode masks over from the previous step and is updated
+        in place.
+        """
+        for _ in range(self.max_steps):
+            drive = list(source_drive)
+            for (_, cathodes), mask in zip(self._diodes, diode_drive):
+                if mask:
+                    for group_i in cathodes:
+                        drive[group_i] |= mask
+            state = self._flood(drive, adjacency)
+
+            changed = False
+            for diode_i, (anode, _) in enumerate(self._diodes):
+                mask = state[anode] if anode >= 0 else 0
+                if mask != diode_drive[diode_i]:
+                    diode_drive[diode_i] = mask
+                    changed = True
+            if not changed:
+                return state
+        return state
+
+    def run(self, scenarios: Sequence[Mapping[str, Any]]) -> BitParallelResult:
+        """
+        Settle all scenarios in one bit-parallel pass.
+
+        Args:
+            scenarios: One input assignment per scenario
+
+        Returns:
+            BitParallelResult with per-scenario states
+
+        Raises:
+            KeyError: If an assignment names an unknown input
+        """
+        start = time.perf_counter()
+        count = len(scenarios)
+        all_mask = (1 << count) - 1
+
+        source_drive = self._source_masks(scenarios, all_mask)
+        energized = [0] * len(self._relays)
+        diode_drive = [0] * len(self._diodes)
+
+        unstable = 0
+        steps = 0
+        while True:
+            steps += 1
+            state = self._settle(source_drive, self._build_adjacency(energized, all_mask), diode_drive)
+
+            unstable = 0
+            next_energized = []
+            for (coil, _), mask in zip(self._relays, energized):
+                target = state[coil] if coil >= 0 else 0
+                unstable |= target ^ mask
+                next_energized.append(target)
+
+            if not unstable or steps >= self.max_steps:
+                break
+            energized = next_energized
+
+        return self._collect_result(scenarios, state, all_mask & ~unstable, steps, time.perf_counter() - start)
+
+    def _collect_result(
+        self,
+        scenarios: Sequence[Mapping[str, Any]],
+        state: List[int],
+        stable_mask: int,
+        steps: int,
+        wall_time: float
+    ) -> BitParallelResult:
+        """Expand group states into per-VNET, link, indicator and bus masks."""
+        netlist = self.netlist
+        link_masks = {
+            link_name: state[group_i] for link_name, group_i in self._link_groups.items()
+        }
+        indicator_masks = {}
+        for component_id, groups in self._indicators.items():
+            mask = 0
+            for group_i in groups:
+                mask |= state[group_i]
+            indicator_masks[component_id] = mask
+
+        return BitParallelResult(
+            scenario_count=len(scenarios),
+            steps=steps,
+            wall_time=wall_time,
+            stable_mask=stable_mask,
+            scenarios_in=[dict(assignment) for assignment in scenarios],
+            vnet_masks={
+                vnet_id: state[netlist.vnet_group[vnet_i]]
+                for vnet_i, vnet_id in enumerate(netlist.vnet_ids)
+            },
+            link_masks=link_masks,
+            indicator_masks=indicator_masks,
+            bus_bit_masks={
+                component_id: [link_masks.get(link_name, 0) for link_name in link_names]
+                for component_id, link_names in self._buses.items()
+            }
+        )
+
+    def get_statistics(self) -> dict:
+        """
+        Get statistics about the compiled circuit.
+
+        Returns:
+            Dictionary with statistics
+        """
+        return {
+            'link_groups': self.group_count,
+            'switches': len(self._switches),
+            'thumbwheels': len(self._thumbwheels),
+            'relays': len(self._relays),
+            'diodes': len(self._diodes),
+            'indicators': len(self._indicators),
+            'buses': len(self._buses)
+        }
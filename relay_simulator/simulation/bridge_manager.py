@@ -4,106 +4,234 @@ Bridge Manager - Interface for components to create/remove bridges
 This provides components (particularly relays) with methods to:
 - Create bridges between VNETs when contacts close
 - Remove bridges when contacts open
+- Preallocate bridges once and switch them by toggling their enabled flag
 - Query existing bridges
+
+The bridges dictionary (shared with the engine, evaluator and propagator)
+and each VNET's bridge_ids only ever hold enabled bridges, so readers need
+not check the flag. A preallocated bridge keeps its ID and VNET endpoints
+for the whole simulation: enabling it re-inserts the same object, and no
+IDs are generated while contacts switch.
+
+bridge_hash is an XOR of per-bridge keys over the enabled bridges, updated
+as bridges are connected and disconnected, so the cycle detector can
+fingerprint the bridge configuration without scanning it.
 """
 
-from typing import Dict, Optional
+from typing import Dict, List, Optional
 from core.bridge import Bridge
 from core.id_manager import IDManager
 from core.vnet import VNET
+from simulation.connectivity_manager import ConnectivityManager
+
+
+def bridge_key(bridge: Bridge) -> int:
+    """Hash of a bridge's VNET pair (in either order) and owner."""
+    a, b = bridge.vnet_id1, bridge.vnet_id2
+    if b < a:
+        a, b = b, a
+    return hash((a, b, bridge.owner_component_id))
 
 
 class BridgeManager:
     """
     Manager class for bridge operations during simulation.
-    
+
     Provides components with methods to:
     - Create bridges (relay contacts, etc.)
     - Remove bridges
+    - Allocate and enable/disable fixed bridges
     - Query bridges
     """
-    
-    def __init__(self, bridges: Dict[str, Bridge], id_manager: IDManager, vnets: Dict[str, VNET]):
+
+    def __init__(
+        self,
+        bridges: Dict[str, Bridge],
+        id_manager: IDManager,
+        vnets: Dict[str, VNET],
+        connectivity: Optional[ConnectivityManager] = None
+    ):
         """
         Initialize bridge manager.
-        
+
         Args:
             bridges: Dictionary of all bridges by ID
             id_manager: ID manager for generating bridge IDs
             vnets: Dictionary of all VNETs by ID (needed to update bridge_ids)
+            connectivity: Optional ConnectivityManager to keep groups up to date
         """
         self.bridges = bridges
         self.id_manager = id_manager
         self.vnets = vnets
-    
+        self.connectivity = connectivity
+
+        # Preallocated bridges (enabled or not) by ID
+        self._allocated: Dict[str, Bridge] = {}
+
+        # Enabled bridges per owning component: component_id -> {bridge_id: Bridge}
+        self._by_component: Dict[str, Dict[str, Bridge]] = {}
+        # XOR of bridge_key() over the enabled bridges
+        self.bridge_hash = 0
+        for bridge_id, bridge in bridges.items():
+            self._by_component.setdefault(bridge.owner_component_id, {})[bridge_id] = bridge
+            self.bridge_hash ^= bridge_key(bridge)
+
     def create_bridge(self, vnet1_id: str, vnet2_id: str, component_id: str) -> str:
         """
         Create a bridge between two VNETs.
-        
+
         Args:
             vnet1_id: First VNET ID
             vnet2_id: Second VNET ID
             component_id: ID of component creating the bridge
-            
+
         Returns:
             Bridge ID
         """
         bridge_id = self.id_manager.generate_id()
-        bridge = Bridge(vnet1_id, vnet2_id, component_id, bridge_id)
-        self.bridges[bridge_id] = bridge
-        
-        # Add bridge to both VNETs
-        vnet1 = self.vnets.get(vnet1_id)
-        vnet2 = self.vnets.get(vnet2_id)
-        if vnet1:
-            vnet1.add_bridge(bridge_id)
-        if vnet2:
-            vnet2.add_bridge(bridge_id)
-        
+        self._connect(Bridge(vnet1_id, vnet2_id, component_id, bridge_id))
         return bridge_id
-    
+
     def remove_bridge(self, bridge_id: str) -> Optional[Bridge]:
         """
         Remove a bridge.
-        
+
+        A preallocated bridge is only disabled and can be enabled again.
+
         Args:
             bridge_id: Bridge ID to remove
-            
+
         Returns:
             Removed bridge or None if not found
         """
-        bridge = self.bridges.pop(bridge_id, None)
-        
-        # Remove bridge from both VNETs
-        if bridge:
-            vnet1 = self.vnets.get(bridge.vnet_id1)
-            vnet2 = self.vnets.get(bridge.vnet_id2)
-            if vnet1:
-                vnet1.remove_bridge(bridge_id)
-            if vnet2:
-                vnet2.remove_bridge(bridge_id)
-        
+        bridge = self.bridges.get(bridge_id)
+        if bridge is not None:
+            self._disconnect(bridge)
         return bridge
-    
-    def get_bridges_for_component(self, component_id: str) -> list:
+
+    def allocate_bridge(
+        self,
+        vnet1_id: str,
+        vnet2_id: str,
+        component_id: str,
+        bridge_id: str,
+        enabled: bool = False
+    ) -> str:
+        """
+        Register a fixed bridge that is switched with set_bridge_enabled().
+
+        Allocating an ID again with the same VNETs and owner (e.g. on a
+        simulation restart) reuses the existing bridge.
+
+        Args:
+            vnet1_id: First VNET ID
+            vnet2_id: Second VNET ID
+            component_id: ID of the owning component
+            bridge_id: Stable bridge ID (unique per component contact)
+            enabled: Initial state
+
+        Returns:
+            Bridge ID
+        """
+        bridge = self._allocated.get(bridge_id)
+        if bridge is None or (bridge.vnet_id1, bridge.vnet_id2, bridge.owner_component_id) != \
+                (vnet1_id, vnet2_id, component_id):
+            if bridge is not None:
+                self._disconnect(bridge)
+            old = self.bridges.get(bridge_id)
+            if old is not None:
+                self._disconnect(old)
+            bridge = Bridge(vnet1_id, vnet2_id, component_id, bridge_id)
+            bridge.enabled = False
+            self._allocated[bridge_id] = bridge
+        self.set_bridge_enabled(bridge_id, enabled)
+        return bridge_id
+
+    def set_bridge_enabled(self, bridge_id: str, enabled: bool) -> bool:
         """
-        Get all bridges created by a component.
-        
+        Enable or disable a preallocated bridge.
+
+        Args:
+            bridge_id: Bridge ID from allocate_bridge()
+            enabled: True to connect its VNETs, False to disconnect them
+
+        Returns:
+            True if the bridge changed state
+        """
+        bridge = self._allocated.get(bridge_id)
+        if bridge is None:
+            return False
+        if enabled and self.bridges.get(bridge_id) is not bridge:
+            self._connect(bridge)
+            return True
+        if not enabled and bridge.enabled:
+            self._disconnect(bridge)
+            return True
+        return False
+
+    def _connect(self, bridge: Bridge):
+        """Add a bridge to the bridges dict, its VNETs and connectivity."""
+        bridge_id = bridge.bridge_id
+        bridge.enabled = True
+        old = self.bridges.get(bridge_id)
+        if old is not None:
+            self.bridge_hash ^= bridge_key(old)
+        self.bridges[bridge_id] = bridge
+        self.bridge_hash ^= bridge_key(bridge)
+        self._by_component.setdefault(bridge.owner_component_id, {})[bridge_id] = bridge
+
+        # Add bridge to both VNETs
+        vnet1 = self.vnets.get(bridge.vnet_id1)
+        vnet2 = self.vnets.get(bridge.vnet_id2)
+        if vnet1:
+            vnet1.add_bridge(bridge_id)
+        if vnet2:
+            vnet2.add_bridge(bridge_id)
+
+        if self.connectivity:
+            self.connectivity.add_bridge(bridge_id, bridge.vnet_id1, bridge.vnet_id2)
+
+    def _disconnect(self, bridge: Bridge):
+        """Remove a bridge from the bridges dict, its VNETs and connectivity."""
+        bridge_id = bridge.bridge_id
+        bridge.enabled = False
+        if self.bridges.get(bridge_id) is bridge:
+            del self.bridges[bridge_id]
+            self.bridge_hash ^= bridge_key(bridge)
+        owned = self._by_component.get(bridge.owner_component_id)
+        if owned is not None:
+            owned.pop(bridge_id, None)
+
+        # Remove bridge from both VNETs
+        vnet1 = self.vnets.get(bridge.vnet_id1)
+        vnet2 = self.vnets.get(bridge.vnet_id2)
+        if vnet1:
+            vnet1.remove_bridge(bridge_id)
+        if vnet2:
+            vnet2.remove_bridge(bridge_id)
+
+        if self.connectivity:
+            self.connectivity.remove_bridge(bridge_id)
+
+    def get_bridges_for_component(self, component_id: str) -> List[Bridge]:
+        """
+        Get all enabled bridges owned by a component.
+
         Args:
             component_id: Component ID
-            
+
         Returns:
             List of Bridge instances
         """
-        return [b for b in self.bridges.values() if b.component_id == component_id]
-    
+        owned = self._by_component.get(component_id)
+        return list(owned.values()) if owned else []
+
     def remove_bridges_for_component(self, component_id: str):
         """
         Remove all bridges created by a component.
-        
+
         Args:
             component_id: Component ID
         """
-        bridge_ids = [bid for bid, b in self.bridges.items() if b.component_id == component_id]
-        for bridge_id in bridge_ids:
-            self.bridges.pop(bridge_id, None)
+        for bridge in self.get_bridges_for_component(component_id):
+            self._disconnect(bridge)
@@ -0,0 +1,259 @@
+"""
+Compiled Netlist - Integer-indexed view of the simulation structures
+
+The object graph built by the GUI (dicts of VNETs, Tabs, Bridges and
+Components keyed by 8-character string IDs) is convenient for editing and
+rendering, but the simulation hot loop only needs a few static relations:
+
+- tab -> VNET
+- VNET -> drive sources (the pins whose state can assert HIGH)
+- VNET -> components to re-run when the VNET changes
+- VNET -> static link group (VNETs sharing a link name)
+
+CompiledNetlist lowers those relations into dense, integer-indexed arrays
+once per simulation start. The engine loop then works on indices and a
+compact state array, and only writes states back to VNET objects when they
+actually change (components and renderers read VNET objects).
+
+Bridges are not compiled: they change at run time and are handled by
+ConnectivityManager, which merges the static link groups from this netlist.
+
+The state array also carries a Zobrist hash (XOR of a random 64-bit key per
+HIGH VNET), updated in O(1) per state change, which the cycle detector uses
+to fingerprint the whole state vector.
+"""
+
+import random
+from array import array
+from typing import Dict, Iterable, List, Tuple
+
+from core.vnet import VNET
+from core.tab import Tab
+from core.state import PinState
+from components.base import Component
+
+
+class CompiledNetlist:
+    """
+    Dense integer-indexed netlist for the simulation loop.
+
+    Indices are assigned in dictionary order at compile time. The netlist is
+    static: recompile it if VNETs, tabs, components or link names change.
+
+    Attributes:
+        vnet_ids: VNET index -> VNET ID
+        vnet_objects: VNET index -> VNET instance
+        vnet_index: VNET ID -> VNET index
+        tab_ids: Tab index -> tab ID
+        tab_index: Tab ID -> tab index
+        tab_vnet: Tab index -> VNET index (-1 if the tab is in no VNET)
+        vnet_drivers: VNET index -> tuple of drive sources (pins, or tabs without a pin)
+        vnet_components: VNET index -> tuple of connected component IDs
+        vnet_group: VNET index -> static link group index
+        group_vnets: Link group index -> tuple of member VNET indices
+        vnet_high: VNET index -> 1 if HIGH, 0 if FLOAT
+        state_hash: Zobrist hash of vnet_high
+    """
+
+    # Fixed seed: fingerprints are reproducible between runs
+    HASH_SEED = 0x52534D
+
+    def __init__(
+        self,
+        vnets: Dict[str, VNET],
+        tabs: Dict[str, Tab],
+        components: Dict[str, Component]
+    ):
+        """
+        Compile the netlist.
+
+        Args:
+            vnets: Dictionary of all VNETs by ID
+            tabs: Dictionary of all tabs by ID
+            components: Dictionary of all components by ID
+        """
+        # VNET indices
+        self.vnet_ids: List[str] = []
+        self.vnet_objects: List[VNET] = []
+        self.vnet_index: Dict[str, int] = {}
+        for vnet_id, vnet in vnets.items():
+            if not vnet:
+                continue
+            self.vnet_index[vnet_id] = len(self.vnet_ids)
+            self.vnet_ids.append(vnet_id)
+            self.vnet_objects.append(vnet)
+
+        # Tab indices
+        self.tab_ids: List[str] = list(tabs.keys())
+        self.tab_index: Dict[str, int] = {tab_id: i for i, tab_id in enumerate(self.tab_ids)}
+        self.tab_vnet = array('i', [-1]) * len(self.tab_ids)
+
+        # Per-VNET drive sources and components
+        vnet_drivers: List[Tuple] = []
+        vnet_components: List[Tuple[str, ...]] = []
+        for vnet_i, vnet in enumerate(self.vnet_objects):
+            drivers = {}
+            component_ids = {}
+            for tab_id in vnet.tab_ids:
+                tab_i = self.tab_index.get(tab_id)
+                if tab_i is None:
+                    continue  # Junction IDs and unknown tabs have no drive
+                self.tab_vnet[tab_i] = vnet_i
+
+                tab = tabs[tab_id]
+                pin = tab.parent_pin
+                # Tabs of the same pin share its state: one drive source per pin
+                source = pin if pin is not None else tab
+                drivers[id(source)] = source
+
+                if pin is not None and pin.parent_component is not None:
+                    component_id = pin.parent_component.component_id
+                    if component_id in components:
+                        component_ids[component_id] = None
+
+            vnet_drivers.append(tuple(drivers.values()))
+            vnet_components.append(tuple(component_ids))
+
+        self.vnet_drivers: List[Tuple] = vnet_drivers
+        self.vnet_components: List[Tuple[str, ...]] = vnet_components
+
+        # Static link groups
+        self.vnet_group = array('i', [0]) * len(self.vnet_ids)
+        self.group_vnets: List[Tuple[int, ...]] = []
+        self._compile_link_groups()
+
+        # Compact state array and its rolling hash
+        rng = random.Random(self.HASH_SEED)
+        self._hash_keys: List[int] = [rng.getrandbits(64) for _ in self.vnet_ids]
+        self.vnet_high = bytearray(len(self.vnet_ids))
+        self.state_hash = 0
+        self.load_states()
+
+    def _compile_link_groups(self):
+        """Union VNETs sharing a link name into static link groups."""
+        parent = list(range(len(self.vnet_ids)))
+
+        def find(x: int) -> int:
+            while parent[x] != x:
+                parent[x] = parent[parent[x]]
+                x = parent[x]
+            return x
+
+        first_for_link: Dict[str, int] = {}
+        for vnet_i, vnet in enumerate(self.vnet_objects):
+            for link_name in vnet.link_names:
+                if not link_name:
+                    continue
+                first = first_for_link.setdefault(link_name, vnet_i)
+                if first != vnet_i:
+                    ra, rb = find(first), find(vnet_i)
+                    if ra != rb:
+                        parent[rb] = ra
+
+        group_of_root: Dict[int, int] = {}
+        members: List[List[int]] = []
+        for vnet_i in range(len(self.vnet_ids)):
+            root = find(vnet_i)
+            group_i = group_of_root.get(root)
+            if group_i is None:
+                group_i = len(members)
+                group_of_root[root] = group_i
+                members.append([])
+            members[group_i].append(vnet_i)
+            self.vnet_group[vnet_i] = group_i
+
+        self.group_vnets = [tuple(m) for m in members]
+
+    # === STATE ===
+
+    def load_states(self):
+        """Copy VNET object states into the state array (object graph -> arrays)."""
+        high = PinState.HIGH
+        vnet_high = self.vnet_high
+        state_hash = 0
+        for vnet_i, vnet in enumerate(self.vnet_objects):
+            if vnet.state == high:
+                vnet_high[vnet_i] = 1
+                state_hash ^= self._hash_keys[vnet_i]
+            else:
+                vnet_high[vnet_i] = 0
+        self.state_hash = state_hash
+
+    def store_state(self, vnet_i: int, is_high: bool):
+        """
+        Set a VNET state in the array and write it back to the VNET object.
+
+        Args:
+            vnet_i: VNET index
+            is_high: True for HIGH, False for FLOAT
+        """
+        value = 1 if is_high else 0
+        if self.vnet_high[vnet_i] != value:
+            self.vnet_high[vnet_i] = value
+            self.state_hash ^= self._hash_keys[vnet_i]
+        self.vnet_objects[vnet_i].state = PinState.HIGH if is_high else PinState.FLOAT
+
+    def is_driven_high(self, vnet_indices: Iterable[int]) -> bool:
+        """
+        Check whether any drive source of the given VNETs is HIGH.
+
+        VNET.state is not a drive source: only component pin states can
+        actively assert HIGH.
+
+        Args:
+            vnet_indices: VNET indices (typically one connectivity group)
+
+        Returns:
+            True if at least one drive source is HIGH
+        """
+        high = PinState.HIGH
+        vnet_drivers = self.vnet_drivers
+        for vnet_i in vnet_indices:
+            for source in vnet_drivers[vnet_i]:
+                if source.state == high:
+                    return True
+        return False
+
+    # === QUERIES ===
+
+    def get_vnet_index(self, vnet_id: str) -> int:
+        """
+        Get the index of a VNET.
+
+        Args:
+            vnet_id: VNET ID
+
+        Returns:
+            VNET index, or -1 if the VNET is not part of the netlist
+        """
+        return self.vnet_index.get(vnet_id, -1)
+
+    def get_vnet_for_tab(self, tab_id: str) -> int:
+        """
+        Get the index of the VNET containing a tab.
+
+        Args:
+            tab_id: Tab ID
+
+        Returns:
+            VNET index, or -1 if unknown
+        """
+        tab_i = self.tab_index.get(tab_id)
+        if tab_i is None:
+            return -1
+        return self.tab_vnet[tab_i]
+
+    def get_statistics(self) -> dict:
+        """
+        Get statistics about the compiled netlist.
+
+        Returns:
+            Dictionary with statistics
+        """
+        return {
+            'vnets': len(self.vnet_ids),
+            'tabs': len(self.tab_ids),
+            'link_groups': len(self.group_vnets),
+            'drive_sources': sum(len(d) for d in self.vnet_drivers),
+            'component_fanout': sum(len(c) for c in self.vnet_components)
+        }
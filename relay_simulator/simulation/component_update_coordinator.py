@@ -10,11 +10,12 @@ Date: 2025-12-10
 """
 
 import threading
-from typing import Dict, Set, List, Optional
+from typing import Dict, Set, List, Optional, Iterable, Tuple
 from threading import Event, RLock
 from components.base import Component
 from core.vnet import VNET
 from core.tab import Tab
+from core.locking import NULL_LOCK
 
 
 class ComponentUpdateCoordinator:
@@ -35,6 +36,8 @@ class ComponentUpdateCoordinator:
         _pending_updates: Set of component IDs with pending updates
         _completion_event: Event signaled when all updates complete
         _queued_components: Set of component IDs currently queued
+        _fanout: Optional VNET ID -> tuple of connected component IDs
+                 (built once at simulation start, see build_fanout_index)
     """
     
     def __init__(self, components: Dict[str, Component], tabs: Dict[str, Tab]):
@@ -51,10 +54,23 @@ class ComponentUpdateCoordinator:
         self._pending_updates: Set[str] = set()
         self._completion_event = Event()
         self._queued_components: Set[str] = set()
+        self._fanout: Optional[Dict[str, Tuple[str, ...]]] = None
         
         # Initially, nothing is pending, so we're in "completed" state
         self._completion_event.set()
     
+    def set_single_writer(self, enabled: bool):
+        """
+        Skip locking while the simulation engine owns this coordinator.
+        
+        In single-writer mode only the thread holding the engine's run lock
+        may call it. Switch only while no other thread uses it.
+        
+        Args:
+            enabled: True to use no lock, False to restore a real lock
+        """
+        self._lock = NULL_LOCK if enabled else RLock()
+    
     def queue_component_update(self, component_id: str) -> bool:
         """
         Queue a component for logic update.
@@ -103,6 +119,87 @@ class ComponentUpdateCoordinator:
                 count += 1
         return count
     
+    def queue_components(self, component_ids: Iterable[str]) -> int:
+        """
+        Queue known-valid component IDs with a single set union.
+        
+        Fast path for precomputed fan-out tuples. IDs must be keys of the
+        components dictionary. Already queued or pending components are
+        skipped, as in queue_component_update().
+        
+        Args:
+            component_ids: Component IDs to queue
+            
+        Returns:
+            Number of components newly queued
+        """
+        with self._lock:
+            queued = self._queued_components
+            before = len(queued)
+            if self._pending_updates:
+                queued.update(set(component_ids).difference(self._pending_updates))
+            else:
+                queued.update(component_ids)
+            count = len(queued) - before
+            if count:
+                self._completion_event.clear()
+            return count
+    
+    def _components_for_vnet(self, vnet: VNET) -> Set[str]:
+        """Find all unique components with tabs in a VNET (slow path)."""
+        connected_component_ids = set()
+        for tab_id in vnet.get_all_tabs():
+            tab = self._tabs.get(tab_id)
+            if tab and tab.parent_pin and tab.parent_pin.parent_component:
+                component_id = tab.parent_pin.parent_component.component_id
+                if component_id in self._components:
+                    connected_component_ids.add(component_id)
+        return connected_component_ids
+    
+    def build_fanout_index(self, vnets: Dict[str, VNET]):
+        """
+        Build the VNET -> component fan-out table.
+        
+        Called once at simulation start. Tabs never move between VNETs while
+        the simulation runs, and bridges join VNETs without changing which
+        components sit on each VNET, so the table stays valid until the
+        circuit is rebuilt.
+        
+        Args:
+            vnets: Dictionary of all VNETs by ID
+        """
+        fanout = {
+            vnet_id: tuple(self._components_for_vnet(vnet))
+            for vnet_id, vnet in vnets.items() if vnet
+        }
+        with self._lock:
+            self._fanout = fanout
+    
+    def set_fanout_index(self, fanout: Optional[Dict[str, Tuple[str, ...]]]):
+        """
+        Install a precomputed fan-out table (e.g. from a CompiledNetlist).
+        
+        Args:
+            fanout: VNET ID -> tuple of component IDs, or None to drop the table
+        """
+        with self._lock:
+            self._fanout = fanout
+    
+    def get_components_for_vnet(self, vnet_id: str) -> Tuple[str, ...]:
+        """
+        Get the fan-out of a VNET from the index.
+        
+        Args:
+            vnet_id: VNET ID
+            
+        Returns:
+            Tuple of component IDs (empty if no index or unknown VNET)
+        """
+        with self._lock:
+            if self._fanout is None:
+                return ()
+            return self._fanout.get(vnet_id, ())
+    
     def queue_components_for_vnet(self, vnet: VNET) -> int:
         """
         Queue all components connected to a VNET for updates.
@@ -111,6 +208,8 @@ class ComponentUpdateCoordinator:
         them for logic updates. This is typically called after a VNET's
         state changes.
         
+        Uses the fan-out index when built; otherwise walks the VNET's tabs.
+        
         Args:
             vnet: The VNET whose connected components should be queued
             
@@ -118,18 +217,13 @@ class ComponentUpdateCoordinator:
             Number of components successfully queued
         """
         with self._lock:
-            # Find all unique components connected to this VNET
-            connected_component_ids = set()
-            
-            # Get all tab IDs from the VNET
-            for tab_id in vnet.get_all_tabs():
-                tab = self._tabs.get(tab_id)
-                if tab and tab.parent_pin and tab.parent_pin.parent_component:
-                    component_id = tab.parent_pin.parent_component.component_id
-                    connected_component_ids.add(component_id)
+            if self._fanout is not None:
+                component_ids = self._fanout.get(vnet.vnet_id)
+                if component_ids is not None:
+                    return self.queue_components(component_ids)
             
             # Queue all connected components
-            return self.queue_multiple_updates(connected_component_ids)
+            return self.queue_components(self._components_for_vnet(vnet))
     
     def queue_components_for_vnets(self, vnets: List[VNET]) -> int:
         """
@@ -144,16 +238,10 @@ class ComponentUpdateCoordinator:
             Number of components successfully queued
         """
         with self._lock:
-            all_component_ids = set()
-            
+            count = 0
             for vnet in vnets:
-                for tab_id in vnet.get_all_tabs():
-                    tab = self._tabs.get(tab_id)
-                    if tab and tab.parent_pin and tab.parent_pin.parent_component:
-                        component_id = tab.parent_pin.parent_component.component_id
-                        all_component_ids.add(component_id)
-            
-            return self.queue_multiple_updates(all_component_ids)
+                count += self.queue_components_for_vnet(vnet)
+            return count
     
     def start_updates(self) -> int:
         """
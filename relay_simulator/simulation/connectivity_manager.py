@@ -0,0 +1,466 @@
+"""
+Connectivity Manager - Incremental connectivity groups for the simulation loop
+
+A connectivity group is a set of VNETs that are electrically joined through
+link names (static, resolved before simulation) and bridges (dynamic, created
+and removed by components such as relays while the simulation runs).
+
+Rebuilding the groups from scratch on every iteration costs O(VNETs + bridges +
+links) even when only one relay contact moved. This manager keeps the groups
+up to date incrementally instead:
+
+1. VNETs sharing a link name are collapsed once into static link clusters
+   (taken from the CompiledNetlist link groups when a netlist is attached)
+2. Bridges become edges between clusters (with a multiplicity count)
+3. Adding a bridge merges two groups (smaller group relabelled into larger)
+4. Removing a bridge searches the old group from both endpoints and splits
+   off the smaller side if they are no longer connected
+5. Groups touched by bridge changes are remembered so the engine can
+   re-evaluate exactly the groups affected by dirty VNETs or changed bridges
+
+The resulting groups are identical to a full union-find recompute over the
+same VNETs, bridges and link names (see rebuild_groups()).
+"""
+
+from collections import defaultdict, deque
+from threading import RLock
+from typing import Dict, Hashable, Iterable, List, Optional, Set, Tuple
+
+from core.vnet import VNET
+from core.bridge import Bridge
+from core.locking import NULL_LOCK
+from simulation.compiled_netlist import CompiledNetlist
+
+
+class ConnectivityManager:
+    """
+    Maintains connectivity groups across links and bridges incrementally.
+
+    The manager is built lazily (see build()) so that bridges created by
+    components during sim_start() are picked up from the bridge dictionary.
+    After that, BridgeManager reports every bridge change through
+    add_bridge()/remove_bridge().
+
+    Link names are treated as static once built. Call invalidate() if link
+    names change while the simulation is running.
+
+    When a CompiledNetlist is attached, its static link groups are used as the
+    clusters and collect_group_indices() returns groups as VNET indices.
+
+    Thread-safe: Uses an RLock because relay timer threads may change bridges
+    while the engine is evaluating groups.
+
+    Attributes:
+        vnets: Dictionary of all VNETs by ID
+        bridges: Dictionary of all bridges by ID
+        netlist: Optional CompiledNetlist providing link groups and indices
+    """
+
+    def __init__(
+        self,
+        vnets: Dict[str, VNET],
+        bridges: Dict[str, Bridge],
+        netlist: Optional[CompiledNetlist] = None
+    ):
+        """
+        Initialize the connectivity manager.
+
+        Args:
+            vnets: Dictionary of all VNETs by ID
+            bridges: Dictionary of all bridges by ID
+            netlist: Optional CompiledNetlist (can also be attached before build())
+        """
+        self.vnets = vnets
+        self.bridges = bridges
+        self.netlist = netlist
+        self._lock = RLock()
+        self._built = False
+
+        # Static link clusters: vnet_id -> cluster_id, cluster_id -> member vnet IDs.
+        # Cluster IDs are root VNET IDs, or netlist link group indices.
+        self._cluster_of: Dict[str, Hashable] = {}
+        self._cluster_members: Dict[Hashable, Tuple[str, ...]] = {}
+
+        # Dynamic bridge edges between clusters
+        self._bridge_edges: Dict[str, Optional[Tuple[Hashable, Hashable]]] = {}
+        self._cluster_edges: Dict[Hashable, Dict[Hashable, int]] = defaultdict(dict)
+
+        # Groups: cluster_id -> group_id, group_id -> set of cluster IDs
+        self._group_of: Dict[Hashable, int] = {}
+        self._group_clusters: Dict[int, Set[Hashable]] = {}
+        self._next_group_id = 0
+
+        # Clusters whose group changed since the last collect_groups()
+        self._touched_clusters: Set[Hashable] = set()
+
+    # === BUILD ===
+
+    def set_single_writer(self, enabled: bool):
+        """
+        Skip locking while the simulation engine owns this manager.
+
+        In single-writer mode only the thread holding the engine's run lock
+        may call it. Switch only while no other thread uses it.
+
+        Args:
+            enabled: True to use no lock, False to restore a real lock
+        """
+        self._lock = NULL_LOCK if enabled else RLock()
+
+    def is_built(self) -> bool:
+        """Check whether the connectivity structure has been built."""
+        with self._lock:
+            return self._built
+
+    def invalidate(self):
+        """Discard the structure so the next sync() rebuilds it from scratch."""
+        with self._lock:
+            self._built = False
+
+    def build(self):
+        """
+        Build link clusters and groups from the current VNETs and bridges.
+
+        Link clusters are formed once. Every bridge in the bridge dictionary
+        is then added as an edge, merging groups as needed.
+        """
+        with self._lock:
+            self._cluster_of.clear()
+            self._cluster_members.clear()
+            self._bridge_edges.clear()
+            self._cluster_edges.clear()
+            self._group_of.clear()
+            self._group_clusters.clear()
+            self._touched_clusters.clear()
+
+            members: Dict[Hashable, List[str]] = defaultdict(list)
+            if self.netlist is not None:
+                vnet_ids = self.netlist.vnet_ids
+                for group_i, vnet_indices in enumerate(self.netlist.group_vnets):
+                    members[group_i] = [vnet_ids[i] for i in vnet_indices]
+            else:
+                parent = self._link_union_find()
+                for vnet_id in self.vnets.keys():
+                    members[parent[vnet_id]].append(vnet_id)
+
+            for cluster_id, vnet_ids in members.items():
+                self._cluster_members[cluster_id] = tuple(vnet_ids)
+                for vnet_id in vnet_ids:
+                    self._cluster_of[vnet_id] = cluster_id
+                group_id = self._new_group_id()
+                self._group_of[cluster_id] = group_id
+                self._group_clusters[group_id] = {cluster_id}
+
+            self._built = True
+
+            for bridge_id, bridge in list(self.bridges.items()):
+                if bridge:
+                    self._add_edge(bridge_id, bridge.vnet_id1, bridge.vnet_id2)
+
+    def sync(self):
+        """
+        Make sure the structure reflects the bridge dictionary.
+
+        Builds the structure on first use. Afterwards only reconciles bridges
+        that were added to or removed from the dictionary without going
+        through BridgeManager (O(1) when nothing was missed).
+        """
+        with self._lock:
+            if not self._built:
+                self.build()
+                return
+
+            if self.bridges.keys() == self._bridge_edges.keys():
+                return
+
+            for bridge_id in [b for b in self._bridge_edges if b not in self.bridges]:
+                self._remove_edge(bridge_id)
+            for bridge_id, bridge in list(self.bridges.items()):
+                if bridge and bridge_id not in self._bridge_edges:
+                    self._add_edge(bridge_id, bridge.vnet_id1, bridge.vnet_id2)
+
+    def _link_union_find(self) -> Dict[str, str]:
+        """Union VNETs that share link names. Returns vnet_id -> root vnet_id."""
+        parent: Dict[str, str] = {vnet_id: vnet_id for vnet_id in self.vnets.keys()}
+
+        def find(x: str) -> str:
+            while parent[x] != x:
+                parent[x] = parent[parent[x]]
+                x = parent[x]
+            return x
+
+        first_for_link: Dict[str, str] = {}
+        for vnet_id, vnet in self.vnets.items():
+            if not vnet:
+                continue
+            for link_name in getattr(vnet, 'link_names', set()) or set():
+                if not link_name:
+                    continue
+                first = first_for_link.setdefault(link_name, vnet_id)
+                if first != vnet_id:
+                    ra, rb = find(first), find(vnet_id)
+                    if ra != rb:
+                        parent[rb] = ra
+
+        return {vnet_id: find(vnet_id) for vnet_id in parent}
+
+    def _new_group_id(self) -> int:
+        group_id = self._next_group_id
+        self._next_group_id += 1
+        return group_id
+
+    # === BRIDGE UPDATES ===
+
+    def add_bridge(self, bridge_id: str, vnet_id1: str, vnet_id2: str):
+        """
+        Record a new bridge, merging the two groups it connects.
+
+        Args:
+            bridge_id: Bridge ID
+            vnet_id1: First VNET ID
+            vnet_id2: Second VNET ID
+        """
+        with self._lock:
+            if self._built:
+                self._add_edge(bridge_id, vnet_id1, vnet_id2)
+
+    def remove_bridge(self, bridge_id: str):
+        """
+        Forget a bridge, splitting its group if it was the last connection.
+
+        Args:
+            bridge_id: Bridge ID
+        """
+        with self._lock:
+            if self._built:
+                self._remove_edge(bridge_id)
+
+    def _add_edge(self, bridge_id: str, vnet_id1: str, vnet_id2: str):
+        if bridge_id in self._bridge_edges:
+            self._remove_edge(bridge_id)
+
+        c1 = self._cluster_of.get(vnet_id1)
+        c2 = self._cluster_of.get(vnet_id2)
+        if c1 is None or c2 is None:
+            # Bridge to an unknown VNET has no electrical effect
+            self._bridge_edges[bridge_id] = None
+            return
+
+        self._bridge_edges[bridge_id] = (c1, c2)
+        self._touched_clusters.add(c1)
+        self._touched_clusters.add(c2)
+        if c1 == c2:
+            return
+
+        count = self._cluster_edges[c1].get(c2, 0)
+        self._cluster_edges[c1][c2] = count + 1
+        self._cluster_edges[c2][c1] = count + 1
+        if count == 0:
+            self._merge_groups(self._group_of[c1], self._group_of[c2])
+
+    def _remove_edge(self, bridge_id: str):
+        edge = self._bridge_edges.pop(bridge_id, None)
+        if edge is None:
+            return
+
+        c1, c2 = edge
+        self._touched_clusters.add(c1)
+        self._touched_clusters.add(c2)
+        if c1 == c2:
+            return
+
+        count = self._cluster_edges[c1].get(c2, 0) - 1
+        if count > 0:
+            self._cluster_edges[c1][c2] = count
+            self._cluster_edges[c2][c1] = count
+            return
+
+        self._cluster_edges[c1].pop(c2, None)
+        self._cluster_edges[c2].pop(c1, None)
+        self._split_if_disconnected(c1, c2)
+
+    def _merge_groups(self, g1: int, g2: int):
+        """Merge two groups, relabelling the smaller into the larger."""
+        if g1 == g2:
+            return
+        if len(self._group_clusters[g1]) < len(self._group_clusters[g2]):
+            g1, g2 = g2, g1
+        absorbed = self._group_clusters.pop(g2)
+        for cluster_id in absorbed:
+            self._group_of[cluster_id] = g1
+        self._group_clusters[g1].update(absorbed)
+
+    def _split_if_disconnected(self, c1: Hashable, c2: Hashable):
+        """
+        Split the group of c1/c2 if they are no longer connected.
+
+        Searches from both endpoints in lockstep and stops as soon as the
+        searches meet or one side is exhausted, so the cost is bounded by the
+        smaller of the two resulting groups.
+        """
+        seen1, seen2 = {c1}, {c2}
+        queue1, queue2 = deque([c1]), deque([c2])
+
+        while queue1 and queue2:
+            for seen, other_seen, queue in ((seen1, seen2, queue1), (seen2, seen1, queue2)):
+                cluster_id = queue.popleft()
+                for neighbor in self._cluster_edges.get(cluster_id, {}):
+                    if neighbor in other_seen:
+                        return  # Still connected
+                    if neighbor not in seen:
+                        seen.add(neighbor)
+                        queue.append(neighbor)
+                if not queue:
+                    break
+
+        # One side is exhausted without meeting the other: split it off
+        split_off = seen1 if not queue1 else seen2
+        old_group = self._group_of[c1]
+        new_group = self._new_group_id()
+        self._group_clusters[old_group].difference_update(split_off)
+        self._group_clusters[new_group] = split_off
+        for cluster_id in split_off:
+            self._group_of[cluster_id] = new_group
+
+    # === QUERIES ===
+
+    def collect_groups(self, vnet_ids: Iterable[str]) -> List[List[str]]:
+        """
+        Get member VNET IDs of every group touched since the last call.
+
+        A group is touched if it contains one of the given (dirty) VNET IDs,
+        or if a bridge change affected it since the previous call.
+
+        Args:
+            vnet_ids: IDs of VNETs needing re-evaluation
+
+        Returns:
+            List of groups, each a list of member VNET IDs
+        """
+        with self._lock:
+            group_ids: Set[int] = set()
+            for vnet_id in vnet_ids:
+                cluster_id = self._cluster_of.get(vnet_id)
+                if cluster_id is not None:
+                    group_ids.add(self._group_of[cluster_id])
+            for cluster_id in self._touched_clusters:
+                group_ids.add(self._group_of[cluster_id])
+            self._touched_clusters.clear()
+
+            return [self._members_of(group_id) for group_id in group_ids]
+
+    def collect_group_indices(self, vnet_indices: Iterable[int]) -> List[List[int]]:
+        """
+        Index-based collect_groups() for use with the attached CompiledNetlist.
+
+        Args:
+            vnet_indices: Netlist indices of VNETs needing re-evaluation
+
+        Returns:
+            List of groups, each a list of member VNET indices
+        """
+        with self._lock:
+            vnet_group = self.netlist.vnet_group
+            group_vnets = self.netlist.group_vnets
+            group_of = self._group_of
+
+            group_ids: Set[int] = set()
+            for vnet_i in vnet_indices:
+                group_ids.add(group_of[vnet_group[vnet_i]])
+            for cluster_id in self._touched_clusters:
+                group_ids.add(group_of[cluster_id])
+            self._touched_clusters.clear()
+
+            groups: List[List[int]] = []
+            for group_id in group_ids:
+                members: List[int] = []
+                for cluster_id in self._group_clusters[group_id]:
+                    members.extend(group_vnets[cluster_id])
+                groups.append(members)
+            return groups
+
+    def get_group_for_vnet(self, vnet_id: str) -> Set[str]:
+        """
+        Get all VNET IDs in the same group as a VNET.
+
+        Args:
+            vnet_id: VNET ID
+
+        Returns:
+            Set of VNET IDs (empty if VNET unknown)
+        """
+        with self._lock:
+            cluster_id = self._cluster_of.get(vnet_id)
+            if cluster_id is None:
+                return set()
+            return set(self._members_of(self._group_of[cluster_id]))
+
+    def get_all_groups(self) -> List[Set[str]]:
+        """
+        Get every connectivity group.
+
+        Returns:
+            List of sets of VNET IDs
+        """
+        with self._lock:
+            return [set(self._members_of(group_id)) for group_id in self._group_clusters]
+
+    def get_group_count(self) -> int:
+        """Get the number of connectivity groups."""
+        with self._lock:
+            return len(self._group_clusters)
+
+    def _members_of(self, group_id: int) -> List[str]:
+        members: List[str] = []
+        for cluster_id in self._group_clusters[group_id]:
+            members.extend(self._cluster_members[cluster_id])
+        return members
+
+    def rebuild_groups(self) -> List[Set[str]]:
+        """
+        Compute groups with a full union-find over links and bridges.
+
+        This is the reference (non-incremental) computation. It does not
+        modify the incremental structure and is intended for verification.
+
+        Returns:
+            List of sets of VNET IDs
+        """
+        parent = self._link_union_find()
+
+        def find(x: str) -> str:
+            while parent[x] != x:
+                parent[x] = parent[parent[x]]
+                x = parent[x]
+            return x
+
+        for bridge in list(self.bridges.values()):
+            if not bridge:
+                continue
+            v1 = getattr(bridge, 'vnet_id1', None)
+            v2 = getattr(bridge, 'vnet_id2', None)
+            if v1 in parent and v2 in parent:
+                ra, rb = find(v1), find(v2)
+                if ra != rb:
+                    parent[rb] = ra
+
+        groups: Dict[str, Set[str]] = defaultdict(set)
+        for vnet_id in self.vnets.keys():
+            groups[find(vnet_id)].add(vnet_id)
+        return list(groups.values())
+
+    def get_statistics(self) -> dict:
+        """
+        Get statistics about connectivity groups.
+
+        Returns:
+            Dictionary with statistics
+        """
+        with self._lock:
+            return {
+                'built': self._built,
+                'link_clusters': len(self._cluster_members),
+                'groups': len(self._group_clusters),
+                'bridges': len(self._bridge_edges),
+                'touched_clusters': len(self._touched_clusters)
+            }
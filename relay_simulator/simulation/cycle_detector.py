@@ -0,0 +1,204 @@
+"""
+Cycle Detector - Oscillation detection by state fingerprinting
+
+A circuit oscillates when it keeps revisiting the same states. Instead of
+waiting for an iteration limit, the engine fingerprints its state after
+every iteration (or every relay-driven settle step):
+
+- VNET states: the Zobrist hash kept by CompiledNetlist (O(1) per change)
+- Bridges: the XOR hash kept by BridgeManager (O(1) per bridge change)
+
+Only the fingerprint is stored per observation. The exact state (compact
+bitset + bridge set) is copied only when a fingerprint has been seen before
+within the window, which is rare unless the circuit is cycling. A cycle of
+length p is reported once the fingerprint sequence has repeated for
+'repeats' full periods and the exact states of the last period are known
+and match, which rules out hash collisions and one-off revisits. Because
+exact states start at the first revisit, a cycle of 2 periods is confirmed
+one observation after its second period. The report lists the VNETs that
+change within the cycle and the components taking part (components on
+those VNETs and owners of toggling bridges).
+"""
+
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Deque, Dict, FrozenSet, List, Optional, Tuple
+
+from simulation.bridge_manager import BridgeManager
+from simulation.compiled_netlist import CompiledNetlist
+
+
+@dataclass
+class OscillationReport:
+    """Description of a detected state cycle."""
+    cycle_length: int = 0
+    detected_at: int = 0
+    period: Optional[float] = None
+    vnet_ids: List[str] = field(default_factory=list)
+    component_ids: List[str] = field(default_factory=list)
+
+    def describe(self) -> str:
+        """One-line summary for status bars and logs."""
+        text = f"cycle of {self.cycle_length}"
+        if self.period is not None:
+            text += f" steps ({self.period * 1000:.1f} ms)"
+        else:
+            text += " iterations"
+        return f"{text} through {len(self.vnet_ids)} VNETs, {len(self.component_ids)} components"
+
+
+# Exact state copied at a revisit: (VNET state bitset, bridge set)
+_Snapshot = Tuple[bytes, FrozenSet[Tuple[str, str, str]]]
+
+
+class CycleDetector:
+    """
+    Detects repeated engine states from a sequence of observations.
+
+    Call observe() at each point where the state should be compared (after
+    an iteration or a settle step) and clear() whenever an external input
+    starts a new sequence. Only the last 'history' observations are kept.
+    """
+
+    def __init__(
+        self,
+        netlist: CompiledNetlist,
+        bridge_manager: Optional[BridgeManager] = None,
+        history: int = 4096,
+        min_period: int = 2,
+        repeats: int = 2
+    ):
+        """
+        Initialize the detector.
+
+        Args:
+            netlist: Compiled netlist whose state array is fingerprinted
+            bridge_manager: Bridge manager whose bridges are fingerprinted
+                            (None = circuit without bridges)
+            history: Maximum number of observations kept
+            min_period: Shortest cycle reported (a period of 1 is a state
+                that merely did not change between observations)
+            repeats: Full periods that must repeat before reporting
+        """
+        self.netlist = netlist
+        self.bridge_manager = bridge_manager
+        self.min_period = min_period
+        self.repeats = repeats
+        # (fingerprint, simulated time) per observation
+        self._entries: Deque[Tuple[int, Optional[float]]] = deque(maxlen=history)
+        # Latest position of each fingerprint in the window
+        self._last_seen: Dict[int, int] = {}
+        # Exact states of revisited observations by position
+        self._snapshots: Dict[int, _Snapshot] = {}
+        self._count = 0
+
+    def clear(self):
+        """Forget all observations."""
+        self._entries.clear()
+        self._last_seen.clear()
+        self._snapshots.clear()
+        self._count = 0
+
+    def _snapshot(self) -> _Snapshot:
+        pairs = []
+        if self.bridge_manager is not None:
+            for bridge in list(self.bridge_manager.bridges.values()):
+                a, b = bridge.vnet_id1, bridge.vnet_id2
+                if b < a:
+                    a, b = b, a
+                pairs.append((a, b, bridge.owner_component_id))
+        return bytes(self.netlist.vnet_high), frozenset(pairs)
+
+    def _entry(self, position: int) -> Tuple[int, Optional[float]]:
+        return self._entries[position - (self._count - len(self._entries))]
+
+    def observe(self, sim_time: Optional[float] = None) -> Optional[OscillationReport]:
+        """
+        Record the current state and check for a cycle.
+
+        Args:
+            sim_time: Simulated time of the observation (settle steps)
+
+        Returns:
+            OscillationReport if the state sequence is cycling, else None
+        """
+        fingerprint = self.netlist.state_hash
+        if self.bridge_manager is not None:
+            fingerprint ^= self.bridge_manager.bridge_hash
+
+        entries = self._entries
+        if len(entries) == entries.maxlen:
+            # Forget the observation about to leave the window
+            dropped = self._count - len(entries)
+            old_fingerprint = entries[0][0]
+            if self._last_seen.get(old_fingerprint) == dropped:
+                del self._last_seen[old_fingerprint]
+            self._snapshots.pop(dropped, None)
+
+        position = self._count
+        entries.append((fingerprint, sim_time))
+        self._count += 1
+        previous = self._last_seen.get(fingerprint)
+        self._last_seen[fingerprint] = position
+        if previous is None:
+            return None
+        self._snapshots[position] = self._snapshot()
+
+        oldest = self._count - len(entries)
+        period = position - previous
+        start = position - self.repeats * period + 1
+        if period < self.min_period or start < oldest:
+            return None
+
+        # Every period in the window has identical fingerprints...
+        last = position - period + 1
+        for begin in range(start, last, period):
+            for offset in range(period):
+                if self._entry(begin + offset)[0] != self._entry(last + offset)[0]:
+                    return None
+        # ...the last period's exact states are known...
+        snapshots = self._snapshots
+        if any(p not in snapshots for p in range(previous, position)):
+            return None
+        # ...and the repeated state is really the same (not a hash collision)
+        if snapshots[position] != snapshots[previous]:
+            return None
+
+        return self._build_report(position, period)
+
+    def _build_report(self, position: int, period: int) -> OscillationReport:
+        """Collect the VNETs and components that change within the cycle."""
+        cycle = [self._snapshots[position - offset] for offset in range(period + 1)]
+
+        netlist = self.netlist
+        changed = set()
+        reference = cycle[0][0]
+        for states, _ in cycle[1:]:
+            if states != reference:
+                changed.update(i for i, (a, b) in enumerate(zip(states, reference)) if a != b)
+
+        component_ids = {}
+        for vnet_i in sorted(changed):
+            for component_id in netlist.vnet_components[vnet_i]:
+                component_ids[component_id] = None
+
+        all_bridges = set()
+        common_bridges = set(cycle[0][1])
+        for _, bridge_set in cycle:
+            all_bridges |= bridge_set
+            common_bridges &= bridge_set
+        for _, _, owner in sorted(all_bridges - common_bridges):
+            if owner:
+                component_ids[owner] = None
+
+        report = OscillationReport(
+            cycle_length=period,
+            detected_at=position,
+            vnet_ids=[netlist.vnet_ids[vnet_i] for vnet_i in sorted(changed)],
+            component_ids=list(component_ids)
+        )
+        first_time = self._entry(position)[1]
+        last_time = self._entry(position - period)[1]
+        if first_time is not None and last_time is not None:
+            report.period = first_time - last_time
+        return report
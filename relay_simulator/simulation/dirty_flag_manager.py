@@ -18,11 +18,17 @@ A VNET becomes dirty when:
 - The simulation first starts (all VNETs dirty initially)
 
 The simulation reaches stability when no VNETs are dirty.
+
+Dirty VNETs are kept in an explicit FIFO queue (an insertion-ordered dict)
+fed by mark_dirty() and by the VNETs themselves (state setter, bridge
+changes) through a dirty listener. Retrieval therefore costs O(dirty VNETs)
+instead of scanning every VNET.
 """
 
 from typing import Dict, Set, List, Optional
 from threading import RLock
 from core.vnet import VNET
+from core.locking import NULL_LOCK
 from core.state import PinState
 
 
@@ -37,9 +43,15 @@ class DirtyFlagManager:
     Thread-safe: All operations use locking to ensure correct behavior
     in multi-threaded simulation scenarios.
     
+    The manager registers itself as dirty listener on every VNET, so the
+    queue also sees VNETs dirtied directly (e.g. vnet.state = ...). Entries
+    whose flag was cleared directly on the VNET are dropped on retrieval.
+    
     Attributes:
         _vnets: Dictionary mapping vnet_id -> VNET object
         _lock: Reentrant lock for thread-safety
+        _dirty_queue: Insertion-ordered dirty VNET IDs (dict used as FIFO set)
+        _peak_depth: Largest queue depth seen since reset_peak_depth()
     """
     
     def __init__(self, vnets: Dict[str, VNET]):
@@ -51,6 +63,69 @@ class DirtyFlagManager:
         """
         self._vnets = vnets
         self._lock = RLock()  # Reentrant lock for nested calls
+        self._dirty_queue: Dict[str, None] = {}
+        self._peak_depth = 0
+        
+        for vnet in vnets.values():
+            self.register_vnet(vnet)
+    
+    def set_single_writer(self, enabled: bool):
+        """
+        Skip locking while the simulation engine owns the dirty queue.
+        
+        In single-writer mode only the thread holding the engine's run lock
+        may call this manager. Switch only while no other thread uses it.
+        
+        Args:
+            enabled: True to use no lock, False to restore a real lock
+        """
+        self._lock = NULL_LOCK if enabled else RLock()
+    
+    def register_vnet(self, vnet: VNET):
+        """
+        Start tracking dirty notifications from a VNET.
+        
+        Called for every VNET at construction. Call it for VNETs added to the
+        dictionary afterwards.
+        
+        Args:
+            vnet: VNET to track
+        """
+        if not vnet:
+            return
+        vnet.set_dirty_listener(self._on_vnet_dirty)
+        if vnet.is_dirty():
+            self._enqueue(vnet.vnet_id)
+    
+    def _on_vnet_dirty(self, vnet: VNET):
+        """Dirty listener: a VNET went from clean to dirty."""
+        self._enqueue(vnet.vnet_id)
+    
+    def _enqueue(self, vnet_id: str):
+        with self._lock:
+            queue = self._dirty_queue
+            if vnet_id not in queue:
+                queue[vnet_id] = None
+                if len(queue) > self._peak_depth:
+                    self._peak_depth = len(queue)
+    
+    def _live_dirty_ids(self) -> List[str]:
+        """
+        Get queued IDs that are still dirty, dropping stale entries.
+        
+        Must be called with the lock held.
+        """
+        stale = []
+        live = []
+        for vnet_id in self._dirty_queue:
+            vnet = self._vnets.get(vnet_id)
+            if vnet and vnet.is_dirty():
+                live.append(vnet_id)
+            else:
+                stale.append(vnet_id)
+        for vnet_id in stale:
+            del self._dirty_queue[vnet_id]
+        return live
     
     def mark_dirty(self, vnet_id: str) -> bool:
         """
@@ -68,6 +143,7 @@ class DirtyFlagManager:
             vnet = self._vnets.get(vnet_id)
             if vnet:
                 vnet.mark_dirty()
+                self._enqueue(vnet_id)
                 return True
             return False
     
@@ -103,6 +179,7 @@ class DirtyFlagManager:
             True if VNET was cleared, False if not found
         """
         with self._lock:
+            self._dirty_queue.pop(vnet_id, None)
             vnet = self._vnets.get(vnet_id)
             if vnet:
                 vnet.clear_dirty()
@@ -142,6 +219,7 @@ class DirtyFlagManager:
             for vnet in self._vnets.values():
                 vnet.clear_dirty()
                 count += 1
+            self._dirty_queue.clear()
             return count
     
     def is_dirty(self, vnet_id: str) -> bool:
@@ -164,35 +242,27 @@ class DirtyFlagManager:
     
     def get_dirty_vnets(self) -> List[VNET]:
         """
-        Get all VNETs that are currently dirty.
+        Get all VNETs that are currently dirty, in the order they became dirty.
         
-        Thread-safe operation.
+        Thread-safe operation. Cost is O(dirty VNETs).
         
         Returns:
             List of dirty VNET objects
         """
         with self._lock:
-            dirty_vnets = []
-            for vnet in self._vnets.values():
-                if vnet.is_dirty():
-                    dirty_vnets.append(vnet)
-            return dirty_vnets
+            return [self._vnets[vnet_id] for vnet_id in self._live_dirty_ids()]
     
     def get_dirty_vnet_ids(self) -> Set[str]:
         """
         Get IDs of all VNETs that are currently dirty.
         
-        Thread-safe operation.
+        Thread-safe operation. Cost is O(dirty VNETs).
         
         Returns:
             Set of dirty VNET IDs
         """
         with self._lock:
-            dirty_ids = set()
-            for vnet_id, vnet in self._vnets.items():
-                if vnet.is_dirty():
-                    dirty_ids.add(vnet_id)
-            return dirty_ids
+            return set(self._live_dirty_ids())
     
     def has_dirty_vnets(self) -> bool:
         """
@@ -204,10 +274,7 @@ class DirtyFlagManager:
             True if at least one VNET is dirty, False if all clean (stable)
         """
         with self._lock:
-            for vnet in self._vnets.values():
-                if vnet.is_dirty():
-                    return True
-            return False
+            return bool(self._live_dirty_ids())
     
     def is_stable(self) -> bool:
         """
@@ -230,11 +297,7 @@ class DirtyFlagManager:
             Number of dirty VNETs
         """
         with self._lock:
-            count = 0
-            for vnet in self._vnets.values():
-                if vnet.is_dirty():
-                    count += 1
-            return count
+            return len(self._live_dirty_ids())
     
     def mark_all_dirty(self) -> int:
         """
@@ -249,8 +312,9 @@ class DirtyFlagManager:
         """
         with self._lock:
             count = 0
-            for vnet in self._vnets.values():
+            for vnet_id, vnet in self._vnets.items():
                 vnet.mark_dirty()
+                self._enqueue(vnet_id)
                 count += 1
             return count
     
@@ -282,6 +346,7 @@ class DirtyFlagManager:
             # Compare states
             if vnet.state != new_state:
                 vnet.mark_dirty()
+                self._enqueue(vnet_id)
                 return True
             
             return False
@@ -333,9 +398,31 @@ class DirtyFlagManager:
                 'dirty_vnets': dirty,
                 'clean_vnets': clean,
                 'dirty_percentage': (dirty / total * 100) if total > 0 else 0,
-                'is_stable': self.is_stable()
+                'is_stable': self.is_stable(),
+                'peak_dirty_depth': self._peak_depth
             }
     
+    def get_peak_depth(self) -> int:
+        """
+        Get the largest dirty-queue depth seen since the last reset_peak_depth().
+        
+        Thread-safe operation.
+        
+        Returns:
+            Peak number of queued dirty VNETs
+        """
+        with self._lock:
+            return self._peak_depth
+    
+    def reset_peak_depth(self):
+        """
+        Restart peak depth tracking (from the current queue depth).
+        
+        Thread-safe operation.
+        """
+        with self._lock:
+            self._peak_depth = len(self._dirty_queue)
+    
     def reset(self):
         """
         Clear all dirty flags and reset state.
@@ -347,3 +434,4 @@ class DirtyFlagManager:
         with self._lock:
             for vnet in self._vnets.values():
                 vnet.clear_dirty()
+            self._dirty_queue.clear()
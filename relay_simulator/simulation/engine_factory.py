@@ -9,12 +9,22 @@ Based on performance analysis (THREADING_BOTTLENECK_ANALYSIS.md):
 - Multi-threading only beneficial for circuits >2000 components
 - Default: Single-threaded
 - Option: Force multi-threaded or auto-detect based on component count
+- Option: Multi-process (components sharded by page into worker
+  processes, see process_sharded_engine.py) - never chosen by auto
+- Option: Calibrated - time each candidate engine on the actual circuit
+  and host, and cache the fastest per circuit hash and CPU count
 
 Author: Cascade AI
 Date: 2025-12-10
 """
 
-from typing import Dict, Optional, Union
+import hashlib
+import json
+import os
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple, Union
 from enum import Enum
 
 from core.vnet import VNET
@@ -23,13 +33,16 @@ from core.bridge import Bridge
 from components.base import Component
 from simulation.simulation_engine import SimulationEngine
 from simulation.threaded_simulation_engine import ThreadedSimulationEngine
+from simulation.process_sharded_engine import ProcessShardedSimulationEngine
 
 
 class EngineMode(Enum):
     """Simulation engine execution mode."""
     SINGLE_THREADED = "single"
     MULTI_THREADED = "multi"
+    MULTI_PROCESS = "process"
     AUTO = "auto"
+    CALIBRATED = "calibrated"
 
 
 class EngineConfig:
@@ -37,8 +50,9 @@ class EngineConfig:
     Configuration for simulation engine selection.
     
     Attributes:
-        mode: Execution mode (single, multi, or auto)
+        mode: Execution mode (single, multi, process, auto, or calibrated)
         thread_count: Number of worker threads (for multi-threaded mode)
+        process_count: Number of worker processes (for multi-process mode)
         auto_threshold: Component count threshold for auto mode (default: 2000)
         max_iterations: Maximum iterations before oscillation detection
         timeout_seconds: Maximum time before timeout
@@ -50,29 +64,36 @@ class EngineConfig:
         thread_count: Optional[int] = None,
         auto_threshold: int = 2000,
         max_iterations: int = 10000,
-        timeout_seconds: float = 30.0
+        timeout_seconds: float = 30.0,
+        process_count: Optional[int] = None
     ):
         """
         Initialize engine configuration.
         
         Args:
-            mode: Execution mode - 'single', 'multi', or 'auto' (default: auto)
+            mode: Execution mode - 'single', 'multi', 'process', 'auto' or
+                  'calibrated' (default: auto)
             thread_count: Number of threads for multi-threaded mode (None = CPU count)
             auto_threshold: Component count for auto mode to switch to multi-threaded
             max_iterations: Maximum simulation iterations
             timeout_seconds: Maximum simulation time
+            process_count: Number of worker processes for multi-process mode
+                           (None = CPU count - 1)
         """
         # Convert string to enum if needed
         if isinstance(mode, str):
             mode_map = {
                 'single': EngineMode.SINGLE_THREADED,
                 'multi': EngineMode.MULTI_THREADED,
-                'auto': EngineMode.AUTO
+                'process': EngineMode.MULTI_PROCESS,
+                'auto': EngineMode.AUTO,
+                'calibrated': EngineMode.CALIBRATED
             }
             mode = mode_map.get(mode.lower(), EngineMode.AUTO)
         
         self.mode = mode
         self.thread_count = thread_count
+        self.process_count = process_count
         self.auto_threshold = auto_threshold
         self.max_iterations = max_iterations
         self.timeout_seconds = timeout_seconds
@@ -83,6 +104,187 @@ class EngineConfig:
                 f"auto_threshold={self.auto_threshold})")
 
 
+# Builds fresh (vnets, tabs, bridges, components) for one calibration run.
+# The components must not be the live objects of an open document (see
+# build_detached_simulation_structures), because every candidate engine
+# starts, settles and stops them.
+StructureBuilder = Callable[[], Tuple[Dict[str, VNET], Dict[str, Tab], Dict[str, Bridge], Dict[str, Component]]]
+
+
+def circuit_hash(
+    vnets: Dict[str, VNET],
+    tabs: Dict[str, Tab],
+    bridges: Dict[str, Bridge],
+    components: Dict[str, Component]
+) -> str:
+    """
+    Hash the shape of a circuit for the calibration cache.
+    
+    Covers component IDs and types and each VNET's tabs and link names.
+    VNET IDs are generated on every load, so VNETs are identified by their
+    sorted tab IDs instead.
+    
+    Returns:
+        Hex digest, identical for every load of the same document
+    """
+    digest = hashlib.sha1()
+    for component_id in sorted(components):
+        digest.update(f"C|{component_id}|{components[component_id].component_type}\n".encode())
+    signatures = sorted(
+        "|".join(sorted(vnet.get_all_tabs())) + "#" + "|".join(sorted(vnet.get_all_links()))
+        for vnet in vnets.values()
+    )
+    for signature in signatures:
+        digest.update(f"V|{signature}\n".encode())
+    digest.update(f"T|{len(tabs)}|B|{len(bridges)}".encode())
+    return digest.hexdigest()
+
+
+@dataclass
+class CalibrationResult:
+    """
+    Outcome of timing the candidate engines on one circuit and host.
+    
+    Attributes:
+        mode: Fastest engine mode (single, multi or process)
+        worker_count: Threads (multi) or worker processes (process)
+        timings: Best settle time in seconds per candidate label
+        circuit_hash: circuit_hash() of the calibrated circuit
+        cpu_count: CPU count of the calibrated host
+        cached: True when read back from the calibration cache
+    """
+    mode: EngineMode
+    worker_count: Optional[int] = None
+    timings: Dict[str, float] = field(default_factory=dict)
+    circuit_hash: str = ""
+    cpu_count: int = 1
+    cached: bool = False
+    
+    @property
+    def label(self) -> str:
+        """Candidate label of the chosen engine (e.g. 'multi x4')."""
+        if self.mode == EngineMode.SINGLE_THREADED:
+            return "single"
+        return f"{self.mode.value} x{self.worker_count}"
+    
+    def apply(self, config: EngineConfig) -> EngineConfig:
+        """
+        Copy a configuration with the calibrated mode and worker count.
+        
+        Args:
+            config: Base configuration (iteration and timeout limits are kept)
+            
+        Returns:
+            New EngineConfig
+        """
+        return EngineConfig(
+            mode=self.mode,
+            thread_count=self.worker_count if self.mode == EngineMode.MULTI_THREADED else config.thread_count,
+            auto_threshold=config.auto_threshold,
+            max_iterations=config.max_iterations,
+            timeout_seconds=config.timeout_seconds,
+            process_count=self.worker_count if self.mode == EngineMode.MULTI_PROCESS else config.process_count
+        )
+    
+    def describe(self) -> str:
+        """One-line summary for logs, e.g. 'multi x4 (single 101.2 ms, multi x4 60.3 ms)'."""
+        source = "cached calibration" if self.cached else "calibrated"
+        if not self.timings:
+            return f"{self.label} ({source}: only candidate on {self.cpu_count} CPU(s))"
+        times = ", ".join(f"{label} {seconds * 1000:.1f} ms" for label, seconds in self.timings.items())
+        return f"{self.label} ({source}: {times})"
+    
+    def to_dict(self) -> dict:
+        """Serialize for the calibration cache."""
+        return {
+            'mode': self.mode.value,
+            'worker_count': self.worker_count,
+            'timings': self.timings
+        }
+    
+    @classmethod
+    def from_dict(cls, data: dict, circuit_hash: str, cpu_count: int) -> 'CalibrationResult':
+        """Deserialize a calibration cache entry."""
+        return cls(
+            mode=EngineMode(data['mode']),
+            worker_count=data.get('worker_count'),
+            timings=dict(data.get('timings', {})),
+            circuit_hash=circuit_hash,
+            cpu_count=cpu_count,
+            cached=True
+        )
+
+
+class CalibrationCache:
+    """
+    JSON file of calibration results keyed by circuit hash and CPU count.
+    
+    Stored next to the GUI settings (~/.relay_simulator) by default. Only
+    the most recent MAX_ENTRIES circuits are kept.
+    """
+    
+    MAX_ENTRIES = 64
+    
+    def __init__(self, path: Optional[Union[str, Path]] = None):
+        """
+        Initialize the cache.
+        
+        Args:
+            path: Cache file (None = ~/.relay_simulator/engine_calibration.json)
+        """
+        if path is None:
+            path = Path.home() / '.relay_simulator' / 'engine_calibration.json'
+        self.path = Path(path)
+    
+    @staticmethod
+    def key(circuit_hash: str, cpu_count: int) -> str:
+        """Cache key for a circuit on a host with cpu_count CPUs."""
+        return f"{circuit_hash}:{cpu_count}"
+    
+    def get(self, circuit_hash: str, cpu_count: int) -> Optional[CalibrationResult]:
+        """
+        Look up a calibration result.
+        
+        Returns:
+            Cached CalibrationResult, or None if this circuit and CPU count
+            have not been calibrated
+        """
+        data = self._load().get(self.key(circuit_hash, cpu_count))
+        if data is None:
+            return None
+        try:
+            return CalibrationResult.from_dict(data, circuit_hash, cpu_count)
+        except (KeyError, ValueError):
+            return None
+    
+    def put(self, result: CalibrationResult):
+        """Store a calibration result, evicting the oldest entries if full."""
+        entries = self._load()
+        key = self.key(result.circuit_hash, result.cpu_count)
+        entries.pop(key, None)
+        entries[key] = result.to_dict()
+        while len(entries) > self.MAX_ENTRIES:
+            entries.pop(next(iter(entries)))
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.path, 'w') as f:
+                json.dump(entries, f, indent=2)
+        except IOError as e:
+            print(f"Warning: Could not save engine calibration: {e}")
+    
+    def _load(self) -> Dict[str, dict]:
+        """Read all entries (empty if the file is missing or unreadable)."""
+        if not self.path.exists():
+            return {}
+        try:
+            with open(self.path, 'r') as f:
+                entries = json.load(f)
+            return entries if isinstance(entries, dict) else {}
+        except (json.JSONDecodeError, IOError) as e:
+            print(f"Warning: Could not load engine calibration: {e}")
+            return {}
+
+
 class SimulationEngineFactory:
     """
     Factory for creating simulation engines.
@@ -107,30 +309,54 @@ class SimulationEngineFactory:
         timeout_seconds=30.0
     )
     
+    # Speedup over single-threaded a calibrated candidate must reach
+    MIN_SPEEDUP = 1.1
+    
+    # Settle timeout for each calibration run
+    CALIBRATION_TIMEOUT = 5.0
+    
     @staticmethod
     def create_engine(
         vnets: Dict[str, VNET],
         tabs: Dict[str, Tab],
         bridges: Dict[str, Bridge],
         components: Dict[str, Component],
-        config: Optional[EngineConfig] = None
-    ) -> Union[SimulationEngine, ThreadedSimulationEngine]:
+        config: Optional[EngineConfig] = None,
+        calibration_cache: Optional[CalibrationCache] = None
+    ) -> SimulationEngine:
         """
         Create appropriate simulation engine based on configuration.
         
+        Multi-process mode needs the 'fork' start method; where it is not
+        available a single-threaded engine is created instead.
+        
+        Calibrated mode uses the cached calibration of this circuit and
+        host; circuits not yet calibrated (see calibrate()) fall back to
+        the auto rule.
+        
         Args:
             vnets: Dictionary of all VNETs by ID
             tabs: Dictionary of all tabs by ID
             bridges: Dictionary of all bridges by ID
             components: Dictionary of all components by ID
             config: Engine configuration (None = use defaults)
+            calibration_cache: Cache for calibrated mode (None = default file)
             
         Returns:
-            SimulationEngine or ThreadedSimulationEngine instance
+            SimulationEngine, ThreadedSimulationEngine or
+            ProcessShardedSimulationEngine instance
         """
         if config is None:
             config = SimulationEngineFactory.DEFAULT_CONFIG
         
+        if config.mode == EngineMode.CALIBRATED:
+            cache = calibration_cache or CalibrationCache()
+            calibration = cache.get(circuit_hash(vnets, tabs, bridges, components), os.cpu_count() or 1)
+            if calibration is not None:
+                return SimulationEngineFactory.create_engine(
+                    vnets, tabs, bridges, components, calibration.apply(config)
+                )
+        
         # Determine which engine to use
         component_count = len(components)
         use_threaded = False
@@ -139,10 +365,23 @@ class SimulationEngineFactory:
             use_threaded = False
         elif config.mode == EngineMode.MULTI_THREADED:
             use_threaded = True
-        elif config.mode == EngineMode.AUTO:
+        elif config.mode in (EngineMode.AUTO, EngineMode.CALIBRATED):
             # Auto-detect based on component count
             use_threaded = component_count >= config.auto_threshold
         
+        if config.mode == EngineMode.MULTI_PROCESS:
+            if ProcessShardedSimulationEngine.is_supported():
+                return ProcessShardedSimulationEngine(
+                    vnets=vnets,
+                    tabs=tabs,
+                    bridges=bridges,
+                    components=components,
+                    max_iterations=config.max_iterations,
+                    timeout_seconds=config.timeout_seconds,
+                    process_count=config.process_count
+                )
+            print("Multi-process engine needs the 'fork' start method; using single-threaded")
+        
         # Create the appropriate engine
         if use_threaded:
             return ThreadedSimulationEngine(
@@ -237,6 +476,168 @@ class SimulationEngineFactory:
             vnets, tabs, bridges, components, config
         )
     
+    @staticmethod
+    def create_multi_process(
+        vnets: Dict[str, VNET],
+        tabs: Dict[str, Tab],
+        bridges: Dict[str, Bridge],
+        components: Dict[str, Component],
+        process_count: Optional[int] = None,
+        max_iterations: int = 10000,
+        timeout_seconds: float = 30.0
+    ) -> SimulationEngine:
+        """
+        Create a multi-process (page-sharded) simulation engine.
+        
+        Convenience method for explicitly creating multi-process engine.
+        Falls back to single-threaded where processes cannot be forked.
+        
+        Args:
+            vnets: Dictionary of all VNETs by ID
+            tabs: Dictionary of all tabs by ID
+            bridges: Dictionary of all bridges by ID
+            components: Dictionary of all components by ID
+            process_count: Number of worker processes (None = CPU count - 1)
+            max_iterations: Maximum iterations before oscillation detection
+            timeout_seconds: Maximum time before timeout
+            
+        Returns:
+            ProcessShardedSimulationEngine (or SimulationEngine) instance
+        """
+        config = EngineConfig(
+            mode=EngineMode.MULTI_PROCESS,
+            process_count=process_count,
+            max_iterations=max_iterations,
+            timeout_seconds=timeout_seconds
+        )
+        
+        return SimulationEngineFactory.create_engine(
+            vnets, tabs, bridges, components, config
+        )
+    
+    @staticmethod
+    def calibrate(
+        build_structures: StructureBuilder,
+        thread_counts: Optional[List[int]] = None,
+        include_process: bool = False,
+        repeats: int = 1,
+        circuit_key: Optional[str] = None,
+        cache: Optional[CalibrationCache] = None,
+        use_cache: bool = True
+    ) -> CalibrationResult:
+        """
+        Pick the fastest engine for a circuit by timing it on this host.
+        
+        Each candidate engine (single-threaded, threaded with each of
+        thread_counts workers and, if include_process, multi-process) runs
+        initialize() and the first settle pass on freshly built structures
+        without real-time pacing. Every call to build_structures must return
+        new components, not those of an open document, because each run
+        changes their state. Calibration settles the circuit several times,
+        so interactive callers should run it off the UI thread. A candidate
+        must beat single-threaded by MIN_SPEEDUP to be chosen. The result is
+        cached per circuit hash and CPU count, so later starts of the same
+        circuit skip the benchmark.
+        
+        Multi-process is opt-in: components in worker processes do not
+        update their host copies, which the GUI renders.
+        
+        Args:
+            build_structures: Returns fresh (vnets, tabs, bridges, components),
+                              with new component objects, on every call
+            thread_counts: Worker counts to try (None = 2, 4 and CPU count,
+                           up to the CPU count; none on a single CPU)
+            include_process: Also try the multi-process engine
+            repeats: Runs per candidate (best time is kept)
+            circuit_key: circuit_hash() of the circuit, if already known
+            cache: Calibration cache (None = default file)
+            use_cache: Read and store the cached result
+            
+        Returns:
+            CalibrationResult (cached=True if the benchmark was skipped)
+        """
+        cpu_count = os.cpu_count() or 1
+        structures = None
+        if circuit_key is None:
+            structures = build_structures()
+            circuit_key = circuit_hash(*structures)
+        
+        if use_cache:
+            cache = cache or CalibrationCache()
+            calibration = cache.get(circuit_key, cpu_count)
+            if calibration is not None:
+                return calibration
+        
+        if thread_counts is None:
+            thread_counts = sorted({n for n in (2, 4, cpu_count) if 2 <= n <= cpu_count})
+        candidates: List[Tuple[str, EngineMode, Optional[int]]] = [("single", EngineMode.SINGLE_THREADED, None)]
+        candidates += [(f"multi x{n}", EngineMode.MULTI_THREADED, n) for n in thread_counts]
+        if include_process and ProcessShardedSimulationEngine.is_supported():
+            candidates += [(f"process x{n}", EngineMode.MULTI_PROCESS, n) for n in thread_counts or [2]]
+        
+        timings: Dict[str, float] = {}
+        if len(candidates) > 1:
+            for label, mode, worker_count in candidates:
+                best = float("inf")
+                for _ in range(max(1, repeats)):
+                    if structures is None:
+                        structures = build_structures()
+                    best = min(best, SimulationEngineFactory._time_candidate(mode, worker_count, structures))
+                    structures = None
+                timings[label] = best
+        
+        chosen = candidates[0]
+        if timings:
+            single = timings["single"]
+            fastest = min(candidates, key=lambda candidate: timings[candidate[0]])
+            if timings[fastest[0]] * SimulationEngineFactory.MIN_SPEEDUP < single:
+                chosen = fastest
+        
+        calibration = CalibrationResult(
+            mode=chosen[1],
+            worker_count=chosen[2],
+            timings=timings,
+            circuit_hash=circuit_key,
+            cpu_count=cpu_count
+        )
+        if use_cache:
+            cache.put(calibration)
+        return calibration
+    
+    @staticmethod
+    def _time_candidate(
+        mode: EngineMode,
+        worker_count: Optional[int],
+        structures: Tuple[Dict, Dict, Dict, Dict]
+    ) -> float:
+        """
+        Time initialize() and the first settle pass of one candidate engine.
+        
+        Returns:
+            Wall seconds (infinity if the engine failed to start or settle)
+        """
+        vnets, tabs, bridges, components = structures
+        limits = dict(max_iterations=10000, timeout_seconds=SimulationEngineFactory.CALIBRATION_TIMEOUT,
+                      realtime=False)
+        if mode == EngineMode.MULTI_THREADED:
+            engine = ThreadedSimulationEngine(vnets, tabs, bridges, components,
+                                              thread_count=worker_count, **limits)
+        elif mode == EngineMode.MULTI_PROCESS:
+            engine = ProcessShardedSimulationEngine(vnets, tabs, bridges, components,
+                                                    process_count=worker_count, **limits)
+        else:
+            engine = SimulationEngine(vnets, tabs, bridges, components, **limits)
+        
+        began = time.perf_counter()
+        try:
+            if not engine.initialize():
+                return float("inf")
+            stats = engine.run()
+            elapsed = time.perf_counter() - began
+            return elapsed if stats.stable else float("inf")
+        finally:
+            engine.shutdown()
+    
     @staticmethod
     def get_recommended_mode(component_count: int) -> EngineMode:
         """
@@ -313,7 +714,7 @@ def create_engine(
         tabs: Dictionary of all tabs by ID
         bridges: Dictionary of all bridges by ID
         components: Dictionary of all components by ID
-        mode: 'single', 'multi', or 'auto' (default: auto)
+        mode: 'single', 'multi', 'process', 'auto' or 'calibrated' (default: auto)
         **kwargs: Additional EngineConfig parameters
         
     Returns:
@@ -329,6 +730,10 @@ def create_engine(
         # Force multi-threaded with 8 threads
         engine = create_engine(vnets, tabs, bridges, components, 
                              mode='multi', thread_count=8)
+        
+        # Shard pages across 4 worker processes
+        engine = create_engine(vnets, tabs, bridges, components,
+                             mode='process', process_count=4)
     """
     config = EngineConfig(mode=mode, **kwargs)
     return SimulationEngineFactory.create_engine(vnets, tabs, bridges, components, config)
@@ -0,0 +1,355 @@
+"""
+Event Scheduler - Discrete-event simulated time for the simulation engine
+
+Timed behavior (relay switching delays) is expressed as events on a
+simulated-time axis instead of sleeping threads:
+
+1. A component schedules a callback at (current sim time + delay)
+2. Events are kept in a priority heap keyed by (time, sequence)
+3. The engine fires events in time order between settle passes
+
+Headless runs advance simulated time as fast as the CPU allows and are fully
+deterministic (events at the same time fire in scheduling order). The GUI
+attaches a RealTimeThrottle, which maps simulated time to wall-clock time and
+fires due events from a single pacing thread. Every relay delay and clock
+half-period is an event on this one thread; events falling due within the
+throttle's resolution (1 ms) share one wake-up and one simulation restart.
+"""
+
+import heapq
+import itertools
+import threading
+import time
+from typing import Any, Callable, List, Optional, Tuple
+
+from core.locking import NULL_LOCK
+
+
+class EventScheduler:
+    """
+    Priority queue of timed callbacks on a simulated-time axis.
+
+    Simulated time is in seconds and starts at 0.0. It only moves forward
+    when events are fired (run_due/run_next/advance_to), or follows an
+    attached time source (see set_time_source) in real-time mode.
+
+    Thread-safe: Uses a Condition (RLock) because relay logic may schedule
+    events from the engine thread while the real-time throttle fires them.
+    Callbacks are invoked outside the lock.
+    """
+
+    def __init__(self):
+        """Initialize an empty scheduler at simulated time 0.0."""
+        self._lock = threading.Condition(threading.RLock())
+        self._heap: List[Tuple[float, int, Callable, tuple]] = []
+        self._sequence = itertools.count()
+        self._pending = set()
+        self._cancelled = set()
+        self._now = 0.0
+        self._time_source: Optional[Callable[[], float]] = None
+        self._events_fired = 0
+
+    # === TIME ===
+
+    @property
+    def now(self) -> float:
+        """Current simulated time in seconds."""
+        with self._lock:
+            if self._time_source is not None:
+                self._now = max(self._now, self._time_source())
+            return self._now
+
+    def set_time_source(self, time_source: Optional[Callable[[], float]]):
+        """
+        Make simulated time follow an external clock (real-time mode).
+
+        While set, 'now' never lags behind the source, so events scheduled
+        after an idle period are relative to the current wall-clock time.
+
+        Args:
+            time_source: Callable returning simulated seconds, or None
+        """
+        with self._lock:
+            self._time_source = time_source
+            self._lock.notify_all()
+
+    # === SCHEDULING ===
+
+    def schedule(self, delay: float, callback: Callable, *args: Any) -> int:
+        """
+        Schedule a callback after a simulated delay.
+
+        Args:
+            delay: Delay in simulated seconds (>= 0)
+            callback: Callable invoked with *args when the event fires
+            *args: Positional arguments for the callback
+
+        Returns:
+            Event ID (for cancel())
+        """
+        with self._lock:
+            return self.schedule_at(self.now + max(0.0, delay), callback, *args)
+
+    def schedule_at(self, when: float, callback: Callable, *args: Any) -> int:
+        """
+        Schedule a callback at an absolute simulated time.
+
+        Args:
+            when: Simulated time in seconds (clamped to now)
+            callback: Callable invoked with *args when the event fires
+            *args: Positional arguments for the callback
+
+        Returns:
+            Event ID (for cancel())
+        """
+        with self._lock:
+            event_id = next(self._sequence)
+            heapq.heappush(self._heap, (max(when, self._now), event_id, callback, args))
+            self._pending.add(event_id)
+            self._lock.notify_all()
+            return event_id
+
+    def cancel(self, event_id: int) -> bool:
+        """
+        Cancel a pending event.
+
+        Args:
+            event_id: ID returned by schedule()/schedule_at()
+
+        Returns:
+            True if the event was pending, False otherwise
+        """
+        with self._lock:
+            if event_id not in self._pending:
+                return False
+            self._pending.discard(event_id)
+            self._cancelled.add(event_id)
+            return True
+
+    def clear(self):
+        """Drop all pending events."""
+        with self._lock:
+            self._heap.clear()
+            self._pending.clear()
+            self._cancelled.clear()
+            self._lock.notify_all()
+
+    def reset(self):
+        """Drop all pending events and rewind simulated time to 0.0."""
+        with self._lock:
+            self.clear()
+            self._now = 0.0
+            self._events_fired = 0
+
+    # === QUERIES ===
+
+    def _discard_cancelled(self):
+        """Pop cancelled events off the top of the heap (lock held)."""
+        while self._heap and self._heap[0][1] in self._cancelled:
+            _, event_id, _, _ = heapq.heappop(self._heap)
+            self._cancelled.discard(event_id)
+
+    def peek_time(self) -> Optional[float]:
+        """
+        Get the time of the next pending event.
+
+        Returns:
+            Simulated time of the earliest event, or None if none pending
+        """
+        with self._lock:
+            self._discard_cancelled()
+            return self._heap[0][0] if self._heap else None
+
+    def has_pending(self) -> bool:
+        """Check whether any events are pending."""
+        return self.peek_time() is not None
+
+    def get_pending_count(self) -> int:
+        """Get the number of pending (not cancelled) events."""
+        with self._lock:
+            return len(self._pending)
+
+    def get_events_fired(self) -> int:
+        """Get the number of events fired since creation or reset()."""
+        with self._lock:
+            return self._events_fired
+
+    # === FIRING ===
+
+    def _pop_due(self, until: float) -> Optional[Tuple[float, int, Callable, tuple]]:
+        """Pop the next event due at or before 'until' (lock held)."""
+        self._discard_cancelled()
+        if self._heap and self._heap[0][0] <= until:
+            event = heapq.heappop(self._heap)
+            self._pending.discard(event[1])
+            if event[0] > self._now:
+                self._now = event[0]
+            self._events_fired += 1
+            return event
+        return None
+
+    def run_due(self, until: float) -> int:
+        """
+        Fire every event due at or before a simulated time, in time order.
+
+        Events scheduled by callbacks are fired too if they fall due.
+        Simulated time is left at the time of the last fired event.
+
+        Args:
+            until: Simulated time limit in seconds
+
+        Returns:
+            Number of events fired
+        """
+        fired = 0
+        while True:
+            with self._lock:
+                event = self._pop_due(until)
+            if event is None:
+                return fired
+            _, _, callback, args = event
+            callback(*args)
+            fired += 1
+
+    def run_next(self) -> int:
+        """
+        Advance to the next event time and fire every event at that time.
+
+        Returns:
+            Number of events fired (0 if none pending)
+        """
+        next_time = self.peek_time()
+        if next_time is None:
+            return 0
+        return self.run_due(next_time)
+
+    def advance_to(self, when: float) -> int:
+        """
+        Fire all events up to a simulated time, then set the time to it.
+
+        Args:
+            when: Target simulated time in seconds
+
+        Returns:
+            Number of events fired
+        """
+        fired = self.run_due(when)
+        with self._lock:
+            if when > self._now:
+                self._now = when
+        return fired
+
+    def wait_for_change(self, timeout: Optional[float] = None):
+        """
+        Block until events are scheduled/cleared or the timeout expires.
+
+        Args:
+            timeout: Maximum wall-clock seconds to wait
+        """
+        with self._lock:
+            self._lock.wait(timeout)
+
+
+class RealTimeThrottle:
+    """
+    Optional real-time pacing for an EventScheduler (used by the GUI).
+
+    One background thread maps simulated time to wall-clock time
+    (sim_time = elapsed_wall_time * speed), sleeps until the earliest event
+    is due, fires it along with every event due within the next
+    `resolution` wall-clock seconds and then calls on_batch once so the
+    caller can re-run the simulation. Relays and clocks toggling within the
+    same millisecond thus cost one wake-up and one restart instead of one
+    each; each event still fires at its exact simulated time.
+
+    Attributes:
+        scheduler: EventScheduler being paced
+        speed: Simulated seconds per wall-clock second
+        resolution: Wall-clock window (seconds) coalesced into one batch
+        batches: Number of batches fired since start()
+        events_fired: Number of events fired since start()
+    """
+
+    DEFAULT_RESOLUTION = 0.001
+
+    def __init__(
+        self,
+        scheduler: EventScheduler,
+        on_batch: Callable[[], None],
+        speed: float = 1.0,
+        lock: Optional[Any] = None,
+        resolution: float = DEFAULT_RESOLUTION
+    ):
+        """
+        Initialize the throttle (not started).
+
+        Args:
+            scheduler: EventScheduler to pace
+            on_batch: Called (without arguments) after each batch of fired events
+            speed: Simulated seconds per wall-clock second
+            lock: Held while firing a batch (the engine's run lock), so
+                  event callbacks never run concurrently with a settle pass
+            resolution: Events due within this many wall-clock seconds of
+                        each other fire as one batch (0 = only simultaneous)
+        """
+        self.scheduler = scheduler
+        self.speed = speed
+        self.resolution = resolution
+        self.batches = 0
+        self.events_fired = 0
+        self._on_batch = on_batch
+        self._fire_lock = lock if lock is not None else NULL_LOCK
+        self._thread: Optional[threading.Thread] = None
+        self._stop_event = threading.Event()
+        self._origin = 0.0
+
+    def _sim_time(self) -> float:
+        return (time.perf_counter() - self._origin) * self.speed
+
+    def start(self):
+        """Start pacing from the scheduler's current simulated time."""
+        if self._thread and self._thread.is_alive():
+            return
+        self._origin = time.perf_counter() - self.scheduler.now / self.speed
+        self.batches = 0
+        self.events_fired = 0
+        self.scheduler.set_time_source(self._sim_time)
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._run, name="RealTimeThrottle", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: float = 0.5):
+        """Stop pacing and detach from the scheduler's time."""
+        self._stop_event.set()
+        self.scheduler.set_time_source(None)  # Wakes the thread
+        if self._thread and self._thread.is_alive() and self._thread is not threading.current_thread():
+            self._thread.join(timeout=timeout)
+        self._thread = None
+
+    def is_running(self) -> bool:
+        """Check whether the pacing thread is running."""
+        return bool(self._thread and self._thread.is_alive())
+
+    def _run(self):
+        while not self._stop_event.is_set():
+            next_time = self.scheduler.peek_time()
+            if next_time is None:
+                self.scheduler.wait_for_change(timeout=0.25)
+                continue
+
+            now = self._sim_time()
+            if next_time > now:
+                self.scheduler.wait_for_change(timeout=(next_time - now) / self.speed)
+                continue
+
+            # Also fire what falls due within the next resolution step
+            with self._fire_lock:
+                fired = self.scheduler.run_due(now + self.resolution * self.speed)
+            if fired:
+                self.batches += 1
+                self.events_fired += fired
+            if fired and not self._stop_event.is_set():
+                try:
+                    self._on_batch()
+                except Exception as e:
+                    print(f"RealTimeThrottle: batch callback error: {e}")
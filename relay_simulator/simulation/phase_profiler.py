@@ -0,0 +1,180 @@
+"""
+Phase Profiler - Hot-path timing for the simulation engines
+
+Breaks the wall time of a simulation run down by phase so it is clear which
+part of a board dominates settle time, without attaching cProfile:
+
+- group_build: collecting the groups (or VNET tasks) to evaluate
+- group_eval: evaluating group states and writing them back to VNETs
+- simulate_logic: component simulate_logic() calls
+- dirty_bookkeeping: dirty queue and component update queue handling
+- callbacks: relay/clock notifications handled by the engine
+
+Component calls are also counted and timed per component type and per
+component. Engines hold a PhaseProfiler only while profiling is enabled and
+test for None on the hot path, so the cost when disabled is one comparison
+per phase.
+"""
+
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Dict, List, Tuple
+
+
+PHASES = ("group_build", "group_eval", "simulate_logic", "dirty_bookkeeping", "callbacks")
+
+
+@dataclass
+class ComponentTypeProfile:
+    """Call count and cumulative simulate_logic time for one component type."""
+    calls: int = 0
+    total_time: float = 0.0
+
+
+@dataclass
+class PhaseProfile:
+    """Per-phase timings of one simulation run."""
+    phase_times: Dict[str, float] = field(default_factory=lambda: dict.fromkeys(PHASES, 0.0))
+    component_types: Dict[str, ComponentTypeProfile] = field(default_factory=dict)
+    component_times: Dict[str, float] = field(default_factory=dict)
+    component_type_of: Dict[str, str] = field(default_factory=dict)
+    top_n: int = 10
+
+    @property
+    def total_time(self) -> float:
+        """Sum of all phase times."""
+        return sum(self.phase_times.values())
+
+    @property
+    def slowest_components(self) -> List[Tuple[str, str, float]]:
+        """Top-N components by cumulative time as (component_id, type, seconds)."""
+        ranked = sorted(self.component_times.items(), key=lambda item: item[1], reverse=True)
+        return [
+            (component_id, self.component_type_of.get(component_id, ""), seconds)
+            for component_id, seconds in ranked[:self.top_n]
+        ]
+
+    def merge(self, other: 'PhaseProfile'):
+        """Add another profile's timings to this one (e.g. across settle steps)."""
+        for phase, seconds in other.phase_times.items():
+            self.phase_times[phase] = self.phase_times.get(phase, 0.0) + seconds
+        for component_type, entry in other.component_types.items():
+            mine = self.component_types.setdefault(component_type, ComponentTypeProfile())
+            mine.calls += entry.calls
+            mine.total_time += entry.total_time
+        for component_id, seconds in other.component_times.items():
+            self.component_times[component_id] = self.component_times.get(component_id, 0.0) + seconds
+        self.component_type_of.update(other.component_type_of)
+
+    def to_dict(self) -> dict:
+        """JSON-serializable form (tools and logs)."""
+        return {
+            "phase_times": dict(self.phase_times),
+            "component_types": {
+                component_type: {"calls": entry.calls, "total_time": entry.total_time}
+                for component_type, entry in sorted(self.component_types.items())
+            },
+            "slowest_components": [
+                {"component_id": component_id, "type": component_type, "total_time": seconds}
+                for component_id, component_type, seconds in self.slowest_components
+            ],
+        }
+
+    def describe(self) -> str:
+        """Multi-line human-readable report."""
+        total = self.total_time or 1.0
+        lines = ["Phase times:"]
+        for phase, seconds in self.phase_times.items():
+            lines.append(f"  {phase:<18} {seconds * 1000:9.3f} ms  {100.0 * seconds / total:5.1f}%")
+        if self.component_types:
+            lines.append("Component types:")
+            ranked = sorted(self.component_types.items(), key=lambda item: item[1].total_time, reverse=True)
+            for component_type, entry in ranked:
+                lines.append(
+                    f"  {component_type:<18} {entry.calls:7d} calls {entry.total_time * 1000:9.3f} ms"
+                )
+        slowest = self.slowest_components
+        if slowest:
+            lines.append(f"Slowest components (top {len(slowest)}):")
+            for component_id, component_type, seconds in slowest:
+                lines.append(f"  {component_id} ({component_type}) {seconds * 1000:.3f} ms")
+        return "\n".join(lines)
+
+
+class PhaseProfiler:
+    """
+    Accumulates phase and component timings until snapshot() is taken.
+
+    Thread-safe: the threaded engine records component times from pool
+    workers, so updates are serialized with a lock (only paid while
+    profiling is enabled).
+    """
+
+    clock = staticmethod(time.perf_counter)
+
+    def __init__(self, top_n: int = 10):
+        """
+        Initialize an empty profiler.
+
+        Args:
+            top_n: Number of slowest components listed in snapshots
+        """
+        self.top_n = top_n
+        self._lock = threading.Lock()
+        self._profile = PhaseProfile(top_n=top_n)
+
+    def add(self, phase: str, seconds: float):
+        """Add time to a phase."""
+        with self._lock:
+            times = self._profile.phase_times
+            times[phase] = times.get(phase, 0.0) + seconds
+
+    def lap(self, phase: str, since: float) -> float:
+        """
+        Add the time elapsed since a clock() reading to a phase.
+
+        Returns:
+            The current clock() reading (start of the next phase)
+        """
+        now = self.clock()
+        self.add(phase, now - since)
+        return now
+
+    def record_component(self, component, seconds: float):
+        """Record one simulate_logic call (phase time is added separately)."""
+        component_id = component.component_id
+        component_type = getattr(component, 'component_type', type(component).__name__)
+        with self._lock:
+            profile = self._profile
+            entry = profile.component_types.get(component_type)
+            if entry is None:
+                entry = profile.component_types[component_type] = ComponentTypeProfile()
+            entry.calls += 1
+            entry.total_time += seconds
+            profile.component_times[component_id] = profile.component_times.get(component_id, 0.0) + seconds
+            profile.component_type_of[component_id] = component_type
+
+    def snapshot(self, reset: bool = False) -> PhaseProfile:
+        """
+        Return the timings recorded so far.
+
+        Args:
+            reset: Start a new profile after taking the snapshot
+
+        Returns:
+            PhaseProfile (not shared with the profiler when reset is True)
+        """
+        with self._lock:
+            profile = self._profile
+            if reset:
+                self._profile = PhaseProfile(top_n=self.top_n)
+                return profile
+            copy = PhaseProfile(top_n=self.top_n)
+            copy.merge(profile)
+            return copy
+
+    def reset(self):
+        """Discard all recorded timings."""
+        with self._lock:
+            self._profile = PhaseProfile(top_n=self.top_n)
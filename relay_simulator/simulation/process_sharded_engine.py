@@ -0,0 +1,617 @@
+"""
+Process-Sharded Simulation Engine
+
+Threads cannot speed up the Python-heavy component logic because of the
+GIL. This engine shards the components of a document by page into worker
+processes, which run simulate_logic() and relay/clock events in parallel.
+
+Every worker process is forked at initialize() and holds a full replica of
+the circuit, but only starts and runs the components of its own pages. The
+host process keeps the authoritative netlist and evaluates the connectivity
+groups (cheap with the compiled netlist). At each iteration barrier only
+compact boundary messages cross process boundaries:
+
+- Host -> worker: state changes of the VNETs the worker's components read
+- Worker -> host: drive changes of its pins on dirty VNETs, the VNETs it
+  marked dirty, bridges its relays created/removed, clock edges and the
+  time of its next scheduled event
+
+VNET states only change during group evaluation, so within one iteration
+every component reads the same inputs in whichever process it runs and the
+circuit settles to the same states as with the single-threaded engine.
+
+Scheduled events of a worker (relay transfers) are mirrored by one proxy
+event per worker on the host's scheduler. When the proxy fires (timed runs
+or the real-time throttle), the worker fires its own events due at that time
+and reports their effects.
+
+Components the host changes or reads directly stay in the host process
+(HOST_COMPONENT_TYPES: switches, thumbwheels and clocks driven by the GUI
+or stimulus, and memories whose contents are edited and restored). The
+internal state of a worker's components (e.g. relay armature position) is
+only current in the worker; VNET states, pin drives and bridges are current
+in the host after every run.
+
+Requires the 'fork' start method (Linux, macOS); see is_supported().
+"""
+
+import multiprocessing
+import os
+from array import array
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from core.vnet import VNET
+from core.tab import Tab
+from core.bridge import Bridge
+from core.pin import Pin
+from core.state import PinState
+from components.base import Component
+from simulation.simulation_engine import (
+    SimulationEngine,
+    SimulationState,
+    SimulationStatistics as _EngineStatistics
+)
+
+
+__all__ = [
+    "ProcessShardedSimulationEngine",
+    "SimulationState",
+    "SimulationStatistics",
+    "BoundaryMessage",
+    "HOST_COMPONENT_TYPES",
+    "partition_by_page",
+]
+
+
+# Inputs and stateful components the host changes or reads directly
+HOST_COMPONENT_TYPES = frozenset({"Switch", "Thumbwheel", "Clock", "Memory"})
+
+# Shard index of the host process
+HOST_SHARD = 0
+
+
+@dataclass
+class SimulationStatistics(_EngineStatistics):
+    """Statistics gathered during simulation, including boundary traffic."""
+    boundary_messages: int = 0
+    boundary_vnet_updates: int = 0
+    boundary_pin_updates: int = 0
+
+
+@dataclass
+class BoundaryMessage:
+    """
+    Effects of one worker step, sent to the host at a barrier.
+
+    VNETs are netlist indices and pins the netlist index of one of their
+    tabs (identical in every forked process); signed entries are
+    index + 1, negative for FLOAT.
+
+    Attributes:
+        pins: Drive states of the worker's pins on dirty VNETs (signed)
+        dirty: VNET indices the worker marked dirty
+        bridges_added: (worker bridge ID, VNET index 1, VNET index 2, owner ID)
+        bridges_removed: Worker bridge IDs
+        clock_edges: Clock component ID -> edges since the last message
+        relay_switched: True if a relay transferred its contacts
+        next_event: Simulated time of the worker's next event (None = none)
+        updated: Components that ran without raising
+    """
+    pins: array = field(default_factory=lambda: array('i'))
+    dirty: array = field(default_factory=lambda: array('i'))
+    bridges_added: List[Tuple[str, int, int, str]] = field(default_factory=list)
+    bridges_removed: List[str] = field(default_factory=list)
+    clock_edges: Dict[str, int] = field(default_factory=dict)
+    relay_switched: bool = False
+    next_event: Optional[float] = None
+    updated: int = 0
+
+
+def partition_by_page(components: Dict[str, Component], worker_count: int) -> Dict[str, int]:
+    """
+    Assign components to shards by page.
+
+    HOST_COMPONENT_TYPES go to the host (shard 0). Pages are never split:
+    they are assigned largest first to the least loaded worker (shards
+    1..worker_count), so wiring local to a page stays within one process.
+
+    Args:
+        components: Dictionary of all components by ID
+        worker_count: Number of worker processes (>= 1)
+
+    Returns:
+        Dict of component_id -> shard index
+    """
+    shard_of: Dict[str, int] = {}
+    pages: Dict[str, List[str]] = {}
+    for component_id, component in components.items():
+        if component.component_type in HOST_COMPONENT_TYPES:
+            shard_of[component_id] = HOST_SHARD
+        else:
+            pages.setdefault(component.page_id or "", []).append(component_id)
+
+    load = [0] * (worker_count + 1)
+    for page_id in sorted(pages, key=lambda page: (-len(pages[page]), page)):
+        shard = min(range(1, worker_count + 1), key=lambda index: (load[index], index))
+        load[shard] += len(pages[page_id])
+        for component_id in pages[page_id]:
+            shard_of[component_id] = shard
+    return shard_of
+
+
+def _tab_pins(netlist, tabs: Dict[str, Tab]) -> List[Optional[Pin]]:
+    """Parent pin of every netlist tab (pins are addressed by tab index)."""
+    return [tabs[tab_id].parent_pin for tab_id in netlist.tab_ids]
+
+
+def _pack_states(states: Iterable[Tuple[int, bool]]) -> array:
+    """Pack (index, is_high) pairs as signed index + 1 (negative = FLOAT)."""
+    return array('i', [index + 1 if is_high else -index - 1 for index, is_high in states])
+
+
+class _ShardReplica(SimulationEngine):
+    """
+    Worker-side engine: a full circuit replica that only runs its own shard.
+
+    Never runs the settle loop; the host evaluates groups and sends the VNET
+    states. Only owned components are started, so the worker's bridges and
+    scheduled events all belong to its shard.
+    """
+
+    def __init__(self, vnets, tabs, bridges, components, owned: Set[str]):
+        super().__init__(vnets, tabs, bridges, components, realtime=False)
+        self.owned = owned
+        self._known_bridges: Set[str] = set(bridges)
+        self._owned_drivers: List[Tuple[Tuple[int, Pin], ...]] = []
+
+    def _start_component(self, component: Component):
+        if component.component_id in self.owned:
+            super()._start_component(component)
+
+    def start(self) -> BoundaryMessage:
+        """Start the owned components and report their initial effects."""
+        if not self.initialize():
+            raise RuntimeError("Shard initialization failed")
+
+        # Drive sources are the pins the tabs were built with (components
+        # such as buses may recreate their pins at sim_start)
+        pin_index = {}
+        for tab_i, pin in enumerate(_tab_pins(self.netlist, self.tabs)):
+            if pin is not None:
+                pin_index.setdefault(id(pin), tab_i)
+        owned = self.owned
+        for drivers in self.netlist.vnet_drivers:
+            self._owned_drivers.append(tuple(
+                (pin_index[id(source)], source) for source in drivers
+                if isinstance(source, Pin) and source.parent_component is not None
+                and source.parent_component.component_id in owned
+            ))
+        return self.collect()
+
+    def apply_vnet_states(self, packed: array, now: float):
+        """Apply host VNET state changes and catch up with simulated time."""
+        netlist = self.netlist
+        for value in packed:
+            if value > 0:
+                netlist.store_state(value - 1, True)
+            else:
+                netlist.store_state(-value - 1, False)
+        self.scheduler.advance_to(now)
+
+    def execute(self, component_ids: List[str]) -> int:
+        """Run simulate_logic() for owned components; returns successes."""
+        updated = 0
+        for component_id in component_ids:
+            try:
+                self.components[component_id].simulate_logic(self.vnet_manager, self.bridge_manager)
+                updated += 1
+            except Exception as e:
+                print(f"Error in simulate_logic for {component_id}: {e}")
+        return updated
+
+    def collect(self, updated: int = 0) -> BoundaryMessage:
+        """Gather the effects since the last message and reset them."""
+        netlist = self.netlist
+        vnet_index = netlist.vnet_index
+        high = PinState.HIGH
+
+        dirty_ids = self.dirty_manager.get_dirty_vnet_ids()
+        dirty = array('i', sorted(vnet_index[vnet_id] for vnet_id in dirty_ids if vnet_id in vnet_index))
+        self.dirty_manager.clear_multiple_dirty(dirty_ids)
+
+        owned_drivers = self._owned_drivers
+        pins = {}
+        for vnet_i in dirty:
+            for pin_i, pin in owned_drivers[vnet_i]:
+                pins[pin_i] = pin.state == high
+
+        current = set(self.bridges)
+        added = []
+        for bridge_id in current - self._known_bridges:
+            bridge = self.bridges[bridge_id]
+            added.append((
+                bridge_id,
+                vnet_index.get(bridge.vnet_id1, -1),
+                vnet_index.get(bridge.vnet_id2, -1),
+                bridge.owner_component_id
+            ))
+        removed = list(self._known_bridges - current)
+        self._known_bridges = current
+
+        message = BoundaryMessage(
+            pins=_pack_states(pins.items()),
+            dirty=dirty,
+            bridges_added=added,
+            bridges_removed=removed,
+            clock_edges=self._clock_edges,
+            relay_switched=self._relay_switched,
+            next_event=self.scheduler.peek_time(),
+            updated=updated
+        )
+        self._clock_edges = {}
+        self._relay_switched = False
+        return message
+
+    def stop(self):
+        """Stop the owned components."""
+        for component_id in self.owned:
+            try:
+                self.components[component_id].sim_stop()
+            except Exception as e:
+                print(f"Error in sim_stop for {component_id}: {e}")
+        self.scheduler.clear()
+
+
+def _run_worker(conn, vnets, tabs, bridges, components, owned: Set[str]):
+    """
+    Worker process main loop (forked: the circuit objects are inherited).
+
+    Commands from the host:
+        ("execute", vnet_states, now, component_ids)
+        ("events", vnet_states, now)
+        ("stop",)
+    Every command except stop is answered with a BoundaryMessage.
+    """
+    replica = _ShardReplica(vnets, tabs, bridges, components, owned)
+    try:
+        conn.send((len(replica.vnets), replica.start()))
+        while True:
+            command = conn.recv()
+            kind = command[0]
+            if kind == "stop":
+                replica.stop()
+                break
+            replica.apply_vnet_states(command[1], command[2])
+            if kind == "execute":
+                conn.send(replica.collect(replica.execute(command[3])))
+            else:
+                # The host's proxy event fired: now is this worker's event time
+                conn.send(replica.collect())
+    except (EOFError, KeyboardInterrupt):
+        pass
+    finally:
+        conn.close()
+
+
+class _WorkerHandle:
+    """Host-side end of one worker process."""
+
+    __slots__ = ('shard', 'process', 'conn', 'vnet_updates', 'proxy_event', 'proxy_time', 'bridge_ids')
+
+    def __init__(self, shard: int, process, conn):
+        self.shard = shard
+        self.process = process
+        self.conn = conn
+        # VNET index -> is_high, changed since the last command to this worker
+        self.vnet_updates: Dict[int, bool] = {}
+        self.proxy_event: Optional[int] = None
+        self.proxy_time: Optional[float] = None
+        # Worker bridge ID -> host bridge ID
+        self.bridge_ids: Dict[str, str] = {}
+
+
+class ProcessShardedSimulationEngine(SimulationEngine):
+    """
+    Simulation engine that runs component logic in page-sharded processes.
+
+    Extends SimulationEngine: the host runs the settle loop and group
+    evaluation, and the component phase of every iteration is a barrier
+    across the host and the worker processes (see module docstring).
+
+    Attributes:
+        worker_count: Number of worker processes
+        shard_of: Component ID -> shard (0 = host, 1..worker_count = workers)
+        (plus all SimulationEngine attributes)
+    """
+
+    _statistics_type = SimulationStatistics
+
+    # Seconds to wait for a worker to exit at shutdown
+    STOP_TIMEOUT = 2.0
+
+    def __init__(
+        self,
+        vnets: Dict[str, VNET],
+        tabs: Dict[str, Tab],
+        bridges: Dict[str, Bridge],
+        components: Dict[str, Component],
+        max_iterations: int = 10000,
+        timeout_seconds: float = 30.0,
+        process_count: Optional[int] = None,
+        realtime: bool = True
+    ):
+        """
+        Initialize the process-sharded simulation engine.
+
+        Args:
+            vnets: Dictionary of all VNETs by ID
+            tabs: Dictionary of all tabs by ID
+            bridges: Dictionary of all bridges by ID
+            components: Dictionary of all components by ID
+            max_iterations: Maximum iterations before oscillation detection
+            timeout_seconds: Maximum time before timeout
+            process_count: Number of worker processes (None = CPU count - 1)
+            realtime: Pace scheduled events against wall-clock time
+                      (see SimulationEngine)
+        """
+        super().__init__(
+            vnets, tabs, bridges, components,
+            max_iterations=max_iterations,
+            timeout_seconds=timeout_seconds,
+            realtime=realtime
+        )
+        if process_count is None:
+            process_count = (os.cpu_count() or 2) - 1
+        self.worker_count = max(1, process_count)
+        self.shard_of = partition_by_page(components, self.worker_count)
+        self._workers: List[_WorkerHandle] = []
+        self._pins: List[Optional[Pin]] = []
+        # VNET index -> workers whose components read it
+        self._vnet_readers: List[Tuple[_WorkerHandle, ...]] = []
+
+    @staticmethod
+    def is_supported() -> bool:
+        """Check whether worker processes can be forked on this platform."""
+        return "fork" in multiprocessing.get_all_start_methods()
+
+    # === LIFECYCLE ===
+
+    def initialize(self) -> bool:
+        """
+        Initialize the simulation (see SimulationEngine.initialize()).
+
+        Forks the worker processes first (they inherit the circuit in its
+        start state), then starts the host's components and applies the
+        workers' initial pin drives and bridges.
+
+        Returns:
+            True if initialization successful, False otherwise
+        """
+        if self.get_state() != SimulationState.STOPPED:
+            return False
+        try:
+            self._start_workers()
+        except Exception as e:
+            print(f"Initialization error: Failed to start shard workers: {e}")
+            self._stop_workers()
+            return False
+
+        if not super().initialize():
+            self._stop_workers()
+            return False
+
+        try:
+            self._route_boundaries()
+            for worker in self._workers:
+                vnet_count, message = self._receive(worker)
+                if vnet_count != len(self.netlist.vnet_ids):
+                    raise RuntimeError(f"shard {worker.shard} compiled a different netlist")
+                self._apply_message(worker, message)
+        except Exception as e:
+            print(f"Initialization error: {e}")
+            self.shutdown()
+            with self._state_lock:
+                self.state = SimulationState.ERROR
+            return False
+
+        self._publish_snapshot()
+        return True
+
+    def _start_workers(self):
+        """Fork one worker process per shard."""
+        context = multiprocessing.get_context("fork")
+        owned: List[Set[str]] = [set() for _ in range(self.worker_count + 1)]
+        for component_id, shard in self.shard_of.items():
+            owned[shard].add(component_id)
+
+        for shard in range(1, self.worker_count + 1):
+            host_conn, worker_conn = context.Pipe()
+            process = context.Process(
+                target=_run_worker,
+                args=(worker_conn, self.vnets, self.tabs, self.bridges, self.components, owned[shard]),
+                name=f"RSimShard-{shard}",
+                daemon=True
+            )
+            process.start()
+            worker_conn.close()
+            self._workers.append(_WorkerHandle(shard, process, host_conn))
+
+    def _route_boundaries(self):
+        """Index pins and the workers reading each VNET (netlist compiled)."""
+        self._pins = _tab_pins(self.netlist, self.tabs)
+        workers = self._workers
+        shard_of = self.shard_of
+        self._vnet_readers = []
+        for component_ids in self.netlist.vnet_components:
+            shards = {shard_of.get(component_id, HOST_SHARD) for component_id in component_ids}
+            self._vnet_readers.append(tuple(
+                worker for worker in workers if worker.shard in shards
+            ))
+
+    def _start_component(self, component: Component):
+        """Start only the host's components (workers start their own)."""
+        if self.shard_of.get(component.component_id, HOST_SHARD) == HOST_SHARD:
+            super()._start_component(component)
+
+    def shutdown(self) -> bool:
+        """
+        Shutdown the simulation and stop the worker processes.
+
+        Returns:
+            True if shutdown successful, False otherwise
+        """
+        result = super().shutdown()
+        self._stop_workers()
+        return result
+
+    def _stop_workers(self):
+        for worker in self._workers:
+            try:
+                worker.conn.send(("stop",))
+            except (OSError, ValueError):
+                pass
+            worker.process.join(self.STOP_TIMEOUT)
+            if worker.process.is_alive():
+                worker.process.terminate()
+                worker.process.join()
+            worker.conn.close()
+        self._workers = []
+        self._vnet_readers = []
+
+    # === BOUNDARY EXCHANGE ===
+
+    def _send(self, worker: _WorkerHandle, *command):
+        """Send a command with the VNET changes the worker has not seen yet."""
+        updates = worker.vnet_updates
+        worker.vnet_updates = {}
+        with self._stats_lock:
+            self.statistics.boundary_messages += 1
+            self.statistics.boundary_vnet_updates += len(updates)
+        worker.conn.send((command[0], _pack_states(updates.items()), self.scheduler.now) + command[1:])
+
+    def _receive(self, worker: _WorkerHandle):
+        try:
+            return worker.conn.recv()
+        except EOFError:
+            raise RuntimeError(f"Shard worker {worker.shard} exited") from None
+
+    def _apply_message(self, worker: _WorkerHandle, message: BoundaryMessage):
+        """Apply a worker's boundary message to the host's circuit."""
+        pins = self._pins
+        for value in message.pins:
+            if value > 0:
+                pins[value - 1].set_state(PinState.HIGH)
+            else:
+                pins[-value - 1].set_state(PinState.FLOAT)
+
+        vnet_ids = self.netlist.vnet_ids
+        for bridge_id in message.bridges_removed:
+            host_id = worker.bridge_ids.pop(bridge_id, None)
+            if host_id is not None:
+                self.bridge_manager.set_bridge_enabled(host_id, False)
+        for bridge_id, vnet_i1, vnet_i2, owner_id in message.bridges_added:
+            if vnet_i1 >= 0 and vnet_i2 >= 0:
+                # Mirror under the worker's ID (relay contact IDs are stable)
+                worker.bridge_ids[bridge_id] = self.bridge_manager.allocate_bridge(
+                    vnet_ids[vnet_i1], vnet_ids[vnet_i2], owner_id, bridge_id, enabled=True
+                )
+
+        if message.dirty:
+            self.dirty_manager.mark_multiple_dirty({vnet_ids[vnet_i] for vnet_i in message.dirty})
+        for clock_id, edges in message.clock_edges.items():
+            self._clock_edges[clock_id] = self._clock_edges.get(clock_id, 0) + edges
+        if message.relay_switched:
+            self._relay_switched = True
+        with self._stats_lock:
+            self.statistics.boundary_pin_updates += len(message.pins)
+
+        self._schedule_proxy(worker, message.next_event)
+
+    def _schedule_proxy(self, worker: _WorkerHandle, next_event: Optional[float]):
+        """Keep one host event at the time of the worker's next event."""
+        if next_event == worker.proxy_time:
+            return
+        if worker.proxy_event is not None:
+            self.scheduler.cancel(worker.proxy_event)
+        worker.proxy_time = next_event
+        worker.proxy_event = None
+        if next_event is not None:
+            worker.proxy_event = self.scheduler.schedule_at(next_event, self._fire_worker_events, worker)
+
+    def _fire_worker_events(self, worker: _WorkerHandle):
+        """Proxy event callback: the worker fires its events due now."""
+        worker.proxy_event = None
+        worker.proxy_time = None
+        self._send(worker, "events")
+        self._apply_message(worker, self._receive(worker))
+
+    # === ITERATION PHASES ===
+
+    def _evaluate_groups(self, groups: List[List[int]]):
+        """
+        Evaluate groups (see SimulationEngine) and queue the VNET changes
+        for the workers whose components read them.
+        """
+        netlist = self.netlist
+        vnet_high = netlist.vnet_high
+        vnet_ids = netlist.vnet_ids
+        vnet_components = netlist.vnet_components
+        vnet_readers = self._vnet_readers
+        for members in groups:
+            is_high = netlist.is_driven_high(members)
+
+            for vnet_i in members:
+                if vnet_high[vnet_i] != is_high:
+                    netlist.store_state(vnet_i, is_high)
+                    self.coordinator.queue_components(vnet_components[vnet_i])
+                    for worker in vnet_readers[vnet_i]:
+                        worker.vnet_updates[vnet_i] = is_high
+                self.dirty_manager.clear_dirty(vnet_ids[vnet_i])
+
+    def _execute_components(self, pending_components: List[Component]) -> int:
+        """
+        Run the iteration's components on the host and in the workers.
+
+        Workers with pending components run concurrently with the host's
+        share; their boundary messages are applied in shard order at the
+        barrier.
+
+        Returns:
+            Number of components that ran without raising
+        """
+        shard_of = self.shard_of
+        host_components = []
+        worker_ids: Dict[int, List[str]] = {}
+        for component in pending_components:
+            shard = shard_of.get(component.component_id, HOST_SHARD)
+            if shard == HOST_SHARD:
+                host_components.append(component)
+            else:
+                worker_ids.setdefault(shard, []).append(component.component_id)
+
+        busy = [worker for worker in self._workers if worker.shard in worker_ids]
+        for worker in busy:
+            self._send(worker, "execute", worker_ids[worker.shard])
+
+        updated = super()._execute_components(host_components)
+
+        for worker in busy:
+            message = self._receive(worker)
+            self._apply_message(worker, message)
+            updated += message.updated
+            for component_id in worker_ids[worker.shard]:
+                self.coordinator.mark_update_complete(component_id)
+        return updated
+
+    def get_shard_sizes(self) -> Dict[int, int]:
+        """
+        Get the number of components per shard.
+
+        Returns:
+            Dict of shard index (0 = host) -> component count
+        """
+        sizes: Dict[int, int] = {}
+        for shard in self.shard_of.values():
+            sizes[shard] = sizes.get(shard, 0) + 1
+        return sizes
@@ -19,9 +19,8 @@ Date: 2025-12-10
 import time
 import threading
 import os
-from collections import defaultdict
-from typing import Dict, List, Optional, Set
-from dataclasses import dataclass
+from typing import Callable, Dict, List, Optional, Set
+from dataclasses import dataclass, replace
 from enum import Enum
 
 from core.vnet import VNET
@@ -33,8 +32,15 @@ from simulation.vnet_evaluator import VnetEvaluator
 from simulation.state_propagator import StatePropagator
 from simulation.dirty_flag_manager import DirtyFlagManager
 from simulation.component_update_coordinator import ComponentUpdateCoordinator
-from simulation.vnet_manager import VnetManager
+from simulation.vnet_manager import VnetManager, build_link_index
 from simulation.bridge_manager import BridgeManager
+from simulation.connectivity_manager import ConnectivityManager
+from simulation.compiled_netlist import CompiledNetlist
+from simulation.event_scheduler import EventScheduler, RealTimeThrottle
+from simulation.cycle_detector import CycleDetector, OscillationReport
+from simulation.phase_profiler import PhaseProfiler, PhaseProfile
+from simulation.single_writer import SimulationSnapshot, ExternalUpdateQueue
+from simulation.timed_run import StepStatistics, TimedRunResult, TimedRunner
 
 
 class SimulationState(Enum):
@@ -58,6 +64,10 @@ class SimulationStatistics:
     max_iterations_reached: bool = False
     timeout_reached: bool = False
     stable: bool = False
+    groups_evaluated: int = 0
+    peak_dirty_depth: int = 0
+    oscillation: Optional[OscillationReport] = None
+    profile: Optional[PhaseProfile] = None
 
 
 class SimulationEngine:
@@ -68,24 +78,38 @@ class SimulationEngine:
     - Initialization: Call SimStart on all components, mark all VNETs dirty
     - Main Loop: Evaluate dirty VNETs, propagate states, update components
     - Stability Detection: Detect when simulation reaches stable state
-    - Oscillation Detection: Detect infinite loops via max iterations or timeout
+    - Oscillation Detection: Detect repeated states (state fingerprints per
+      iteration and per relay-driven settle step), max iterations or timeout
     - Shutdown: Call SimStop on all components, cleanup
     
-    Thread-safe: Uses locks for state changes and statistics updates.
+    Thread-safe (single writer): run(), timed runs and real-time event
+    batches hold run_lock, and in single-writer mode the VNETs and managers
+    the loop mutates skip their own locks. Other threads read the published
+    snapshot (get_snapshot()) and change circuit state through
+    apply_external_update().
     
     Attributes:
         state: Current simulation state
+        run_lock: Coarse lock held by the thread mutating simulation state
         vnets: Dictionary of all VNETs by ID
         tabs: Dictionary of all tabs by ID
         bridges: Dictionary of all bridges by ID
         components: Dictionary of all components by ID
+        link_index: Link name -> VNETs, built once and shared by the
+                    evaluator, propagator and vnet_manager
         evaluator: VNET state evaluator
         propagator: State propagation system
         dirty_manager: Dirty flag manager
         coordinator: Component update coordinator
+        connectivity: Incremental connectivity groups (links + bridges)
+        netlist: Integer-indexed netlist used by the main loop (compiled at start)
+        scheduler: Simulated-time event queue (relay switching delays)
         statistics: Simulation statistics
     """
     
+    # Statistics dataclass created at initialize() (subclasses add fields)
+    _statistics_type = SimulationStatistics
+    
     def __init__(
         self,
         vnets: Dict[str, VNET],
@@ -93,7 +117,9 @@ class SimulationEngine:
         bridges: Dict[str, Bridge],
         components: Dict[str, Component],
         max_iterations: int = 10000,
-        timeout_seconds: float = 30.0
+        timeout_seconds: float = 30.0,
+        realtime: bool = True,
+        single_writer: bool = True
     ):
         """
         Initialize the simulation engine.
@@ -105,6 +131,12 @@ class SimulationEngine:
             components: Dictionary of all components by ID
             max_iterations: Maximum iterations before oscillation detection
             timeout_seconds: Maximum time before timeout
+            realtime: Pace scheduled events against wall-clock time (GUI).
+                      If False, simulated time only advances through
+                      process_next_event() and runs are deterministic.
+            single_writer: Skip per-object locks on VNETs and managers while
+                           the engine owns them (between initialize() and
+                           shutdown()); run_lock serializes all writers.
         """
         # Core data structures
         self.vnets = vnets
@@ -120,20 +152,38 @@ class SimulationEngine:
         self.state = SimulationState.STOPPED
         self._state_lock = threading.RLock()
         
-        # Phase 4 components
-        self.evaluator = VnetEvaluator(vnets, tabs, bridges)
-        self.propagator = StatePropagator(vnets, tabs, bridges)
+        # Phase 4 components (links are resolved: index them once)
+        self.link_index = build_link_index(vnets.values())
+        self.evaluator = VnetEvaluator(vnets, tabs, bridges, self.link_index)
+        self.propagator = StatePropagator(vnets, tabs, bridges, self.link_index)
         self.dirty_manager = DirtyFlagManager(vnets)
         self.coordinator = ComponentUpdateCoordinator(components, tabs)
+        self.connectivity = ConnectivityManager(vnets, bridges)
+        self.netlist: Optional[CompiledNetlist] = None
+        
+        # Single writer: whoever mutates simulation state holds run_lock
+        self.run_lock = threading.RLock()
+        self._single_writer = single_writer
+        self._external_updates = ExternalUpdateQueue(self.run_lock)
+        self._snapshot: Optional[SimulationSnapshot] = None
+        self._snapshot_version = 0
+        
+        # Simulated time: relays schedule contact transfers as events
+        self.scheduler = EventScheduler()
+        self._throttle: Optional[RealTimeThrottle] = (
+            RealTimeThrottle(self.scheduler, self._on_scheduler_batch, lock=self.run_lock)
+            if realtime else None
+        )
+        self.timed_runner = TimedRunner(self, self._throttle)
         
         # Create managers for component interface
         from core.id_manager import IDManager
         self.id_manager = IDManager()  # For generating bridge IDs
-        self.vnet_manager = VnetManager(vnets, tabs, self.dirty_manager)
-        self.bridge_manager = BridgeManager(bridges, self.id_manager, vnets)
+        self.vnet_manager = VnetManager(vnets, tabs, self.dirty_manager, self.link_index)
+        self.bridge_manager = BridgeManager(bridges, self.id_manager, vnets, self.connectivity)
         
         # Statistics
-        self.statistics = SimulationStatistics()
+        self.statistics = self._statistics_type()
         self._stats_lock = threading.RLock()
         
         # Control flags
@@ -142,6 +192,23 @@ class SimulationEngine:
         
         # GUI callback for async updates (e.g., relay timer completion)
         self._gui_restart_callback = None
+        
+        # Clock edges seen since initialize(): clock component ID -> count
+        self._clock_edges: Dict[str, int] = {}
+        
+        # Oscillation detection (detectors are created with the netlist).
+        # Settle steps are only compared while they are driven purely by
+        # relay transfers; clock edges and other inputs start a new sequence.
+        self._iteration_cycles: Optional[CycleDetector] = None
+        self._step_cycles: Optional[CycleDetector] = None
+        self._relay_switched = False
+        self._observed_edges = 0
+
+        # Per-phase profiling (None = off). Enable with set_profiling() or:
+        #   $env:RSIM_PROFILE = "1"
+        self._profiler: Optional[PhaseProfiler] = (
+            PhaseProfiler() if self._read_env_bool("RSIM_PROFILE") else None
+        )
 
         # Debug controls (off by default).
         # PowerShell:
@@ -216,8 +283,9 @@ class SimulationEngine:
         Steps:
         1. Set state to INITIALIZING
         2. Call sim_start() on all components
-        3. Mark all VNETs dirty (force initial evaluation)
-        4. Reset statistics
+        3. Compile the netlist and build connectivity groups (links + initial bridges)
+        4. Mark all VNETs dirty (force initial evaluation)
+        5. Reset statistics
         
         Returns:
             True if initialization successful, False otherwise
@@ -231,29 +299,34 @@ class SimulationEngine:
         try:
             # Reset statistics
             with self._stats_lock:
-                self.statistics = SimulationStatistics()
+                self.statistics = self._statistics_type()
+            
+            # Simulated time starts at 0.0 with no pending events
+            self.scheduler.reset()
+            self._clock_edges = {}
+            self._relay_switched = False
+            self._observed_edges = 0
             
             # Call sim_start on all components
             for component in self.components.values():
                 try:
-                    component.sim_start(self.vnet_manager, self.bridge_manager)
-                    
-                    # Set callback for DPDT relays to trigger simulation restart when timer completes
-                    if hasattr(component, 'set_on_contacts_switched_callback'):
-                        component.set_on_contacts_switched_callback(self._on_relay_contacts_switched)
-
-                    # Set callback for Clock components to trigger simulation restart when they tick
-                    if hasattr(component, 'set_on_tick_callback'):
-                        component.set_on_tick_callback(self._on_clock_tick)
+                    self._start_component(component)
                 except Exception as e:
                     print(f"Error in sim_start for {component.component_id}: {e}")
                     # Continue with other components
             
+            # Links are resolved and initial bridges exist: compile once
+            self._compile_netlist()
+            self._set_single_writer(self._single_writer)
+            
             # Mark all VNETs dirty to force initial evaluation
             self.dirty_manager.mark_all_dirty()
 
             self._debug_dump_vnets(iteration=0, phase="after_initialize_mark_all_dirty")
             
+            if self._throttle:
+                self._throttle.start()
+            
             # Reset control flags
             self._running = False
             self._stop_requested = False
@@ -261,6 +334,7 @@ class SimulationEngine:
             with self._state_lock:
                 self.state = SimulationState.STOPPED
             
+            self._publish_snapshot()
             return True
             
         except Exception as e:
@@ -269,28 +343,148 @@ class SimulationEngine:
                 self.state = SimulationState.ERROR
             return False
     
-    def _on_relay_contacts_switched(self):
+    def _start_component(self, component: Component):
+        """Wire a component to the engine's scheduler/callbacks and call sim_start()."""
+        # Relays schedule their switching delay on the engine's event queue
+        if hasattr(component, 'set_event_scheduler'):
+            component.set_event_scheduler(self.scheduler)
+        
+        component.sim_start(self.vnet_manager, self.bridge_manager)
+        
+        # Set callback for DPDT relays to trigger simulation restart when timer completes
+        if hasattr(component, 'set_on_contacts_switched_callback'):
+            component.set_on_contacts_switched_callback(self._on_relay_contacts_switched)
+
+        # Set callback for Clock components to trigger simulation restart when they tick
+        if hasattr(component, 'set_on_tick_callback'):
+            scheduled = hasattr(component, 'set_event_scheduler')
+            component.set_on_tick_callback(
+                lambda vnet_ids=None, clock_id=component.component_id, scheduled=scheduled:
+                    self._on_clock_tick(clock_id, vnet_ids, scheduled)
+            )
+    
+    def _compile_netlist(self):
+        """Compile the integer-indexed netlist and rebuild connectivity groups on it."""
+        self.netlist = CompiledNetlist(self.vnets, self.tabs, self.components)
+        self.connectivity.netlist = self.netlist
+        self.coordinator.set_fanout_index(dict(zip(self.netlist.vnet_ids, self.netlist.vnet_components)))
+        self.connectivity.build()
+        # A zero-delay settle can glitch A-B-A once; require three periods there
+        self._iteration_cycles = CycleDetector(self.netlist, self.bridge_manager, repeats=3)
+        self._step_cycles = CycleDetector(self.netlist, self.bridge_manager)
+    
+    def _on_relay_contacts_switched(self, vnet_ids: Optional[Set[str]] = None):
         """
         Callback for when a relay switches its contacts.
         
-        Marks all VNETs dirty and requests the GUI to restart simulation.
-        This is called from the relay's timer thread.
+        Marks the VNETs at the ends of the old and new bridges dirty, so
+        only the connectivity groups containing them are re-evaluated.
+        Called while the scheduler fires the relay's switching event; the
+        GUI restart is requested once per batch of events (see
+        _on_scheduler_batch).
+        
+        Args:
+            vnet_ids: Affected VNET IDs (None = unknown, mark everything dirty)
         """
-        self.dirty_manager.mark_all_dirty()
+        profiler = self._profiler
+        began = profiler.clock() if profiler is not None else 0.0
+        self._relay_switched = True
+        if vnet_ids is None:
+            self.dirty_manager.mark_all_dirty()
+        else:
+            self.dirty_manager.mark_multiple_dirty(vnet_ids)
+        if profiler is not None:
+            profiler.lap("callbacks", began)
+    
+    def _on_scheduler_batch(self):
+        """
+        Called by the real-time throttle after it fired a batch of events.
         
-        # Trigger GUI to restart simulation
+        Requests the GUI to restart simulation.
+        """
         if self._gui_restart_callback:
             self._gui_restart_callback()
-        else:
-            pass
+    
+    def process_next_event(self) -> bool:
+        """
+        Advance simulated time to the next scheduled event and fire it.
+        
+        Fires every event due at that time (e.g. all relays switching
+        together). The caller is expected to run() afterwards to settle.
+        
+        Returns:
+            True if an event was fired, False if none are pending
+        """
+        return self.scheduler.run_next() > 0
+    
+    def run_until(self, sim_time: float) -> TimedRunResult:
+        """
+        Advance the circuit to a simulated time as fast as the CPU allows.
+        
+        See TimedRunner.run_until(). Requires realtime=False.
+        """
+        return self.timed_runner.run_until(sim_time)
+    
+    def run_for(self, duration: float) -> TimedRunResult:
+        """Advance the circuit by a span of simulated time (see TimedRunner.run_for())."""
+        return self.timed_runner.run_for(duration)
+    
+    def run_clock_edges(self, count: int, clock_id: Optional[str] = None) -> TimedRunResult:
+        """Advance the circuit by a number of clock edges (see TimedRunner.run_clock_edges())."""
+        return self.timed_runner.run_clock_edges(count, clock_id)
+    
+    def get_clock_edges(self, clock_id: Optional[str] = None) -> int:
+        """
+        Get the number of clock output toggles since initialize().
+        
+        Args:
+            clock_id: Count only edges of this clock (default: any clock)
+            
+        Returns:
+            Number of edges
+        """
+        if clock_id is None:
+            return sum(self._clock_edges.values())
+        return self._clock_edges.get(clock_id, 0)
+    
+    def get_simulated_time(self) -> float:
+        """
+        Get the current simulated time.
+        
+        Returns:
+            Simulated time in seconds since initialize()
+        """
+        return self.scheduler.now
 
-    def _on_clock_tick(self):
+    def _on_clock_tick(
+        self,
+        clock_id: Optional[str] = None,
+        vnet_ids: Optional[Set[str]] = None,
+        scheduled: bool = False
+    ):
         """Callback for when a Clock toggles its output.
 
-        Called from the clock's background thread.
+        Called from the clock's scheduler event (or background thread).
+        Only the clock's output VNETs are marked dirty. Scheduled ticks
+        leave the GUI restart to _on_scheduler_batch (one per batch); only
+        a clock on its fallback thread requests a restart itself.
+
+        Args:
+            clock_id: ID of the clock that toggled
+            vnet_ids: Output VNET IDs (None = unknown, mark everything dirty)
+            scheduled: True if the tick was fired by the event scheduler
         """
-        self.dirty_manager.mark_all_dirty()
-        if self._gui_restart_callback:
+        profiler = self._profiler
+        began = profiler.clock() if profiler is not None else 0.0
+        if clock_id is not None:
+            self._clock_edges[clock_id] = self._clock_edges.get(clock_id, 0) + 1
+        if vnet_ids is None:
+            self.dirty_manager.mark_all_dirty()
+        else:
+            self.dirty_manager.mark_multiple_dirty(vnet_ids)
+        if profiler is not None:
+            profiler.lap("callbacks", began)
+        if not scheduled and self._gui_restart_callback:
             self._gui_restart_callback()
     
     def set_gui_restart_callback(self, callback):
@@ -309,19 +503,35 @@ class SimulationEngine:
         Run the main simulation loop until stable or max iterations/timeout.
         
         Main loop:
-        1. Get all dirty VNETs
-        2. For each dirty VNET:
-           a. Evaluate new state
-           b. If state changed, propagate to connected VNETs
-           c. Queue affected components for update
-        3. Execute component updates (simulate_logic)
-        4. Check if stable (no dirty VNETs)
-        5. Check for oscillation (max iterations or timeout)
-        6. Repeat until stable or oscillation detected
+        1. Apply updates queued by apply_external_update()
+        2. Get all dirty VNETs
+        3. For each connectivity group touched by a dirty VNET or a bridge change:
+           a. Evaluate group state from tab drives
+           b. Apply it to every VNET in the group
+           c. Queue components of VNETs whose state changed
+        4. Execute component updates (simulate_logic)
+        5. Check if stable (no dirty VNETs)
+        6. Check for oscillation (max iterations or timeout)
+        7. Repeat until stable or oscillation detected
+        
+        Holds run_lock for the whole pass and publishes a snapshot at the end.
         
         Returns:
             SimulationStatistics object with results
         """
+        with self.run_lock:
+            stats = self._run_owned()
+            self._publish_snapshot()
+        
+        # An update queued just as the loop finished is applied now; the
+        # caller's next run() settles it
+        if self._external_updates:
+            with self.run_lock:
+                self._external_updates.apply()
+        return stats
+    
+    def _run_owned(self) -> SimulationStatistics:
+        """Main loop body of run() (run_lock held)."""
         with self._state_lock:
             if self.state not in (SimulationState.STOPPED, SimulationState.STABLE):
                 return self.statistics
@@ -335,74 +545,29 @@ class SimulationEngine:
         start_time = time.time()
         iteration = 0
 
-        def evaluate_tabs_only(vnet: VNET) -> PinState:
-            """Evaluate a VNET from tab/pin drives only.
-
-            IMPORTANT: VNET.state is not a drive source. Only component pin states
-            (via Tab.state -> Pin.state) can actively assert HIGH.
-            """
-            for tab_id in vnet.get_all_tabs():
-                tab = self.tabs.get(tab_id)
-                if tab and tab.state == PinState.HIGH:
-                    return PinState.HIGH
-            return PinState.FLOAT
-
-        # Pre-index link_name -> {vnet_id} (links are static during a run)
-        link_index: Dict[str, Set[str]] = defaultdict(set)
-        for vnet_id, vnet in self.vnets.items():
-            if not vnet:
-                continue
-            for link_name in getattr(vnet, 'link_names', set()) or set():
-                if link_name:
-                    link_index[link_name].add(vnet_id)
-
-        def _union_find_groups() -> Dict[str, Set[str]]:
-            """Build connected components across bridges + link names.
-
-            Deterministic and order-independent. This replaces recursive link
-            evaluation (which can become order-dependent in cyclic link graphs).
-            """
-
-            parent: Dict[str, str] = {}
-
-            def find(x: str) -> str:
-                # Path compression
-                while parent[x] != x:
-                    parent[x] = parent[parent[x]]
-                    x = parent[x]
-                return x
-
-            def union(a: str, b: str) -> None:
-                ra, rb = find(a), find(b)
-                if ra != rb:
-                    parent[rb] = ra
-
-            # Init parents
-            for vnet_id in self.vnets.keys():
-                parent[vnet_id] = vnet_id
-
-            # Bridges (dynamic)
-            for bridge in self.bridges.values():
-                if not bridge:
-                    continue
-                v1 = getattr(bridge, 'vnet_id1', None)
-                v2 = getattr(bridge, 'vnet_id2', None)
-                if v1 in parent and v2 in parent:
-                    union(v1, v2)
-
-            # Links (static)
-            for vnet_ids in link_index.values():
-                vnet_ids_list = list(vnet_ids)
-                if len(vnet_ids_list) < 2:
-                    continue
-                first = vnet_ids_list[0]
-                for other in vnet_ids_list[1:]:
-                    union(first, other)
+        if self.netlist is None:
+            self._compile_netlist()
+        netlist = self.netlist
+        vnet_index = netlist.vnet_index
+
+        # VNET objects are the source of truth between runs (stop/reset write them)
+        netlist.load_states()
+
+        # Peak dirty-queue depth and oscillation reports are per run
+        self.dirty_manager.reset_peak_depth()
+        with self._stats_lock:
+            self.statistics.oscillation = None
+        iteration_cycles = self._iteration_cycles
+        iteration_cycles.clear()
+
+        # Profiling: 'mark' is the start of the phase being timed
+        profiler = self._profiler
+        clock = PhaseProfiler.clock
+        mark = 0.0
 
-            groups: Dict[str, Set[str]] = defaultdict(set)
-            for vnet_id in self.vnets.keys():
-                groups[find(vnet_id)].add(vnet_id)
-            return groups
+        # Connectivity groups are maintained incrementally by BridgeManager.
+        # Only reconcile bridges added/removed outside of it since last run.
+        self.connectivity.sync()
         
         try:
             while self._running and not self._stop_requested:
@@ -412,8 +577,17 @@ class SimulationEngine:
                 with self._stats_lock:
                     self.statistics.iterations = iteration
                 
+                # Changes made by other threads while this pass runs
+                if self._external_updates:
+                    self._external_updates.apply()
+                
+                if profiler is not None:
+                    mark = clock()
+                
                 # Get dirty VNETs
                 dirty_vnets = self.dirty_manager.get_dirty_vnets()
+                if profiler is not None:
+                    mark = profiler.lap("dirty_bookkeeping", mark)
 
                 self._debug_dump_vnets(iteration=iteration, phase="loop_start", dirty_vnets=dirty_vnets)
                 
@@ -431,65 +605,79 @@ class SimulationEngine:
                         self.state = SimulationState.STABLE
                     
                     self._running = False
+                    self._observe_settle_step()
                     self._debug_dump_vnets(iteration=iteration, phase="stable_reached")
                     break
 
-                # Deterministic recompute: build full connectivity groups (bridges + links),
+                # Deterministic group evaluation over connectivity groups (bridges + links):
                 # compute group state from pin/tab drives only, then apply to all VNETs.
+                # Only groups containing a dirty VNET or touched by a bridge change can
+                # have a different result, so untouched groups are skipped.
                 # Only queue components when a VNET's state actually changes.
-                groups = _union_find_groups()
-
-                for group_ids in groups.values():
-                    group_state = PinState.FLOAT
-                    for vnet_id in group_ids:
-                        gvnet = self.vnets.get(vnet_id)
-                        if not gvnet:
-                            continue
-                        if evaluate_tabs_only(gvnet) == PinState.HIGH:
-                            group_state = PinState.HIGH
-                            break
-
-                    for vnet_id in group_ids:
-                        gvnet = self.vnets.get(vnet_id)
-                        if not gvnet:
-                            continue
-
-                        old_state = gvnet.state
-                        if old_state != group_state:
-                            gvnet.state = group_state
-                            self.coordinator.queue_components_for_vnet(gvnet)
-                        # Consider this VNET evaluated for this iteration.
-                        self.dirty_manager.clear_dirty(vnet_id)
+                dirty_indices = []
+                for vnet in dirty_vnets:
+                    vnet_i = vnet_index.get(vnet.vnet_id)
+                    if vnet_i is None:
+                        # Not part of the compiled netlist: nothing to evaluate
+                        self.dirty_manager.clear_dirty(vnet.vnet_id)
+                    else:
+                        dirty_indices.append(vnet_i)
+
+                groups = self.connectivity.collect_group_indices(dirty_indices)
+                with self._stats_lock:
+                    self.statistics.groups_evaluated += len(groups)
+                if profiler is not None:
+                    mark = profiler.lap("group_build", mark)
+
+                self._evaluate_groups(groups)
+                if profiler is not None:
+                    mark = profiler.lap("group_eval", mark)
 
                 # If nothing changed electrically, we can still have pending component updates
                 # from previous iteration; otherwise we are stable.
                 self._debug_dump_vnets(iteration=iteration, phase="after_vnet_processing")
                 
+                if profiler is not None:
+                    mark = clock()
+                
                 # Start component updates
                 num_pending = self.coordinator.start_updates()
                 
                 # Execute component logic
                 if num_pending > 0:
                     pending_components = self.coordinator.get_pending_components()
+                    if profiler is not None:
+                        mark = profiler.lap("dirty_bookkeeping", mark)
                     
-                    for component in pending_components:
-                        try:
-                            component.simulate_logic(self.vnet_manager, self.bridge_manager)
-                            with self._stats_lock:
-                                self.statistics.components_updated += 1
-                        except Exception as e:
-                            print(f"Error in simulate_logic for {component.component_id}: {e}")
-                            import traceback
-                            traceback.print_exc()
-                        finally:
-                            self.coordinator.mark_update_complete(component.component_id)
+                    updated = self._execute_components(pending_components)
+                    
+                    with self._stats_lock:
+                        self.statistics.components_updated += updated
+                    if profiler is not None:
+                        mark = profiler.lap("simulate_logic", mark)
                     
                     # Wait for all updates to complete
                     self.coordinator.wait_for_completion(timeout=1.0)
+                if profiler is not None:
+                    profiler.lap("dirty_bookkeeping", mark)
                     # No global post-component VNET scan here.
                     # Components are responsible for marking affected VNETs dirty via VnetManager,
                     # and bridge changes (add/remove) already mark VNETs dirty.
                 
+                # Check for oscillation (repeated state)
+                report = iteration_cycles.observe()
+                if report is not None:
+                    elapsed = time.time() - start_time
+                    with self._stats_lock:
+                        self.statistics.oscillation = report
+                        self.statistics.total_time = elapsed
+                    
+                    with self._state_lock:
+                        self.state = SimulationState.OSCILLATING
+                    
+                    self._running = False
+                    break
+                
                 # Check for oscillation (max iterations)
                 if iteration >= self.max_iterations:
                     elapsed = time.time() - start_time
@@ -516,6 +704,10 @@ class SimulationEngine:
                     self._running = False
                     break
             
+            with self._stats_lock:
+                self.statistics.peak_dirty_depth = self.dirty_manager.get_peak_depth()
+            self._publish_profile()
+            
             # If stopped by request
             if self._stop_requested:
                 elapsed = time.time() - start_time
@@ -537,8 +729,171 @@ class SimulationEngine:
                 self.state = SimulationState.ERROR
             
             self._running = False
+            self._publish_profile()
             return self.statistics
     
+    def _evaluate_groups(self, groups: List[List[int]]):
+        """
+        Evaluate connectivity groups and apply their states (run_lock held).
+        
+        Each group's state is computed from pin/tab drives only and applied
+        to every member VNET. Components are queued only for VNETs whose
+        state actually changed; every member's dirty flag is cleared.
+        
+        Args:
+            groups: Groups of netlist VNET indices (collect_group_indices())
+        """
+        netlist = self.netlist
+        vnet_high = netlist.vnet_high
+        vnet_ids = netlist.vnet_ids
+        vnet_components = netlist.vnet_components
+        for members in groups:
+            is_high = netlist.is_driven_high(members)
+
+            for vnet_i in members:
+                if vnet_high[vnet_i] != is_high:
+                    # Write back to the VNET object (read by components/renderers)
+                    netlist.store_state(vnet_i, is_high)
+                    self.coordinator.queue_components(vnet_components[vnet_i])
+                # Consider this VNET evaluated for this iteration.
+                self.dirty_manager.clear_dirty(vnet_ids[vnet_i])
+    
+    def _execute_components(self, pending_components: List[Component]) -> int:
+        """
+        Run simulate_logic() for the pending components (run_lock held).
+        
+        Marks every component's update complete, including failed ones.
+        
+        Args:
+            pending_components: Components queued for this iteration
+            
+        Returns:
+            Number of components that ran without raising
+        """
+        profiler = self._profiler
+        clock = PhaseProfiler.clock
+        updated = 0
+        for component in pending_components:
+            try:
+                if profiler is None:
+                    component.simulate_logic(self.vnet_manager, self.bridge_manager)
+                else:
+                    began = clock()
+                    component.simulate_logic(self.vnet_manager, self.bridge_manager)
+                    profiler.record_component(component, clock() - began)
+                updated += 1
+            except Exception as e:
+                print(f"Error in simulate_logic for {component.component_id}: {e}")
+                import traceback
+                traceback.print_exc()
+            finally:
+                self.coordinator.mark_update_complete(component.component_id)
+        return updated
+    
+    def apply_external_update(self, update: Callable[[], None]) -> bool:
+        """
+        Change circuit state from another thread (e.g. a GUI interaction).
+        
+        The update runs under run_lock: immediately if no run holds it,
+        otherwise it is queued and applied by the running loop at the start
+        of its next iteration (or right after the run). Request a run
+        afterwards to settle the change.
+        
+        Args:
+            update: Callable without arguments (e.g. toggles a switch and
+                    marks VNETs dirty)
+            
+        Returns:
+            True if applied immediately, False if queued
+        """
+        return self._external_updates.submit(update)
+    
+    def _set_single_writer(self, enabled: bool):
+        """Switch VNETs and managers between lock-free and locked access."""
+        for vnet in self.vnets.values():
+            vnet.set_single_writer(enabled)
+        self.dirty_manager.set_single_writer(enabled)
+        self.coordinator.set_single_writer(enabled)
+        self.connectivity.set_single_writer(enabled)
+    
+    def _publish_snapshot(self):
+        """Publish VNET states, state and statistics for other threads (run_lock held)."""
+        netlist = self.netlist
+        if netlist is None:
+            return
+        self._snapshot_version += 1
+        self._snapshot = SimulationSnapshot(
+            version=self._snapshot_version,
+            state=self.get_state(),
+            sim_time=self.scheduler.now,
+            statistics=self.get_statistics(),
+            vnet_high=bytes(netlist.vnet_high),
+            vnet_index=netlist.vnet_index,
+            tab_index=netlist.tab_index,
+            tab_vnet=netlist.tab_vnet
+        )
+    
+    def get_snapshot(self) -> Optional[SimulationSnapshot]:
+        """
+        Get the most recently published snapshot (no locking).
+        
+        Returns:
+            SimulationSnapshot, or None before initialize()
+        """
+        return self._snapshot
+    
+    def _publish_profile(self):
+        """Move the profiler's timings for this run into statistics.profile."""
+        profiler = self._profiler
+        with self._stats_lock:
+            self.statistics.profile = profiler.snapshot(reset=True) if profiler is not None else None
+    
+    def set_profiling(self, enabled: bool, top_n: int = 10):
+        """
+        Switch per-phase profiling on or off (takes effect on the next run).
+        
+        While enabled, each run() stores a PhaseProfile in
+        statistics.profile: wall time per phase (group build, group
+        evaluation, simulate_logic, dirty bookkeeping, callbacks), call
+        counts and time per component type and the slowest components.
+        Relay/clock callbacks between runs count towards the next run.
+        Timed runs also return the total over all settle passes.
+        
+        Args:
+            enabled: True to profile, False to remove the profiler
+            top_n: Number of slowest components to list
+        """
+        self._profiler = PhaseProfiler(top_n) if enabled else None
+    
+    def is_profiling(self) -> bool:
+        """
+        Check if per-phase profiling is enabled.
+        
+        Returns:
+            True if enabled, False otherwise
+        """
+        return self._profiler is not None
+    
+    def _observe_settle_step(self):
+        """
+        Fingerprint a settled state for step-level cycle detection.
+        
+        Settled states caused only by relay transfers are compared with the
+        previous ones; a repeating sequence is a self-oscillating relay loop
+        (buzzer) and is reported in statistics.oscillation. Any other cause
+        (start, clock edge, user input) begins a new sequence.
+        """
+        edges = sum(self._clock_edges.values())
+        if not self._relay_switched or edges != self._observed_edges:
+            self._step_cycles.clear()
+        self._relay_switched = False
+        self._observed_edges = edges
+        
+        report = self._step_cycles.observe(self.scheduler.now)
+        if report is not None:
+            with self._stats_lock:
+                self.statistics.oscillation = report
+    
     def stop(self):
         """
         Request simulation to stop.
@@ -570,19 +925,28 @@ class SimulationEngine:
             while self._running and (time.time() - start) < timeout:
                 time.sleep(0.01)
         
+        if self._throttle:
+            self._throttle.stop()
+        
         try:
-            # Call sim_stop on all components
-            for component in self.components.values():
-                try:
-                    component.sim_stop()
-                except Exception as e:
-                    print(f"Error in sim_stop for {component.component_id}: {e}")
-            
-            # Clear dirty flags
-            self.dirty_manager.reset()
-            
-            # Cancel pending updates
-            self.coordinator.cancel_all_updates()
+            with self.run_lock:
+                # Call sim_stop on all components
+                for component in self.components.values():
+                    try:
+                        component.sim_stop()
+                    except Exception as e:
+                        print(f"Error in sim_stop for {component.component_id}: {e}")
+                
+                # Clear dirty flags
+                self.dirty_manager.reset()
+                
+                # Cancel pending updates and timed events
+                self.coordinator.cancel_all_updates()
+                self.scheduler.clear()
+                self._external_updates.clear()
+                
+                # Objects are no longer owned by a running simulation
+                self._set_single_writer(False)
             
             with self._state_lock:
                 self.state = SimulationState.STOPPED
@@ -595,6 +959,31 @@ class SimulationEngine:
                 self.state = SimulationState.ERROR
             return False
     
+    def reset(self) -> bool:
+        """
+        Return to the simulation start state without rebuilding structures.
+        
+        Shuts the simulation down, floats every pin, tab and VNET, then runs
+        initialize() again. Lets batch runners apply many stimulus vectors to
+        one loaded document.
+        
+        Returns:
+            True if re-initialization successful, False otherwise
+        """
+        if not self.shutdown():
+            return False
+        
+        for component in self.components.values():
+            for pin in component.get_all_pins().values():
+                pin._state = PinState.FLOAT
+                for tab in pin.tabs.values():
+                    tab._state = PinState.FLOAT
+        for vnet in self.vnets.values():
+            vnet.state = PinState.FLOAT
+        self.dirty_manager.reset()
+        
+        return self.initialize()
+    
     def get_state(self) -> SimulationState:
         """
         Get current simulation state (thread-safe).
@@ -613,16 +1002,8 @@ class SimulationEngine:
             Copy of current SimulationStatistics
         """
         with self._stats_lock:
-            # Return a copy
-            return SimulationStatistics(
-                iterations=self.statistics.iterations,
-                components_updated=self.statistics.components_updated,
-                time_to_stability=self.statistics.time_to_stability,
-                total_time=self.statistics.total_time,
-                max_iterations_reached=self.statistics.max_iterations_reached,
-                timeout_reached=self.statistics.timeout_reached,
-                stable=self.statistics.stable
-            )
+            # Return a copy (of the engine's statistics type)
+            return replace(self.statistics)
     
     def is_running(self) -> bool:
         """
@@ -646,4 +1027,4 @@ class SimulationEngine:
     def reset_statistics(self):
         """Reset simulation statistics to initial state."""
         with self._stats_lock:
-            self.statistics = SimulationStatistics()
+            self.statistics = self._statistics_type()
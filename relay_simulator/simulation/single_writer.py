@@ -0,0 +1,113 @@
+"""
+Single-writer helpers for the simulation engine
+
+One thread at a time mutates simulation state, holding the engine's coarse
+run lock. Other threads never touch the live objects:
+
+- SimulationSnapshot: immutable copy of VNET states, engine state and
+  statistics, published at the end of initialize() and of every run()
+- ExternalUpdateQueue: changes requested by other threads (e.g. GUI
+  clicks), applied under the run lock immediately or by the running loop
+"""
+
+import threading
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Callable, Dict, List, Sequence
+
+if TYPE_CHECKING:
+    from simulation.simulation_engine import SimulationState, SimulationStatistics
+
+
+@dataclass(frozen=True)
+class SimulationSnapshot:
+    """
+    Engine state published at the end of initialize() and of every run().
+
+    Readers on other threads (GUI, renderers, API) use the snapshot instead
+    of the live objects the engine mutates. The index dictionaries are
+    shared with the compiled netlist and never modified.
+    """
+    version: int
+    state: 'SimulationState'
+    sim_time: float
+    statistics: 'SimulationStatistics'
+    vnet_high: bytes
+    vnet_index: Dict[str, int]
+    tab_index: Dict[str, int]
+    tab_vnet: Sequence[int]
+
+    def is_vnet_high(self, vnet_id: str) -> bool:
+        """Check whether a VNET was HIGH when the snapshot was taken."""
+        vnet_i = self.vnet_index.get(vnet_id)
+        return vnet_i is not None and self.vnet_high[vnet_i] == 1
+
+    def is_tab_high(self, tab_id: str) -> bool:
+        """Check whether the VNET containing a tab was HIGH."""
+        tab_i = self.tab_index.get(tab_id)
+        if tab_i is None:
+            return False
+        vnet_i = self.tab_vnet[tab_i]
+        return vnet_i >= 0 and self.vnet_high[vnet_i] == 1
+
+
+class ExternalUpdateQueue:
+    """
+    Circuit changes requested by threads that do not hold the run lock.
+
+    submit() runs an update at once if the run lock is free, otherwise
+    queues it; the thread holding the lock calls apply() to run the queue
+    in order.
+    """
+
+    def __init__(self, run_lock: threading.RLock):
+        """
+        Initialize the queue.
+
+        Args:
+            run_lock: The engine's coarse run lock
+        """
+        self.run_lock = run_lock
+        self._updates: List[Callable[[], None]] = []
+        self._lock = threading.Lock()
+
+    def __bool__(self) -> bool:
+        """True if updates are waiting (unlocked check for the hot loop)."""
+        return bool(self._updates)
+
+    def submit(self, update: Callable[[], None]) -> bool:
+        """
+        Run an update under the run lock, or queue it if the lock is held.
+
+        Args:
+            update: Callable without arguments
+
+        Returns:
+            True if applied immediately, False if queued
+        """
+        if self.run_lock.acquire(blocking=False):
+            try:
+                self.apply()
+                update()
+            finally:
+                self.run_lock.release()
+            return True
+
+        with self._lock:
+            self._updates.append(update)
+        return False
+
+    def apply(self):
+        """Run queued updates in order (run lock held)."""
+        with self._lock:
+            updates = self._updates
+            self._updates = []
+        for update in updates:
+            try:
+                update()
+            except Exception as e:
+                print(f"Error in external update: {e}")
+
+    def clear(self):
+        """Drop queued updates without running them."""
+        with self._lock:
+            self._updates = []
@@ -18,11 +18,12 @@ This is a critical part of the simulation engine that runs after state
 evaluation to ensure electrical continuity across the entire circuit.
 """
 
-from typing import Dict, Set, Optional
+from typing import Dict, Set, Optional, Tuple
 from core.state import PinState
 from core.vnet import VNET
 from core.tab import Tab
 from core.bridge import Bridge
+from simulation.vnet_manager import build_link_index
 
 
 class StatePropagator:
@@ -44,7 +45,8 @@ class StatePropagator:
         self,
         all_vnets: Dict[str, VNET],
         all_tabs: Dict[str, Tab],
-        all_bridges: Dict[str, Bridge]
+        all_bridges: Dict[str, Bridge],
+        link_index: Optional[Dict[str, Tuple[VNET, ...]]] = None
     ):
         """
         Initialize the state propagator.
@@ -53,10 +55,17 @@ class StatePropagator:
             all_vnets: Dictionary mapping vnet_id -> VNET object
             all_tabs: Dictionary mapping tab_id -> Tab object
             all_bridges: Dictionary mapping bridge_id -> Bridge object
+            link_index: Optional link name -> VNETs index shared with the
+                        VnetManager (built from all_vnets if not given)
         """
         self.all_vnets = all_vnets
         self.all_tabs = all_tabs
         self.all_bridges = all_bridges
+        
+        # Link names are static during simulation: look linked VNETs up by name
+        if link_index is None:
+            link_index = build_link_index(all_vnets.values())
+        self.link_index = link_index
     
     def propagate_vnet_state(self, vnet: VNET, new_state: PinState, include_bridges: bool = True) -> Set[str]:
         """
@@ -172,15 +181,11 @@ class StatePropagator:
         # Get all link names from this VNET
         link_names = vnet.link_names.copy()
         
-        # For each link name, find all other VNETs with the same link
+        # For each link name, collect the other VNETs carrying it
         for link_name in link_names:
-            for other_vnet_id, other_vnet in self.all_vnets.items():
+            for other_vnet in self.link_index.get(link_name, ()):
                 # Skip self
-                if other_vnet_id == vnet.vnet_id:
-                    continue
-                
-                # Check if other VNET has this link name
-                if other_vnet.has_link(link_name):
+                if other_vnet is not vnet:
                     linked_vnets.append(other_vnet)
         
         return linked_vnets
@@ -0,0 +1,201 @@
+"""
+Stimulus - Input assignment and output probing for batch runs
+
+Shared by the bit-parallel engine and the test-vector runner:
+
+- Inputs are Switch (bool) and Thumbwheel (0..15) components, addressed by
+  component ID or by a unique Switch label / Thumbwheel bus name
+- Outputs are Indicator lit states and BusDisplay/SevenSegmentDisplay values
+"""
+
+import itertools
+from typing import Any, Dict, List, Mapping, Optional, Sequence, Tuple, Union
+
+from core.vnet import VNET
+from core.state import PinState
+from components.base import Component
+from simulation.vnet_manager import Bus, VnetManager, build_link_index
+
+
+INPUT_COMPONENT_TYPES = ("Switch", "Thumbwheel")
+
+
+def build_input_index(components: Mapping[str, Component]) -> Dict[str, Component]:
+    """
+    Map input keys to Switch/Thumbwheel components.
+
+    Component IDs always resolve. Switch labels and Thumbwheel bus names
+    resolve only when they are unique.
+
+    Args:
+        components: Dictionary of components by ID
+
+    Returns:
+        Dictionary of input key -> component
+    """
+    index: Dict[str, Component] = {}
+    ambiguous = set()
+
+    for component in components.values():
+        if component.component_type == "Switch":
+            alias = component.properties.get("label")
+        elif component.component_type == "Thumbwheel":
+            alias = component.properties.get("bus_name")
+        else:
+            continue
+
+        if isinstance(alias, str) and alias.strip():
+            alias = alias.strip()
+            if alias in index and index[alias] is not component:
+                ambiguous.add(alias)
+            index[alias] = component
+
+    for alias in ambiguous:
+        del index[alias]
+    for component in components.values():
+        if component.component_type in INPUT_COMPONENT_TYPES:
+            index[component.component_id] = component
+    return index
+
+
+def resolve_input(input_index: Mapping[str, Component], key: str) -> Component:
+    """
+    Look up an input component.
+
+    Raises:
+        KeyError: If the key is unknown or ambiguous
+    """
+    component = input_index.get(key)
+    if component is None:
+        raise KeyError(f"Unknown or ambiguous input '{key}' (expected a Switch or Thumbwheel)")
+    return component
+
+
+def exhaustive_vectors(
+    input_index: Mapping[str, Component],
+    input_keys: Sequence[str]
+) -> List[Dict[str, Union[bool, int]]]:
+    """
+    Build every combination of the given inputs.
+
+    Switches take False/True, thumbwheels 0..15. The first key varies
+    slowest.
+
+    Args:
+        input_index: Index from build_input_index()
+        input_keys: Input keys to enumerate
+
+    Returns:
+        List of input assignments
+    """
+    ranges = []
+    for key in input_keys:
+        if resolve_input(input_index, key).component_type == "Thumbwheel":
+            ranges.append(range(16))
+        else:
+            ranges.append((False, True))
+    return [dict(zip(input_keys, values)) for values in itertools.product(*ranges)]
+
+
+def apply_inputs(
+    input_index: Mapping[str, Component],
+    assignment: Mapping[str, Any],
+    vnet_manager,
+    bridge_manager=None
+):
+    """
+    Set inputs on a running simulation (after initialize()).
+
+    The components drive their new output and mark their VNETs dirty.
+
+    Raises:
+        KeyError: If an input key is unknown or ambiguous
+    """
+    for key, value in assignment.items():
+        component = resolve_input(input_index, key)
+        if component.component_type == "Thumbwheel":
+            component._set_value(int(value))
+        else:
+            component.set_state(bool(value))
+        component.simulate_logic(vnet_manager, bridge_manager)
+
+
+class OutputProbe:
+    """
+    Reads indicator and bus display states from settled VNETs.
+
+    Tab and link lookups are resolved once, so a probe can be read after
+    every vector of a batch run.
+    """
+
+    def __init__(
+        self,
+        vnets: Mapping[str, VNET],
+        components: Mapping[str, Component],
+        link_index: Optional[Mapping[str, Tuple[VNET, ...]]] = None
+    ):
+        """
+        Resolve output components against the VNETs.
+
+        Args:
+            vnets: Dictionary of all VNETs by ID
+            components: Dictionary of all components by ID
+            link_index: Optional link name -> VNETs index (e.g. the engine's
+                        link_index; built from vnets if not given)
+        """
+        vnet_for_tab: Dict[str, VNET] = {}
+        for vnet in vnets.values():
+            for tab_id in vnet.tab_ids:
+                vnet_for_tab[tab_id] = vnet
+        vnets_for_link = link_index if link_index is not None else build_link_index(vnets.values())
+
+        self.indicators: Dict[str, Tuple[VNET, ...]] = {}
+        self.buses: Dict[str, Bus] = {}
+        for component_id, component in components.items():
+            if component.component_type == "Indicator":
+                lit_by = {}
+                for pin in component.get_all_pins().values():
+                    for tab_id in pin.tabs:
+                        vnet = vnet_for_tab.get(tab_id)
+                        if vnet is not None:
+                            lit_by[vnet.vnet_id] = vnet
+                self.indicators[component_id] = tuple(lit_by.values())
+            else:
+                link_names = get_bus_link_names(component)
+                if link_names is not None:
+                    self.buses[component_id] = tuple(
+                        tuple(vnets_for_link.get(link_name, ())) for link_name in link_names
+                    )
+
+    def read(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Read the current output states.
+
+        Returns:
+            {'indicators': {component_id: bool}, 'buses': {component_id: int}}
+        """
+        high = PinState.HIGH
+        indicators = {
+            component_id: any(vnet.state == high for vnet in vnets)
+            for component_id, vnets in self.indicators.items()
+        }
+        read_bus = VnetManager.read_bus
+        buses = {component_id: read_bus(bus) for component_id, bus in self.buses.items()}
+        return {'indicators': indicators, 'buses': buses}
+
+
+def get_bus_link_names(component: Component):
+    """
+    Get the per-bit link names read by a bus display component.
+
+    Returns:
+        List of link names (bit 0 first), or None if not a bus display
+    """
+    if component.component_type == "BusDisplay":
+        return [
+            component.get_bit_link_name(bit_index)
+            for bit_index in range(component._get_number_of_pins())
+        ]
+    if component.component_type == "SevenSegmentDisplay":
+        return component.get_nibble_link_names()
+    return None
@@ -0,0 +1,103 @@
+"""
+Structure Builder - Simulation data structures from a Document
+
+Builds the (vnets, tabs, bridges, components) dictionaries that the
+simulation engines consume. Used by the GUI when entering simulation mode
+and by headless runners, so both simulate exactly the same netlist.
+"""
+
+from typing import Dict, Tuple
+
+from core.document import Document
+from core.vnet import VNET
+from core.tab import Tab
+from core.bridge import Bridge
+from core.state import PinState
+from components.base import Component
+
+
+def build_simulation_structures(
+    document: Document
+) -> Tuple[Dict[str, VNET], Dict[str, Tab], Dict[str, Bridge], Dict[str, Component]]:
+    """
+    Build simulation data structures from a document.
+
+    Pin and tab states are reset to FLOAT so no state persists from a
+    previous simulation run.
+
+    Args:
+        document: Document to build from
+
+    Returns:
+        Tuple of (vnets, tabs, bridges, components) dictionaries
+    """
+    vnets: Dict[str, VNET] = {}
+    tabs: Dict[str, Tab] = {}
+    bridges: Dict[str, Bridge] = {}
+    components: Dict[str, Component] = {}
+
+    # Collect all components from all pages
+    for page in document.get_all_pages():
+        for component in page.get_all_components():
+            components[component.component_id] = component
+
+            # Collect all tabs from component pins and RESET THEIR STATE
+            for pin in component.get_all_pins().values():
+                pin._state = PinState.FLOAT
+                for tab in pin.tabs.values():
+                    tab._state = PinState.FLOAT
+                    tabs[tab.tab_id] = tab
+
+    # Build VNETs for each page; the document's builder only re-unions the
+    # nets edited since its last build. Index tab -> VNET on the way for
+    # link resolution.
+    vnet_builder = document.vnet_builder
+    pages = document.get_all_pages()
+    vnet_builder.forget_pages(page.page_id for page in pages)
+    tab_index: Dict[str, VNET] = {}
+    for page in pages:
+        for vnet in vnet_builder.build_vnets_for_page(page):
+            vnets[vnet.vnet_id] = vnet
+            for tab_id in vnet.tab_ids:
+                tab_index[tab_id] = vnet
+
+    # Resolve cross-page links (adds link_names onto the appropriate VNETs)
+    try:
+        from core.link_resolver import LinkResolver
+        resolver = LinkResolver()
+        resolver.resolve_links(
+            document,
+            list(vnets.values()),
+            tab_index,
+            link_map=vnet_builder.get_link_map(pages)
+        )
+    except Exception:
+        # Links are optional; continue without failing simulation build
+        pass
+
+    return vnets, tabs, bridges, components
+
+
+def build_detached_simulation_structures(
+    document_data: dict,
+    component_factory=None
+) -> Tuple[Dict[str, VNET], Dict[str, Tab], Dict[str, Bridge], Dict[str, Component]]:
+    """
+    Build simulation data structures from a serialized document.
+
+    The document is rebuilt from document_data (Document.to_dict()), so
+    the components are new objects. Throwaway runs such as engine
+    calibration can start, settle and stop them without touching the
+    components of the document being edited.
+
+    Args:
+        document_data: Serialized document (Document.to_dict())
+        component_factory: ComponentFactory (None = the default factory)
+
+    Returns:
+        Tuple of (vnets, tabs, bridges, components) dictionaries
+    """
+    if component_factory is None:
+        from components.factory import get_factory
+        component_factory = get_factory()
+    return build_simulation_structures(Document.from_dict(document_data, component_factory))
@@ -1,90 +1,90 @@
 """
 Threaded Simulation Engine
 
-A multi-threaded variant of the SimulationEngine that uses a thread pool
-to parallelize VNET evaluation and component logic execution.
+A multi-threaded variant of the SimulationEngine that shards the work of
+each iteration across a thread pool.
 
-This improves performance on multi-core systems by processing multiple
-VNETs and components concurrently, while maintaining thread-safety through
-proper locking strategies.
+Every iteration has two parallel phases, each ending at a barrier:
+
+1. Group evaluation: the connectivity groups touched by dirty VNETs are
+   split into one shard per worker. Workers only read pin drives and the
+   compiled state array and return the VNETs whose state changes. The
+   calling thread merges those changes at the barrier (state write-back,
+   component queueing, dirty flags), so each group is evaluated once.
+2. Component execution: pending components are split into shards and each
+   shard runs as one batch (one work item per shard, not per component).
+
+VNET states only change in phase 1, so the components of one iteration
+read the same inputs whichever shard runs them, and the results match the
+single-threaded engine. Work smaller than min_shard_size items per shard
+runs as a single shard on the calling thread, where a pool round trip
+would cost more than it saves.
+
+Everything else (compiled netlist, incremental connectivity, simulated
+time, oscillation detection, snapshots, profiling) is inherited from
+SimulationEngine. See testing/threaded_engine_benchmark.py for timings
+against the single-threaded engine.
 
 Author: Cascade AI
 Date: 2025-12-10
 """
 
-import time
-import threading
-from typing import Dict, List, Optional, Set
 from dataclasses import dataclass
-from enum import Enum
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
 
 from core.vnet import VNET
 from core.tab import Tab
 from core.bridge import Bridge
 from components.base import Component
-from simulation.vnet_evaluator import VnetEvaluator
-from simulation.state_propagator import StatePropagator
-from simulation.dirty_flag_manager import DirtyFlagManager
-from simulation.component_update_coordinator import ComponentUpdateCoordinator
-from thread_pool_pkg.thread_pool import ThreadPoolManager, WorkItem
-from components.thread_safe_component import ThreadSafeComponent, ComponentExecutionCoordinator
+from simulation.simulation_engine import (
+    SimulationEngine,
+    SimulationState,
+    SimulationStatistics as _EngineStatistics
+)
+from thread_pool_pkg.thread_pool import ThreadPoolManager, WorkItem, PoolState
+from components.thread_safe_component import ComponentExecutionCoordinator, takes_simulation_managers
 
 
-class SimulationState(Enum):
-    """Simulation state enumeration."""
-    STOPPED = "stopped"
-    INITIALIZING = "initializing"
-    RUNNING = "running"
-    STABLE = "stable"
-    OSCILLATING = "oscillating"
-    TIMEOUT = "timeout"
-    ERROR = "error"
+__all__ = ["ThreadedSimulationEngine", "SimulationState", "SimulationStatistics"]
 
 
 @dataclass
-class SimulationStatistics:
-    """Statistics gathered during simulation."""
-    iterations: int = 0
-    components_updated: int = 0
-    time_to_stability: float = 0.0
-    total_time: float = 0.0
-    max_iterations_reached: bool = False
-    timeout_reached: bool = False
-    stable: bool = False
+class SimulationStatistics(_EngineStatistics):
+    """Statistics gathered during simulation, including shard counters."""
     vnets_processed_parallel: int = 0
     components_processed_parallel: int = 0
     component_errors: int = 0
     successful_components: int = 0
+    shards_dispatched: int = 0
 
 
-class ThreadedSimulationEngine:
+class ThreadedSimulationEngine(SimulationEngine):
     """
     Multi-threaded simulation engine for relay logic simulator.
-    
-    Extends the single-threaded SimulationEngine with parallel processing:
-    - Parallel VNET evaluation using thread pool
-    - Parallel component logic execution
-    - Thread-safe state management
-    - Performance optimizations for multi-core systems
-    
-    All VNETs and components already have thread-safe locks (RLock),
-    so we can safely process them in parallel.
-    
+
+    Extends SimulationEngine with sharded parallel phases:
+    - Group evaluation split into per-thread shards, merged at a barrier
+    - Component logic executed in per-thread batches
+
+    Component shards run concurrently, so VNETs and managers keep their
+    per-object locks (single-writer mode is only used when the pool has a
+    single worker). run_lock still serializes runs against external updates.
+
+    Components written against the older engine API (simulate_logic()
+    and sim_start() without manager arguments) are still supported.
+
     Attributes:
-        state: Current simulation state
-        vnets: Dictionary of all VNETs by ID
-        tabs: Dictionary of all tabs by ID
-        bridges: Dictionary of all bridges by ID
-        components: Dictionary of all components by ID
-        evaluator: VNET state evaluator
-        propagator: State propagation system
-        dirty_manager: Dirty flag manager
-        coordinator: Component update coordinator
-        thread_pool: Thread pool for parallel execution
+        thread_pool: Thread pool for the shards
         execution_coordinator: Thread-safe component execution coordinator
-        statistics: Simulation statistics
+        min_shard_size: Minimum groups/components per pool shard
+        (plus all SimulationEngine attributes)
     """
-    
+
+    _statistics_type = SimulationStatistics
+
+    # Below this many work items per shard the phase runs on the calling thread
+    DEFAULT_MIN_SHARD_SIZE = 64
+
     def __init__(
         self,
         vnets: Dict[str, VNET],
@@ -93,11 +93,13 @@ class ThreadedSimulationEngine:
         components: Dict[str, Component],
         max_iterations: int = 10000,
         timeout_seconds: float = 30.0,
-        thread_count: Optional[int] = None
+        thread_count: Optional[int] = None,
+        realtime: bool = True,
+        min_shard_size: int = DEFAULT_MIN_SHARD_SIZE
     ):
         """
         Initialize the threaded simulation engine.
-        
+
         Args:
             vnets: Dictionary of all VNETs by ID
             tabs: Dictionary of all tabs by ID
@@ -106,433 +108,260 @@ class ThreadedSimulationEngine:
             max_iterations: Maximum iterations before oscillation detection
             timeout_seconds: Maximum time before timeout
             thread_count: Number of worker threads (None = auto-detect)
+            realtime: Pace scheduled events against wall-clock time
+                      (see SimulationEngine)
+            min_shard_size: Minimum work items per shard; smaller phases
+                            run on the calling thread
         """
-        # Core data structures
-        self.vnets = vnets
-        self.tabs = tabs
-        self.bridges = bridges
-        self.components = components
-        
-        # Simulation parameters
-        self.max_iterations = max_iterations
-        self.timeout_seconds = timeout_seconds
-        
-        # State management
-        self.state = SimulationState.STOPPED
-        self._state_lock = threading.RLock()
-        
-        # Phase 4 components
-        self.evaluator = VnetEvaluator(vnets, tabs, bridges)
-        self.propagator = StatePropagator(vnets, tabs, bridges)
-        self.dirty_manager = DirtyFlagManager(vnets)
-        self.coordinator = ComponentUpdateCoordinator(components, tabs)
-        
-        # Phase 5 - Thread pool
+        # Component shards write concurrently: keep per-object locks
+        super().__init__(
+            vnets, tabs, bridges, components,
+            max_iterations=max_iterations,
+            timeout_seconds=timeout_seconds,
+            realtime=realtime,
+            single_writer=False
+        )
+
+        self.thread_count = thread_count
+        self.min_shard_size = max(1, min_shard_size)
         self.thread_pool = ThreadPoolManager(thread_count=thread_count)
-        
-        # Phase 5.3 - Thread-safe component execution coordinator
-        self.execution_coordinator = ComponentExecutionCoordinator()
-        
+        self._shard_serial = 0
+
+        # With one worker every shard runs inline, so nothing writes concurrently
+        self._single_writer = self.thread_pool.thread_count == 1
+
         # Register all components for thread-safe execution
+        self.execution_coordinator = ComponentExecutionCoordinator()
         for component in components.values():
             self.execution_coordinator.register_component(component)
-        
-        # Statistics
-        self.statistics = SimulationStatistics()
-        self._stats_lock = threading.RLock()
-        
-        # Control flags
-        self._running = False
-        self._stop_requested = False
-    
+
     def initialize(self) -> bool:
         """
-        Initialize the simulation.
-        
-        Steps:
-        1. Set state to INITIALIZING
-        2. Start thread pool
-        3. Call sim_start() on all components
-        4. Mark all VNETs dirty (force initial evaluation)
-        5. Reset statistics
-        
+        Initialize the simulation (see SimulationEngine.initialize()).
+
+        Starts the thread pool first. A pool shut down by a previous
+        shutdown() (e.g. from reset()) is replaced by a new one.
+
         Returns:
             True if initialization successful, False otherwise
         """
-        with self._state_lock:
-            if self.state != SimulationState.STOPPED:
-                return False
-            
-            self.state = SimulationState.INITIALIZING
-        
-        try:
-            # Start thread pool
-            if not self.thread_pool.start():
-                raise Exception("Failed to start thread pool")
-            
-            # Reset statistics
-            with self._stats_lock:
-                self.statistics = SimulationStatistics()
-            
-            # Call sim_start on all components
-            for component in self.components.values():
-                try:
-                    component.sim_start()
-                except Exception as e:
-                    print(f"Error in sim_start for {component.component_id}: {e}")
-            
-            # Mark all VNETs dirty
-            self.dirty_manager.mark_all_dirty()
-            
-            # Reset control flags
-            self._running = False
-            self._stop_requested = False
-            
-            with self._state_lock:
-                self.state = SimulationState.STOPPED
-            
-            return True
-            
-        except Exception as e:
-            print(f"Initialization error: {e}")
-            with self._state_lock:
-                self.state = SimulationState.ERROR
+        if self.thread_pool.get_state() == PoolState.SHUTDOWN:
+            self.thread_pool = ThreadPoolManager(thread_count=self.thread_count)
+        if not self.thread_pool.start():
+            print("Initialization error: Failed to start thread pool")
             return False
-    
-    def _evaluate_vnet_task(self, vnet: VNET) -> tuple:
+
+        self.execution_coordinator.reset_statistics()
+        return super().initialize()
+
+    def _start_component(self, component: Component):
+        """
+        Start a component, including ones written against the older API.
+
+        Older components take no manager arguments and only drive their
+        pins from simulate_logic(), so they are queued for the first run.
+        """
+        if takes_simulation_managers(component.sim_start):
+            super()._start_component(component)
+        else:
+            component.sim_start()
+            self.coordinator.queue_component_update(component.component_id)
+
+    # === SHARDING ===
+
+    def _shard_count(self, item_count: int) -> int:
+        """Number of shards for a phase with item_count work items (1 = inline)."""
+        return max(1, min(self.thread_pool.thread_count, item_count // self.min_shard_size))
+
+    @staticmethod
+    def _partition(items: Sequence, shard_count: int) -> List[Sequence]:
+        """Split items into shard_count contiguous shards, preserving order."""
+        size, extra = divmod(len(items), shard_count)
+        shards = []
+        start = 0
+        for index in range(shard_count):
+            end = start + size + (1 if index < extra else 0)
+            shards.append(items[start:end])
+            start = end
+        return shards
+
+    def _run_shards(self, name: str, function: Callable, items: Sequence, shard_count: int) -> list:
         """
-        Task to evaluate a single VNET.
-        
+        Run function(shard) for every shard and wait for all of them (barrier).
+
         Args:
-            vnet: VNET to evaluate
-            
+            name: Phase name (task IDs and errors)
+            function: Shard function, called with a slice of items
+            items: Work items of the phase
+            shard_count: Number of shards (1 runs inline on this thread)
+
         Returns:
-            Tuple of (vnet_id, old_state, new_state)
+            Shard results in shard order
         """
-        old_state = vnet.state
-        new_state = self.evaluator.evaluate_vnet_state(vnet)
-        return (vnet.vnet_id, old_state, new_state)
-    
-    def _propagate_vnet_task(self, vnet: VNET, new_state) -> Set[str]:
+        if shard_count == 1:
+            return [function(items)]
+
+        shards = self._partition(items, shard_count)
+        results = [None] * shard_count
+
+        def run_shard(index: int, shard: Sequence):
+            results[index] = function(shard)
+
+        # Task IDs are unique per batch: the pool tracks pending work by ID
+        self._shard_serial += 1
+        serial = self._shard_serial
+        self.thread_pool.submit_batch([
+            WorkItem(f'{name}_{serial}_{index}', run_shard, (index, shard))
+            for index, shard in enumerate(shards)
+        ])
+        if not self.thread_pool.wait_for_completion(timeout=10.0):
+            raise RuntimeError(f"{name} shards did not complete")
+
+        for index, result in enumerate(results):
+            if result is None:
+                raise RuntimeError(f"{name} shard {index} failed")
+        with self._stats_lock:
+            self.statistics.shards_dispatched += shard_count
+        return results
+
+    # === PHASE 1: GROUP EVALUATION ===
+
+    def _evaluate_group_shard(self, groups: Sequence[List[int]]) -> List[Tuple[int, bool]]:
         """
-        Task to propagate a VNET state change.
-        
+        Evaluate a shard of connectivity groups without writing anything.
+
         Args:
-            vnet: VNET to propagate
-            new_state: New state to propagate
-            
+            groups: Groups of netlist VNET indices
+
         Returns:
-            Set of affected VNET IDs
+            (VNET index, is_high) for every member VNET whose state changes
         """
-        return self.propagator.propagate_vnet_state(vnet, new_state)
-    
-    def _execute_component_task(self, component: Component) -> tuple[bool, Optional[Exception]]:
+        netlist = self.netlist
+        vnet_high = netlist.vnet_high
+        is_driven_high = netlist.is_driven_high
+        changes = []
+        for members in groups:
+            is_high = is_driven_high(members)
+            for vnet_i in members:
+                if vnet_high[vnet_i] != is_high:
+                    changes.append((vnet_i, is_high))
+        return changes
+
+    def _evaluate_groups(self, groups: List[List[int]]):
+        """
+        Evaluate groups in shards and merge the state changes at the barrier.
+
+        Changes are applied in shard order, which is the group order of a
+        serial pass, so components are queued in the same order as by
+        SimulationEngine.
+        """
+        shard_changes = self._run_shards(
+            "eval", self._evaluate_group_shard, groups, self._shard_count(len(groups))
+        )
+
+        netlist = self.netlist
+        vnet_components = netlist.vnet_components
+        queue_components = self.coordinator.queue_components
+        for changes in shard_changes:
+            for vnet_i, is_high in changes:
+                # Write back to the VNET object (read by components/renderers)
+                netlist.store_state(vnet_i, is_high)
+                queue_components(vnet_components[vnet_i])
+
+        # Every member VNET has been evaluated for this iteration
+        vnet_ids = netlist.vnet_ids
+        evaluated = {vnet_ids[vnet_i] for members in groups for vnet_i in members}
+        self.dirty_manager.clear_multiple_dirty(evaluated)
+        with self._stats_lock:
+            self.statistics.vnets_processed_parallel += len(evaluated)
+
+    # === PHASE 2: COMPONENT EXECUTION ===
+
+    def _execute_component_shard(
+        self,
+        components: Sequence[Component]
+    ) -> Dict[str, Tuple[bool, Optional[Exception]]]:
         """
-        Task to execute component logic with thread-safety.
-        
-        Uses the ComponentExecutionCoordinator to execute component logic
-        with proper locking and error handling.
-        
+        Run simulate_logic() for a shard of components as one batch.
+
         Args:
-            component: Component to execute
-            
+            components: Components of this shard
+
         Returns:
-            Tuple of (success, exception)
+            Dict of component_id -> (success, exception)
         """
-        return self.execution_coordinator.execute_component_parallel(component.component_id)
-    
-    def run(self) -> SimulationStatistics:
+        coordinator = self.execution_coordinator
+        profiler = self._profiler
+        if profiler is None:
+            return coordinator.execute_batch_parallel(
+                [component.component_id for component in components],
+                self.vnet_manager, self.bridge_manager
+            )
+
+        clock = profiler.clock
+        results = {}
+        for component in components:
+            began = clock()
+            results[component.component_id] = coordinator.execute_component_parallel(
+                component.component_id, self.vnet_manager, self.bridge_manager
+            )
+            profiler.record_component(component, clock() - began)
+        return results
+
+    def _execute_components(self, pending_components: List[Component]) -> int:
         """
-        Run the main simulation loop with parallel processing.
-        
-        Main loop:
-        1. Get all dirty VNETs
-        2. Evaluate VNETs in parallel using thread pool
-        3. Propagate state changes in parallel
-        4. Queue affected components
-        5. Execute component logic in parallel
-        6. Check for stability, oscillation, timeout
-        
+        Execute pending components in shards and record the results.
+
         Returns:
-            SimulationStatistics object with results
+            Number of components that ran without raising
         """
-        with self._state_lock:
-            if self.state not in (SimulationState.STOPPED, SimulationState.STABLE):
-                return self.statistics
-            
-            self.state = SimulationState.RUNNING
-            self._running = True
-            self._stop_requested = False
-        
-        start_time = time.time()
-        iteration = 0
-        
-        try:
-            while self._running and not self._stop_requested:
-                iteration += 1
-                
-                # Update statistics
-                with self._stats_lock:
-                    self.statistics.iterations = iteration
-                
-                # Get dirty VNETs
-                dirty_vnets = self.dirty_manager.get_dirty_vnets()
-                
-                # If no dirty VNETs, we've reached stability
-                if not dirty_vnets:
-                    elapsed = time.time() - start_time
-                    with self._stats_lock:
-                        self.statistics.stable = True
-                        self.statistics.time_to_stability = elapsed
-                        self.statistics.total_time = elapsed
-                    
-                    with self._state_lock:
-                        self.state = SimulationState.STABLE
-                    
-                    self._running = False
-                    break
-                
-                # === PARALLEL VNET EVALUATION ===
-                # Submit all VNET evaluations to thread pool
-                eval_tasks = [
-                    WorkItem(f'eval_{vnet.vnet_id}', self._evaluate_vnet_task, (vnet,))
-                    for vnet in dirty_vnets
-                ]
-                
-                self.thread_pool.submit_batch(eval_tasks)
-                self.thread_pool.wait_for_completion(timeout=10.0)
-                
-                with self._stats_lock:
-                    self.statistics.vnets_processed_parallel += len(dirty_vnets)
-                
-                # Collect results and propagate changes
-                affected_vnets: Set[str] = set()
-                vnets_to_propagate = []
-                
-                for vnet in dirty_vnets:
-                    new_state = self.evaluator.evaluate_vnet_state(vnet)
-                    
-                    if new_state != vnet.state:
-                        vnets_to_propagate.append((vnet, new_state))
-                    
-                    # Clear dirty flag
-                    self.dirty_manager.clear_dirty(vnet.vnet_id)
-                    
-                    # Queue components
-                    self.coordinator.queue_components_for_vnet(vnet)
-                
-                # === PARALLEL STATE PROPAGATION ===
-                # Propagate state changes in parallel
-                if vnets_to_propagate:
-                    prop_tasks = [
-                        WorkItem(f'prop_{vnet.vnet_id}', self._propagate_vnet_task, (vnet, new_state))
-                        for vnet, new_state in vnets_to_propagate
-                    ]
-                    
-                    self.thread_pool.submit_batch(prop_tasks)
-                    self.thread_pool.wait_for_completion(timeout=10.0)
-                    
-                    # Collect affected VNETs
-                    for vnet, new_state in vnets_to_propagate:
-                        propagated = self.propagator.propagate_vnet_state(vnet, new_state)
-                        affected_vnets.update(propagated)
-                
-                # NOTE: We no longer re-mark all propagated VNETs dirty here.
-                # Propagation applies the resolved state; forcing re-evaluation can create oscillation
-                # when certain connectivity (e.g., bridges) is resolved outside the evaluator.
-                
-                # === PARALLEL COMPONENT EXECUTION ===
-                # Start component updates
-                num_pending = self.coordinator.start_updates()
-                
-                if num_pending > 0:
-                    pending_components = self.coordinator.get_pending_components()
-                    
-                    # Submit component logic to thread pool
-                    comp_tasks = [
-                        WorkItem(f'comp_{comp.component_id}', self._execute_component_task, (comp,))
-                        for comp in pending_components
-                    ]
-                    
-                    self.thread_pool.submit_batch(comp_tasks)
-                    self.thread_pool.wait_for_completion(timeout=10.0)
-                    
-                    # Collect execution results and update statistics
-                    exec_stats = self.execution_coordinator.get_statistics()
-                    
-                    with self._stats_lock:
-                        self.statistics.components_updated += num_pending
-                        self.statistics.components_processed_parallel += num_pending
-                        self.statistics.component_errors = exec_stats['failed_executions']
-                        self.statistics.successful_components = exec_stats['successful_executions']
-                    
-                    # Log any errors
-                    if exec_stats['error_count'] > 0:
-                        for error_info in exec_stats['errors']:
-                            comp_id = error_info['component_id']
-                            exc = error_info['exception']
-                            print(f"Component {comp_id} error: {exc}")
-                    
-                    # Mark all components complete
-                    for comp in pending_components:
-                        self.coordinator.mark_update_complete(comp.component_id)
-                    
-                    # No global post-component VNET scan here.
-                    # Components must mark affected VNETs dirty via VnetManager, and bridge changes
-                    # already mark VNETs dirty.
-                
-                # Check for oscillation
-                if iteration >= self.max_iterations:
-                    elapsed = time.time() - start_time
-                    with self._stats_lock:
-                        self.statistics.max_iterations_reached = True
-                        self.statistics.total_time = elapsed
-                    
-                    with self._state_lock:
-                        self.state = SimulationState.OSCILLATING
-                    
-                    self._running = False
-                    break
-                
-                # Check for timeout
-                elapsed = time.time() - start_time
-                if elapsed >= self.timeout_seconds:
-                    with self._stats_lock:
-                        self.statistics.timeout_reached = True
-                        self.statistics.total_time = elapsed
-                    
-                    with self._state_lock:
-                        self.state = SimulationState.TIMEOUT
-                    
-                    self._running = False
-                    break
-            
-            # If stopped by request
-            if self._stop_requested:
-                elapsed = time.time() - start_time
-                with self._stats_lock:
-                    self.statistics.total_time = elapsed
-                
-                with self._state_lock:
-                    self.state = SimulationState.STOPPED
-            
-            return self.statistics
-            
-        except Exception as e:
-            print(f"Simulation error: {e}")
-            elapsed = time.time() - start_time
-            with self._stats_lock:
-                self.statistics.total_time = elapsed
-            
-            with self._state_lock:
-                self.state = SimulationState.ERROR
-            
-            self._running = False
-            return self.statistics
-    
-    def stop(self):
-        """Request simulation to stop."""
-        self._stop_requested = True
-    
+        shard_results = self._run_shards(
+            "comp", self._execute_component_shard, pending_components,
+            self._shard_count(len(pending_components))
+        )
+
+        updated = 0
+        for results in shard_results:
+            for component_id, (success, exception) in results.items():
+                if success:
+                    updated += 1
+                else:
+                    print(f"Component {component_id} error: {exception}")
+                self.coordinator.mark_update_complete(component_id)
+
+        with self._stats_lock:
+            self.statistics.components_processed_parallel += len(pending_components)
+            self.statistics.successful_components += updated
+            self.statistics.component_errors += len(pending_components) - updated
+        return updated
+
+    # === LIFECYCLE ===
+
     def shutdown(self) -> bool:
         """
-        Shutdown the simulation and cleanup.
-        
-        Steps:
-        1. Stop the simulation if running
-        2. Call sim_stop() on all components
-        3. Clear dirty flags
-        4. Cancel pending component updates
-        5. Shutdown thread pool
-        
+        Shutdown the simulation and the thread pool.
+
         Returns:
             True if shutdown successful, False otherwise
         """
-        # Stop if running
-        if self._running:
-            self.stop()
-            timeout = 2.0
-            start = time.time()
-            while self._running and (time.time() - start) < timeout:
-                time.sleep(0.01)
-        
-        try:
-            # Call sim_stop on all components
-            for component in self.components.values():
-                try:
-                    component.sim_stop()
-                except Exception as e:
-                    print(f"Error in sim_stop for {component.component_id}: {e}")
-            
-            # Clear dirty flags
-            self.dirty_manager.reset()
-            
-            # Cancel pending updates
-            self.coordinator.cancel_all_updates()
-            
-            # Shutdown thread pool
-            self.thread_pool.shutdown(wait=True, timeout=2.0)
-            
-            with self._state_lock:
-                self.state = SimulationState.STOPPED
-            
-            return True
-            
-        except Exception as e:
-            print(f"Shutdown error: {e}")
-            with self._state_lock:
-                self.state = SimulationState.ERROR
-            return False
-    
-    def get_state(self) -> SimulationState:
-        """Get current simulation state (thread-safe)."""
-        with self._state_lock:
-            return self.state
-    
-    def get_statistics(self) -> SimulationStatistics:
-        """Get current simulation statistics (thread-safe)."""
-        with self._stats_lock:
-            return SimulationStatistics(
-                iterations=self.statistics.iterations,
-                components_updated=self.statistics.components_updated,
-                time_to_stability=self.statistics.time_to_stability,
-                total_time=self.statistics.total_time,
-                max_iterations_reached=self.statistics.max_iterations_reached,
-                timeout_reached=self.statistics.timeout_reached,
-                stable=self.statistics.stable,
-                vnets_processed_parallel=self.statistics.vnets_processed_parallel,
-                components_processed_parallel=self.statistics.components_processed_parallel,
-                component_errors=self.statistics.component_errors,
-                successful_components=self.statistics.successful_components
-            )
-    
-    def is_running(self) -> bool:
-        """Check if simulation is currently running."""
-        return self._running
-    
-    def is_stable(self) -> bool:
-        """Check if simulation has reached stable state."""
-        with self._state_lock:
-            return self.state == SimulationState.STABLE
-    
+        result = super().shutdown()
+        self.thread_pool.shutdown(wait=True, timeout=2.0)
+        return result
+
     def reset_statistics(self):
-        """Reset simulation statistics to initial state."""
-        with self._stats_lock:
-            self.statistics = SimulationStatistics()
-        
-        # Also reset execution coordinator statistics
+        """Reset simulation and component execution statistics."""
+        super().reset_statistics()
         self.execution_coordinator.reset_statistics()
-    
+
     def get_thread_pool_stats(self) -> dict:
         """Get thread pool statistics."""
         return self.thread_pool.get_statistics()
-    
+
     def get_execution_coordinator_stats(self) -> dict:
         """
         Get component execution coordinator statistics.
-        
+
         Returns execution statistics including successful/failed counts
         and any errors that occurred during parallel component execution.
         """
         return self.execution_coordinator.get_statistics()
-        return self.thread_pool.get_statistics()
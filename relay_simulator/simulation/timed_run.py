@@ -0,0 +1,208 @@
+"""
+Timed Runs - Headless simulated-time API for the simulation engine
+
+Advances a circuit through its scheduled events (relay transfers, clock
+toggles) as fast as the CPU allows, settling after every batch:
+
+- run_until(t): until the next event lies beyond simulated time t
+- run_for(d): by d simulated seconds
+- run_clock_edges(n): until n clock output toggles have occurred
+
+Each run returns a TimedRunResult with the final VNET states and per-step
+statistics. Used through SimulationEngine.run_until() and friends.
+"""
+
+import time
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Dict, List, Optional
+
+from core.state import PinState
+from simulation.cycle_detector import OscillationReport
+from simulation.event_scheduler import RealTimeThrottle
+from simulation.phase_profiler import PhaseProfile
+
+if TYPE_CHECKING:
+    from simulation.simulation_engine import SimulationEngine
+
+
+@dataclass
+class StepStatistics:
+    """Statistics for one settle pass of a timed run."""
+    sim_time: float = 0.0
+    events_fired: int = 0
+    iterations: int = 0
+    components_updated: int = 0
+    groups_evaluated: int = 0
+    peak_dirty_depth: int = 0
+    state: str = ""
+
+
+@dataclass
+class TimedRunResult:
+    """Result of run_until()/run_for()/run_clock_edges()."""
+    sim_time: float = 0.0
+    wall_time: float = 0.0
+    clock_edges: int = 0
+    events_fired: int = 0
+    stable: bool = False
+    final_state: str = ""
+    vnet_states: Dict[str, PinState] = field(default_factory=dict)
+    steps: List[StepStatistics] = field(default_factory=list)
+    oscillation: Optional[OscillationReport] = None
+    profile: Optional[PhaseProfile] = None
+
+
+class TimedRunner:
+    """
+    Runs an engine through simulated time, one settle pass per event batch.
+
+    Requires an engine created with realtime=False: the real-time throttle
+    would fire the same events concurrently.
+    """
+
+    def __init__(self, engine: 'SimulationEngine', throttle: Optional[RealTimeThrottle] = None):
+        """
+        Initialize the runner.
+
+        Args:
+            engine: Engine to advance
+            throttle: The engine's real-time throttle, if any
+        """
+        self.engine = engine
+        self.throttle = throttle
+
+    def run_until(self, sim_time: float) -> TimedRunResult:
+        """
+        Advance the circuit to a simulated time as fast as the CPU allows.
+
+        Settles the circuit, then repeatedly fires the next batch of
+        scheduled events (relay transfers, clock toggles) and settles again,
+        until the next event lies beyond sim_time. Stops early if a settle
+        pass does not reach stability (oscillation, timeout, error) or the
+        relay-driven steps repeat a cycle (result.oscillation is set).
+
+        Args:
+            sim_time: Target simulated time in seconds
+
+        Returns:
+            TimedRunResult with final VNET states and per-step statistics
+        """
+        return self._run(sim_time, edge_target=None, clock_id=None)
+
+    def run_for(self, duration: float) -> TimedRunResult:
+        """
+        Advance the circuit by a span of simulated time (see run_until()).
+
+        Args:
+            duration: Simulated seconds to advance
+
+        Returns:
+            TimedRunResult with final VNET states and per-step statistics
+        """
+        return self.run_until(self.engine.scheduler.now + duration)
+
+    def run_clock_edges(self, count: int, clock_id: Optional[str] = None) -> TimedRunResult:
+        """
+        Advance the circuit until a number of clock edges have occurred.
+
+        Each output toggle of a Clock component is one edge. Stops early if
+        no more events are pending (e.g. every clock is disabled).
+
+        Args:
+            count: Number of edges to run
+            clock_id: Count only edges of this clock (default: any clock)
+
+        Returns:
+            TimedRunResult with final VNET states and per-step statistics
+        """
+        return self._run(None, edge_target=count, clock_id=clock_id)
+
+    def _run(
+        self,
+        sim_time: Optional[float],
+        edge_target: Optional[int],
+        clock_id: Optional[str]
+    ) -> TimedRunResult:
+        if self.throttle and self.throttle.is_running():
+            raise RuntimeError("Timed runs require an engine created with realtime=False")
+
+        with self.engine.run_lock:
+            return self._run_owned(sim_time, edge_target, clock_id)
+
+    def _run_owned(
+        self,
+        sim_time: Optional[float],
+        edge_target: Optional[int],
+        clock_id: Optional[str]
+    ) -> TimedRunResult:
+        from simulation.simulation_engine import SimulationState
+
+        engine = self.engine
+        scheduler = engine.scheduler
+        stable = SimulationState.STABLE.value
+        start_wall = time.perf_counter()
+        start_edges = engine.get_clock_edges(clock_id)
+        result = TimedRunResult()
+
+        step = self._settle_step(scheduler.now, 0)
+        result.steps.append(step)
+        self._merge_step_profile(result)
+
+        while step.state == stable:
+            result.oscillation = engine.get_statistics().oscillation
+            if result.oscillation is not None:
+                break
+
+            if edge_target is not None and engine.get_clock_edges(clock_id) - start_edges >= edge_target:
+                break
+
+            next_time = scheduler.peek_time()
+            if next_time is None or (sim_time is not None and next_time > sim_time):
+                break
+
+            fired = scheduler.run_due(next_time)
+            result.events_fired += fired
+            step = self._settle_step(next_time, fired)
+            result.steps.append(step)
+            self._merge_step_profile(result)
+
+        if result.oscillation is None:
+            result.oscillation = engine.get_statistics().oscillation
+
+        if sim_time is not None and step.state == stable and result.oscillation is None:
+            scheduler.advance_to(sim_time)
+
+        result.sim_time = scheduler.now
+        result.wall_time = time.perf_counter() - start_wall
+        result.clock_edges = engine.get_clock_edges(clock_id) - start_edges
+        if result.oscillation is not None:
+            result.final_state = SimulationState.OSCILLATING.value
+        else:
+            result.final_state = step.state
+        result.stable = result.final_state == stable
+        result.vnet_states = {vnet_id: vnet.state for vnet_id, vnet in engine.vnets.items()}
+        return result
+
+    def _settle_step(self, sim_time: float, events_fired: int) -> StepStatistics:
+        """Run one settle pass and record its statistics (deltas for this pass)."""
+        engine = self.engine
+        before = engine.get_statistics()
+        stats = engine.run()
+        return StepStatistics(
+            sim_time=sim_time,
+            events_fired=events_fired,
+            iterations=stats.iterations,
+            components_updated=stats.components_updated - before.components_updated,
+            groups_evaluated=stats.groups_evaluated - before.groups_evaluated,
+            peak_dirty_depth=stats.peak_dirty_depth,
+            state=engine.get_state().value
+        )
+
+    def _merge_step_profile(self, result: TimedRunResult):
+        """Add the last settle pass's phase profile to a timed run's total."""
+        profile = self.engine.get_statistics().profile
+        if profile is None:
+            return
+        if result.profile is None:
+            result.profile = PhaseProfile(top_n=profile.top_n)
+        result.profile.merge(profile)
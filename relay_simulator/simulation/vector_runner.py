@@ -0,0 +1,200 @@
+"""
+Vector Runner - Exhaustive stimulus vectors across a process pool
+
+For circuits the bit-parallel engine cannot handle (Memory), independent
+stimulus vectors are fanned out over a ProcessPoolExecutor:
+
+1. Each worker loads the document once and builds the simulation structures
+2. Per vector it resets the engine (no rebuild), applies the inputs and runs
+   a headless timed run
+3. Results stream back in input order and can be written as JSONL
+
+Vector format (one dict per vector, e.g. one JSON object per line):
+
+    {"id": "add-3-4", "inputs": {"A": true, "B": 4}, "time": 0.5}
+
+"inputs" maps Switch/Thumbwheel keys to values (see simulation.stimulus).
+"time" (simulated seconds) or "clock_edges" override the runner default.
+A line without "inputs" is taken as the input mapping itself.
+"""
+
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, Iterable, Iterator, Mapping, Optional, TextIO
+
+from fileio.document_loader import load_document
+from simulation.simulation_engine import SimulationEngine
+from simulation.structure_builder import build_simulation_structures
+from simulation.stimulus import build_input_index, apply_inputs, OutputProbe
+
+
+class VectorWorker:
+    """
+    Simulation state for one process: a loaded document and a reusable engine.
+
+    Usable in-process as well (workers=1 or tests).
+    """
+
+    def __init__(self, document_path: str, run_time: float = 1.0, enable_clocks: bool = False):
+        """
+        Load the document and build the engine.
+
+        Args:
+            document_path: Path to the .rsim file
+            run_time: Default simulated seconds per vector
+            enable_clocks: Enable every clock at simulation start
+        """
+        self.run_time = run_time
+
+        document = load_document(document_path)
+        vnets, tabs, bridges, components = build_simulation_structures(document)
+        if enable_clocks:
+            for component in components.values():
+                if component.component_type == "Clock":
+                    component.properties["enable_on_sim_start"] = True
+
+        self.engine = SimulationEngine(vnets, tabs, bridges, components, realtime=False)
+        self.input_index = build_input_index(components)
+        self.probe = OutputProbe(vnets, components, self.engine.link_index)
+
+        # Non-volatile memory keeps writes across simulation starts: restore
+        # the loaded contents before every vector so vectors stay independent
+        # (each snapshot and restore is one flat array copy; mapped images
+        # need no snapshot)
+        self._memory_snapshots = {
+            component_id: None if component.is_mapped else component.memory.copy()
+            for component_id, component in components.items()
+            if component.component_type == "Memory"
+        }
+        self._initialized = False
+
+    def _restore_memory(self):
+        for component_id, contents in self._memory_snapshots.items():
+            component = self.engine.components[component_id]
+            if contents is None:
+                component.memory.clear()  # drops copy-on-write changes
+            else:
+                component.memory = contents.copy()
+
+    def run_vector(self, index: int, vector: Mapping[str, Any]) -> Dict[str, Any]:
+        """
+        Run one stimulus vector from the simulation start state.
+
+        Args:
+            index: Position of the vector in the input
+            vector: Vector dict (see module docstring)
+
+        Returns:
+            JSON-serializable result dict ('error' set if the vector failed)
+        """
+        start = time.perf_counter()
+        inputs = vector.get("inputs", vector) if isinstance(vector, Mapping) else {}
+        result: Dict[str, Any] = {"index": index}
+        if isinstance(vector, Mapping) and "id" in vector:
+            result["id"] = vector["id"]
+        result["inputs"] = dict(inputs)
+
+        try:
+            self._restore_memory()
+            ok = self.engine.reset() if self._initialized else self.engine.initialize()
+            self._initialized = True
+            if not ok:
+                raise RuntimeError("Simulation initialization failed")
+
+            apply_inputs(self.input_index, inputs, self.engine.vnet_manager, self.engine.bridge_manager)
+
+            if "clock_edges" in vector:
+                run = self.engine.run_clock_edges(int(vector["clock_edges"]))
+            else:
+                run = self.engine.run_for(float(vector.get("time", self.run_time)))
+
+            result.update({
+                "stable": run.stable,
+                "final_state": run.final_state,
+                "sim_time": run.sim_time,
+                "clock_edges": run.clock_edges,
+            })
+            result.update(self.probe.read())
+        except Exception as e:
+            result["error"] = f"{type(e).__name__}: {e}"
+
+        result["wall_time"] = time.perf_counter() - start
+        return result
+
+
+# Per-process worker, created by the pool initializer
+_worker: Optional[VectorWorker] = None
+
+
+def _init_worker(document_path: str, run_time: float, enable_clocks: bool):
+    global _worker
+    _worker = VectorWorker(document_path, run_time=run_time, enable_clocks=enable_clocks)
+
+
+def _run_in_worker(item):
+    index, vector = item
+    return _worker.run_vector(index, vector)
+
+
+def run_vectors(
+    document_path: str,
+    vectors: Iterable[Mapping[str, Any]],
+    workers: Optional[int] = None,
+    run_time: float = 1.0,
+    enable_clocks: bool = False,
+    chunksize: int = 16
+) -> Iterator[Dict[str, Any]]:
+    """
+    Run stimulus vectors in parallel, yielding results in input order.
+
+    Args:
+        document_path: Path to the .rsim file
+        vectors: Stimulus vectors (see module docstring)
+        workers: Worker processes (None = CPU count, 1 = run in-process)
+        run_time: Default simulated seconds per vector
+        enable_clocks: Enable every clock at simulation start
+        chunksize: Vectors sent to a worker per task
+
+    Yields:
+        Result dict per vector (see VectorWorker.run_vector)
+    """
+    if workers is None:
+        workers = os.cpu_count() or 1
+
+    if workers <= 1:
+        worker = VectorWorker(document_path, run_time=run_time, enable_clocks=enable_clocks)
+        for index, vector in enumerate(vectors):
+            yield worker.run_vector(index, vector)
+        return
+
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        initializer=_init_worker,
+        initargs=(document_path, run_time, enable_clocks)
+    ) as executor:
+        yield from executor.map(_run_in_worker, enumerate(vectors), chunksize=chunksize)
+
+
+def read_vectors_jsonl(stream: TextIO) -> Iterator[Dict[str, Any]]:
+    """Read one vector per non-empty line of a JSONL stream."""
+    for line in stream:
+        line = line.strip()
+        if line:
+            yield json.loads(line)
+
+
+def write_results_jsonl(results: Iterable[Dict[str, Any]], stream: TextIO) -> int:
+    """
+    Write results as JSONL, flushing after each line.
+
+    Returns:
+        Number of results written
+    """
+    count = 0
+    for result in results:
+        stream.write(json.dumps(result) + "\n")
+        stream.flush()
+        count += 1
+    return count
@@ -15,11 +15,12 @@ This is a critical part of the simulation engine that runs during each
 simulation iteration to determine electrical connectivity.
 """
 
-from typing import Dict, Set, Optional
+from typing import Dict, Set, Optional, Tuple
 from core.state import PinState, combine_states
 from core.vnet import VNET
 from core.tab import Tab
 from core.bridge import Bridge
+from simulation.vnet_manager import build_link_index
 
 
 class VnetEvaluator:
@@ -42,7 +43,8 @@ class VnetEvaluator:
         self,
         all_vnets: Dict[str, VNET],
         all_tabs: Dict[str, Tab],
-        all_bridges: Dict[str, Bridge]
+        all_bridges: Dict[str, Bridge],
+        link_index: Optional[Dict[str, Tuple[VNET, ...]]] = None
     ):
         """
         Initialize the VNET evaluator.
@@ -51,10 +53,17 @@ class VnetEvaluator:
             all_vnets: Dictionary mapping vnet_id -> VNET object
             all_tabs: Dictionary mapping tab_id -> Tab object
             all_bridges: Dictionary mapping bridge_id -> Bridge object
+            link_index: Optional link name -> VNETs index shared with the
+                        VnetManager (built from all_vnets if not given)
         """
         self.all_vnets = all_vnets
         self.all_tabs = all_tabs
         self.all_bridges = all_bridges
+        
+        # Link names are static during simulation: look linked VNETs up by name
+        if link_index is None:
+            link_index = build_link_index(all_vnets.values())
+        self.link_index = link_index
     
     def evaluate_vnet_state(self, vnet: VNET) -> PinState:
         """
@@ -168,20 +177,16 @@ class VnetEvaluator:
         # Get all link names from this VNET
         link_names = vnet.link_names.copy()  # Copy to avoid iteration issues
         
-        # For each link name, find all other VNETs with the same link
+        # For each link name, evaluate the other VNETs carrying it
         for link_name in link_names:
-            for other_vnet_id, other_vnet in self.all_vnets.items():
+            for other_vnet in self.link_index.get(link_name, ()):
                 # Skip self and already-visited VNETs
-                if other_vnet_id == vnet.vnet_id:
-                    continue
-                if other_vnet_id in visited_vnets:
+                if other_vnet.vnet_id in visited_vnets:
                     continue
                 
-                # Check if other VNET has this link name
-                if other_vnet.has_link(link_name):
-                    # Recursively evaluate the linked VNET
-                    linked_state = self._evaluate_recursive(other_vnet, visited_vnets)
-                    states.append(linked_state)
+                # Recursively evaluate the linked VNET
+                linked_state = self._evaluate_recursive(other_vnet, visited_vnets)
+                states.append(linked_state)
         
         return states
     
@@ -313,8 +318,8 @@ class VnetEvaluator:
         
         # Check links
         for link_name in vnet.link_names:
-            for other_vnet_id, other_vnet in self.all_vnets.items():
-                if other_vnet_id != vnet.vnet_id and other_vnet.has_link(link_name):
+            for other_vnet in self.link_index.get(link_name, ()):
+                if other_vnet.vnet_id not in visited:
                     self._collect_connected_vnets(other_vnet, connected, visited)
         
         # Check bridges
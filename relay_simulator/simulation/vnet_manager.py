@@ -5,13 +5,42 @@ This provides a simplified interface for components to:
 - Mark VNETs dirty when pin states change
 - Read VNET states
 - Query which VNET a tab belongs to
+- Look up the VNETs carrying a link name
+- Read and drive multi-bit buses as integer words
+
+Link names are resolved before simulation starts and do not change while
+it runs, so the link index is built once per simulation and shared with
+the evaluator and propagator (see build_link_index()).
 """
 
-from typing import Dict, Optional
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+from core.state import PinState
 from core.vnet import VNET
 from core.tab import Tab
+from core.pin import Pin
 from simulation.dirty_flag_manager import DirtyFlagManager
 
+# Resolved bus: per bit (LSB first), the VNETs carrying {bus_name}_{start + bit}
+Bus = Tuple[Tuple[VNET, ...], ...]
+
+
+def build_link_index(vnets: Iterable[VNET]) -> Dict[str, Tuple[VNET, ...]]:
+    """
+    Build a link name -> VNETs index.
+    
+    Args:
+        vnets: VNETs with resolved link names
+        
+    Returns:
+        Dictionary of link name -> VNETs carrying it (in VNET order)
+    """
+    index: Dict[str, List[VNET]] = {}
+    for vnet in vnets:
+        for link_name in vnet.link_names:
+            if link_name:
+                index.setdefault(link_name, []).append(vnet)
+    return {link_name: tuple(members) for link_name, members in index.items()}
+
 
 class VnetManager:
     """
@@ -20,10 +49,18 @@ class VnetManager:
     Provides components with methods to:
     - Mark VNETs dirty when pin states change
     - Get VNET state for a tab
-    - Find which VNET contains a tab
+    - Find which VNET contains a tab or pin
+    - Find the VNETs carrying a link name
+    - Read and drive buses a word at a time
     """
     
-    def __init__(self, vnets: Dict[str, VNET], tabs: Dict[str, Tab], dirty_manager: DirtyFlagManager):
+    def __init__(
+        self,
+        vnets: Dict[str, VNET],
+        tabs: Dict[str, Tab],
+        dirty_manager: DirtyFlagManager,
+        link_index: Optional[Dict[str, Tuple[VNET, ...]]] = None
+    ):
         """
         Initialize VNET manager.
         
@@ -31,6 +68,7 @@ class VnetManager:
             vnets: Dictionary of all VNETs by ID
             tabs: Dictionary of all tabs by ID
             dirty_manager: DirtyFlagManager for marking VNETs dirty
+            link_index: Optional prebuilt link index (from build_link_index())
         """
         self.vnets = vnets
         self.tabs = tabs
@@ -41,6 +79,18 @@ class VnetManager:
         for vnet_id, vnet in vnets.items():
             for tab_id in vnet.tab_ids:
                 self.tab_to_vnet[tab_id] = vnet_id
+        
+        # pin_id -> vnet_id of the pin's first tab
+        self.pin_to_vnet: Dict[str, Optional[str]] = {}
+        for tab_id, tab in tabs.items():
+            if tab.parent_pin:
+                self.pin_to_vnet.setdefault(tab.parent_pin.pin_id, self.tab_to_vnet.get(tab_id))
+        
+        # link_name -> VNETs carrying it
+        self.link_index = link_index if link_index is not None else build_link_index(vnets.values())
+        
+        # Resolved buses: (bus_name, start_bit, width) -> Bus
+        self._buses: Dict[Tuple[str, int, int], Bus] = {}
     
     def get_vnet_for_tab(self, tab_id: str) -> Optional[VNET]:
         """
@@ -67,12 +117,127 @@ class VnetManager:
         Returns:
             VNET containing the pin's tab, or None if not found
         """
-        # Find a tab belonging to this pin
-        for tab_id, tab in self.tabs.items():
-            if tab.parent_pin and tab.parent_pin.pin_id == pin_id:
-                return self.get_vnet_for_tab(tab_id)
+        vnet_id = self.pin_to_vnet.get(pin_id)
+        if vnet_id:
+            return self.vnets.get(vnet_id)
         return None
     
+    def get_vnets_for_link(self, link_name: str) -> Tuple[VNET, ...]:
+        """
+        Get the VNETs carrying a link name.
+        
+        Args:
+            link_name: Link name to look up
+            
+        Returns:
+            Tuple of VNETs (empty if no VNET carries the link)
+        """
+        return self.link_index.get(link_name, ())
+    
+    def is_link_high(self, link_name: str) -> bool:
+        """
+        Check whether any VNET carrying a link name is HIGH.
+        
+        Args:
+            link_name: Link name to check
+            
+        Returns:
+            True if the link is HIGH
+        """
+        for vnet in self.link_index.get(link_name, ()):
+            if vnet.state == PinState.HIGH:
+                return True
+        return False
+    
+    # === Buses ===
+    
+    def get_bus(self, bus_name: str, width: int, start_bit: int = 0) -> Bus:
+        """
+        Resolve a bus to its per-bit VNETs (once; later calls hit a cache).
+        
+        Bit i is the link {bus_name}_{start_bit + i}.
+        
+        Args:
+            bus_name: Bus name (link name prefix)
+            width: Number of bits
+            start_bit: Link index of bit 0
+            
+        Returns:
+            Tuple of per-bit VNET tuples, LSB first
+        """
+        key = (bus_name, start_bit, width)
+        bus = self._buses.get(key)
+        if bus is None:
+            link_index = self.link_index
+            bus = tuple(
+                link_index.get(f"{bus_name}_{start_bit + bit}", ()) for bit in range(width)
+            )
+            self._buses[key] = bus
+        return bus
+    
+    @staticmethod
+    def read_bus(bus: Bus) -> int:
+        """
+        Read a resolved bus as an integer (bit i set when any of its VNETs is HIGH).
+        
+        Args:
+            bus: Bus from get_bus()
+            
+        Returns:
+            Bus value, bit 0 = LSB
+        """
+        high = PinState.HIGH
+        value = 0
+        for bit, vnets in enumerate(bus):
+            for vnet in vnets:
+                if vnet.state == high:
+                    value |= 1 << bit
+                    break
+        return value
+    
+    def read_bus_value(self, bus_name: str, width: int, start_bit: int = 0) -> int:
+        """
+        Read {bus_name}_{start_bit}..{bus_name}_{start_bit + width - 1} as an integer.
+        
+        Args:
+            bus_name: Bus name (link name prefix)
+            width: Number of bits
+            start_bit: Link index of bit 0
+            
+        Returns:
+            Bus value, bit 0 = LSB
+        """
+        return self.read_bus(self.get_bus(bus_name, width, start_bit))
+    
+    def drive_pins(self, pins: Sequence[Optional[Pin]], value: Optional[int]) -> bool:
+        """
+        Drive output pins as one word.
+        
+        Pin i goes HIGH when bit i of value is set and FLOAT otherwise
+        (all FLOAT when value is None). Only the VNETs of pins that change
+        are marked dirty.
+        
+        Args:
+            pins: Output pins, LSB first (None entries are skipped)
+            value: Word to drive, or None to float every pin
+            
+        Returns:
+            True if any pin changed state
+        """
+        high, floating = PinState.HIGH, PinState.FLOAT
+        changed = False
+        for bit, pin in enumerate(pins):
+            if pin is None:
+                continue
+            new_state = high if value is not None and (value >> bit) & 1 else floating
+            if pin.state == new_state:
+                continue
+            pin.set_state(new_state)
+            changed = True
+            for tab_id in pin.tabs:
+                self.mark_vnet_dirty(tab_id)
+        return changed
+    
     def get_vnet_state(self, tab_id: str) -> bool:
         """
         Get the state of the VNET containing a tab.
@@ -0,0 +1,127 @@
+"""
+Link Resolver Benchmark
+
+Times simulation start-up (build_simulation_structures) on a generated
+document with a 256-bit bus: every page holds BUS components exposing the
+same 256 link names, so every bit links one VNET per BUS across all pages.
+Link resolution through the tab → VNET index is compared with the previous
+scan of every VNET for every link name, and both must map each link name
+to the same VNETs.
+
+Usage:
+    python testing/link_resolver_benchmark.py [pages] [buses_per_page] [bits] [runs]
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import time
+from collections import defaultdict
+from typing import Dict, List, Set, Tuple
+
+from core.document import Document
+from core.link_resolver import LinkResolver
+from core.vnet import VNET
+from components.bus import BUS
+from simulation.structure_builder import build_simulation_structures
+
+
+def build_bus_document(page_count: int, buses_per_page: int, bits: int) -> Document:
+    """
+    Build a document of BUS components sharing one bus name.
+
+    Args:
+        page_count: Number of pages
+        buses_per_page: BUS components per page
+        bits: Pins (link names) per BUS
+
+    Returns:
+        Document with page_count * buses_per_page * bits single-tab VNETs
+    """
+    document = Document()
+    for p in range(page_count):
+        page = document.create_page(f"Page {p + 1}")
+        for b in range(buses_per_page):
+            bus = BUS(f"BUS{p:02d}{b:02d}", page.page_id)
+            bus.properties['bus_name'] = 'DATA'
+            bus.properties['number_of_pins'] = bits
+            bus.on_property_changed('number_of_pins')
+            page.add_component(bus)
+    return document
+
+
+def scan_link_to_vnets(link_map: Dict[str, List[Tuple[str, str, List[str]]]],
+                       vnets: List[VNET]) -> Dict[str, Set[VNET]]:
+    """Previous algorithm: check every VNET against every linked tab."""
+    link_to_vnets: Dict[str, Set[VNET]] = defaultdict(set)
+    for link_name, component_infos in link_map.items():
+        all_linked_tabs = set()
+        for comp_id, page_id, tab_ids in component_infos:
+            all_linked_tabs.update(tab_ids)
+        for vnet in vnets:
+            for tab_id in all_linked_tabs:
+                if vnet.has_tab(tab_id):
+                    link_to_vnets[link_name].add(vnet)
+                    break
+    return link_to_vnets
+
+
+def run_benchmark(page_count: int, buses_per_page: int, bits: int,
+                  runs: int = 3) -> Dict[str, float]:
+    """
+    Time start-up and both link mapping algorithms.
+
+    Returns:
+        Dict of best seconds for 'startup', 'indexed' and 'scan', plus
+        'vnets' and 'links' counts
+    """
+    document = build_bus_document(page_count, buses_per_page, bits)
+    resolver = LinkResolver()
+    link_map = resolver._build_link_map(document)
+
+    best = {'startup': float("inf"), 'indexed': float("inf"), 'scan': float("inf")}
+    for _ in range(runs):
+        began = time.perf_counter()
+        vnets, _, _, _ = build_simulation_structures(document)
+        best['startup'] = min(best['startup'], time.perf_counter() - began)
+
+        vnet_list = list(vnets.values())
+        began = time.perf_counter()
+        indexed = resolver._map_links_to_vnets(link_map, resolver.build_tab_index(vnet_list))
+        best['indexed'] = min(best['indexed'], time.perf_counter() - began)
+
+        began = time.perf_counter()
+        scanned = scan_link_to_vnets(link_map, vnet_list)
+        best['scan'] = min(best['scan'], time.perf_counter() - began)
+
+        assert dict(indexed) == dict(scanned), "Link → VNET maps differ"
+        assert all(len(vnets_of) == page_count * buses_per_page for vnets_of in indexed.values())
+
+    best['vnets'] = len(vnets)
+    best['links'] = len(link_map)
+    return best
+
+
+def main():
+    """Run the benchmark and print a report."""
+    page_count = int(sys.argv[1]) if len(sys.argv) > 1 else 4
+    buses_per_page = int(sys.argv[2]) if len(sys.argv) > 2 else 2
+    bits = int(sys.argv[3]) if len(sys.argv) > 3 else 256
+    runs = int(sys.argv[4]) if len(sys.argv) > 4 else 3
+
+    print("=" * 60)
+    print(f"LINK RESOLVER BENCHMARK ({bits}-bit bus, {page_count} pages x "
+          f"{buses_per_page} BUS components)")
+    print("=" * 60)
+    result = run_benchmark(page_count, buses_per_page, bits, runs)
+    print(f"VNETs: {result['vnets']}, link names: {result['links']}")
+    print(f"Start-up (structures + links): {result['startup'] * 1000:>9.1f} ms")
+    print(f"Link mapping, tab index:       {result['indexed'] * 1000:>9.1f} ms")
+    print(f"Link mapping, VNET scan:       {result['scan'] * 1000:>9.1f} ms"
+          f"  ({result['scan'] / result['indexed']:.0f}x slower)")
+    print("Link → VNET maps identical ✓")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,194 @@
+"""
+Memory Benchmark for core simulation objects
+
+Measures bytes per tab (including its share of the pin) and bytes per VNET
+on generated large circuits, comparing the compact core classes (__slots__,
+lazily allocated link/bridge sets, striped VNET locks) with the previous
+dict-backed layout (reproduced below as Legacy* classes).
+
+Usage:
+    python testing/memory_benchmark.py [tab_count]
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import gc
+import threading
+import tracemalloc
+from typing import Callable, List, Tuple
+
+from core.vnet import VNET
+from core.tab import Tab
+from core.pin import Pin
+from core.bridge import Bridge
+from core.state import PinState
+
+
+class LegacyTab:
+    """Tab layout before __slots__ (instance __dict__)."""
+
+    def __init__(self, tab_id, parent_pin, relative_position):
+        self.tab_id = tab_id
+        self.parent_pin = parent_pin
+        self.relative_position = relative_position
+        self._state = PinState.FLOAT
+
+
+class LegacyPin:
+    """Pin layout before __slots__ (instance __dict__)."""
+
+    def __init__(self, pin_id, parent_component):
+        self.pin_id = pin_id
+        self.parent_component = parent_component
+        self.tabs = {}
+        self._state = PinState.FLOAT
+
+    def add_tab(self, tab):
+        self.tabs[tab.tab_id] = tab
+        tab.parent_pin = self
+
+
+class LegacyVNET:
+    """VNET layout before compaction: three sets and an RLock per VNET."""
+
+    def __init__(self, vnet_id, page_id=None):
+        self.vnet_id = vnet_id
+        self.page_id = page_id
+        self.tab_ids = set()
+        self.link_names = set()
+        self.bridge_ids = set()
+        self._state = PinState.FLOAT
+        self._dirty = True
+        self._dirty_listener = None
+        self._lock = threading.RLock()
+
+    def add_tab(self, tab_id):
+        self.tab_ids.add(tab_id)
+
+    def add_link(self, link_name):
+        self.link_names.add(link_name)
+
+
+class LegacyBridge:
+    """Bridge layout before __slots__ (instance __dict__)."""
+
+    def __init__(self, vnet_id1, vnet_id2, owner_component_id, bridge_id):
+        self.bridge_id = bridge_id
+        self.vnet_id1 = vnet_id1
+        self.vnet_id2 = vnet_id2
+        self.owner_component_id = owner_component_id
+
+
+def measure(build: Callable[[], object]) -> Tuple[int, object]:
+    """
+    Measure the bytes allocated (and kept) by build().
+
+    Returns:
+        Tuple of (bytes, built objects) - objects are kept alive by the caller
+    """
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    built = build()
+    gc.collect()
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return after - before, built
+
+
+def generate_ids(prefix: str, count: int) -> List[str]:
+    """Pre-generate IDs so string storage is not counted per object."""
+    return [f"{prefix}{i:08x}" for i in range(count)]
+
+
+def build_tabs(pin_cls, tab_cls, pin_ids, tab_ids, tabs_per_pin: int):
+    """Pins with several tabs each (like indicators/relays)."""
+    pins = []
+    position = (0, 0)
+    for p, pin_id in enumerate(pin_ids):
+        pin = pin_cls(pin_id, None)
+        for t in range(tabs_per_pin):
+            pin.add_tab(tab_cls(tab_ids[p * tabs_per_pin + t], pin, position))
+        pins.append(pin)
+    return pins
+
+
+def build_vnets(vnet_cls, vnet_ids, tab_ids, tabs_per_vnet: int, link_every: int):
+    """VNETs with a few tabs each; every link_every-th VNET has a link name."""
+    vnets = []
+    for v, vnet_id in enumerate(vnet_ids):
+        vnet = vnet_cls(vnet_id, "page0001")
+        for t in range(tabs_per_vnet):
+            vnet.add_tab(tab_ids[v * tabs_per_vnet + t])
+        if v % link_every == 0:
+            vnet.add_link(f"LINK{v}")
+        vnets.append(vnet)
+    return vnets
+
+
+def build_bridges(bridge_cls, bridge_ids, vnet_ids):
+    return [
+        bridge_cls(vnet_ids[i], vnet_ids[i + 1], "relay001", bridge_id)
+        for i, bridge_id in enumerate(bridge_ids)
+    ]
+
+
+def run_benchmark(tab_count: int = 60000) -> dict:
+    """
+    Measure per-object memory for legacy and compact layouts.
+
+    Args:
+        tab_count: Number of tabs in the generated circuit
+
+    Returns:
+        Dict of {name: (legacy_bytes_per_object, compact_bytes_per_object)}
+    """
+    tabs_per_pin = 4
+    tabs_per_vnet = 3
+    pin_ids = generate_ids("p", tab_count // tabs_per_pin)
+    tab_ids = generate_ids("t", tab_count)
+    vnet_ids = generate_ids("v", tab_count // tabs_per_vnet)
+    bridge_ids = generate_ids("b", len(vnet_ids) // 10)
+
+    results = {}
+
+    legacy, kept = measure(lambda: build_tabs(LegacyPin, LegacyTab, pin_ids, tab_ids, tabs_per_pin))
+    del kept
+    compact, kept = measure(lambda: build_tabs(Pin, Tab, pin_ids, tab_ids, tabs_per_pin))
+    del kept
+    results["tab (incl. pin share)"] = (legacy / tab_count, compact / tab_count)
+
+    legacy, kept = measure(lambda: build_vnets(LegacyVNET, vnet_ids, tab_ids, tabs_per_vnet, 20))
+    del kept
+    compact, kept = measure(lambda: build_vnets(VNET, vnet_ids, tab_ids, tabs_per_vnet, 20))
+    del kept
+    results["vnet"] = (legacy / len(vnet_ids), compact / len(vnet_ids))
+
+    legacy, kept = measure(lambda: build_bridges(LegacyBridge, bridge_ids, vnet_ids))
+    del kept
+    compact, kept = measure(lambda: build_bridges(Bridge, bridge_ids, vnet_ids))
+    del kept
+    results["bridge"] = (legacy / len(bridge_ids), compact / len(bridge_ids))
+
+    return results
+
+
+def main():
+    """Run the memory benchmark and print a report."""
+    tab_count = int(sys.argv[1]) if len(sys.argv) > 1 else 60000
+
+    print("=" * 60)
+    print(f"MEMORY BENCHMARK ({tab_count} tabs)")
+    print("=" * 60)
+
+    results = run_benchmark(tab_count)
+    print(f"{'Object':<24}{'Before':>12}{'After':>12}{'Saved':>10}")
+    for name, (before, after) in results.items():
+        saved = 100.0 * (before - after) / before if before else 0.0
+        print(f"{name:<24}{before:>10.1f} B{after:>10.1f} B{saved:>9.1f}%")
+
+
+if __name__ == "__main__":
+    main()
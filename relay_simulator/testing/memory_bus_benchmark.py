@@ -0,0 +1,160 @@
+"""
+Memory Bus Benchmark
+
+Times settling a memory-heavy design when the address bus changes, with
+Memory reading its buses through the VnetManager word API against the
+previous per-bit scan of every VNET for has_link(f"{bus}_{i}").
+
+The design is MEMORIES Memory components (16-bit address, 16-bit data)
+sharing an address bus driven by four Thumbwheels, each memory with its
+own data bus shown on a BusDisplay, plus FILLER unconnected Indicators so
+the VNET count resembles a CPU document. Each step sets a new address and
+settles; data bus values are checked against the memory contents.
+
+Usage:
+    python testing/memory_bus_benchmark.py [memories] [filler] [steps]
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import time
+from typing import List, Tuple
+
+from core.document import Document
+from core.state import PinState
+from core.wire import Wire
+from components.vcc import VCC
+from components.memory import Memory
+from components.thumbwheel import Thumbwheel
+from components.bus_display import BusDisplay
+from components.indicator import Indicator
+from simulation.simulation_engine import SimulationEngine
+from simulation.structure_builder import build_simulation_structures
+
+
+ADDRESS_BITS = 16
+DATA_BITS = 16
+
+
+def build_memory_document(memory_count: int, filler: int) -> Tuple[Document, List[Thumbwheel], List[Memory]]:
+    """
+    Build a document of memories on one address bus.
+
+    Returns:
+        Tuple of (document, address thumbwheels LSB first, memories)
+    """
+    document = Document()
+    page = document.create_page("CPU")
+
+    thumbwheels = []
+    for nibble in range(ADDRESS_BITS // 4):
+        thumbwheel = Thumbwheel(f"TW{nibble}", page.page_id)
+        thumbwheel.properties.update(bus_name="A", start_pin=4 * nibble)
+        page.add_component(thumbwheel)
+        thumbwheels.append(thumbwheel)
+
+    vcc = VCC("VCC", page.page_id)
+    page.add_component(vcc)
+    vcc_tab = next(iter(next(iter(vcc.pins.values())).tabs))
+
+    memories = []
+    for m in range(memory_count):
+        memory = Memory(f"MEM{m:02d}", page.page_id)
+        memory.properties.update(address_bits=ADDRESS_BITS, data_bits=DATA_BITS,
+                                 address_bus_name="A", data_bus_name=f"D{m}")
+        memory.on_property_changed('data_bits')
+        page.add_component(memory)
+        for control in ("Enable", "Read"):
+            page.add_wire(Wire(f"W{m:02d}{control}", vcc_tab, f"{memory.component_id}.{control}.tab"))
+        display = BusDisplay(f"DISP{m:02d}", page.page_id)
+        display.properties.update(bus_name=f"D{m}", number_of_pins=DATA_BITS)
+        page.add_component(display)
+        memories.append(memory)
+
+    for i in range(filler):
+        page.add_component(Indicator(f"IND{i:05d}", page.page_id))
+
+    return document, thumbwheels, memories
+
+
+def scan_read_bus_value(vnet_manager, bus_name: str, num_bits: int) -> int:
+    """Previous Memory._read_bus_value: scan every VNET for every bit."""
+    value = 0
+    for bit_index in range(num_bits):
+        link_name = f"{bus_name}_{bit_index}"
+        for vnet in vnet_manager.vnets.values():
+            if vnet.has_link(link_name) and vnet.state == PinState.HIGH:
+                value |= (1 << bit_index)
+                break
+    return value
+
+
+def run_design(memory_count: int, filler: int, steps: int, scan: bool) -> Tuple[float, List[int]]:
+    """
+    Step the address bus and settle after every step.
+
+    Args:
+        scan: Use the previous per-bit VNET scan for Memory bus reads
+
+    Returns:
+        Tuple of (settle seconds, data value of the first memory per step)
+    """
+    document, thumbwheels, memories = build_memory_document(memory_count, filler)
+    for m, memory in enumerate(memories):
+        for address in range(steps):
+            memory.memory[address * 0x0101] = (address * 37 + m) & 0xFFFF
+    if scan:
+        for memory in memories:
+            memory._read_bus_value = scan_read_bus_value
+
+    engine = SimulationEngine(*build_simulation_structures(document), realtime=False)
+    assert engine.initialize()
+    manager = engine.vnet_manager
+    engine.run()
+
+    values = []
+    elapsed = 0.0
+    for step in range(steps):
+        address = step * 0x0101
+
+        def set_address():
+            for nibble, thumbwheel in enumerate(thumbwheels):
+                thumbwheel.properties["value"] = (address >> (4 * nibble)) & 0xF
+                thumbwheel.simulate_logic(manager)
+
+        began = time.perf_counter()
+        engine.apply_external_update(set_address)
+        stats = engine.run()
+        elapsed += time.perf_counter() - began
+        assert stats.stable, f"Step {step} did not settle"
+        for m, memory in enumerate(memories):
+            assert memory.last_address == address
+            assert manager.read_bus_value(f"D{m}", DATA_BITS) == memory.read_memory(address)
+        values.append(manager.read_bus_value("D0", DATA_BITS))
+
+    engine.shutdown()
+    return elapsed, values
+
+
+def main():
+    """Run the benchmark and print a report."""
+    memory_count = int(sys.argv[1]) if len(sys.argv) > 1 else 8
+    filler = int(sys.argv[2]) if len(sys.argv) > 2 else 2000
+    steps = int(sys.argv[3]) if len(sys.argv) > 3 else 16
+
+    print("=" * 60)
+    print(f"MEMORY BUS BENCHMARK ({memory_count} memories, {ADDRESS_BITS}-bit address, "
+          f"{filler} filler components, {steps} steps)")
+    print("=" * 60)
+    word, word_values = run_design(memory_count, filler, steps, scan=False)
+    scan, scan_values = run_design(memory_count, filler, steps, scan=True)
+    assert word_values == scan_values, "Data bus values differ"
+    print(f"Word API:     {word * 1000:>9.1f} ms")
+    print(f"VNET scan:    {scan * 1000:>9.1f} ms  ({scan / word:.1f}x slower)")
+    print("Data bus values identical ✓")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,208 @@
+"""
+Memory Image Benchmark
+
+Times loading and saving a fully populated Memory (16-bit address, 16-bit
+data by default) with the dense MemoryArray store against the previous
+sparse dict store, reproduced below as legacy_* functions:
+- .mem text files, parsed through write_memory() one line at a time
+- the .rsim JSON: {"address": value} dict versus the encoded block
+Raw binary and Intel HEX loads are timed alongside. Every path must
+produce the same contents.
+
+A multi-MB ROM (MAPPED_ADDRESS_BITS) attached as a memory-mapped image is
+then compared with embedding the same words as an encoded .rsim block:
+document load time, .rsim size and random word read time.
+
+Usage:
+    python testing/memory_image_benchmark.py [address_bits] [data_bits] [runs]
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import json
+import random
+import tempfile
+import time
+from typing import Callable, Dict, List, Tuple
+
+from components.memory import Memory
+from components.memory_image import MemoryArray, decode_block, encode_block
+
+
+MAPPED_ADDRESS_BITS = 21
+
+
+def make_memory(address_bits: int, data_bits: int) -> Memory:
+    """Memory with every word set to a random non-zero value."""
+    memory = Memory("MEM", "page001")
+    memory.properties.update(address_bits=address_bits, data_bits=data_bits)
+    memory.on_property_changed('data_bits')
+    rng = random.Random(1)
+    for address in range(memory.memory_size):
+        memory.write_memory(address, rng.randint(1, memory.max_value))
+    return memory
+
+
+def legacy_load_text(memory: Memory, filepath: str) -> Dict[int, int]:
+    """Previous load_from_file: one write_memory() into a dict per line."""
+    contents: Dict[int, int] = {}
+    with open(filepath, 'r') as f:
+        for line in f:
+            line = line.strip()
+            if not line or line.startswith('#') or ':' not in line:
+                continue
+            addr_str, val_str = line.split(':', 1)
+            address = int(addr_str.strip(), 16) & ((1 << memory._get_address_bits()) - 1)
+            value = int(val_str.strip(), 16) & memory.max_value
+            if value == 0:
+                contents.pop(address, None)
+            else:
+                contents[address] = value
+    return contents
+
+
+def legacy_save_text(memory: Memory, contents: Dict[int, int], filepath: str):
+    """Previous save_to_file: one formatted write per sorted dict entry."""
+    with open(filepath, 'w') as f:
+        f.write("# Memory contents\n")
+        for addr in sorted(contents.keys()):
+            val = contents[addr]
+            addr_width = (memory._get_address_bits() + 3) // 4
+            val_width = (memory._get_data_bits() + 3) // 4
+            f.write(f"{addr:0{addr_width}X}:{val:0{val_width}X}\n")
+
+
+def best_of(runs: int, action: Callable[[], object]) -> Tuple[float, object]:
+    """Best time of runs calls and the last result."""
+    best, result = float("inf"), None
+    for _ in range(runs):
+        began = time.perf_counter()
+        result = action()
+        best = min(best, time.perf_counter() - began)
+    return best, result
+
+
+def run_benchmark(address_bits: int, data_bits: int, runs: int = 3) -> List[Tuple[str, float, float, int, int]]:
+    """
+    Time each load/save path with the dense and the legacy store.
+
+    Returns:
+        List of (case, dense seconds, legacy seconds, dense bytes, legacy bytes);
+        legacy seconds and bytes are 0 where there was no previous path
+    """
+    memory = make_memory(address_bits, data_bits)
+    expected = dict(memory.memory.items())
+    results = []
+
+    with tempfile.TemporaryDirectory() as tmp:
+        paths = {ext: os.path.join(tmp, f"image.{ext}") for ext in ("mem", "bin", "hex")}
+        legacy_path = os.path.join(tmp, "legacy.mem")
+
+        dense_save, _ = best_of(runs, lambda: memory.save_to_file(paths["mem"]))
+        legacy_save, _ = best_of(runs, lambda: legacy_save_text(memory, expected, legacy_path))
+        results.append(("save .mem text", dense_save, legacy_save,
+                        os.path.getsize(paths["mem"]), os.path.getsize(legacy_path)))
+
+        loader = make_memory(3, 1)
+        loader.properties.update(address_bits=address_bits, data_bits=data_bits)
+        loader.on_property_changed('data_bits')
+
+        dense_load, _ = best_of(runs, lambda: loader.load_from_file(paths["mem"]))
+        assert dict(loader.memory.items()) == expected, ".mem contents differ"
+        legacy_load, legacy_contents = best_of(runs, lambda: legacy_load_text(loader, paths["mem"]))
+        assert legacy_contents == expected, "Legacy .mem contents differ"
+        results.append(("load .mem text", dense_load, legacy_load, 0, 0))
+
+        for ext, case in (("bin", "load raw binary"), ("hex", "load Intel HEX")):
+            memory.save_to_file(paths[ext])
+            seconds, _ = best_of(runs, lambda: loader.load_from_file(paths[ext]))
+            assert dict(loader.memory.items()) == expected, f".{ext} contents differ"
+            results.append((case, seconds, 0.0, os.path.getsize(paths[ext]), 0))
+
+    dense_json, dense_text = best_of(runs, lambda: json.dumps(memory.to_dict()))
+    legacy_json, legacy_text = best_of(
+        runs, lambda: json.dumps({'memory': {str(k): v for k, v in expected.items()}}))
+    results.append((".rsim save", dense_json, legacy_json, len(dense_text), len(legacy_text)))
+
+    dense_parse, loaded = best_of(runs, lambda: Memory.from_dict(json.loads(dense_text)))
+    assert dict(loaded.memory.items()) == expected, ".rsim contents differ"
+    legacy_parse, legacy_loaded = best_of(
+        runs, lambda: {int(k): int(v) for k, v in json.loads(legacy_text)['memory'].items()})
+    assert legacy_loaded == expected, "Legacy .rsim contents differ"
+    results.append((".rsim load", dense_parse, legacy_parse, 0, 0))
+    return results
+
+
+def run_mapped_benchmark(tmp: str, runs: int = 3) -> List[Tuple[str, float, float, int, int]]:
+    """
+    Time a mapped ROM image against the same words embedded in the .rsim.
+
+    Returns:
+        Rows as for run_benchmark(): (case, mapped seconds, embedded seconds,
+        mapped bytes, embedded bytes)
+    """
+    rng = random.Random(2)
+    words = MemoryArray(1 << MAPPED_ADDRESS_BITS, 16)
+    words.load_bytes(rng.randbytes(2 << MAPPED_ADDRESS_BITS))
+    image = os.path.join(tmp, "rom.bin")
+    with open(image, 'wb') as f:
+        f.write(words.to_bytes())
+
+    rom = Memory("ROM", "page001")
+    rom.properties.update(address_bits=MAPPED_ADDRESS_BITS, data_bits=16, mapped_image_file=image)
+    rom.on_property_changed('mapped_image_file')
+    mapped_text = json.dumps(rom.to_dict())
+    embedded_text = json.dumps({'memory_image': encode_block(words)})
+
+    def load_embedded():
+        store = MemoryArray(1 << MAPPED_ADDRESS_BITS, 16)
+        decode_block(json.loads(embedded_text)['memory_image'], store)
+        return store
+
+    mapped_load, loaded = best_of(runs, lambda: Memory.from_dict(json.loads(mapped_text)))
+    embedded_load, embedded = best_of(runs, load_embedded)
+    assert loaded.is_mapped and not loaded.mapped_image_changed
+
+    addresses = [rng.randrange(1 << MAPPED_ADDRESS_BITS) for _ in range(100000)]
+    mapped_read, mapped_values = best_of(runs, lambda: [loaded.memory.get(a) for a in addresses])
+    embedded_read, embedded_values = best_of(runs, lambda: [embedded.get(a) for a in addresses])
+    assert mapped_values == embedded_values == [words[a] for a in addresses], "ROM reads differ"
+    loaded.memory.close()
+    rom.memory.close()
+
+    return [
+        ("load document", mapped_load, embedded_load, len(mapped_text), len(embedded_text)),
+        ("100k reads", mapped_read, embedded_read, 0, 0),
+    ]
+
+
+def main():
+    """Run the benchmark and print a report."""
+    address_bits = int(sys.argv[1]) if len(sys.argv) > 1 else 16
+    data_bits = int(sys.argv[2]) if len(sys.argv) > 2 else 16
+    runs = int(sys.argv[3]) if len(sys.argv) > 3 else 3
+
+    print("=" * 60)
+    print(f"MEMORY IMAGE BENCHMARK ({1 << address_bits} x {data_bits}-bit words, all non-zero)")
+    print("=" * 60)
+    print(f"{'Case':<18}{'Dense':>11}{'Dict':>12}{'Speedup':>9}{'Bytes':>10}{'Dict bytes':>12}")
+    for case, dense, legacy, size, legacy_size in run_benchmark(address_bits, data_bits, runs):
+        speedup = f"{legacy / dense:>8.1f}x" if legacy else f"{'':>9}"
+        legacy_cell = f"{legacy * 1000:>9.2f} ms" if legacy else f"{'':>12}"
+        print(f"{case:<18}{dense * 1000:>8.2f} ms{legacy_cell}{speedup}"
+              f"{size or '':>10}{legacy_size or '':>12}")
+    print("Contents identical for every format ✓")
+
+    print(f"{'Mapped ROM':<18}{'Mapped':>11}{'Embedded':>12}{'Speedup':>9}{'Bytes':>10}{'Emb. bytes':>12}"
+          f"  ({1 << MAPPED_ADDRESS_BITS} x 16-bit words)")
+    with tempfile.TemporaryDirectory() as tmp:
+        for case, mapped, embedded, size, embedded_size in run_mapped_benchmark(tmp, runs):
+            print(f"{case:<18}{mapped * 1000:>8.2f} ms{embedded * 1000:>9.2f} ms{embedded / mapped:>8.1f}x"
+                  f"{size or '':>10}{embedded_size or '':>12}")
+    print("Mapped reads identical to the embedded words ✓")
+
+
+if __name__ == "__main__":
+    main()
@@ -196,6 +196,52 @@ def test_vnet_based_queueing():
     print()
 
 
+def test_fanout_index():
+    """Test precomputed VNET -> component fan-out index."""
+    print("Test 3b: Fan-out index")
+    
+    components = {
+        'comp1': MockComponent('comp1', 'page1'),
+        'comp2': MockComponent('comp2', 'page1'),
+    }
+    
+    pin1 = Pin('pin1', components['comp1'])
+    pin2 = Pin('pin2', components['comp2'])
+    tab1a = Tab('tab1a', pin1, (0, 0))
+    tab1b = Tab('tab1b', pin1, (1, 0))
+    tab2 = Tab('tab2', pin2, (0, 0))
+    tabs = {'tab1a': tab1a, 'tab1b': tab1b, 'tab2': tab2}
+    
+    vnet1 = VNET('vnet1', 'page1')
+    vnet1.add_tab('tab1a')
+    vnet1.add_tab('tab1b')
+    vnet1.add_tab('tab2')
+    vnet2 = VNET('vnet2', 'page1')
+    vnets = {'vnet1': vnet1, 'vnet2': vnet2}
+    
+    coordinator = ComponentUpdateCoordinator(components, tabs)
+    coordinator.build_fanout_index(vnets)
+    
+    # Two tabs of comp1 are deduplicated
+    fanout = coordinator.get_components_for_vnet('vnet1')
+    assert sorted(fanout) == ['comp1', 'comp2'], "Fan-out should be deduplicated"
+    assert coordinator.get_components_for_vnet('vnet2') == (), "Empty VNET has no fan-out"
+    
+    # Bridges do not invalidate the index
+    vnet1.add_bridge('bridge1')
+    assert coordinator.queue_components_for_vnet(vnet1) == 2, "Should queue 2 from index"
+    
+    # Pending components are not queued again
+    coordinator.start_updates()
+    coordinator.mark_update_complete('comp2')
+    assert coordinator.queue_components(fanout) == 1, "Only comp2 should be queued"
+    assert coordinator.get_queued_count() == 1, "Should have 1 queued"
+    
+    print("  ✓ Fan-out index built once and deduplicated")
+    print("  ✓ Queueing via set union skips pending components")
+    print()
+
+
 def test_pending_updates():
     """Test pending update tracking."""
     print("Test 4: Pending update tracking")
@@ -513,6 +559,7 @@ def run_all_tests():
     test_basic_queueing()
     test_batch_queueing()
     test_vnet_based_queueing()
+    test_fanout_index()
     test_pending_updates()
     test_completion_waiting()
     test_thread_safety()
@@ -536,6 +583,7 @@ def run_all_tests():
     print("✓ Timeout handling")
     print("✓ Thread-safe operations")
     print("✓ Batch operations")
+    print("✓ Precomputed VNET fan-out index")
     print("✓ Statistics and monitoring")
     print()
 
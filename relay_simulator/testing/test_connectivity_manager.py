@@ -0,0 +1,294 @@
+"""
+Test suite for ConnectivityManager
+
+Tests incremental connectivity groups: link clusters, bridge merges and
+splits, touched-group collection, and equivalence with a full recompute.
+"""
+
+import sys
+import os
+import random
+
+# Add parent directory to path to import relay_simulator
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from core.vnet import VNET
+from core.bridge import Bridge
+from core.id_manager import IDManager
+from simulation.connectivity_manager import ConnectivityManager
+from simulation.bridge_manager import BridgeManager
+from simulation.simulation_engine import SimulationEngine
+from testing.threaded_engine_benchmark import build_relay_stages
+
+
+def _make_vnets(count):
+    vnets = {}
+    for i in range(count):
+        vnet = VNET(f"v{i}")
+        vnets[vnet.vnet_id] = vnet
+    return vnets
+
+
+def _normalize(groups):
+    return sorted(sorted(g) for g in groups)
+
+
+def test_initial_groups():
+    """Test that each VNET starts in its own group."""
+    print("\n=== Testing Initial Groups ===")
+
+    vnets = _make_vnets(4)
+    cm = ConnectivityManager(vnets, {})
+    cm.build()
+
+    assert cm.get_group_count() == 4
+    assert cm.get_group_for_vnet("v0") == {"v0"}
+    assert cm.get_group_for_vnet("missing") == set()
+
+    print("✓ One group per unlinked VNET")
+
+
+def test_link_clusters():
+    """Test that VNETs sharing a link name share a group."""
+    print("\n=== Testing Link Clusters ===")
+
+    vnets = _make_vnets(4)
+    vnets["v0"].add_link("CLK")
+    vnets["v2"].add_link("CLK")
+    cm = ConnectivityManager(vnets, {})
+    cm.build()
+
+    assert cm.get_group_for_vnet("v0") == {"v0", "v2"}
+    assert cm.get_group_count() == 3
+
+    print("✓ Linked VNETs grouped together")
+
+
+def test_bridge_merge_and_split():
+    """Test merging on bridge add and splitting on bridge remove."""
+    print("\n=== Testing Bridge Merge/Split ===")
+
+    vnets = _make_vnets(3)
+    bridges = {}
+    cm = ConnectivityManager(vnets, bridges)
+    cm.build()
+
+    bridges["b1"] = Bridge("v0", "v1", "relay", "b1")
+    cm.add_bridge("b1", "v0", "v1")
+    bridges["b2"] = Bridge("v1", "v2", "relay", "b2")
+    cm.add_bridge("b2", "v1", "v2")
+    assert cm.get_group_for_vnet("v0") == {"v0", "v1", "v2"}
+    print("✓ Bridges merge groups")
+
+    # Parallel bridge: removing one must not split
+    bridges["b3"] = Bridge("v0", "v1", "relay", "b3")
+    cm.add_bridge("b3", "v0", "v1")
+    del bridges["b1"]
+    cm.remove_bridge("b1")
+    assert cm.get_group_for_vnet("v0") == {"v0", "v1", "v2"}
+    print("✓ Parallel bridge keeps group connected")
+
+    del bridges["b2"]
+    cm.remove_bridge("b2")
+    assert cm.get_group_for_vnet("v0") == {"v0", "v1"}
+    assert cm.get_group_for_vnet("v2") == {"v2"}
+    print("✓ Removing last connecting bridge splits group")
+
+
+def test_collect_groups_touched():
+    """Test that collect_groups returns dirty and bridge-touched groups only."""
+    print("\n=== Testing Collect Groups ===")
+
+    vnets = _make_vnets(5)
+    bridges = {}
+    cm = ConnectivityManager(vnets, bridges)
+    cm.build()
+
+    assert _normalize(cm.collect_groups(["v4"])) == [["v4"]]
+
+    bridges["b1"] = Bridge("v0", "v1", "relay", "b1")
+    cm.add_bridge("b1", "v0", "v1")
+    assert _normalize(cm.collect_groups([])) == [["v0", "v1"]]
+    # Touched set is consumed
+    assert cm.collect_groups([]) == []
+
+    del bridges["b1"]
+    cm.remove_bridge("b1")
+    assert _normalize(cm.collect_groups([])) == [["v0"], ["v1"]]
+
+    print("✓ Only touched groups collected")
+
+
+def test_sync_reconciles_external_bridges():
+    """Test that sync() picks up bridges changed outside the manager."""
+    print("\n=== Testing Sync ===")
+
+    vnets = _make_vnets(3)
+    bridges = {}
+    cm = ConnectivityManager(vnets, bridges)
+    cm.build()
+
+    bridges["b1"] = Bridge("v0", "v2", "relay", "b1")
+    cm.sync()
+    assert cm.get_group_for_vnet("v0") == {"v0", "v2"}
+
+    del bridges["b1"]
+    cm.sync()
+    assert cm.get_group_for_vnet("v0") == {"v0"}
+
+    print("✓ External bridge changes reconciled")
+
+
+def test_random_matches_full_recompute():
+    """Test random bridge churn against the full union-find reference."""
+    print("\n=== Testing Random Churn vs Full Recompute ===")
+
+    rng = random.Random(1234)
+    vnets = _make_vnets(40)
+    for i in range(0, 40, 7):
+        vnets[f"v{i}"].add_link(f"L{i % 3}")
+    bridges = {}
+    cm = ConnectivityManager(vnets, bridges)
+    cm.build()
+
+    next_id = 0
+    for _ in range(500):
+        if bridges and rng.random() < 0.45:
+            bridge_id = rng.choice(list(bridges.keys()))
+            del bridges[bridge_id]
+            cm.remove_bridge(bridge_id)
+        else:
+            a, b = rng.sample(range(40), 2)
+            bridge_id = f"b{next_id}"
+            next_id += 1
+            bridges[bridge_id] = Bridge(f"v{a}", f"v{b}", "relay", bridge_id)
+            cm.add_bridge(bridge_id, f"v{a}", f"v{b}")
+
+        assert _normalize(cm.get_all_groups()) == _normalize(cm.rebuild_groups())
+
+    print("✓ Incremental groups match full recompute over 500 operations")
+
+
+def test_bridge_manager_integration():
+    """Test that BridgeManager keeps connectivity in sync."""
+    print("\n=== Testing BridgeManager Integration ===")
+
+    vnets = _make_vnets(3)
+    bridges = {}
+    cm = ConnectivityManager(vnets, bridges)
+    cm.build()
+    manager = BridgeManager(bridges, IDManager(), vnets, cm)
+
+    bridge_id = manager.create_bridge("v0", "v1", "relay")
+    assert cm.get_group_for_vnet("v0") == {"v0", "v1"}
+
+    manager.remove_bridge(bridge_id)
+    assert cm.get_group_for_vnet("v0") == {"v0"}
+
+    print("✓ create_bridge/remove_bridge update groups")
+
+
+def test_preallocated_bridges():
+    """Test that allocated bridges switch by their enabled flag."""
+    print("\n=== Testing Preallocated Bridges ===")
+
+    vnets = _make_vnets(3)
+    bridges = {}
+    cm = ConnectivityManager(vnets, bridges)
+    cm.build()
+    id_manager = IDManager()
+    manager = BridgeManager(bridges, id_manager, vnets, cm)
+
+    nc = manager.allocate_bridge("v0", "v1", "relay", "relay.COM1-NC1", enabled=True)
+    no = manager.allocate_bridge("v0", "v2", "relay", "relay.COM1-NO1")
+    assert set(bridges) == {nc} and cm.get_group_for_vnet("v0") == {"v0", "v1"}
+    assert vnets["v2"].get_all_bridges() == []
+
+    nc_bridge = bridges[nc]
+    for _ in range(100):
+        assert manager.set_bridge_enabled(nc, False)
+        assert manager.set_bridge_enabled(no, True)
+        assert not manager.set_bridge_enabled(no, True), "Already enabled"
+        manager.set_bridge_enabled(no, False)
+        manager.set_bridge_enabled(nc, True)
+    assert bridges[nc] is nc_bridge and nc_bridge.enabled
+    assert cm.get_group_for_vnet("v0") == {"v0", "v1"}
+    assert id_manager.get_used_count() == 0, "Switching generates no IDs"
+    print("✓ 200 contact transfers reuse two bridge objects")
+
+    manager.set_bridge_enabled(nc, False)
+    manager.set_bridge_enabled(no, True)
+    assert set(bridges) == {no} and not nc_bridge.enabled
+    assert vnets["v1"].get_all_bridges() == [] and vnets["v2"].get_all_bridges() == [no]
+    assert cm.get_group_for_vnet("v0") == {"v0", "v2"}
+    assert [b.bridge_id for b in manager.get_bridges_for_component("relay")] == [no]
+    assert manager.get_bridges_for_component("other") == []
+    print("✓ Disabled bridges leave the bridges dict, VNETs and groups")
+
+    # Re-allocating (simulation restart) reuses the bridge
+    assert manager.allocate_bridge("v0", "v1", "relay", nc) == nc
+    assert nc not in bridges and len(manager.get_bridges_for_component("relay")) == 1
+    manager.remove_bridges_for_component("relay")
+    assert bridges == {} and cm.get_group_count() == 3
+    print("✓ Re-allocation and remove_bridges_for_component")
+
+
+def test_relay_contacts_preallocated():
+    """Test that relays in an engine toggle fixed contact bridges."""
+    print("\n=== Testing Relay Contact Bridges ===")
+
+    vnets, tabs, bridges, components = build_relay_stages(3)
+    engine = SimulationEngine(vnets, tabs, bridges, components, realtime=False)
+    assert engine.initialize() and engine.run().stable
+    closed = dict(bridges)
+    assert sorted(closed) == ["RLY00000.COM1-NC1", "RLY00001.COM1-NC1", "RLY00002.COM1-NC1"]
+
+    switches = [c for c in components.values() if c.component_type == "Switch"]
+    for _ in range(5):
+        for switch in switches:
+            engine.apply_external_update(lambda s=switch: (
+                s.interact("toggle"), s.simulate_logic(engine.vnet_manager, engine.bridge_manager)))
+        engine.run()
+        assert engine.process_next_event()
+        assert engine.run().stable
+    assert all(b.bridge_id.endswith("NO1") for b in bridges.values()), "Odd toggle count: energized"
+    assert engine.id_manager.get_used_count() == 0
+
+    assert engine.reset() and engine.run().stable
+    assert bridges == closed and all(b is closed[b.bridge_id] for b in bridges.values())
+    engine.shutdown()
+    print("✓ Contacts switch without new bridge IDs; reset() restores NC bridges")
+
+
+def run_all_tests():
+    """Run all connectivity manager tests."""
+    print("=" * 60)
+    print("CONNECTIVITY MANAGER TEST SUITE")
+    print("=" * 60)
+
+    try:
+        test_initial_groups()
+        test_link_clusters()
+        test_bridge_merge_and_split()
+        test_collect_groups_touched()
+        test_sync_reconciles_external_bridges()
+        test_random_matches_full_recompute()
+        test_bridge_manager_integration()
+        test_preallocated_bridges()
+        test_relay_contacts_preallocated()
+
+        print("\n" + "=" * 60)
+        print("ALL CONNECTIVITY MANAGER TESTS PASSED ✓")
+        print("=" * 60)
+        return True
+
+    except AssertionError as e:
+        print(f"\n✗ TEST FAILED: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+
+if __name__ == "__main__":
+    success = run_all_tests()
+    sys.exit(0 if success else 1)
@@ -0,0 +1,251 @@
+"""
+Test suite for state-hash oscillation detection
+
+Tests CycleDetector on its own, a self-interrupting relay (buzzer) in timed
+runs, a zero-delay oscillating component inside run(), and that clocked
+circuits are not reported as oscillating.
+"""
+
+import sys
+import os
+
+# Add parent directory to path to import relay_simulator
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from core.vnet import VNET
+from core.pin import Pin
+from core.tab import Tab
+from core.state import PinState
+from components.base import Component
+from components.vcc import VCC
+from components.dpdt_relay import DPDTRelay
+from core.id_manager import IDManager
+from simulation.bridge_manager import BridgeManager, bridge_key
+from simulation.compiled_netlist import CompiledNetlist
+from simulation.cycle_detector import CycleDetector
+from simulation.simulation_engine import SimulationEngine, SimulationState
+
+
+EXAMPLE_PATH = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..', 'examples', 'Example.rsim'))
+
+
+class TogglingComponent(Component):
+    """Zero-delay inverter on its own output: flips on every evaluation."""
+
+    component_type = "Toggler"
+
+    def __init__(self, component_id: str, page_id: str):
+        super().__init__(component_id, page_id)
+        self.output_pin = Pin(f"{component_id}.out", self)
+        self.output_pin.add_tab(Tab(f"{component_id}.out.tab", self.output_pin, (0, 0)))
+        self.add_pin(self.output_pin)
+
+    def simulate_logic(self, vnet_manager, bridge_manager=None):
+        current = self.output_pin.state
+        self.output_pin.set_state(PinState.FLOAT if current == PinState.HIGH else PinState.HIGH)
+        for tab_id in self.output_pin.tabs:
+            vnet_manager.mark_tab_dirty(tab_id)
+
+    def sim_start(self, vnet_manager, bridge_manager=None):
+        self.output_pin.set_state(PinState.HIGH)
+
+    def sim_stop(self):
+        pass
+
+    def render(self, canvas_adapter, x_offset=0, y_offset=0):
+        pass
+
+
+def _own_vnet(vnets, tabs, pin, vnet_id):
+    """Put every tab of a pin into a new VNET."""
+    vnet = VNET(vnet_id, "page1")
+    for tab in pin.tabs.values():
+        vnet.add_tab(tab.tab_id)
+        tabs[tab.tab_id] = tab
+    vnets[vnet_id] = vnet
+    return vnet
+
+
+def _buzzer_circuit():
+    """VCC -> COM1, NC1 -> COIL: the relay keeps interrupting its own coil."""
+    vnets, tabs, components = {}, {}, {}
+    vcc = VCC("vcc1", "page1")
+    relay = DPDTRelay("relay1", "page1")
+    components = {"vcc1": vcc, "relay1": relay}
+
+    supply = _own_vnet(vnets, tabs, vcc._output_pin, "V_SUPPLY")
+    for tab in relay.get_pin_by_name("COM1").tabs.values():
+        supply.add_tab(tab.tab_id)
+        tabs[tab.tab_id] = tab
+
+    coil = _own_vnet(vnets, tabs, relay.get_pin_by_name("COIL"), "V_COIL")
+    for tab in relay.get_pin_by_name("NC1").tabs.values():
+        coil.add_tab(tab.tab_id)
+        tabs[tab.tab_id] = tab
+
+    for name in ("NO1", "COM2", "NO2", "NC2"):
+        _own_vnet(vnets, tabs, relay.get_pin_by_name(name), f"V_{name}")
+    return vnets, tabs, {}, components
+
+
+def test_detector_requires_repeats():
+    """Test that a single revisit is not a cycle but a repeating one is."""
+    print("\n=== Testing CycleDetector ===")
+
+    vnets = {f"v{i}": VNET(f"v{i}") for i in range(3)}
+    netlist = CompiledNetlist(vnets, {}, {})
+    detector = CycleDetector(netlist)
+
+    def observe(*high):
+        for i in range(3):
+            netlist.store_state(i, i in high)
+        return detector.observe()
+
+    assert observe(0) is None
+    assert observe(1) is None
+    assert observe(0) is None, "A-B-A is a revisit, not yet a cycle"
+    print("✓ Single revisit not reported")
+
+    assert observe(1) is None, "B has no earlier exact state to compare with"
+    report = observe(0)
+    assert report is not None and report.cycle_length == 2
+    assert sorted(report.vnet_ids) == ["v0", "v1"]
+    print("✓ A-B-A-B-A reported as a cycle of 2 over the toggling VNETs")
+
+    detector.clear()
+    assert observe(1) is None
+    assert observe(1) is None, "Unchanged state is not a cycle"
+    print("✓ clear() starts a new sequence")
+
+
+def test_detector_window_and_bridge_hash():
+    """Test that history is bounded and bridge changes update the fingerprint."""
+    print("\n=== Testing CycleDetector Window ===")
+
+    vnets = {f"v{i}": VNET(f"v{i}") for i in range(8)}
+    netlist = CompiledNetlist(vnets, {}, {})
+    bridges = {}
+    manager = BridgeManager(bridges, IDManager(), vnets)
+    detector = CycleDetector(netlist, manager, history=4)
+
+    for i in range(8):
+        netlist.store_state(i, True)
+        assert detector.observe() is None
+    assert len(detector._entries) == 4 and len(detector._last_seen) == 4
+    assert not detector._snapshots, "No revisits, no state copies"
+    print("✓ Fingerprints dropped as they leave the window")
+
+    manager.allocate_bridge("v0", "v1", "relay1", "relay1.C")
+    manager.set_bridge_enabled("relay1.C", True)
+    assert manager.bridge_hash == bridge_key(bridges["relay1.C"])
+    enabled = detector.observe()
+    manager.set_bridge_enabled("relay1.C", False)
+    assert manager.bridge_hash == 0
+    assert detector.observe() is None and enabled is None
+    assert detector._snapshots, "Revisit of the bridge-less state is copied"
+    manager.set_bridge_enabled("relay1.C", True)
+    assert detector.observe() is None
+    manager.set_bridge_enabled("relay1.C", False)
+    report = detector.observe()
+    assert report is not None and report.component_ids == ["relay1"]
+    print("✓ Toggling bridge reported through its owner")
+
+
+def test_buzzer_timed_run():
+    """Test that a relay buzzer stops a timed run with a report."""
+    print("\n=== Testing Relay Buzzer ===")
+
+    vnets, tabs, bridges, components = _buzzer_circuit()
+    engine = SimulationEngine(vnets, tabs, bridges, components, realtime=False)
+    assert engine.initialize()
+
+    result = engine.run_for(10.0)
+    report = result.oscillation
+    assert report is not None, "Buzzer should be reported"
+    assert result.final_state == SimulationState.OSCILLATING.value and not result.stable
+    assert report.cycle_length == 2
+    assert abs(report.period - 2 * DPDTRelay.SWITCHING_DELAY) < 1e-9
+    assert "relay1" in report.component_ids
+    assert "V_COIL" in report.vnet_ids
+    assert len(result.steps) <= 8 and result.sim_time < 0.1
+    print(f"✓ {report.describe()} after {len(result.steps)} steps")
+
+    # Without a clock this used to spin forever
+    result = engine.run_clock_edges(5)
+    assert result.oscillation is not None and result.clock_edges == 0
+    print("✓ run_clock_edges returns instead of spinning")
+
+    engine.shutdown()
+
+
+def test_zero_delay_oscillation():
+    """Test that run() reports an in-settle oscillation before max_iterations."""
+    print("\n=== Testing Zero-Delay Oscillation ===")
+
+    comp = TogglingComponent("osc1", "page1")
+    vnets, tabs = {}, {}
+    _own_vnet(vnets, tabs, comp.output_pin, "V_OSC")
+    engine = SimulationEngine(vnets, tabs, {}, {"osc1": comp}, realtime=False)
+    assert engine.initialize()
+
+    stats = engine.run()
+    assert engine.get_state() == SimulationState.OSCILLATING
+    assert not stats.max_iterations_reached
+    assert stats.oscillation is not None and stats.oscillation.cycle_length == 2
+    assert stats.oscillation.component_ids == ["osc1"]
+    assert stats.iterations < 20
+    print(f"✓ Detected after {stats.iterations} iterations ({stats.oscillation.describe()})")
+
+    engine.shutdown()
+
+
+def test_clocked_circuit_not_flagged():
+    """Test that periodic clock-driven states are not reported."""
+    print("\n=== Testing Clocked Circuit ===")
+
+    from fileio.document_loader import load_document
+    from simulation.structure_builder import build_simulation_structures
+
+    vnets, tabs, bridges, components = build_simulation_structures(load_document(EXAMPLE_PATH))
+    for component in components.values():
+        if component.component_type == "Clock":
+            component.properties["enable_on_sim_start"] = True
+    engine = SimulationEngine(vnets, tabs, bridges, components, realtime=False)
+    assert engine.initialize()
+
+    result = engine.run_for(3.0)
+    assert result.oscillation is None and result.stable
+    assert result.clock_edges > 4
+    print(f"✓ {result.clock_edges} clock edges, no oscillation reported")
+
+    engine.shutdown()
+
+
+def run_all_tests():
+    """Run all cycle detection tests."""
+    print("=" * 60)
+    print("CYCLE DETECTION TEST SUITE")
+    print("=" * 60)
+
+    try:
+        test_detector_requires_repeats()
+        test_detector_window_and_bridge_hash()
+        test_buzzer_timed_run()
+        test_zero_delay_oscillation()
+        test_clocked_circuit_not_flagged()
+
+        print("\n" + "=" * 60)
+        print("ALL CYCLE DETECTION TESTS PASSED ✓")
+        print("=" * 60)
+        return True
+
+    except AssertionError as e:
+        print(f"\n✗ TEST FAILED: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+
+if __name__ == "__main__":
+    success = run_all_tests()
+    sys.exit(0 if success else 1)
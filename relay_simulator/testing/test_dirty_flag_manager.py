@@ -429,6 +429,67 @@ def test_reset():
     print()
 
 
+def test_dirty_queue():
+    """Test queue fed by VNET setters and O(dirty) retrieval order."""
+    print("Test 11: Dirty queue")
+    
+    vnets = {}
+    for i in range(5):
+        vnet = VNET(vnet_id=f"vnet{i:03d}", page_id="page001")
+        vnets[f"vnet{i:03d}"] = vnet
+    
+    manager = DirtyFlagManager(vnets)
+    manager.clear_all_dirty()
+    
+    # Direct VNET changes reach the queue through the dirty listener
+    vnets["vnet003"].state = PinState.HIGH
+    vnets["vnet001"].add_bridge("bridge01")
+    vnets["vnet004"].mark_dirty()
+    
+    dirty_ids = [v.vnet_id for v in manager.get_dirty_vnets()]
+    assert dirty_ids == ["vnet003", "vnet001", "vnet004"], "Should be in FIFO order"
+    assert manager.get_dirty_count() == 3, "Should have 3 dirty VNETs"
+    
+    # Flag cleared directly on the VNET: stale entry dropped on retrieval
+    vnets["vnet001"].clear_dirty()
+    assert manager.get_dirty_vnet_ids() == {"vnet003", "vnet004"}, "Stale entry should be dropped"
+    
+    manager.clear_dirty("vnet003")
+    manager.clear_dirty("vnet004")
+    assert manager.is_stable() == True, "Should be stable"
+    
+    print("  ✓ VNET setters feed the queue")
+    print("  ✓ FIFO retrieval, stale entries dropped")
+    print()
+
+
+def test_peak_depth():
+    """Test peak dirty-queue depth tracking."""
+    print("Test 12: Peak depth")
+    
+    vnets = {}
+    for i in range(4):
+        vnet = VNET(vnet_id=f"vnet{i:03d}", page_id="page001")
+        vnets[f"vnet{i:03d}"] = vnet
+    
+    manager = DirtyFlagManager(vnets)
+    assert manager.get_peak_depth() == 4, "All VNETs start dirty"
+    
+    manager.clear_all_dirty()
+    manager.reset_peak_depth()
+    assert manager.get_peak_depth() == 0, "Peak restarts from current depth"
+    
+    manager.mark_dirty("vnet000")
+    manager.mark_dirty("vnet001")
+    manager.clear_dirty("vnet000")
+    manager.mark_dirty("vnet002")
+    assert manager.get_peak_depth() == 2, "Peak should be 2"
+    assert manager.get_statistics()['peak_dirty_depth'] == 2
+    
+    print("  ✓ Peak depth tracked and reset")
+    print()
+
+
 def run_all_tests():
     """Run all dirty flag manager tests."""
     print("=" * 60)
@@ -447,6 +508,8 @@ def run_all_tests():
         test_mark_all_dirty,
         test_statistics,
         test_reset,
+        test_dirty_queue,
+        test_peak_depth,
     ]
     
     passed = 0
@@ -482,6 +545,8 @@ def run_all_tests():
         print("  ✓ Atomic dirty flag operations")
         print("  ✓ Batch operations support")
         print("  ✓ Statistics and monitoring")
+        print("  ✓ O(dirty) retrieval from dirty queue")
+        print("  ✓ Peak dirty-queue depth")
         return 0
     else:
         print(f"\n✗ {failed} test(s) FAILED")
@@ -8,6 +8,8 @@ Author: Cascade AI
 Date: 2025-12-10
 """
 
+import os
+import tempfile
 import unittest
 from typing import Dict
 
@@ -20,12 +22,26 @@ from components.vcc import VCC
 from components.switch import Switch
 from simulation.simulation_engine import SimulationEngine
 from simulation.threaded_simulation_engine import ThreadedSimulationEngine
+from simulation.process_sharded_engine import ProcessShardedSimulationEngine
 from simulation.engine_factory import (
     SimulationEngineFactory,
     EngineConfig,
     EngineMode,
+    CalibrationCache,
+    CalibrationResult,
+    circuit_hash,
     create_engine
 )
+from fileio.document_loader import load_document
+from simulation.structure_builder import build_simulation_structures, build_detached_simulation_structures
+
+
+EXAMPLE_PATH = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..', 'examples', 'Example.rsim'))
+
+
+def build_example():
+    """Build fresh simulation structures for Example.rsim."""
+    return build_simulation_structures(load_document(EXAMPLE_PATH))
 
 
 class TestEngineConfig(unittest.TestCase):
@@ -51,6 +67,9 @@ class TestEngineConfig(unittest.TestCase):
         
         config3 = EngineConfig(mode='auto')
         self.assertEqual(config3.mode, EngineMode.AUTO)
+        
+        config4 = EngineConfig(mode='calibrated')
+        self.assertEqual(config4.mode, EngineMode.CALIBRATED)
     
     def test_custom_threshold(self):
         """Test custom auto threshold."""
@@ -61,6 +80,12 @@ class TestEngineConfig(unittest.TestCase):
         """Test custom thread count."""
         config = EngineConfig(mode='multi', thread_count=8)
         self.assertEqual(config.thread_count, 8)
+    
+    def test_process_mode(self):
+        """Test multi-process mode and process count."""
+        config = EngineConfig(mode='process', process_count=3)
+        self.assertEqual(config.mode, EngineMode.MULTI_PROCESS)
+        self.assertEqual(config.process_count, 3)
 
 
 class TestSimulationEngineFactory(unittest.TestCase):
@@ -192,6 +217,29 @@ class TestSimulationEngineFactory(unittest.TestCase):
         self.assertIsInstance(engine, ThreadedSimulationEngine)
         self.assertEqual(engine.thread_pool.thread_count, 4)
     
+    @unittest.skipUnless(ProcessShardedSimulationEngine.is_supported(), "needs fork")
+    def test_create_multi_process_explicit(self):
+        """Test explicit multi-process engine creation."""
+        self._create_components(100)
+        
+        engine = SimulationEngineFactory.create_multi_process(
+            self.vnets, self.tabs, self.bridges, self.components,
+            process_count=2
+        )
+        
+        self.assertIsInstance(engine, ProcessShardedSimulationEngine)
+        self.assertEqual(engine.worker_count, 2)
+    
+    def test_auto_mode_never_multi_process(self):
+        """Test auto mode does not select the multi-process engine."""
+        self._create_components(2500)
+        
+        engine = SimulationEngineFactory.create_engine(
+            self.vnets, self.tabs, self.bridges, self.components, EngineConfig()
+        )
+        
+        self.assertNotIsInstance(engine, ProcessShardedSimulationEngine)
+    
     def test_get_recommended_mode_small(self):
         """Test recommendation for small circuits."""
         mode = SimulationEngineFactory.get_recommended_mode(500)
@@ -368,5 +416,111 @@ class TestEngineSelection(unittest.TestCase):
         self.assertIsInstance(engine, ThreadedSimulationEngine)
 
 
+class TestCalibration(unittest.TestCase):
+    """Test calibrated engine selection and its cache."""
+    
+    def setUp(self):
+        """Use a temporary calibration cache."""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.cache = CalibrationCache(os.path.join(self.temp_dir.name, 'engine_calibration.json'))
+    
+    def tearDown(self):
+        self.temp_dir.cleanup()
+    
+    def test_circuit_hash_stable_across_loads(self):
+        """Test that the hash ignores per-load VNET IDs."""
+        first, second = build_example(), build_example()
+        self.assertNotEqual(set(first[0]), set(second[0]))
+        self.assertEqual(circuit_hash(*first), circuit_hash(*second))
+        
+        vnets, tabs, bridges, components = build_example()
+        components.pop(next(iter(components)))
+        self.assertNotEqual(circuit_hash(vnets, tabs, bridges, components), circuit_hash(*first))
+    
+    def test_calibrate_times_candidates_and_caches(self):
+        """Test that calibration times every candidate, then reuses the cache."""
+        result = SimulationEngineFactory.calibrate(build_example, thread_counts=[2], cache=self.cache)
+        
+        self.assertFalse(result.cached)
+        self.assertEqual(set(result.timings), {"single", "multi x2"})
+        self.assertIn(result.mode, (EngineMode.SINGLE_THREADED, EngineMode.MULTI_THREADED))
+        if result.mode == EngineMode.MULTI_THREADED:
+            self.assertLess(result.timings["multi x2"] * SimulationEngineFactory.MIN_SPEEDUP,
+                            result.timings["single"])
+        self.assertTrue(os.path.exists(self.cache.path))
+        
+        again = SimulationEngineFactory.calibrate(build_example, thread_counts=[2], cache=self.cache)
+        self.assertTrue(again.cached)
+        self.assertEqual((again.mode, again.worker_count, again.timings),
+                         (result.mode, result.worker_count, result.timings))
+    
+    def test_calibration_leaves_document_components_untouched(self):
+        """Test that calibrating from a serialized document keeps its components' state."""
+        document = load_document(EXAMPLE_PATH)
+        components = {c.component_id: c for page in document.get_all_pages()
+                      for c in page.get_all_components()}
+        memory = next(c for c in components.values() if c.component_type == 'Memory')
+        relays = [c for c in components.values() if c.component_type == 'DPDTRelay']
+        self.assertTrue(relays)
+        memory.write_memory(1, 0x5A)
+        before = {component_id: c.to_dict() for component_id, c in components.items()}
+        relay_state = [(r._is_energized, r._target_energized, r._on_contacts_switched_callback)
+                       for r in relays]
+        
+        data = document.to_dict()
+        built = build_detached_simulation_structures(data)[3]
+        self.assertEqual(set(built), set(components))
+        self.assertFalse(any(built[cid] is c for cid, c in components.items()))
+        
+        result = SimulationEngineFactory.calibrate(
+            lambda: build_detached_simulation_structures(data), thread_counts=[2], use_cache=False
+        )
+        
+        self.assertEqual(set(result.timings), {"single", "multi x2"})
+        self.assertEqual(memory.read_memory(1), 0x5A)
+        self.assertEqual({component_id: c.to_dict() for component_id, c in components.items()}, before)
+        self.assertEqual([(r._is_energized, r._target_energized, r._on_contacts_switched_callback)
+                          for r in relays], relay_state)
+    
+    def test_single_cpu_without_candidates(self):
+        """Test that a lone candidate is chosen without running it."""
+        result = SimulationEngineFactory.calibrate(build_example, thread_counts=[], use_cache=False)
+        self.assertEqual(result.mode, EngineMode.SINGLE_THREADED)
+        self.assertEqual(result.timings, {})
+        self.assertIn("single", result.describe())
+    
+    def test_apply_keeps_limits(self):
+        """Test that applying a calibration keeps the base limits."""
+        base = EngineConfig(mode='calibrated', max_iterations=500, timeout_seconds=5.0)
+        config = CalibrationResult(mode=EngineMode.MULTI_THREADED, worker_count=4).apply(base)
+        
+        self.assertEqual(config.mode, EngineMode.MULTI_THREADED)
+        self.assertEqual(config.thread_count, 4)
+        self.assertEqual(config.max_iterations, 500)
+        self.assertEqual(config.timeout_seconds, 5.0)
+    
+    def test_create_engine_uses_cached_calibration(self):
+        """Test calibrated mode with and without a cache entry."""
+        vnets, tabs, bridges, components = build_example()
+        config = EngineConfig(mode='calibrated')
+        
+        engine = SimulationEngineFactory.create_engine(
+            vnets, tabs, bridges, components, config, calibration_cache=self.cache
+        )
+        self.assertNotIsInstance(engine, ThreadedSimulationEngine, "Uncalibrated falls back to auto")
+        
+        self.cache.put(CalibrationResult(
+            mode=EngineMode.MULTI_THREADED,
+            worker_count=2,
+            circuit_hash=circuit_hash(vnets, tabs, bridges, components),
+            cpu_count=os.cpu_count() or 1
+        ))
+        engine = SimulationEngineFactory.create_engine(
+            vnets, tabs, bridges, components, config, calibration_cache=self.cache
+        )
+        self.assertIsInstance(engine, ThreadedSimulationEngine)
+        self.assertEqual(engine.thread_count, 2)
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,280 @@
+"""
+Test suite for EventScheduler and RealTimeThrottle
+
+Tests simulated-time ordering, cancellation, time advance, real-time pacing
+and DPDT relay switching as scheduled events.
+"""
+
+import sys
+import os
+import time
+import threading
+
+# Add parent directory to path to import relay_simulator
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from simulation.event_scheduler import EventScheduler, RealTimeThrottle
+from components.dpdt_relay import DPDTRelay
+from core.state import PinState
+
+
+class MockVNET:
+    """Mock VNET for relay tests."""
+    def __init__(self, vnet_id: str):
+        self.vnet_id = vnet_id
+        self.state = PinState.FLOAT
+
+
+class MockVnetManager:
+    """Mock VnetManager mapping each relay pin to its own VNET."""
+    def __init__(self, relay: DPDTRelay):
+        self.pin_to_vnet = {}
+        self.tab_to_vnet = {}
+        for pin in relay.pins.values():
+            vnet = MockVNET(f"vnet_{pin.pin_id}")
+            self.pin_to_vnet[pin.pin_id] = vnet
+            for tab_id in pin.tabs:
+                self.tab_to_vnet[tab_id] = vnet
+
+    def get_vnet_for_pin(self, pin_id: str):
+        return self.pin_to_vnet.get(pin_id)
+
+    def get_vnet_for_tab(self, tab_id: str):
+        return self.tab_to_vnet.get(tab_id)
+
+
+class MockBridgeManager:
+    """Mock BridgeManager recording bridges as (vnet1, vnet2) pairs."""
+    def __init__(self):
+        self.bridges = {}
+        self.counter = 0
+
+    def create_bridge(self, vnet1_id: str, vnet2_id: str, owner_id: str) -> str:
+        self.counter += 1
+        bridge_id = f"bridge_{self.counter}"
+        self.bridges[bridge_id] = (vnet1_id, vnet2_id)
+        return bridge_id
+
+    def remove_bridge(self, bridge_id: str):
+        self.bridges.pop(bridge_id, None)
+
+
+def test_time_ordering():
+    """Test that events fire in time order, ties in scheduling order."""
+    print("\n=== Testing Time Ordering ===")
+
+    scheduler = EventScheduler()
+    fired = []
+    scheduler.schedule(0.030, fired.append, "c")
+    scheduler.schedule(0.010, fired.append, "a")
+    scheduler.schedule(0.010, fired.append, "b")
+
+    assert scheduler.peek_time() == 0.010
+    assert scheduler.run_next() == 2
+    assert fired == ["a", "b"]
+    assert scheduler.now == 0.010
+    print("✓ Events at the same time fire together, in order")
+
+    assert scheduler.run_next() == 1
+    assert fired == ["a", "b", "c"]
+    assert scheduler.now == 0.030
+    assert scheduler.run_next() == 0
+    print("✓ Simulated time follows fired events")
+
+
+def test_cancel_and_advance():
+    """Test cancellation and advance_to()."""
+    print("\n=== Testing Cancel and Advance ===")
+
+    scheduler = EventScheduler()
+    fired = []
+    keep = scheduler.schedule(0.5, fired.append, "keep")
+    drop = scheduler.schedule(0.2, fired.append, "drop")
+
+    assert scheduler.cancel(drop) is True
+    assert scheduler.cancel(drop) is False
+    assert scheduler.get_pending_count() == 1
+    print("✓ Cancelled event no longer pending")
+
+    assert scheduler.advance_to(0.4) == 0
+    assert scheduler.now == 0.4
+    assert scheduler.advance_to(1.0) == 1
+    assert fired == ["keep"]
+    assert scheduler.now == 1.0
+    assert scheduler.cancel(keep) is False
+    print("✓ advance_to fires due events and sets time")
+
+    # Events scheduled by callbacks fire if they fall due
+    scheduler.schedule(0.1, lambda: scheduler.schedule(0.1, fired.append, "chained"))
+    scheduler.advance_to(1.5)
+    assert fired == ["keep", "chained"]
+    print("✓ Chained events fire within the same advance")
+
+
+def test_realtime_throttle():
+    """Test that the throttle fires events against wall-clock time."""
+    print("\n=== Testing Real-Time Throttle ===")
+
+    scheduler = EventScheduler()
+    batches = []
+    done = threading.Event()
+
+    def on_batch():
+        batches.append(scheduler.now)
+        done.set()
+
+    throttle = RealTimeThrottle(scheduler, on_batch)
+    throttle.start()
+    try:
+        start = time.perf_counter()
+        scheduler.schedule(0.02, lambda: None)
+        scheduler.schedule(0.02, lambda: None)
+        assert done.wait(1.0), "Throttle should fire the event"
+        elapsed = time.perf_counter() - start
+        assert elapsed >= 0.015, "Event must not fire before it is due"
+        assert len(batches) == 1, "Simultaneous events form one batch"
+    finally:
+        throttle.stop()
+
+    assert not throttle.is_running()
+    print("✓ Events paced to wall-clock time, one batch callback")
+
+
+def test_realtime_throttle_coalesces():
+    """Test that events within the throttle resolution share one batch."""
+    print("\n=== Testing Real-Time Throttle Coalescing ===")
+
+    scheduler = EventScheduler()
+    fired = []
+    batch_sizes = []
+    done = threading.Event()
+
+    def on_batch():
+        batch_sizes.append(len(fired) - sum(batch_sizes))
+        if len(fired) == 4:
+            done.set()
+
+    throttle = RealTimeThrottle(scheduler, on_batch)
+    assert throttle.resolution == 0.001
+    throttle.start()
+    try:
+        for delay in (0.02, 0.0204, 0.0208, 0.06):
+            scheduler.schedule(delay, fired.append, delay)
+        assert done.wait(1.0), "Throttle should fire every event"
+    finally:
+        throttle.stop()
+
+    assert fired == [0.02, 0.0204, 0.0208, 0.06], "Events fire in time order"
+    assert batch_sizes[0] >= 3, f"Events within 1 ms share a wake-up: {batch_sizes}"
+    assert throttle.batches == len(batch_sizes) <= 2
+    assert throttle.events_fired == 4
+    print(f"✓ 4 events fired in {throttle.batches} batches {batch_sizes}")
+
+
+def test_relay_scheduled_switching():
+    """Test that a relay with a scheduler switches on a simulated-time event."""
+    print("\n=== Testing Relay Scheduled Switching ===")
+
+    relay = DPDTRelay("relay001", "page1")
+    vnet_mgr = MockVnetManager(relay)
+    bridge_mgr = MockBridgeManager()
+    scheduler = EventScheduler()
+    relay.set_event_scheduler(scheduler)
+
+    switched = []
+    affected = set()
+
+    def on_switched(vnet_ids):
+        switched.append(scheduler.now)
+        affected.update(vnet_ids)
+
+    relay.set_on_contacts_switched_callback(on_switched)
+    relay.sim_start(vnet_mgr, bridge_mgr)
+
+    coil_tab = next(iter(relay.get_pin_by_name("COIL").tabs))
+    vnet_mgr.get_vnet_for_tab(coil_tab).state = PinState.HIGH
+    relay.simulate_logic(vnet_mgr, bridge_mgr)
+
+    assert relay.is_timer_active()
+    assert not relay.is_energized()
+    assert scheduler.peek_time() == DPDTRelay.SWITCHING_DELAY
+    print("✓ Coil change schedules contact transfer (no thread)")
+
+    scheduler.run_next()
+    assert relay.is_energized()
+    assert not relay.is_timer_active()
+    assert switched == [DPDTRelay.SWITCHING_DELAY]
+    no1 = vnet_mgr.get_vnet_for_pin(relay.get_pin_by_name("NO1").pin_id).vnet_id
+    assert any(no1 in pair for pair in bridge_mgr.bridges.values())
+    print("✓ Contacts transferred at simulated switching time")
+
+    com1 = vnet_mgr.get_vnet_for_pin(relay.get_pin_by_name("COM1").pin_id).vnet_id
+    assert no1 in affected and com1 in affected
+    coil = vnet_mgr.get_vnet_for_tab(coil_tab).vnet_id
+    assert coil not in affected
+    print("✓ Callback reports only the bridged VNETs")
+
+    # sim_stop cancels a pending transfer
+    vnet_mgr.get_vnet_for_tab(coil_tab).state = PinState.FLOAT
+    relay.simulate_logic(vnet_mgr, bridge_mgr)
+    assert scheduler.has_pending()
+    relay.sim_stop()
+    assert not scheduler.has_pending()
+    print("✓ sim_stop cancels pending transfer")
+
+
+def test_scheduled_clock_ticks_leave_restart_to_batch():
+    """Test that scheduled clock ticks do not request a GUI restart each."""
+    print("\n=== Testing Scheduled Clock Restarts ===")
+
+    from fileio.document_loader import load_document
+    from simulation.structure_builder import build_simulation_structures
+    from simulation.simulation_engine import SimulationEngine
+
+    example = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..', 'examples', 'Example.rsim'))
+    vnets, tabs, bridges, components = build_simulation_structures(load_document(example))
+    for component in components.values():
+        if component.component_type == "Clock":
+            component.properties["enable_on_sim_start"] = True
+    engine = SimulationEngine(vnets, tabs, bridges, components, realtime=False)
+    restarts = []
+    engine.set_gui_restart_callback(lambda: restarts.append(engine.scheduler.now))
+    assert engine.initialize()
+
+    result = engine.run_for(2.0)
+    assert result.clock_edges > 2
+    assert restarts == [], "Scheduled ticks are restarted per batch by the throttle"
+    print(f"✓ {result.clock_edges} scheduled clock edges, no per-tick restarts")
+
+    engine.shutdown()
+
+
+def run_all_tests():
+    """Run all event scheduler tests."""
+    print("=" * 60)
+    print("EVENT SCHEDULER TEST SUITE")
+    print("=" * 60)
+
+    try:
+        test_time_ordering()
+        test_cancel_and_advance()
+        test_realtime_throttle()
+        test_realtime_throttle_coalesces()
+        test_relay_scheduled_switching()
+        test_scheduled_clock_ticks_leave_restart_to_batch()
+
+        print("\n" + "=" * 60)
+        print("ALL EVENT SCHEDULER TESTS PASSED ✓")
+        print("=" * 60)
+        return True
+
+    except AssertionError as e:
+        print(f"\n✗ TEST FAILED: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+
+if __name__ == "__main__":
+    success = run_all_tests()
+    sys.exit(0 if success else 1)
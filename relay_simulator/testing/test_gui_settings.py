@@ -135,6 +135,9 @@ class TestSettings(unittest.TestCase):
         self.settings.set_simulation_threading('multi')
         self.assertEqual(self.settings.get_simulation_threading(), 'multi')
         
+        self.settings.set_simulation_threading('calibrated')
+        self.assertEqual(self.settings.get_simulation_threading(), 'calibrated')
+        
     def test_simulation_threading_invalid(self):
         """Test that invalid threading mode raises error."""
         with self.assertRaises(ValueError):
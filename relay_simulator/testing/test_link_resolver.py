@@ -634,6 +634,42 @@ def test_complex_cross_page_scenario():
     print("✓ Complex cross-page scenario tests passed")
 
 
+def test_wide_bus_tab_index():
+    """Test link resolution through a shared tab index on a 256-bit bus."""
+    print("\n=== Testing Wide Bus Tab Index ===")
+    
+    from testing.link_resolver_benchmark import build_bus_document, scan_link_to_vnets
+    
+    doc = build_bus_document(2, 2, 256)
+    vnets = []
+    for page in doc.get_all_pages():
+        vnets.extend(VnetBuilder().build_vnets_for_page(page))
+    
+    resolver = LinkResolver()
+    tab_index = LinkResolver.build_tab_index(vnets)
+    assert len(tab_index) == 1024
+    link_map = resolver._build_link_map(doc)
+    assert dict(resolver._map_links_to_vnets(link_map, tab_index)) == dict(scan_link_to_vnets(link_map, vnets))
+    print("✓ Tab index maps links to the same VNETs as a full scan")
+    
+    result = resolver.resolve_links(doc, vnets, tab_index)
+    assert result.total_links == 256 and result.resolved_links == 256
+    assert result.cross_page_links == 256
+    assert all(len(vnet.link_names) == 1 for vnet in vnets)
+    print(f"✓ {result.resolved_links} bus bits resolved across pages")
+    
+    assert LinkValidator.find_unconnected_links(doc, vnets, tab_index) == []
+    stats = LinkValidator.get_link_statistics(doc, tab_index=tab_index)
+    assert stats['unique_link_names'] == 0 and stats['link_usage'] == {}
+    assert stats['unique_mapped_link_names'] == 256
+    assert stats['total_components_with_mapped_links'] == 4
+    assert stats['mapped_link_usage']['DATA_255'] == 4
+    assert stats['connected_link_names'] == 256 and stats['unconnected_link_names'] == 0
+    print("✓ Validator shares the tab index and counts BUS link mappings")
+    
+    print("✓ Wide bus tab index tests passed")
+
+
 def run_all_tests():
     """Run all Link Resolver tests."""
     print("=" * 60)
@@ -653,6 +689,7 @@ def run_all_tests():
         test_link_validator_statistics()
         test_link_validator_unconnected()
         test_complex_cross_page_scenario()
+        test_wide_bus_tab_index()
         
         print("\n" + "=" * 60)
         print("✓ ALL LINK RESOLVER TESTS PASSED")
@@ -662,6 +699,7 @@ def run_all_tests():
         print("  ✓ Scan all components for LinkName property")
         print("  ✓ Build link name → components map")
         print("  ✓ Find VNETs containing linked component tabs")
+        print("  ✓ Tab → VNET index instead of scanning every VNET")
         print("  ✓ Add link name to those VNETs")
         print("✓ Create LinkResolver class")
         print("  ✓ resolve_links(document, vnets) - Main entry point")
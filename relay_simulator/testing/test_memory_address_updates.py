@@ -67,3 +67,67 @@ class TestMemoryAddressUpdates(unittest.TestCase):
             self.assertEqual(mem.last_operation, "read")
             self.assertEqual(mem.last_address, address)
             self.assertEqual(mem.last_data, expected_value)
+
+    def test_bus_words_round_trip(self):
+        from core.document import Document
+        from core.wire import Wire
+        from components.vcc import VCC
+        from components.memory import Memory
+        from components.thumbwheel import Thumbwheel
+        from components.bus_display import BusDisplay
+        from components.seven_segment_display import SevenSegmentDisplay
+        from simulation.simulation_engine import SimulationEngine
+        from simulation.structure_builder import build_simulation_structures
+
+        # Two thumbwheels drive address A_0..A_7; Memory reads onto D_0..D_7
+        doc = Document()
+        page = doc.create_page("CPU")
+        low, high = Thumbwheel("TWLO", page.page_id), Thumbwheel("TWHI", page.page_id)
+        low.properties.update(bus_name="A", start_pin=0)
+        high.properties.update(bus_name="A", start_pin=4)
+        mem = Memory("MEM", page.page_id)
+        mem.properties.update(address_bus_name="A", data_bus_name="D")
+        mem.memory[0x5A] = 0xC3
+        display = BusDisplay("DISP", page.page_id)
+        display.properties.update(bus_name="D", number_of_pins=8)
+        seven = SevenSegmentDisplay("SEG", page.page_id)
+        seven.properties.update(bus_name="D", start_pin=4)
+        vcc = VCC("VCC", page.page_id)
+        for component in (low, high, mem, display, seven, vcc):
+            page.add_component(component)
+        vcc_tab = next(iter(next(iter(vcc.pins.values())).tabs))
+        for control in ("Enable", "Read"):
+            page.add_wire(Wire(f"W{control}", vcc_tab, f"MEM.{control}.tab"))
+
+        engine = SimulationEngine(*build_simulation_structures(doc), realtime=False)
+        self.assertTrue(engine.initialize())
+        manager = engine.vnet_manager
+
+        bus = manager.get_bus("A", 8)
+        self.assertEqual(len(bus), 8)
+        self.assertTrue(all(len(vnets) == 2 for vnets in bus))  # thumbwheel + memory tab
+        self.assertIs(manager.get_bus("A", 8), bus)
+
+        def set_address():
+            low.properties["value"] = 0xA
+            high.properties["value"] = 0x5
+            low.simulate_logic(manager)
+            high.simulate_logic(manager)
+
+        engine.apply_external_update(set_address)
+        engine.run()
+
+        self.assertEqual(manager.read_bus_value("A", 8), 0x5A)
+        self.assertEqual(mem.last_operation, "read")
+        self.assertEqual(mem.last_address, 0x5A)
+        self.assertEqual(manager.read_bus_value("D", 8), 0xC3)
+        self.assertEqual(display.read_value(manager), 0xC3)
+        self.assertEqual(seven.read_value(manager), 0xC)
+
+        # Driving the same word again changes no pins
+        self.assertFalse(manager.drive_pins(mem._data_pins, 0xC3))
+        engine.shutdown()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,240 @@
+"""Tests for dense Memory storage and memory image formats."""
+
+import copy
+import json
+import os
+import sys
+import tempfile
+import unittest
+from array import array
+
+from components.memory import Memory
+from components.memory_image import (
+    MAPPED_COPY_ON_WRITE, MappedMemory, MemoryArray, decode_block, encode_block, image_format,
+)
+
+
+def make_memory(address_bits: int = 8, data_bits: int = 8) -> Memory:
+    mem = Memory("MEM", "page001")
+    mem.properties.update(address_bits=address_bits, data_bits=data_bits)
+    mem.on_property_changed('data_bits')
+    return mem
+
+
+class TestMemoryArray(unittest.TestCase):
+    def test_dict_semantics(self):
+        store = MemoryArray(256, 8)
+        self.assertFalse(store)
+        self.assertEqual(len(store), 0)
+
+        store[0x10] = 0x1FF  # masked to 8 bits
+        store[0x02] = 0x34
+        self.assertEqual(store[0x10], 0xFF)
+        self.assertEqual(store.get(0x03), 0)
+        self.assertEqual(store.get(0x400), 0)  # outside the address space
+        self.assertEqual(list(store.items()), [(0x02, 0x34), (0x10, 0xFF)])
+        self.assertEqual(len(store), 2)
+        self.assertIn(0x10, store)
+        self.assertNotIn(0x03, store)
+        self.assertEqual(store, {0x02: 0x34, 0x10: 0xFF})
+
+        self.assertEqual(store.pop(0x02), 0x34)
+        self.assertIsNone(store.pop(0x02))
+        store.clear()
+        self.assertFalse(store)
+        self.assertEqual(store.size, 256)
+
+    def test_copy_and_resize(self):
+        store = MemoryArray(16, 16)
+        store[3] = 0xABCD
+        clone = copy.copy(store)
+        clone[3] = 1
+        self.assertEqual(store[3], 0xABCD)
+
+        narrow = store.resized(8, 8)
+        self.assertEqual((narrow.size, narrow.word_bytes, narrow[3]), (8, 1, 0xCD))
+        self.assertEqual(store.resized(4, 16)[3], 0xABCD)
+
+    def test_block_round_trip(self):
+        store = MemoryArray(1 << 16, 16)
+        for address in range(0, 1 << 16, 251):
+            store[address] = address ^ 0x5A5A
+        block = json.loads(json.dumps(encode_block(store)))
+        self.assertLess(len(block['data']), 64 * 1024)
+
+        restored = MemoryArray(1 << 16, 16)
+        decode_block(block, restored)
+        self.assertEqual(restored, store)
+
+        with self.assertRaises(ValueError):
+            decode_block(dict(block, data="not base64!"), restored)
+
+
+class TestMemoryFiles(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.tmp = self._tmp.name
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def path(self, name: str) -> str:
+        return os.path.join(self.tmp, name)
+
+    def test_formats_round_trip(self):
+        mem = make_memory(16, 16)
+        for address in range(0, 1 << 16, 97):
+            mem.write_memory(address, address * 31 + 7)
+
+        for name, fmt in (("image.mem", 'text'), ("image.bin", 'binary'), ("image.hex", 'intel_hex')):
+            with self.subTest(name=name):
+                self.assertTrue(mem.save_to_file(self.path(name)))
+                self.assertEqual(image_format(self.path(name)), fmt)
+                loaded = make_memory(16, 16)
+                self.assertTrue(loaded.load_from_file(self.path(name)))
+                self.assertEqual(loaded.memory, mem.memory)
+
+    def test_text_file_compatible(self):
+        with open(self.path("old.mem"), "w") as f:
+            f.write("# Address bits: 8\n#\n0000:FF\n0001:A5\n00FF:AA\n")
+        mem = make_memory()
+        self.assertTrue(mem.load_from_file(self.path("old.mem")))
+        self.assertEqual(dict(mem.memory.items()), {0x00: 0xFF, 0x01: 0xA5, 0xFF: 0xAA})
+
+        self.assertTrue(mem.save_to_file(self.path("new.mem")))
+        with open(self.path("new.mem")) as f:
+            lines = [line.strip() for line in f if not line.startswith('#')]
+        self.assertEqual(lines, ["00:FF", "01:A5", "FF:AA"])
+
+    def test_binary_words_little_endian(self):
+        with open(self.path("rom.bin"), "wb") as f:
+            f.write(bytes([0x34, 0x12, 0xFF, 0xFF, 0x01]))  # trailing half word
+        mem = make_memory(3, 12)
+        self.assertTrue(mem.load_from_file(self.path("rom.bin")))
+        self.assertEqual([mem.read_memory(a) for a in range(4)], [0x234, 0xFFF, 0x001, 0])
+
+    def test_intel_hex(self):
+        records = [
+            ":0300300002337A1E",
+            ":020000040000FA",
+            ":00000001FF",
+        ]
+        with open(self.path("prog.txt"), "w") as f:  # detected by content
+            f.write("\n".join(records) + "\n")
+        mem = make_memory()
+        self.assertTrue(mem.load_from_file(self.path("prog.txt")))
+        self.assertEqual(dict(mem.memory.items()), {0x30: 0x02, 0x31: 0x33, 0x32: 0x7A})
+
+        # A bad checksum fails the load and keeps the previous contents
+        with open(self.path("bad.hex"), "w") as f:
+            f.write(":0300300002337A1F\n")
+        self.assertFalse(mem.load_from_file(self.path("bad.hex")))
+        self.assertEqual(mem.read_memory(0x31), 0x33)
+
+    def test_rsim_serialization(self):
+        mem = make_memory(16, 8)
+        mem.write_memory(0xFFFF, 0x42)
+        data = json.loads(json.dumps(mem.to_dict()))
+        self.assertNotIn('memory', data)
+        self.assertEqual(Memory.from_dict(data).memory, mem.memory)
+
+        # Files written before the encoded block still load
+        legacy = {k: v for k, v in data.items() if k != 'memory_image'}
+        legacy['memory'] = {"0": 34, "4": 86}
+        self.assertEqual(dict(Memory.from_dict(legacy).memory.items()), {0: 34, 4: 86})
+
+        mem.properties['is_volatile'] = True
+        self.assertNotIn('memory_image', mem.to_dict())
+
+
+class TestMappedMemory(unittest.TestCase):
+    ADDRESS_BITS = 18
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.image = os.path.join(self._tmp.name, "rom.bin")
+        self.words = array('H', ((a * 40503) & 0xFFFF for a in range(1 << self.ADDRESS_BITS)))
+        with open(self.image, "wb") as f:
+            f.write(self.words.tobytes() if sys.byteorder == 'little' else self._swapped())
+        self.memories = []
+
+    def tearDown(self):
+        for mem in self.memories:
+            if mem.is_mapped:
+                mem.memory.close()
+        self._tmp.cleanup()
+
+    def _swapped(self) -> bytes:
+        words = array('H', self.words)
+        words.byteswap()
+        return words.tobytes()
+
+    def mapped_memory(self, mode: str = 'read_only') -> Memory:
+        mem = make_memory(self.ADDRESS_BITS, 16)
+        mem.properties.update(mapped_image_file=self.image, mapped_image_mode=mode)
+        mem.on_property_changed('mapped_image_file')
+        self.memories.append(mem)
+        return mem
+
+    def test_read_only_image(self):
+        mem = self.mapped_memory()
+        self.assertTrue(mem.is_mapped)
+        self.assertEqual(mem._get_address_bits(), self.ADDRESS_BITS)  # above the 16-bit limit
+        for address in (0, 1, 0x12345, (1 << self.ADDRESS_BITS) - 1):
+            self.assertEqual(mem.read_memory(address), self.words[address])
+
+        mem.write_memory(7, 0)  # ROM: ignored
+        self.assertEqual(mem.read_memory(7), self.words[7])
+        self.assertFalse(mem.load_from_file(self.image))
+
+    def test_copy_on_write_image(self):
+        mem = self.mapped_memory(MAPPED_COPY_ON_WRITE)
+        mem.write_memory(7, 0xBEEF)
+        self.assertEqual(mem.read_memory(7), 0xBEEF)
+        with open(self.image, "rb") as f:
+            f.seek(14)
+            self.assertEqual(int.from_bytes(f.read(2), 'little'), self.words[7])
+
+        mem.clear_memory()  # drops private writes
+        self.assertEqual(mem.read_memory(7), self.words[7])
+
+    def test_short_image_and_narrow_words(self):
+        store = MappedMemory(self.image, 1 << 20, 12)
+        try:
+            self.assertEqual(store.mapped_words, 1 << self.ADDRESS_BITS)
+            self.assertEqual(store.get(3), self.words[3] & 0xFFF)
+            self.assertEqual(store.get(1 << 19), 0)  # past the image
+        finally:
+            store.close()
+
+    def test_rsim_keeps_reference_only(self):
+        mem = self.mapped_memory()
+        data = json.loads(json.dumps(mem.to_dict()))
+        self.assertNotIn('memory_image', data)
+        self.assertEqual(data['mapped_image']['size'], os.path.getsize(self.image))
+
+        loaded = Memory.from_dict(data)
+        self.memories.append(loaded)
+        self.assertFalse(loaded.mapped_image_changed)
+        self.assertEqual(loaded.read_memory(0x2345), self.words[0x2345])
+
+        # A rebuilt image is detected by its hash
+        with open(self.image, "r+b") as f:
+            f.write(b"\xFF\xFF")
+        os.utime(self.image, ns=(0, data['mapped_image']['mtime_ns'] + 1))
+        changed = Memory.from_dict(data)
+        self.memories.append(changed)
+        self.assertTrue(changed.mapped_image_changed)
+
+        # A missing image keeps its reference for the next save
+        for mapped in self.memories:
+            mapped.memory.close()
+        os.remove(self.image)
+        missing = Memory.from_dict(data)
+        self.assertFalse(missing.is_mapped)
+        self.assertEqual(missing.read_memory(3), 0)
+        self.assertEqual(missing.to_dict()['mapped_image'], data['mapped_image'])
+
+
+if __name__ == "__main__":
+    unittest.main()
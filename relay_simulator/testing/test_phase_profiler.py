@@ -0,0 +1,192 @@
+"""
+Test suite for per-phase simulation profiling
+
+Tests PhaseProfiler/PhaseProfile on their own, profiling in the single
+threaded engine (run() and timed runs), switching it at runtime, and the
+threaded engine's profile.
+"""
+
+import sys
+import os
+
+# Add parent directory to path to import relay_simulator
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from core.vnet import VNET
+from core.pin import Pin
+from core.tab import Tab
+from core.state import PinState
+from components.base import Component
+from fileio.document_loader import load_document
+from simulation.phase_profiler import PHASES, PhaseProfiler, PhaseProfile
+from simulation.simulation_engine import SimulationEngine
+from simulation.structure_builder import build_simulation_structures
+from simulation.threaded_simulation_engine import ThreadedSimulationEngine
+
+
+EXAMPLE_PATH = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..', 'examples', 'Example.rsim'))
+
+
+class _Named:
+    def __init__(self, component_id, component_type):
+        self.component_id = component_id
+        self.component_type = component_type
+
+
+class DriverComponent(Component):
+    """Threaded-engine style component that drives its pin HIGH."""
+
+    component_type = "Driver"
+
+    def sim_start(self):
+        pass
+
+    def sim_stop(self):
+        pass
+
+    def simulate_logic(self):
+        for pin in self.pins.values():
+            pin.set_state(PinState.HIGH)
+
+    def render(self, page):
+        pass
+
+
+def _example_engine():
+    vnets, tabs, bridges, components = build_simulation_structures(load_document(EXAMPLE_PATH))
+    for component in components.values():
+        if component.component_type == "Clock":
+            component.properties["enable_on_sim_start"] = True
+    return SimulationEngine(vnets, tabs, bridges, components, realtime=False)
+
+
+def test_profiler_and_profile():
+    """Test accumulation, top-N ordering, snapshot reset and merge."""
+    print("\n=== Testing PhaseProfiler ===")
+
+    profiler = PhaseProfiler(top_n=2)
+    profiler.add("group_eval", 0.5)
+    mark = profiler.lap("group_build", profiler.clock())
+    assert mark > 0.0
+    profiler.record_component(_Named("r1", "Relay"), 0.3)
+    profiler.record_component(_Named("r2", "Relay"), 0.1)
+    profiler.record_component(_Named("i1", "Indicator"), 0.2)
+    profiler.record_component(_Named("r2", "Relay"), 0.3)
+
+    profile = profiler.snapshot()
+    assert set(PHASES) <= set(profile.phase_times)
+    assert profile.phase_times["group_eval"] == 0.5
+    assert profile.component_types["Relay"].calls == 3
+    assert abs(profile.component_types["Relay"].total_time - 0.7) < 1e-9
+    assert [c[0] for c in profile.slowest_components] == ["r2", "r1"]
+    print("✓ Phase times, per-type counts and top-N slowest")
+
+    taken = profiler.snapshot(reset=True)
+    assert taken.component_types["Indicator"].calls == 1
+    assert profiler.snapshot().component_types == {}
+    print("✓ snapshot(reset=True) starts a new profile")
+
+    total = PhaseProfile()
+    total.merge(taken)
+    total.merge(taken)
+    assert total.component_types["Relay"].calls == 6
+    assert total.phase_times["group_eval"] == 1.0
+    assert "Relay" in total.describe() and "slowest_components" in total.to_dict()
+    print("✓ merge(), describe() and to_dict()")
+
+
+def test_engine_profile():
+    """Test that a profiled run accounts for every component call."""
+    print("\n=== Testing Engine Profile ===")
+
+    engine = _example_engine()
+    assert not engine.is_profiling()
+    engine.set_profiling(True, top_n=5)
+    assert engine.initialize()
+
+    stats = engine.run()
+    profile = stats.profile
+    assert stats.stable and profile is not None
+    assert sum(e.calls for e in profile.component_types.values()) == stats.components_updated
+    assert len(profile.slowest_components) == 5
+    for phase in ("group_build", "group_eval", "simulate_logic", "dirty_bookkeeping"):
+        assert profile.phase_times[phase] > 0.0, f"{phase} not timed"
+    assert engine.get_statistics().profile is profile
+    print(f"✓ {stats.components_updated} calls over {len(profile.component_types)} component types")
+
+    result = engine.run_for(2.0)
+    assert result.profile is not None and result.clock_edges > 0
+    assert result.profile.phase_times["callbacks"] > 0.0
+    calls = sum(e.calls for e in result.profile.component_types.values())
+    assert calls == sum(step.components_updated for step in result.steps)
+    print(f"✓ Timed run profile covers {len(result.steps)} settle passes")
+
+    # Switched off at runtime: no profile, no profiler on the hot path
+    engine.set_profiling(False)
+    result = engine.run_for(2.0)
+    assert result.profile is None and engine.get_statistics().profile is None
+    assert engine._profiler is None
+    print("✓ Disabled profiling records nothing")
+
+    engine.shutdown()
+
+
+def test_threaded_engine_profile():
+    """Test the threaded engine's per-phase and per-component timings."""
+    print("\n=== Testing Threaded Engine Profile ===")
+
+    vnets, tabs, components = {}, {}, {}
+    for i in range(4):
+        comp = DriverComponent(f"drv{i}", "page1")
+        pin = Pin(f"drv{i}.out", comp)
+        tab = Tab(f"drv{i}.tab", pin, (0, 0))
+        pin.add_tab(tab)
+        comp.add_pin(pin)
+        vnet = VNET(f"v{i}", "page1")
+        vnet.add_tab(tab.tab_id)
+        vnets[vnet.vnet_id] = vnet
+        tabs[tab.tab_id] = tab
+        components[comp.component_id] = comp
+
+    engine = ThreadedSimulationEngine(vnets, tabs, {}, components, thread_count=2)
+    engine.set_profiling(True)
+    assert engine.is_profiling()
+    assert engine.initialize()
+
+    stats = engine.run()
+    profile = stats.profile
+    assert profile is not None
+    assert profile.component_types["Driver"].calls == stats.components_updated > 0
+    assert profile.phase_times["simulate_logic"] > 0.0
+    assert engine.get_statistics().profile is profile
+    print(f"✓ {stats.components_updated} component calls timed in worker threads")
+
+    engine.shutdown()
+
+
+def run_all_tests():
+    """Run all phase profiler tests."""
+    print("=" * 60)
+    print("PHASE PROFILER TEST SUITE")
+    print("=" * 60)
+
+    try:
+        test_profiler_and_profile()
+        test_engine_profile()
+        test_threaded_engine_profile()
+
+        print("\n" + "=" * 60)
+        print("ALL PHASE PROFILER TESTS PASSED ✓")
+        print("=" * 60)
+        return True
+
+    except AssertionError as e:
+        print(f"\n✗ TEST FAILED: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+
+if __name__ == "__main__":
+    success = run_all_tests()
+    sys.exit(0 if success else 1)
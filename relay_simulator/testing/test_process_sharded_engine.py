@@ -0,0 +1,153 @@
+"""
+Test suite for the process-sharded simulation engine
+
+Tests page partitioning, and that circuits sharded across worker processes
+settle to the same VNET states as with the single-threaded engine.
+"""
+
+import sys
+import os
+
+# Add parent directory to path to import relay_simulator
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from core.state import PinState
+from components.vcc import VCC
+from components.switch import Switch
+from components.dpdt_relay import DPDTRelay
+from fileio.document_loader import load_document
+from simulation.simulation_engine import SimulationEngine
+from simulation.structure_builder import build_simulation_structures
+from simulation.process_sharded_engine import (
+    ProcessShardedSimulationEngine,
+    HOST_SHARD,
+    partition_by_page
+)
+from testing.threaded_engine_benchmark import build_relay_stages, run_scenario
+
+
+EXAMPLE_PATH = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..', 'examples', 'Example.rsim'))
+
+
+def _example_run(create, duration: float):
+    """Run Example.rsim (clocks enabled), reset and run again."""
+    vnets, tabs, bridges, components = build_simulation_structures(load_document(EXAMPLE_PATH))
+    for component in components.values():
+        if component.component_type == "Clock":
+            component.properties["enable_on_sim_start"] = True
+    engine = create(vnets, tabs, bridges, components)
+
+    # VNET IDs are generated per load: key states by each VNET's tabs
+    def keyed(result):
+        return {frozenset(vnet.get_all_tabs()): result.vnet_states[vnet_id]
+                for vnet_id, vnet in vnets.items()}
+
+    assert engine.initialize()
+    first = engine.run_for(duration)
+    assert engine.reset()
+    second = engine.run_for(duration / 2)
+    stats = engine.get_statistics()
+    engine.shutdown()
+    return engine, first, keyed(first), keyed(second), stats
+
+
+def test_partition_by_page():
+    """Test that pages stay whole and inputs stay in the host."""
+    print("\n=== Testing Page Partitioning ===")
+
+    components = {}
+    for page, count in (("A", 6), ("B", 4), ("C", 3), ("D", 1)):
+        for i in range(count):
+            relay = DPDTRelay(f"R{page}{i}", page)
+            components[relay.component_id] = relay
+    for component in (Switch("SW1", "A"), VCC("VCC1", "B")):
+        components[component.component_id] = component
+
+    shard_of = partition_by_page(components, 2)
+    assert shard_of["SW1"] == HOST_SHARD, "Inputs stay in the host"
+    assert shard_of["VCC1"] != HOST_SHARD
+    for page in "ABCD":
+        shards = {shard_of[cid] for cid, c in components.items() if c.page_id == page and cid != "SW1"}
+        assert len(shards) == 1, f"Page {page} split across {shards}"
+    print("✓ Pages are never split; switches stay in the host")
+
+    loads = {}
+    for component_id, shard in shard_of.items():
+        if shard != HOST_SHARD:
+            loads[shard] = loads.get(shard, 0) + 1
+    assert sorted(loads) == [1, 2]
+    assert sorted(loads.values()) == [7, 8], f"Unbalanced shards: {loads}"
+    print(f"✓ Largest page first to the least loaded worker: {loads}")
+
+
+def test_example_matches_single_threaded():
+    """Test timed runs of the example against the single-threaded engine."""
+    print("\n=== Testing Example Equivalence ===")
+
+    _, expected, expected_first, expected_second, _ = _example_run(
+        lambda v, t, b, c: SimulationEngine(v, t, b, c, realtime=False), 2.0)
+    engine, result, first, second, stats = _example_run(
+        lambda v, t, b, c: ProcessShardedSimulationEngine(v, t, b, c, realtime=False, process_count=2), 2.0)
+
+    assert result.stable == expected.stable
+    assert result.clock_edges == expected.clock_edges > 0
+    assert result.events_fired == expected.events_fired
+    assert first == expected_first, "VNET states differ"
+    assert second == expected_second, "VNET states differ after reset()"
+    print(f"✓ {len(first)} VNETs identical after {result.clock_edges} clock edges and after reset()")
+
+    assert stats.boundary_messages > 0 and stats.boundary_pin_updates > 0
+    print(f"✓ {stats.boundary_messages} boundary messages, {stats.boundary_vnet_updates} VNET updates")
+
+
+def test_relays_across_pages():
+    """Test relays in worker processes switching bridges across 40 pages."""
+    print("\n=== Testing Relays Across Pages ===")
+
+    vnets, tabs, bridges, components = build_relay_stages(120, page_count=40)
+    _, expected = run_scenario(SimulationEngine(vnets, tabs, bridges, components, realtime=False), components)
+
+    vnets, tabs, bridges, components = build_relay_stages(120, page_count=40)
+    engine = ProcessShardedSimulationEngine(vnets, tabs, bridges, components, realtime=False, process_count=3)
+    _, states = run_scenario(engine, components)
+
+    assert states == expected, "VNET states differ"
+    assert states["V00000.no"] == PinState.HIGH.value and states["V00000.nc"] == PinState.FLOAT.value
+    sizes = engine.get_shard_sizes()
+    assert sorted(sizes) == [0, 1, 2, 3]
+    print(f"✓ {len(states)} VNETs identical; shard sizes {sizes}")
+
+    assert not engine._workers, "Workers stopped at shutdown"
+    print("✓ Worker processes stopped at shutdown()")
+
+
+def run_all_tests():
+    """Run all process-sharded engine tests."""
+    print("=" * 60)
+    print("PROCESS-SHARDED ENGINE TEST SUITE")
+    print("=" * 60)
+
+    if not ProcessShardedSimulationEngine.is_supported():
+        print("Skipped: worker processes need the 'fork' start method")
+        return True
+
+    try:
+        test_partition_by_page()
+        test_example_matches_single_threaded()
+        test_relays_across_pages()
+
+        print("\n" + "=" * 60)
+        print("ALL PROCESS-SHARDED ENGINE TESTS PASSED ✓")
+        print("=" * 60)
+        return True
+
+    except AssertionError as e:
+        print(f"\n✗ TEST FAILED: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+
+if __name__ == "__main__":
+    success = run_all_tests()
+    sys.exit(0 if success else 1)
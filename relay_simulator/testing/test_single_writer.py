@@ -0,0 +1,171 @@
+"""
+Test suite for the single-writer engine mode
+
+Tests that SimulationEngine drops per-object locks while it owns the
+circuit, publishes snapshots for other threads, and serializes external
+updates through its run lock.
+"""
+
+import sys
+import os
+import threading
+
+# Add parent directory to path to import relay_simulator
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from core.locking import NULL_LOCK
+from core.state import PinState
+from fileio.document_loader import load_document
+from simulation.simulation_engine import SimulationEngine, SimulationState
+from simulation.structure_builder import build_simulation_structures
+
+
+EXAMPLE_PATH = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..', 'examples', 'Example.rsim'))
+
+
+def _example_engine(**kwargs):
+    vnets, tabs, bridges, components = build_simulation_structures(load_document(EXAMPLE_PATH))
+    return SimulationEngine(vnets, tabs, bridges, components, realtime=False, **kwargs)
+
+
+def _first_switch(engine):
+    for component in engine.components.values():
+        if component.component_type == "Switch":
+            return component
+    raise AssertionError("Example should contain a switch")
+
+
+def _toggle(engine, switch):
+    def update():
+        switch.set_state(not switch._is_on)
+        switch.simulate_logic(engine.vnet_manager, engine.bridge_manager)
+    return update
+
+
+def test_lock_ownership():
+    """Test that locks are dropped while the engine owns the circuit."""
+    print("\n=== Testing Lock Ownership ===")
+
+    engine = _example_engine()
+    vnet = next(iter(engine.vnets.values()))
+    assert vnet._lock is not NULL_LOCK
+
+    assert engine.initialize()
+    assert vnet._lock is NULL_LOCK
+    assert engine.dirty_manager._lock is NULL_LOCK
+    assert engine.coordinator._lock is NULL_LOCK
+    assert engine.connectivity._lock is NULL_LOCK
+    print("✓ VNETs and managers use no lock after initialize()")
+
+    assert engine.run().stable
+    engine.shutdown()
+    assert vnet._lock is not NULL_LOCK
+    assert engine.dirty_manager._lock is not NULL_LOCK
+    print("✓ Locks restored at shutdown()")
+
+    locked = _example_engine(single_writer=False)
+    assert locked.initialize()
+    assert next(iter(locked.vnets.values()))._lock is not NULL_LOCK
+    assert locked.run().stable
+    locked.shutdown()
+    print("✓ single_writer=False keeps per-object locks")
+
+
+def test_published_snapshot():
+    """Test that snapshots match the engine state after each run."""
+    print("\n=== Testing Published Snapshot ===")
+
+    engine = _example_engine()
+    assert engine.get_snapshot() is None
+    assert engine.initialize()
+    first = engine.get_snapshot()
+    assert first is not None and first.state == SimulationState.STOPPED
+
+    stats = engine.run()
+    snapshot = engine.get_snapshot()
+    assert snapshot.version > first.version
+    assert snapshot.state == SimulationState.STABLE
+    assert snapshot.statistics.iterations == stats.iterations
+    for vnet_id, vnet in engine.vnets.items():
+        assert snapshot.is_vnet_high(vnet_id) == (vnet.state == PinState.HIGH)
+    for tab_id in engine.tabs:
+        vnet = engine.vnet_manager.get_vnet_for_tab(tab_id)
+        if vnet is not None:
+            assert snapshot.is_tab_high(tab_id) == (vnet.state == PinState.HIGH)
+    assert not snapshot.is_tab_high("no-such-tab")
+    print(f"✓ Snapshot v{snapshot.version} matches {len(engine.vnets)} VNETs")
+
+    # Snapshots are immutable copies: a later run does not change them
+    switch = _first_switch(engine)
+    engine.apply_external_update(_toggle(engine, switch))
+    engine.run()
+    assert engine.get_snapshot().vnet_high != snapshot.vnet_high
+    print("✓ Earlier snapshot unchanged by later runs")
+
+    engine.shutdown()
+
+
+def test_external_updates():
+    """Test immediate and queued external updates."""
+    print("\n=== Testing External Updates ===")
+
+    engine = _example_engine()
+    assert engine.initialize()
+    engine.run()
+    switch = _first_switch(engine)
+    was_on = switch._is_on
+
+    assert engine.apply_external_update(_toggle(engine, switch)) is True
+    assert switch._is_on != was_on
+    print("✓ Applied immediately when no run holds the lock")
+
+    # Another thread holds the run lock (as a run in progress would)
+    holding = threading.Event()
+    release = threading.Event()
+
+    def hold():
+        with engine.run_lock:
+            holding.set()
+            release.wait(5.0)
+
+    holder = threading.Thread(target=hold)
+    holder.start()
+    holding.wait(5.0)
+    assert engine.apply_external_update(_toggle(engine, switch)) is False
+    assert switch._is_on != was_on, "Queued update must not run yet"
+    release.set()
+    holder.join()
+
+    stats = engine.run()
+    assert stats.stable and switch._is_on == was_on
+    print("✓ Queued while the lock is held, applied by the next run()")
+
+    engine.shutdown()
+
+
+def run_all_tests():
+    """Run all single-writer tests."""
+    print("=" * 60)
+    print("SINGLE-WRITER ENGINE TEST SUITE")
+    print("=" * 60)
+
+    try:
+        test_lock_ownership()
+        test_published_snapshot()
+        test_external_updates()
+
+        print("\n" + "=" * 60)
+        print("ALL SINGLE-WRITER TESTS PASSED ✓")
+        print("=" * 60)
+        return True
+
+    except AssertionError as e:
+        print(f"\n✗ TEST FAILED: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+
+if __name__ == "__main__":
+    success = run_all_tests()
+    sys.exit(0 if success else 1)
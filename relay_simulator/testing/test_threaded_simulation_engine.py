@@ -522,6 +522,68 @@ def test_no_deadlock():
     print()
 
 
+def test_sharded_matches_single_threaded():
+    """Test that sharded evaluation gives the single-threaded engine's results."""
+    print("Test 10: Sharded engine matches single-threaded engine")
+    
+    from fileio.document_loader import load_document
+    from simulation.simulation_engine import SimulationEngine
+    from simulation.structure_builder import build_simulation_structures
+    
+    example = Path(__file__).parent.parent.parent / 'examples' / 'Example.rsim'
+    
+    def timed_run(create):
+        vnets, tabs, bridges, components = build_simulation_structures(load_document(str(example)))
+        for component in components.values():
+            if component.component_type == "Clock":
+                component.properties["enable_on_sim_start"] = True
+        engine = create(vnets, tabs, bridges, components)
+        assert engine.initialize()
+        result = engine.run_for(2.0)
+        engine.shutdown()
+        # VNET IDs are generated per load: key states by each VNET's tabs
+        states = {frozenset(vnet.get_all_tabs()): result.vnet_states[vnet_id]
+                  for vnet_id, vnet in vnets.items()}
+        return engine, result, states
+    
+    _, expected, expected_states = timed_run(lambda v, t, b, c: SimulationEngine(v, t, b, c, realtime=False))
+    # One item per shard forces every phase through the pool
+    engine, result, states = timed_run(lambda v, t, b, c: ThreadedSimulationEngine(
+        v, t, b, c, realtime=False, thread_count=4, min_shard_size=1))
+    
+    assert result.stable == expected.stable
+    assert result.clock_edges == expected.clock_edges > 0
+    assert states == expected_states, "VNET states differ"
+    stats = engine.get_statistics()
+    assert stats.shards_dispatched > 0, "Phases should have run on the pool"
+    assert stats.component_errors == 0
+    
+    print(f"  ✓ {len(states)} VNETs identical after {result.clock_edges} clock edges")
+    print(f"  ✓ {stats.shards_dispatched} shards dispatched to the pool")
+    print()
+
+
+def test_shard_partition():
+    """Test shard sizing and order-preserving partitioning."""
+    print("Test 11: Shard partitioning")
+    
+    comp = MockComponent('comp1', 'page1')
+    engine = ThreadedSimulationEngine({}, {}, {}, {'comp1': comp}, thread_count=4, min_shard_size=10)
+    
+    assert engine._shard_count(5) == 1, "Small phases run inline"
+    assert engine._shard_count(25) == 2
+    assert engine._shard_count(1000) == 4, "At most one shard per thread"
+    
+    items = list(range(10))
+    shards = engine._partition(items, 3)
+    assert [len(shard) for shard in shards] == [4, 3, 3]
+    assert [item for shard in shards for item in shard] == items, "Order preserved"
+    
+    print("  ✓ Shard count bounded by thread count and min_shard_size")
+    print("  ✓ Partitions are contiguous and order-preserving")
+    print()
+
+
 def run_all_tests():
     """Run all test functions."""
     print("=" * 60)
@@ -538,6 +600,8 @@ def run_all_tests():
     test_shutdown_with_threads()
     test_statistics_tracking()
     test_no_deadlock()
+    test_sharded_matches_single_threaded()
+    test_shard_partition()
     
     print("=" * 60)
     print("ALL TESTS PASSED! ✓")
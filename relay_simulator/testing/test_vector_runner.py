@@ -0,0 +1,110 @@
+"""
+Test suite for the process-pool vector runner
+
+Tests that per-vector engine resets make vectors independent, that the
+process pool returns the same results as an in-process run, and JSONL
+streaming and error reporting.
+"""
+
+import sys
+import os
+import io
+import json
+
+# Add parent directory to path to import relay_simulator
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from simulation.vector_runner import (
+    VectorWorker, run_vectors, read_vectors_jsonl, write_results_jsonl
+)
+from simulation.stimulus import exhaustive_vectors
+
+
+EXAMPLE_PATH = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..', 'examples', 'Example.rsim'))
+
+
+def _memory_page_inputs(worker):
+    """Switch inputs on the Example's Memory page (ENABLE/READ/WRITE)."""
+    return [key for key in ("ENABLE", "READ", "WRITE") if key in worker.input_index]
+
+
+def _strip(result):
+    return {k: v for k, v in result.items() if k != "wall_time"}
+
+
+def test_reset_between_vectors():
+    """Test that a vector's result does not depend on earlier vectors."""
+    print("\n=== Testing Reset Between Vectors ===")
+
+    worker = VectorWorker(EXAMPLE_PATH)
+    keys = _memory_page_inputs(worker)
+    assert keys, "Example Memory page should have labelled switches"
+    vectors = exhaustive_vectors(worker.input_index, keys)
+
+    sequential = [worker.run_vector(i, {"inputs": v}) for i, v in enumerate(vectors)]
+    assert all("error" not in r and r["stable"] for r in sequential)
+
+    for index in (0, len(vectors) // 2, len(vectors) - 1):
+        fresh = VectorWorker(EXAMPLE_PATH).run_vector(index, {"inputs": vectors[index]})
+        assert _strip(fresh) == _strip(sequential[index]), f"Vector {index} depends on history"
+    print(f"✓ {len(vectors)} vectors match fresh single-vector runs")
+
+
+def test_pool_matches_in_process():
+    """Test that the process pool yields the same results, in order."""
+    print("\n=== Testing Process Pool ===")
+
+    worker = VectorWorker(EXAMPLE_PATH)
+    vectors = [{"id": f"v{i}", "inputs": v}
+               for i, v in enumerate(exhaustive_vectors(worker.input_index, _memory_page_inputs(worker)))]
+
+    serial = list(run_vectors(EXAMPLE_PATH, vectors, workers=1))
+    pooled = list(run_vectors(EXAMPLE_PATH, vectors, workers=2, chunksize=2))
+    assert [r["id"] for r in pooled] == [v["id"] for v in vectors]
+    assert [_strip(r) for r in pooled] == [_strip(r) for r in serial]
+    print(f"✓ {len(pooled)} results identical across 2 workers")
+
+
+def test_jsonl_and_errors():
+    """Test JSONL round trip and per-vector error reporting."""
+    print("\n=== Testing JSONL Streaming ===")
+
+    source = io.StringIO('{"inputs": {}}\n\n{"no-such-switch": true}\n{"inputs": {}, "time": 0.25}\n')
+    out = io.StringIO()
+    count = write_results_jsonl(run_vectors(EXAMPLE_PATH, read_vectors_jsonl(source), workers=1), out)
+    assert count == 3
+
+    lines = [json.loads(line) for line in out.getvalue().splitlines()]
+    assert [r["index"] for r in lines] == [0, 1, 2]
+    assert lines[0]["stable"] and "indicators" in lines[0] and "buses" in lines[0]
+    assert "KeyError" in lines[1]["error"]
+    assert abs(lines[2]["sim_time"] - 0.25) < 1e-9
+    print("✓ One JSON line per vector, errors reported inline")
+
+
+def run_all_tests():
+    """Run all vector runner tests."""
+    print("=" * 60)
+    print("VECTOR RUNNER TEST SUITE")
+    print("=" * 60)
+
+    try:
+        test_reset_between_vectors()
+        test_pool_matches_in_process()
+        test_jsonl_and_errors()
+
+        print("\n" + "=" * 60)
+        print("ALL VECTOR RUNNER TESTS PASSED ✓")
+        print("=" * 60)
+        return True
+
+    except AssertionError as e:
+        print(f"\n✗ TEST FAILED: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+
+if __name__ == "__main__":
+    success = run_all_tests()
+    sys.exit(0 if success else 1)
@@ -12,6 +12,7 @@ import os
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
 from core.vnet_builder import VnetBuilder, VnetBuilderStats
+from core.incremental_vnet_builder import IncrementalVnetBuilder
 from core.page import Page
 from core.wire import Wire, Junction, Waypoint
 from core.pin import Pin
@@ -488,6 +489,101 @@ def test_component_with_multiple_pins():
     print("✓ Component with multiple pins tests passed")
 
 
+def test_large_bus_nets():
+    """Test bus nets with many taps against the pairwise reference."""
+    print("\n=== Testing Large Bus Nets ===")
+    
+    from testing.vnet_builder_benchmark import build_bus_page, pairwise_vnet_tab_sets
+    
+    for nested in (True, False):
+        page = build_bus_page(6, 40, nested)
+        vnets = VnetBuilder().build_vnets_for_page(page)
+        
+        assert len(vnets) == 6, f"Expected 6 VNETs, got {len(vnets)}"
+        built = sorted(sorted(vnet.get_all_tabs()) for vnet in vnets)
+        assert built == sorted(sorted(tabs) for tabs in pairwise_vnet_tab_sets(page))
+        if not nested:
+            assert all(vnet.has_tab(f"N{i:04d}J039") for i, vnet in enumerate(
+                sorted(vnets, key=lambda v: min(v.get_all_tabs())))), "Junction endpoints are kept"
+        layout = "nested junction" if nested else "chained junction-ID"
+        print(f"✓ {layout} bus nets (41 tabs each) match pairwise connectivity")
+    
+    print("✓ Large bus net tests passed")
+
+
+def test_incremental_builder():
+    """Test that edit-time updates match a full build and keep VNET IDs."""
+    print("\n=== Testing Incremental VNET Builder ===")
+    
+    from testing.vnet_builder_benchmark import build_bus_page
+    from components.indicator import Indicator
+    
+    def tab_sets(vnets):
+        return sorted(sorted(vnet.get_all_tabs()) for vnet in vnets)
+    
+    def ids_by_tab(vnets):
+        return {tab_id: vnet.vnet_id for vnet in vnets for tab_id in vnet.get_all_tabs()}
+    
+    page = build_bus_page(4, 8, nested=False)
+    builder = IncrementalVnetBuilder()
+    first = builder.build_vnets_for_page(page)
+    assert tab_sets(first) == tab_sets(VnetBuilder().build_vnets_for_page(page))
+    assert builder.last_rebuilt_nets == 4
+    
+    # Unedited page reuses every net
+    again = builder.build_vnets_for_page(page)
+    assert ids_by_tab(again) == ids_by_tab(first)
+    assert builder.last_rebuilt_nets == 0 and builder.last_reused_nets == 4
+    assert all(a is not b for a, b in zip(first, again)), "Fresh VNET objects per build"
+    assert page.connectivity_changes == set()
+    print("✓ Unedited page reuses all nets")
+    
+    # Split net 0 by removing a bus wire, bridge nets 1 and 2 with a new wire
+    page.remove_wire("N0000B004")
+    page.add_wire(Wire("BRIDGE", "N0001J000", "N0002J000"))
+    assert page.connectivity_changes == {('wire', "N0000B004"), ('wire', "BRIDGE")}
+    edited = builder.build_vnets_for_page(page)
+    assert tab_sets(edited) == tab_sets(VnetBuilder().build_vnets_for_page(page))
+    assert len(edited) == 4
+    ids = ids_by_tab(edited)
+    before = ids_by_tab(first)
+    net3 = [tab for tab in before if tab.startswith("N0003")]
+    assert all(ids[tab] == before[tab] for tab in net3), "Untouched net keeps its ID"
+    assert builder.last_reused_nets == 1
+    print(f"✓ Split and merged nets match a full build ({builder.last_rebuilt_nets} rebuilt)")
+    
+    # Retarget a wire in place and add a component
+    page.wires["N0003S007"].end_tab_id = "N0003J000"
+    page.mark_wire_changed("N0003S007")
+    lamp = Indicator("LAMP", "PAGE1")
+    page.add_component(lamp)
+    edited = builder.build_vnets_for_page(page)
+    assert tab_sets(edited) == tab_sets(VnetBuilder().build_vnets_for_page(page))
+    lamp_tabs = set(next(iter(lamp.get_all_pins().values())).tabs)
+    lamp_tab = next(iter(lamp_tabs))
+    assert builder.get_net_tabs(page, lamp_tab) == lamp_tabs
+    driver_tab = next(tab for tab in ids_by_tab(edited) if tab.startswith("N0003D"))
+    assert "N0003J000" in builder.get_net_tabs(page, driver_tab)
+    print("✓ In-place wire edits and new components are picked up")
+    
+    # Link names edited in place are picked up once marked
+    lamp.link_name = "LAMP_LINK"
+    page.mark_component_changed("LAMP")
+    [(component_id, page_id, tab_ids)] = builder.get_link_map([page])["LAMP_LINK"]
+    assert (component_id, page_id, set(tab_ids)) == ("LAMP", page.page_id, lamp_tabs)
+    print("✓ Link map follows marked component edits")
+    
+    # Removing the component drops its net
+    page.remove_component("LAMP")
+    edited = builder.build_vnets_for_page(page)
+    assert tab_sets(edited) == tab_sets(VnetBuilder().build_vnets_for_page(page))
+    assert builder.get_net_tabs(page, lamp_tab) == set()
+    assert builder.get_link_map([page]) == {}
+    print("✓ Removed component's net is dropped")
+    
+    print("✓ Incremental VNET builder tests passed")
+
+
 def run_all_tests():
     """Run all VNET Builder tests."""
     print("=" * 60)
@@ -506,17 +602,18 @@ def run_all_tests():
         test_mixed_connected_disconnected()
         test_vnet_builder_stats()
         test_empty_page()
+        test_large_bus_nets()
+        test_incremental_builder()
         test_component_with_multiple_pins()
         
         print("\n" + "=" * 60)
         print("✓ ALL VNET BUILDER TESTS PASSED")
         print("=" * 60)
         print("\nSection 2.3 VNET Builder Algorithm Requirements:")
-        print("✓ Implement graph traversal algorithm")
-        print("  ✓ Start from unprocessed tab")
-        print("  ✓ Follow wire to connected tabs")
+        print("✓ Implement connectivity algorithm")
+        print("  ✓ Union tabs of each pin")
+        print("  ✓ Union wire endpoints with connected tabs")
         print("  ✓ Handle junctions (multiple branches)")
-        print("  ✓ Mark tabs as processed")
         print("  ✓ Create VNET with all connected tabs")
         print("✓ Handle edge cases")
         print("  ✓ Disconnected tabs (single-tab VNETs)")
@@ -526,8 +623,9 @@ def run_all_tests():
         print("  ✓ Empty pages")
         print("✓ Optimize for performance")
         print("  ✓ Efficient data structures (sets, dicts)")
-        print("  ✓ Avoid redundant processing (processed_tabs)")
-        print("  ✓ Depth-first search algorithm")
+        print("  ✓ Avoid redundant processing (visited wires)")
+        print("  ✓ Union-find over tabs and junction IDs")
+        print("  ✓ Incremental rebuild of edited nets only")
         print("✓ Create VnetBuilder class/module")
         print("  ✓ build_vnets_for_page(page) - Main entry point")
         print("  ✓ Returns collection of VNETs")
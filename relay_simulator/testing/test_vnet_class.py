@@ -573,6 +573,31 @@ def test_vnet_repr():
     print("✓ VNET repr tests passed")
 
 
+def test_vnet_compact_layout():
+    """Test slots, lazily allocated link/bridge sets and shared locks."""
+    print("\n=== Testing Compact VNET Layout ===")
+    
+    vnet = VNET("vnet001", "page001")
+    assert not hasattr(vnet, '__dict__')
+    assert vnet._link_names is None and vnet._bridge_ids is None
+    assert len(vnet.link_names) == 0 and list(vnet.bridge_ids) == []
+    print("✓ No per-instance dict, link/bridge sets not allocated")
+    
+    vnet.add_link("CLK")
+    vnet.add_bridge("bridge001")
+    assert vnet.link_names == {"CLK"} and vnet.bridge_ids == {"bridge001"}
+    vnet.remove_link("CLK")
+    vnet.remove_bridge("bridge001")
+    assert vnet._link_names is None and vnet._bridge_ids is None
+    print("✓ Sets allocated on first add, released when emptied")
+    
+    vnets = [VNET(f"v{i}") for i in range(200)]
+    assert len({id(v._lock) for v in vnets}) < len(vnets)
+    print("✓ VNETs share striped locks")
+    
+    print("✓ Compact VNET layout tests passed")
+
+
 def run_all_tests():
     """Run all VNET tests."""
     print("=" * 60)
@@ -598,6 +623,7 @@ def run_all_tests():
         test_vnet_thread_safety_tabs()
         test_vnet_thread_safety_dirty()
         test_vnet_repr()
+        test_vnet_compact_layout()
         
         print("\n" + "=" * 60)
         print("✓ ALL VNET TESTS PASSED")
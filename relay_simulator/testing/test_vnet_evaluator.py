@@ -13,6 +13,7 @@ Tests cover:
 6. Circular link detection
 7. Circular bridge detection
 8. Multiple VNET batch evaluation
+9. Link index shared with the VnetManager
 """
 
 import sys
@@ -26,6 +27,8 @@ from core.pin import Pin
 from components.base import Component
 from core.bridge import Bridge, BridgeManager
 from simulation.vnet_evaluator import VnetEvaluator
+from simulation.vnet_manager import VnetManager, build_link_index
+from simulation.dirty_flag_manager import DirtyFlagManager
 
 
 # Mock component for testing
@@ -511,6 +514,47 @@ def test_evaluator_get_connected_vnets():
     print()
 
 
+def test_evaluator_shared_link_index():
+    """Test a long link chain through the index shared with VnetManager."""
+    print("Test 10: Shared link index (long link chain)")
+    
+    # vnet i carries LINK_i and LINK_{i+1}: a chain of 400 linked VNETs
+    count = 400
+    component = MockComponent("comp001", "page001")
+    all_vnets, all_tabs = {}, {}
+    for i in range(count):
+        pin = Pin(pin_id=f"pin{i:03d}", parent_component=component)
+        tab = Tab(tab_id=f"tab{i:03d}", parent_pin=pin, relative_position=(0, 0))
+        pin.add_tab(tab)
+        vnet = VNET(vnet_id=f"vnet{i:03d}", page_id="page001")
+        vnet.add_tab(tab.tab_id)
+        vnet.add_link(f"LINK_{i}")
+        vnet.add_link(f"LINK_{i + 1}")
+        all_vnets[vnet.vnet_id] = vnet
+        all_tabs[tab.tab_id] = tab
+    all_tabs[f"tab{count - 1:03d}"].parent_pin.set_state(PinState.HIGH)
+    
+    link_index = build_link_index(all_vnets.values())
+    assert len(link_index) == count + 1
+    assert [v.vnet_id for v in link_index["LINK_1"]] == ["vnet000", "vnet001"]
+    
+    evaluator = VnetEvaluator(all_vnets, all_tabs, {}, link_index)
+    assert evaluator.link_index is link_index
+    assert evaluator.evaluate_vnet_state(all_vnets["vnet000"]) == PinState.HIGH, \
+        "HIGH at the end of the chain should reach the first VNET"
+    assert len(evaluator.get_all_connected_vnets(all_vnets["vnet000"])) == count
+    print(f"  ✓ HIGH propagates along {count} linked VNETs")
+    
+    manager = VnetManager(all_vnets, all_tabs, DirtyFlagManager(all_vnets), link_index)
+    assert manager.get_vnets_for_link("LINK_0") == (all_vnets["vnet000"],)
+    assert manager.get_vnets_for_link("MISSING") == ()
+    assert manager.get_vnet_for_pin("pin007") is all_vnets["vnet007"]
+    all_vnets["vnet005"].state = PinState.HIGH
+    assert manager.is_link_high("LINK_6") and not manager.is_link_high("LINK_8")
+    print("  ✓ VnetManager link and pin lookups")
+    print()
+
+
 def run_all_tests():
     """Run all VNET evaluator tests."""
     print("=" * 60)
@@ -528,6 +572,7 @@ def run_all_tests():
         test_evaluator_circular_bridges,
         test_evaluator_batch_evaluation,
         test_evaluator_get_connected_vnets,
+        test_evaluator_shared_link_index,
     ]
     
     passed = 0
@@ -562,6 +607,7 @@ def run_all_tests():
         print("  ✓ Include in OR evaluation")
         print("  ✓ Circular link/bridge detection")
         print("  ✓ Batch evaluation support")
+        print("  ✓ Link index shared with VnetManager")
         return 0
     else:
         print(f"\n✗ {failed} test(s) FAILED")
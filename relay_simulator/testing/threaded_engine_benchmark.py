@@ -0,0 +1,202 @@
+"""
+Threaded Engine Benchmark
+
+Compares the sharded ThreadedSimulationEngine (and, where processes can
+be forked, the page-sharded ProcessShardedSimulationEngine) with the
+single-threaded SimulationEngine on a generated relay circuit above the
+factory's EngineConfig.auto_threshold (the size at which AUTO mode picks
+the threaded engine).
+
+Each stage is VCC -> relay COM1, Switch -> relay coil, NO1 and NC1 each
+driving an Indicator (5 components per stage), spread over PAGE_COUNT
+pages. The scenario settles the
+circuit, switches every stage on and settles again once all relays have
+transferred, so both group evaluation and component execution are wide.
+Final VNET states of every engine are checked against the single-threaded
+result.
+
+Usage:
+    python testing/threaded_engine_benchmark.py [component_count] [runs]
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import time
+from typing import Callable, Dict, List, Tuple
+
+from core.vnet import VNET
+from components.vcc import VCC
+from components.switch import Switch
+from components.dpdt_relay import DPDTRelay
+from components.indicator import Indicator
+from simulation.engine_factory import SimulationEngineFactory
+from simulation.simulation_engine import SimulationEngine
+from simulation.threaded_simulation_engine import ThreadedSimulationEngine
+from simulation.process_sharded_engine import ProcessShardedSimulationEngine
+
+
+COMPONENTS_PER_STAGE = 5
+PAGE_COUNT = 40
+
+
+def build_relay_stages(stage_count: int, page_count: int = 1) -> Tuple[Dict, Dict, Dict, Dict]:
+    """
+    Build independent relay stages.
+
+    Args:
+        stage_count: Number of stages (5 components each)
+        page_count: Number of pages the stages are spread over
+
+    Returns:
+        Tuple of (vnets, tabs, bridges, components)
+    """
+    vnets, tabs, components = {}, {}, {}
+
+    def connect(vnet_id: str, page_id: str, *pins):
+        vnet = VNET(vnet_id, page_id)
+        for pin in pins:
+            for tab in pin.tabs.values():
+                vnet.add_tab(tab.tab_id)
+                tabs[tab.tab_id] = tab
+        vnets[vnet_id] = vnet
+
+    def only_pin(component):
+        return next(iter(component.pins.values()))
+
+    for i in range(stage_count):
+        page_id = f"PAGE{i % page_count + 1}"
+        vcc = VCC(f"VCC{i:05d}", page_id)
+        switch = Switch(f"SW{i:05d}", page_id)
+        relay = DPDTRelay(f"RLY{i:05d}", page_id)
+        lamp_no = Indicator(f"LNO{i:05d}", page_id)
+        lamp_nc = Indicator(f"LNC{i:05d}", page_id)
+        for component in (vcc, switch, relay, lamp_no, lamp_nc):
+            components[component.component_id] = component
+
+        connect(f"V{i:05d}.pwr", page_id, only_pin(vcc), relay.get_pin_by_name("COM1"))
+        connect(f"V{i:05d}.coil", page_id, only_pin(switch), relay.get_pin_by_name("COIL"))
+        connect(f"V{i:05d}.no", page_id, relay.get_pin_by_name("NO1"), only_pin(lamp_no))
+        connect(f"V{i:05d}.nc", page_id, relay.get_pin_by_name("NC1"), only_pin(lamp_nc))
+
+    return vnets, tabs, {}, components
+
+
+def run_scenario(engine: SimulationEngine, components: Dict) -> Tuple[float, Dict[str, str]]:
+    """
+    Settle, switch every stage on, and settle again after the relays transfer.
+
+    Only the settle passes (run()) are timed: initialize() and firing the
+    relay transfer events are the same serial code in every engine.
+
+    Returns:
+        Tuple of (settle wall seconds, final VNET states)
+    """
+    assert engine.initialize()
+    switches = [c for c in components.values() if c.component_type == "Switch"]
+
+    def switch_all_on():
+        for switch in switches:
+            switch.interact("toggle")
+            switch.simulate_logic(engine.vnet_manager, engine.bridge_manager)
+
+    elapsed = 0.0
+    for step in range(3):
+        if step == 1:
+            engine.apply_external_update(switch_all_on)
+        elif step == 2:
+            assert engine.process_next_event(), "Relays should have scheduled a transfer"
+        began = time.perf_counter()
+        stats = engine.run()
+        elapsed += time.perf_counter() - began
+        assert stats.stable, f"Settle pass {step} did not reach stability"
+
+    states = {vnet_id: vnet.state.value for vnet_id, vnet in engine.vnets.items()}
+    engine.shutdown()
+    return elapsed, states
+
+
+def run_benchmark(
+    component_count: int,
+    thread_counts: List[int],
+    runs: int = 3
+) -> List[Tuple[str, float]]:
+    """
+    Time the single-threaded and threaded engines on the same circuit.
+
+    Args:
+        component_count: Approximate number of components to generate
+        thread_counts: Worker counts to try for the threaded and
+                       multi-process engines
+        runs: Runs per engine (best time is reported)
+
+    Returns:
+        List of (engine label, best seconds); single-threaded first
+    """
+    stage_count = max(1, component_count // COMPONENTS_PER_STAGE)
+
+    engines: List[Tuple[str, Callable]] = [
+        ("single", lambda v, t, b, c: SimulationEngine(v, t, b, c, realtime=False))
+    ]
+    for thread_count in thread_counts:
+        engines.append((
+            f"threaded x{thread_count}",
+            lambda v, t, b, c, n=thread_count: ThreadedSimulationEngine(
+                v, t, b, c, realtime=False, thread_count=n
+            )
+        ))
+    if ProcessShardedSimulationEngine.is_supported():
+        for process_count in thread_counts:
+            engines.append((
+                f"process x{process_count}",
+                lambda v, t, b, c, n=process_count: ProcessShardedSimulationEngine(
+                    v, t, b, c, realtime=False, process_count=n
+                )
+            ))
+
+    results = []
+    reference = None
+    for label, create in engines:
+        best = float("inf")
+        for _ in range(runs):
+            vnets, tabs, bridges, components = build_relay_stages(stage_count, PAGE_COUNT)
+            elapsed, states = run_scenario(create(vnets, tabs, bridges, components), components)
+            if reference is None:
+                reference = states
+            assert states == reference, f"{label} final VNET states differ from single-threaded"
+            best = min(best, elapsed)
+        results.append((label, best))
+    return results
+
+
+def gil_enabled() -> bool:
+    """Check whether this interpreter serializes Python threads with a GIL."""
+    check = getattr(sys, "_is_gil_enabled", None)
+    return True if check is None else check()
+
+
+def main():
+    """Run the benchmark and print a report."""
+    threshold = SimulationEngineFactory.DEFAULT_CONFIG.auto_threshold
+    component_count = int(sys.argv[1]) if len(sys.argv) > 1 else 2 * threshold
+    runs = int(sys.argv[2]) if len(sys.argv) > 2 else 3
+    cpus = os.cpu_count() or 1
+    thread_counts = sorted({2, 4, min(cpus, 8)})
+
+    print("=" * 60)
+    print(f"ENGINE BENCHMARK ({component_count} components, {PAGE_COUNT} pages, "
+          f"auto_threshold={threshold})")
+    print(f"CPUs: {cpus}, GIL: {'enabled' if gil_enabled() else 'disabled'}")
+    print("=" * 60)
+
+    results = run_benchmark(component_count, thread_counts, runs)
+    single = results[0][1]
+    print(f"{'Engine':<16}{'Best time':>12}{'Speedup':>10}")
+    for label, seconds in results:
+        print(f"{label:<16}{seconds * 1000:>9.1f} ms{single / seconds:>9.2f}x")
+    print("Final VNET states identical for all engines ✓")
+
+
+if __name__ == "__main__":
+    main()
@@ -192,20 +192,15 @@ class InstrumentedThreadedEngine(ThreadedSimulationEngine):
         super().__init__(*args, **kwargs)
         self.profiler = profiler
     
-    def _evaluate_vnet_task(self, vnet: VNET) -> tuple:
-        """Instrumented VNET evaluation."""
+    def _evaluate_group_shard(self, groups):
+        """Instrumented group evaluation shard."""
         with self.profiler.measure('vnet_evaluation'):
-            return super()._evaluate_vnet_task(vnet)
+            return super()._evaluate_group_shard(groups)
     
-    def _propagate_vnet_task(self, vnet: VNET, new_state):
-        """Instrumented state propagation."""
-        with self.profiler.measure('state_propagation'):
-            return super()._propagate_vnet_task(vnet, new_state)
-    
-    def _execute_component_task(self, component):
-        """Instrumented component execution."""
+    def _execute_component_shard(self, components):
+        """Instrumented component execution shard."""
         with self.profiler.measure('component_execution'):
-            return super()._execute_component_task(component)
+            return super()._execute_component_shard(components)
 
 
 def measure_lock_contention(component_count: int, thread_count: int) -> Dict[str, float]:
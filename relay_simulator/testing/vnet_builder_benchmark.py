@@ -0,0 +1,233 @@
+"""
+VNET Builder Benchmark
+
+Times VnetBuilder.build_vnets_for_page on generated pages of bus nets with
+10k+ wires, against the previous pairwise (clique) connectivity map, and
+checks that both produce the same VNET tab sets. Also times
+IncrementalVnetBuilder updating an unedited page and a page with one
+wire edited (applied from the page's edit journal), against a full build.
+
+Each bus net is a driver Indicator plus TAPS tap Indicators, wired the two
+ways documents contain:
+- nested: a trunk wire from the driver with one junction holding a child
+  wire to every tap (old-style files)
+- chained: flat wires from junction to junction along the bus, each
+  junction with a stub wire to its tap (wires drawn in the GUI)
+
+Usage:
+    python testing/vnet_builder_benchmark.py [nets] [taps] [runs]
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import time
+from typing import Dict, List, Set, Tuple
+
+from core.page import Page
+from core.wire import Wire, Junction
+from core.vnet_builder import VnetBuilder
+from core.incremental_vnet_builder import IncrementalVnetBuilder
+from components.indicator import Indicator
+
+
+def build_bus_page(net_count: int, tap_count: int, nested: bool) -> Page:
+    """
+    Build a page of independent bus nets.
+
+    Args:
+        net_count: Number of bus nets
+        tap_count: Taps per net
+        nested: Junction subtree (True) or chained flat wires (False)
+
+    Returns:
+        Page with (tap_count + 1) components and wires per net
+    """
+    page = Page("PAGE1", "Bus")
+
+    def tab_of(component_id: str) -> str:
+        component = Indicator(component_id, "PAGE1")
+        page.add_component(component)
+        pin = next(iter(component.get_all_pins().values()))
+        return next(iter(pin.tabs))
+
+    for net in range(net_count):
+        driver = tab_of(f"N{net:04d}D")
+        taps = [tab_of(f"N{net:04d}T{i:03d}") for i in range(tap_count)]
+        if nested:
+            trunk = Wire(f"N{net:04d}W", driver)
+            junction = Junction(f"N{net:04d}J", (0, 0))
+            for i, tap in enumerate(taps):
+                junction.add_child_wire(Wire(f"N{net:04d}W{i:03d}", tap, tap))
+            trunk.add_junction(junction)
+            page.add_wire(trunk)
+        else:
+            previous = driver
+            for i, tap in enumerate(taps):
+                junction_id = f"N{net:04d}J{i:03d}"
+                page.add_wire(Wire(f"N{net:04d}B{i:03d}", previous, junction_id))
+                page.add_wire(Wire(f"N{net:04d}S{i:03d}", junction_id, tap))
+                previous = junction_id
+    return page
+
+
+def count_wires(page: Page) -> int:
+    """Count wires including junction child wires."""
+    count = 0
+    stack = list(page.get_all_wires())
+    while stack:
+        wire = stack.pop()
+        count += 1
+        for junction in wire.get_all_junctions():
+            stack.extend(junction.get_all_child_wires())
+    return count
+
+
+def pairwise_vnet_tab_sets(page: Page) -> List[Set[str]]:
+    """
+    Previous algorithm: connect every tab pair of each pin and wire tree,
+    then search the resulting graph from each component tab.
+    """
+    all_tabs = {tab_id for component in page.get_all_components()
+                for pin in component.get_all_pins().values() for tab_id in pin.tabs}
+    connectivity: Dict[str, Set[str]] = {}
+
+    def connect_all(tab_ids):
+        for tab1 in tab_ids:
+            neighbours = connectivity.setdefault(tab1, set())
+            for tab2 in tab_ids:
+                if tab1 != tab2:
+                    neighbours.add(tab2)
+
+    for component in page.get_all_components():
+        for pin in component.get_all_pins().values():
+            connect_all(list(pin.tabs))
+
+    visited: Set[str] = set()
+
+    def wire_tabs(wire: Wire) -> Set[str]:
+        if wire.wire_id in visited:
+            return set()
+        visited.add(wire.wire_id)
+        tabs = {wire.start_tab_id}
+        if wire.end_tab_id:
+            tabs.add(wire.end_tab_id)
+        for junction in wire.get_all_junctions():
+            for child in junction.get_all_child_wires():
+                tabs.update(wire_tabs(child))
+        return tabs
+
+    for wire in page.get_all_wires():
+        connect_all(wire_tabs(wire))
+
+    processed: Set[str] = set()
+    result = []
+    for tab_id in all_tabs:
+        if tab_id in processed:
+            continue
+        connected, stack = set(), [tab_id]
+        while stack:
+            current = stack.pop()
+            if current in processed:
+                continue
+            processed.add(current)
+            connected.add(current)
+            stack.extend(connectivity.get(current, ()))
+        result.append(connected)
+    return result
+
+
+def run_benchmark(net_count: int, tap_count: int, runs: int = 3) -> List[Tuple[str, int, float, float]]:
+    """
+    Time both builders on nested and chained bus pages.
+
+    Returns:
+        List of (layout, wire count, union-find seconds, pairwise seconds)
+    """
+    results = []
+    for layout, nested in (("nested", True), ("chained", False)):
+        page = build_bus_page(net_count, tap_count, nested)
+        builder = VnetBuilder()
+
+        best_new = best_old = float("inf")
+        for _ in range(runs):
+            began = time.perf_counter()
+            vnets = builder.build_vnets_for_page(page)
+            best_new = min(best_new, time.perf_counter() - began)
+
+            began = time.perf_counter()
+            reference = pairwise_vnet_tab_sets(page)
+            best_old = min(best_old, time.perf_counter() - began)
+
+        built = sorted(sorted(vnet.get_all_tabs()) for vnet in vnets)
+        assert built == sorted(sorted(tabs) for tabs in reference), f"{layout}: VNETs differ"
+        assert len(vnets) == net_count, f"{layout}: expected one VNET per net"
+        results.append((layout, count_wires(page), best_new, best_old))
+    return results
+
+
+def run_incremental_benchmark(net_count: int, tap_count: int, runs: int = 3) -> List[Tuple[str, float]]:
+    """
+    Time IncrementalVnetBuilder updates on a chained bus page.
+
+    Each edited run removes or restores one bus wire, splitting or
+    re-merging a single net.
+
+    Returns:
+        List of (case, best seconds); full build first
+    """
+    page = build_bus_page(net_count, tap_count, nested=False)
+    builder = IncrementalVnetBuilder()
+    builder.build_vnets_for_page(page)
+    wire = page.wires["N0000B000"]
+
+    best_full = best_same = best_edit = float("inf")
+    for run in range(2 * runs):
+        began = time.perf_counter()
+        VnetBuilder().build_vnets_for_page(page)
+        best_full = min(best_full, time.perf_counter() - began)
+
+        began = time.perf_counter()
+        builder.build_vnets_for_page(page)
+        best_same = min(best_same, time.perf_counter() - began)
+
+        if run % 2:
+            page.add_wire(wire)
+        else:
+            page.remove_wire(wire.wire_id)
+        began = time.perf_counter()
+        vnets = builder.build_vnets_for_page(page)
+        best_edit = min(best_edit, time.perf_counter() - began)
+        assert builder.last_rebuilt_nets <= 2, "Only the edited net is rebuilt"
+
+    built = sorted(sorted(vnet.get_all_tabs()) for vnet in vnets)
+    reference = VnetBuilder().build_vnets_for_page(page)
+    assert built == sorted(sorted(vnet.get_all_tabs()) for vnet in reference), "Incremental VNETs differ"
+    return [("full build", best_full), ("unedited", best_same), ("one wire edited", best_edit)]
+
+
+def main():
+    """Run the benchmark and print a report."""
+    net_count = int(sys.argv[1]) if len(sys.argv) > 1 else 160
+    tap_count = int(sys.argv[2]) if len(sys.argv) > 2 else 64
+    runs = int(sys.argv[3]) if len(sys.argv) > 3 else 3
+
+    print("=" * 60)
+    print(f"VNET BUILDER BENCHMARK ({net_count} nets x {tap_count} taps)")
+    print("=" * 60)
+    print(f"{'Layout':<10}{'Wires':>8}{'Union-find':>14}{'Pairwise':>12}{'Speedup':>10}")
+    for layout, wires, new, old in run_benchmark(net_count, tap_count, runs):
+        print(f"{layout:<10}{wires:>8}{new * 1000:>11.1f} ms{old * 1000:>9.1f} ms{old / new:>9.1f}x")
+    print("VNET tab sets identical for both builders ✓")
+
+    print(f"{'Incremental (chained)':<24}{'Best time':>12}{'Speedup':>10}")
+    results = run_incremental_benchmark(net_count, tap_count, runs)
+    full = results[0][1]
+    for case, seconds in results:
+        print(f"{case:<24}{seconds * 1000:>9.1f} ms{full / seconds:>9.1f}x")
+    print("Incremental VNETs identical to a full build ✓")
+
+
+if __name__ == "__main__":
+    main()
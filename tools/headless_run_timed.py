@@ -0,0 +1,73 @@
+import argparse
+import json
+import sys
+from pathlib import Path
+
+
+# Ensure the package dir is on sys.path so imports work when running via
+# `python tools/headless_run_timed.py ...`
+REPO_ROOT = Path(__file__).resolve().parents[1]
+PKG_ROOT = REPO_ROOT / "relay_simulator"
+if str(PKG_ROOT) not in sys.path:
+    sys.path.insert(0, str(PKG_ROOT))
+
+from fileio.document_loader import load_document
+from simulation.simulation_engine import SimulationEngine
+from simulation.structure_builder import build_simulation_structures
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Run a .rsim circuit headless over simulated time.")
+    parser.add_argument("document", help="Path to .rsim file")
+    group = parser.add_mutually_exclusive_group(required=True)
+    group.add_argument("--time", type=float, help="Simulated seconds to run")
+    group.add_argument("--edges", type=int, help="Number of clock edges to run")
+    parser.add_argument("--clock", help="Clock component ID to count edges for (default: any)")
+    parser.add_argument("--enable-clocks", action="store_true", help="Enable every clock at start")
+    parser.add_argument("--steps", action="store_true", help="Include per-step statistics in the output")
+    parser.add_argument("--profile", action="store_true", help="Include per-phase timings in the output")
+    args = parser.parse_args()
+
+    doc = load_document(args.document)
+    vnets, tabs, bridges, components = build_simulation_structures(doc)
+
+    if args.enable_clocks:
+        for component in components.values():
+            if component.component_type == "Clock":
+                component.properties["enable_on_sim_start"] = True
+
+    engine = SimulationEngine(vnets, tabs, bridges, components, realtime=False)
+    if args.profile:
+        engine.set_profiling(True)
+    engine.initialize()
+    try:
+        if args.time is not None:
+            result = engine.run_for(args.time)
+        else:
+            result = engine.run_clock_edges(args.edges, clock_id=args.clock)
+    finally:
+        engine.shutdown()
+
+    summary = {
+        "sim_time": result.sim_time,
+        "wall_time": result.wall_time,
+        "clock_edges": result.clock_edges,
+        "events_fired": result.events_fired,
+        "stable": result.stable,
+        "final_state": result.final_state,
+        "settle_steps": len(result.steps),
+        "high_vnets": sorted(v for v, s in result.vnet_states.items() if s.value),
+    }
+    if result.oscillation is not None:
+        summary["oscillation"] = result.oscillation.__dict__
+    if result.profile is not None:
+        summary["profile"] = result.profile.to_dict()
+    if args.steps:
+        summary["steps"] = [step.__dict__ for step in result.steps]
+
+    print(json.dumps(summary, indent=2))
+    return 0 if result.stable else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,75 @@
+import argparse
+import sys
+from pathlib import Path
+
+
+# Ensure the package dir is on sys.path so imports work when running via
+# `python tools/run_vectors.py ...`
+REPO_ROOT = Path(__file__).resolve().parents[1]
+PKG_ROOT = REPO_ROOT / "relay_simulator"
+if str(PKG_ROOT) not in sys.path:
+    sys.path.insert(0, str(PKG_ROOT))
+
+from fileio.document_loader import load_document
+from simulation.structure_builder import build_simulation_structures
+from simulation.stimulus import build_input_index, exhaustive_vectors
+from simulation.vector_runner import run_vectors, read_vectors_jsonl, write_results_jsonl
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Run stimulus vectors against a .rsim circuit on a process pool.")
+    parser.add_argument("document", help="Path to .rsim file")
+    source = parser.add_mutually_exclusive_group(required=True)
+    source.add_argument("--vectors", help="JSONL file with one vector per line ('-' for stdin)")
+    source.add_argument("--exhaustive", nargs="+", metavar="INPUT", help="Enumerate every combination of these inputs")
+    parser.add_argument("-o", "--output", help="JSONL results file (default: stdout)")
+    parser.add_argument("--workers", type=int, default=None, help="Worker processes (default: CPU count)")
+    parser.add_argument("--time", type=float, default=1.0, help="Simulated seconds per vector (default: 1.0)")
+    parser.add_argument("--enable-clocks", action="store_true", help="Enable every clock at start")
+    parser.add_argument("--chunksize", type=int, default=16, help="Vectors per worker task")
+    args = parser.parse_args()
+
+    if args.exhaustive:
+        _, _, _, components = build_simulation_structures(load_document(args.document))
+        vectors = [{"inputs": v} for v in exhaustive_vectors(build_input_index(components), args.exhaustive)]
+        input_file = None
+    elif args.vectors == "-":
+        input_file = None
+        vectors = read_vectors_jsonl(sys.stdin)
+    else:
+        input_file = open(args.vectors, "r", encoding="utf-8")
+        vectors = read_vectors_jsonl(input_file)
+
+    output = open(args.output, "w", encoding="utf-8") if args.output else sys.stdout
+    failed = 0
+    try:
+        def counted(results):
+            nonlocal failed
+            for result in results:
+                if "error" in result or not result.get("stable", False):
+                    failed += 1
+                yield result
+
+        count = write_results_jsonl(
+            counted(run_vectors(
+                args.document,
+                vectors,
+                workers=args.workers,
+                run_time=args.time,
+                enable_clocks=args.enable_clocks,
+                chunksize=args.chunksize
+            )),
+            output
+        )
+    finally:
+        if input_file:
+            input_file.close()
+        if args.output:
+            output.close()
+
+    print(f"{count} vectors, {failed} failed or unstable", file=sys.stderr)
+    return 0 if failed == 0 else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())